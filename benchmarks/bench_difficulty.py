@@ -0,0 +1,78 @@
+"""
+Replays a synthetic stream of finished games through the difficulty aggregator into the in-memory
+DynamoDB stand-in, for several micro-batch sizes: events folded per second, TransactWriteItems
+calls and write units, against one UpdateItem per event (measured on a slice and scaled up).
+
+    python benchmarks/bench_difficulty.py [--events 1000000]
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from common import LAMBDA_DIR
+from word_artifact import WordArtifact
+from local_dynamodb import LocalDynamoDB
+from difficulty import DifficultyAggregator, _replay, _buildDifficultyTable
+
+NAIVE_SAMPLE = 20000
+
+
+def syntheticEvents(path, count, rng):
+    artifact = WordArtifact()
+    words = [word for word_length in artifact.lengths() for word in artifact.words(word_length)]
+    # a few words are played much more often than the rest, as with a skewed word choice
+    weights = [1.0 / (rank + 1) ** 0.5 for rank in range(len(words))]
+    with open(path, "w") as f:
+        for word in rng.choices(words, weights=weights, k=count):
+            guesses = rng.randint(1, len(word) + 1)
+            won = rng.random() < 0.85
+            f.write(json.dumps({"word": word, "status": "WON" if won else "LOST", "guesses": guesses if won else len(word) + 1}) + "\n")
+
+
+def naive(path):
+    dynamodb = LocalDynamoDB()
+    table = dynamodb.create_table("DifficultyTable", "word", "shard")
+    start = time.perf_counter()
+    with open(path) as f:
+        for _, line in zip(range(NAIVE_SAMPLE), f):
+            event = json.loads(line)
+            table.update_item(Key={"word": event["word"], "shard": 0},
+                              UpdateExpression="ADD played :one, wins :won, guesses :guesses",
+                              ExpressionAttributeValues={":one": 1, ":won": int(event["status"] == "WON"),
+                                                         ":guesses": event["guesses"] if event["status"] == "WON" else 0})
+    return time.perf_counter() - start, dynamodb.summary()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=1000000)
+    args = parser.parse_args()
+    path = os.path.join(tempfile.mkdtemp(), "events.jsonl")
+    syntheticEvents(path, args.events, random.Random(0))
+
+    print("{:>10} {:>12} {:>10} {:>14} {:>12}".format("batch", "events/s", "writes", "write units", "build ms"))
+    for batch_size in [100, 1000, 10000, 100000]:
+        dynamodb = LocalDynamoDB()
+        table = dynamodb.create_table("DifficultyTable", "word", "shard")
+        aggregator = DifficultyAggregator(table, rng=random.Random(0))
+        start = time.perf_counter()
+        with open(path) as f:
+            stats = _replay(aggregator, f, batch_size)
+        seconds = time.perf_counter() - start
+        summary = dynamodb.summary()
+        start = time.perf_counter()
+        _buildDifficultyTable(table.items(), WordArtifact())
+        build = (time.perf_counter() - start) * 1000
+        print("{:>10} {:>12.0f} {:>10} {:>14.0f} {:>12.1f}".format(
+            batch_size, stats["events"] / seconds, summary["round_trips"], summary["write_units"], build))
+
+    seconds, summary = naive(path)
+    scale = float(args.events) / NAIVE_SAMPLE
+    print("{:>10} {:>12.0f} {:>10.0f} {:>14.0f} {:>12}".format(
+        "per event", NAIVE_SAMPLE / seconds, summary["round_trips"] * scale, summary["write_units"] * scale, "-"))
+
+
+if __name__ == "__main__":
+    main()
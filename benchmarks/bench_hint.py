@@ -0,0 +1,47 @@
+"""
+Measures the candidate index behind the hint endpoint: build time per word length, and the
+latency of filtering the full dictionary with the responses of games after 1 to 5 guesses,
+against a brute force filter that scores every word against every guess.
+
+    python benchmarks/bench_hint.py
+"""
+import random
+import time
+from common import timeit
+from word_artifact import WordArtifact
+from wordle_utils import _encodeResponse
+from candidate_index import CandidateIndex
+from guess import getGuessResponse
+
+
+def bruteForce(words, guesses, responses):
+    return [word for word in words
+            if all(_encodeResponse(getGuessResponse(g, word)) == r for g, r in zip(guesses, responses))]
+
+
+def main():
+    artifact = WordArtifact()
+    rng = random.Random(0)
+    print("{:>6} {:>7} {:>10} {:>8} {:>12} {:>12} {:>14}".format(
+        "length", "words", "build ms", "guesses", "filter (us)", "sample (us)", "brute (us)"))
+    for word_length in artifact.lengths():
+        words = list(artifact.words(word_length))
+        start = time.perf_counter()
+        index = CandidateIndex(word_length, words)
+        build = (time.perf_counter() - start) * 1000
+        for guess_count in range(1, 6):
+            games = []
+            for _ in range(50):
+                target = rng.choice(words)
+                guesses = rng.sample(words, guess_count)
+                games.append((guesses, [_encodeResponse(getGuessResponse(g, target)) for g in guesses]))
+            filtered = timeit(lambda: [index.filter(g, r) for g, r in games], 20) / len(games)
+            remaining = [index.filter(g, r) for g, r in games]
+            sampled = timeit(lambda: [index.sample(bits, 5) for bits in remaining], 20) / len(games)
+            brute = timeit(lambda: [bruteForce(words, g, r) for g, r in games[:5]], 1) / 5
+            print("{:>6} {:>7} {:>10.1f} {:>8} {:>12.1f} {:>12.1f} {:>14.0f}".format(
+                word_length, len(words), build, guess_count, filtered, sampled, brute))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Measures the cost of the per-invocation instrumentation: a DynamoDB call through an
+InstrumentedTable against the same call on the bare table, and a full metrics line.
+Uses the in-memory stand-in, so the numbers are pure overhead without network time.
+
+    python benchmarks/bench_metrics.py
+"""
+import io
+import contextlib
+from common import timeit
+from local_dynamodb import LocalDynamoDB
+import metrics
+
+REPEAT = 20000
+
+
+def main():
+    dynamodb = LocalDynamoDB()
+    table = dynamodb.create_table("GameTable", "game_id")
+    table.put_item(Item={"game_id": "g", "attempts_left": "6", "guesses": ["crane"] * 3, "responses": [1, 2, 3]})
+    instrumented = metrics.InstrumentedTable(table)
+    key = {"game_id": "g"}
+
+    bare = timeit(lambda: table.get_item(Key=key), REPEAT)
+    idle = timeit(lambda: instrumented.get_item(Key=key), REPEAT)
+    metrics._current = metrics.Invocation("bench")
+    recording = timeit(lambda: instrumented.get_item(Key=key), REPEAT)
+    metrics._current = None
+
+    handler = metrics._instrumented("bench")(lambda event, context: {"statusCode": 200})
+    with contextlib.redirect_stdout(io.StringIO()):
+        invocation = timeit(lambda: handler({}, None), REPEAT)
+    print("get_item, bare table:                {:8.2f} us".format(bare))
+    print("get_item, outside an invocation:     {:8.2f} us (+{:.2f})".format(idle, idle - bare))
+    print("get_item, recorded:                  {:8.2f} us (+{:.2f})".format(recording, recording - bare))
+    print("empty instrumented invocation:       {:8.2f} us".format(invocation))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Compares scoring the full dictionary of each length with the vectorized pattern engine
+against calling guess.getGuessResponse for every (guess, target) pair.
+
+    python benchmarks/bench_patterns.py
+"""
+import sys
+import time
+from common import ROOT_DIR, loadWords
+
+sys.path.insert(0, ROOT_DIR)
+import patterns
+from guess import getGuessResponse
+
+# Number of guesses scored with the pure python reference, extrapolated to the whole matrix
+REFERENCE_GUESSES = 50
+
+
+def main():
+    words = loadWords()
+    print("{:>6} {:>7} {:>14} {:>14} {:>8}".format("length", "words", "numpy pairs/s", "python pairs/s", "speedup"))
+    for word_length in range(5, 9):
+        same_length = sorted(w for w in words if len(w) == word_length)
+        start = time.perf_counter()
+        matrix = patterns.patternMatrix(same_length, same_length)
+        vectorized = matrix.size / (time.perf_counter() - start)
+        start = time.perf_counter()
+        for guess in same_length[:REFERENCE_GUESSES]:
+            for target in same_length:
+                getGuessResponse(guess, target)
+        reference = REFERENCE_GUESSES * len(same_length) / (time.perf_counter() - start)
+        print("{:>6} {:>7} {:>14.0f} {:>14.0f} {:>7.1f}x".format(
+            word_length, len(same_length), vectorized, reference, vectorized / reference))
+
+
+if __name__ == "__main__":
+    main()
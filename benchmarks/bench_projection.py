@@ -0,0 +1,69 @@
+"""
+Measures what the projections of the read helpers save on a history-heavy game: an 8 letter
+game with 8 guesses, played through the handlers. For each read made by the handlers,
+whole item against projected: bytes returned, read units (eventual and strongly consistent),
+latency of the stand-in's GetItem and the time boto3 takes to deserialize the wire format.
+
+    python benchmarks/bench_projection.py
+"""
+import contextlib
+import io
+import json
+import random
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from common import timeit
+from local_dynamodb import _installLocalDynamoDB
+from word_artifact import WordArtifact
+from word_loader import _loadWords
+from wordle_runtime import _getTable
+from wordle_utils import _getItem
+import createUser
+import createGame
+import guessBatch
+
+READS = [
+    ("user, to check game_id", "USER_TABLE", "user_id", ["game_id", "version"]),
+    ("game, to check status", "GAME_TABLE", "game_id", ["status", "version"]),
+    ("game, for a hint", "GAME_TABLE", "game_id", ["word_length", "guesses", "responses", "version"]),
+]
+
+
+def deserializeTime(item):
+    serializer = TypeSerializer()
+    deserializer = TypeDeserializer()
+    wire = dict((name, serializer.serialize(value)) for name, value in item.items())
+    return timeit(lambda: dict((name, deserializer.deserialize(value)) for name, value in wire.items()), 2000)
+
+
+def main():
+    dynamodb = _installLocalDynamoDB()
+    words = list(WordArtifact().words(8))
+    _loadWords(_getTable("WORD_TABLE"), words, workers=1)
+    with contextlib.redirect_stdout(io.StringIO()):
+        user_id = json.loads(createUser.handler({}, None)["body"])["message"]["user_id"]
+        game = json.loads(createGame.handler({"pathParameters": {"user_id": user_id},
+                                              "queryStringParameters": {"word_length": "8", "hard_mode": "0"}}, None)["body"])["message"]
+        # eight losing guesses, leaving the game in progress with its longest history
+        guesses = random.Random(0).sample([word for word in words if word != game["word"]], 8)
+        guessBatch.handler({"pathParameters": {"user_id": user_id, "game_id": game["game_id"]},
+                            "body": json.dumps({"guesses": guesses})}, None)
+    keys = {"user_id": user_id, "game_id": game["game_id"]}
+
+    print("{:<24} {:>9} {:>7} {:>8} {:>8} {:>10} {:>13}".format(
+        "read", "projected", "bytes", "RCU", "RCU (SC)", "get (us)", "decode (us)"))
+    for name, table_env, key, attributes in READS:
+        table = _getTable(table_env)
+        for projected in (False, True):
+            projection = attributes if projected else None
+            dynamodb.reset()
+            item = _getItem(table, key, keys[key], attributes=projection)["response"]
+            _getItem(table, key, keys[key], attributes=projection, consistent=True)
+            eventual, consistent = dynamodb.calls
+            latency = timeit(lambda: _getItem(table, key, keys[key], attributes=projection), 2000)
+            print("{:<24} {:>9} {:>7} {:>8} {:>8} {:>10.1f} {:>13.1f}".format(
+                name, "yes" if projected else "no", eventual.bytes_read, eventual.read_units, consistent.read_units,
+                latency, deserializeTime(item)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Compares the encoding of response bodies before and after response_encoder.py: the whole item
+dumped by json.dumps with a Decimal fallback, against the whitelisted view dumped by the json
+module and by orjson (when installed), plus gzip for the clients accepting it.
+Bodies: a game in progress with 8 guesses, the statistics of a user and a history of 1000 games.
+
+    python benchmarks/bench_response_body.py
+"""
+import gzip
+import json
+from decimal import Decimal
+from common import timeit
+import response_encoder
+from guess import getGuessResponse
+from history import _unpackGame, _packGame
+from user_stats import _statsView, STATS_ATTRIBUTES
+from wordle_utils import _encodeResponse, _decodeResponse, _gameView, ApplicationStatus
+
+GUESSES = ["absolute", "thinking", "thousand", "township", "tropical", "thompson", "together", "tomorrow"]
+
+
+def jsonDefault(value):
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    raise TypeError(type(value).__name__)
+
+
+def previousGameView(game):
+    # _gameView before response_encoder.py: a copy of the whole item
+    view = dict(game)
+    view["responses"] = [str(_decodeResponse(response, int(game["word_length"]))) for response in game["responses"]]
+    return view
+
+
+def previous(render, item):
+    return json.dumps({"message": render(item), "status": "OK"}, default=jsonDefault)
+
+
+def bodies():
+    game = {
+        "game_id": "2f1ab2a6-7e0c-4f0b-9a53-8c4e0f7f7a1d", "user_id": "9b1d3f0e-5a2c-4c8e-8f7d-1e2a3b4c5d6e",
+        "hard_mode": "1", "attempts_left": "1", "word_length": "8", "word": "thursday", "status": "IN_PROGRESS",
+        "guesses": GUESSES, "responses": [Decimal(_encodeResponse(getGuessResponse(g, "thursday"))) for g in GUESSES],
+        "expires_at": Decimal(1700000000), "constraints": "th......|a1d1h1r1s1t1u1y1|b0c0e0", "version": Decimal(9),
+    }
+    stats_item = dict((name, Decimal(index % 7)) for index, name in enumerate(STATS_ATTRIBUTES))
+    history = {"user_id": game["user_id"], "games_count": 1000,
+               "games": [_unpackGame(_packGame(5 + n % 4, 1 + n % 6, n % 5 != 0, n % 3 == 0)) for n in range(1000)]}
+    stats = lambda item: _statsView("u", item)
+    same = lambda item: item
+    # (body, item, render before, render after): only the game had no view before
+    return [
+        ("game", game, previousGameView, _gameView),
+        ("stats", stats_item, stats, stats),
+        ("history 1000", history, same, same),
+    ]
+
+
+def encoders():
+    yield "json", json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+    try:
+        import orjson
+        yield "orjson", lambda obj: orjson.dumps(obj).decode("utf-8")
+    except ImportError:
+        print("orjson is not installed, only the json module is measured")
+
+
+def main():
+    print("{:<14} {:<22} {:>8} {:>11} {:>10} {:>10}".format("body", "path", "bytes", "encode us", "gzip B", "gzip us"))
+    for name, item, before, after in bodies():
+        body = previous(before, item)
+        print("{:<14} {:<22} {:>8} {:>11.1f} {:>10} {:>10}".format(
+            name, "json.dumps + default", len(body), timeit(lambda: previous(before, item), 2000), "-", "-"))
+        for backend, dumps in encoders():
+            body = dumps({"message": after(item), "status": ApplicationStatus.OK.name})
+            encode = timeit(lambda: dumps({"message": after(item), "status": ApplicationStatus.OK.name}), 2000)
+            zipped = gzip.compress(body.encode("utf-8"), response_encoder.GZIP_LEVEL)
+            zip_time = timeit(lambda: gzip.compress(body.encode("utf-8"), response_encoder.GZIP_LEVEL), 500)
+            print("{:<14} {:<22} {:>8} {:>11.1f} {:>10} {:>10.1f}".format(
+                name, "view + " + backend, len(body), encode, len(zipped), zip_time))
+
+
+if __name__ == "__main__":
+    main()
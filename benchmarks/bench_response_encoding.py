@@ -0,0 +1,50 @@
+"""
+Measures the size of a finished 8 letter game item and the per-guess cost of reading the
+previous response in hard mode, with legacy string responses and base-3 encoded responses.
+
+    python benchmarks/bench_response_encoding.py
+"""
+from ast import literal_eval
+from common import itemSize, timeit
+from guess import getGuessResponse
+from wordle_utils import _encodeResponse, _decodeResponse
+
+TARGET = "thursday"
+GUESSES = ["absolute", "thinking", "thousand", "township", "tropical", "thompson", "together", "tomorrow", "thursday"]
+
+
+def game(responses):
+    return {
+        "game_id": "2f1ab2a6-7e0c-4f0b-9a53-8c4e0f7f7a1d",
+        "hard_mode": "1",
+        "attempts_left": "0",
+        "word_length": "8",
+        "word": TARGET,
+        "status": "WON",
+        "guesses": GUESSES,
+        "responses": responses,
+    }
+
+
+def main():
+    responses = [getGuessResponse(guess, TARGET) for guess in GUESSES]
+    legacy = [str(response) for response in responses]
+    encoded = [_encodeResponse(response) for response in responses]
+
+    legacy_size = itemSize(game(legacy))
+    encoded_size = itemSize(game(encoded))
+    print("game item size, legacy responses:  {:6d} bytes".format(legacy_size))
+    print("game item size, encoded responses: {:6d} bytes ({:.0f}% smaller)".format(
+        encoded_size, 100.0 * (legacy_size - encoded_size) / legacy_size))
+
+    legacy_parse = timeit(lambda: literal_eval(legacy[-1]), 20000)
+    encoded_parse = timeit(lambda: _decodeResponse(encoded[-1], 8), 20000)
+    encode = timeit(lambda: _encodeResponse(responses[-1]), 20000)
+    print("read previous response, literal_eval: {:6.2f} us".format(legacy_parse))
+    print("read previous response, base-3 code:  {:6.2f} us".format(encoded_parse))
+    print("store response, str() vs encode:      {:6.2f} us vs {:.2f} us".format(
+        timeit(lambda: str(responses[-1]), 20000), encode))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Compares cold-start frequency and latency percentiles of the per-function layout (one Lambda
+function per endpoint) against the single router function of lambda/router.py.
+
+The import time of every handler module is measured in fresh interpreters. Traffic is then
+simulated as a Poisson stream over an endpoint mix. Each function keeps a pool of containers
+that are reused while warm and reclaimed after --idle-timeout seconds without a request. A cold
+start costs --runtime-init plus the imports of the handler, and the router imports a handler
+the first time a container routes to it.
+
+    python benchmarks/bench_router.py --rate 0.2 --hours 24
+
+Production numbers come from the metrics lines of the handlers (see lambda/metrics.py), eg. with
+CloudWatch Logs Insights: stats avg(cold_start) * 100 as cold_pct, pct(duration_ms, 99) as p99 by handler
+"""
+import argparse
+import random
+import statistics
+import subprocess
+import sys
+from common import LAMBDA_DIR
+
+# Share of requests per handler, guesses dominate a game
+MIX = {
+    "guess": 0.62,
+    "getGame": 0.12,
+    "createGame": 0.08,
+    "createUser": 0.06,
+    "getUser": 0.05,
+    "guessBatch": 0.03,
+    "getHome": 0.02,
+    "deleteGame": 0.02,
+}
+# Warm request latency, lognormal around the median
+WARM_MEDIAN = 0.012
+WARM_SIGMA = 0.5
+
+
+def importSeconds(module_name, repeat):
+    """
+    Returns the median time to import a module of lambda/ in a fresh interpreter.
+    """
+    code = ("import sys, time; sys.path.insert(0, {!r}); start = time.perf_counter(); import {}; "
+            "print(time.perf_counter() - start)").format(LAMBDA_DIR, module_name)
+    samples = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        samples.append(float(output.strip().splitlines()[-1]))
+    return statistics.median(samples)
+
+
+def simulate(layout, imports, args, seed):
+    """
+    Replays the same request stream against one layout.
+
+    Returns:
+        dict: handler -> list of (latency, cold start) samples
+    """
+    rng = random.Random(seed)
+    handlers = list(MIX)
+    weights = [MIX[h] for h in handlers]
+    pools = {}
+    samples = {h: [] for h in handlers}
+    now = 0.0
+    end = args.hours * 3600
+    while True:
+        now += rng.expovariate(args.rate)
+        if now > end:
+            return samples
+        handler = rng.choices(handlers, weights)[0]
+        function = "router" if layout == "router" else handler
+        pool = [c for c in pools.get(function, []) if now - c["last_used"] <= args.idle_timeout]
+        idle = [c for c in pool if c["busy_until"] <= now]
+        latency = rng.lognormvariate(0, WARM_SIGMA) * WARM_MEDIAN
+        cold = len(idle) == 0
+        if cold:
+            container = {"imported": set(), "busy_until": now, "last_used": now}
+            pool.append(container)
+            latency += args.runtime_init + (imports["router"] if layout == "router" else 0.0)
+        else:
+            container = max(idle, key=lambda c: c["last_used"])
+        if handler not in container["imported"]:
+            container["imported"].add(handler)
+            latency += imports[handler]
+        container["busy_until"] = now + latency
+        container["last_used"] = now + latency
+        pools[function] = pool
+        samples[handler].append((latency, cold))
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def report(name, samples):
+    everything = [s for per_handler in samples.values() for s in per_handler]
+    latencies = [latency for latency, _ in everything]
+    cold = sum(1 for _, is_cold in everything if is_cold)
+    rare = [s for h in ("getHome", "deleteGame") for s in samples[h]]
+    print("{:>13} {:>9} {:>7.2%} {:>9.1f} {:>9.1f} {:>16.2%}".format(
+        name, len(everything), cold / float(len(everything)),
+        percentile(latencies, 0.5) * 1000, percentile(latencies, 0.99) * 1000,
+        sum(1 for _, is_cold in rare if is_cold) / float(max(1, len(rare)))))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate cold starts of the per-function and router layouts.")
+    parser.add_argument("--rate", type=float, default=0.2, help="requests per second over all endpoints")
+    parser.add_argument("--hours", type=float, default=24)
+    parser.add_argument("--idle-timeout", type=float, default=420, help="seconds an idle container stays warm")
+    parser.add_argument("--runtime-init", type=float, default=0.15, help="seconds to start a python runtime, before imports")
+    parser.add_argument("--repeat", type=int, default=3, help="fresh interpreters per import measurement")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    imports = {name: importSeconds(name, args.repeat) for name in list(MIX) + ["router"]}
+    print("import time in a fresh interpreter (ms): " + ", ".join("{} {:.0f}".format(k, v * 1000) for k, v in imports.items()))
+    # the router imports a handler on first use, after its own lighter import
+    router_imports = dict((name, seconds - imports["router"]) for name, seconds in imports.items())
+    router_imports["router"] = imports["router"]
+    print("{:>13} {:>9} {:>7} {:>9} {:>9} {:>16}".format("layout", "requests", "cold", "p50 ms", "p99 ms", "cold getHome/del"))
+    report("per-function", simulate("per-function", imports, args, args.seed))
+    report("router", simulate("router", router_imports, args, args.seed))
+
+
+if __name__ == "__main__":
+    main()
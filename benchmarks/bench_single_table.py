@@ -0,0 +1,79 @@
+"""
+Compares the storage layouts on the requests of one game: round trips, read and write units of every
+handler, with a cold item cache (a new container for each request) as the worst case.
+The game is an 8 letter one, played to the end with 8 losing guesses and the winning one.
+
+    python benchmarks/bench_single_table.py
+"""
+import contextlib
+import io
+import json
+import os
+import random
+import common  # puts lambda/ on the import path
+from local_dynamodb import _installLocalDynamoDB
+from word_artifact import WordArtifact
+from word_loader import _loadWords
+from wordle_runtime import _getTable, _setResource
+import item_cache
+from item_cache import ItemCache
+import createUser
+import createGame
+import getGame
+import getHome
+import getHint
+import guess
+
+LAYOUTS = ["tables", "single"]
+
+
+def playGame(dynamodb, words):
+    """
+    Plays a game through the handlers and returns the totals of every handler as name -> [requests, round trips, RCU, WCU].
+    """
+    totals = {}
+
+    def request(name, handler, event):
+        item_cache._cache = ItemCache()
+        dynamodb.reset()
+        response = handler(event, None)
+        summary = dynamodb.summary()
+        counters = totals.setdefault(name, [0, 0, 0.0, 0.0])
+        counters[0] += 1
+        counters[1] += summary["round_trips"]
+        counters[2] += summary["read_units"]
+        counters[3] += summary["write_units"]
+        return json.loads(response["body"])["message"] if response.get("body") else None
+
+    user_id = json.loads(createUser.handler({}, None)["body"])["message"]["user_id"]
+    game = request("createGame", createGame.handler, {"pathParameters": {"user_id": user_id},
+                                                      "queryStringParameters": {"word_length": "8", "hard_mode": "0"}})
+    path = {"user_id": user_id, "game_id": game["game_id"]}
+    user = _getTable("USER_TABLE").get_item(Key={"user_id": user_id})["Item"]
+    secret = user["game"]["word"] if "game" in user else _getTable("GAME_TABLE").get_item(Key={"game_id": game["game_id"]})["Item"]["word"]
+    for word in random.Random(0).sample([word for word in words if word != secret], 8) + [secret]:
+        request("getGame", getGame.handler, {"pathParameters": path})
+        request("getHome", getHome.handler, {"queryStringParameters": path, "path": "/v1"})
+        request("getHint", getHint.handler, {"pathParameters": path})
+        request("guess", guess.handler, {"pathParameters": path, "queryStringParameters": {"guess": word}})
+    return totals
+
+
+def main():
+    words = list(WordArtifact().words(8))
+    print("{:<8} {:<12} {:>12} {:>8} {:>8}".format("layout", "handler", "round trips", "RCU", "WCU"))
+    for layout in LAYOUTS:
+        os.environ["STORAGE_LAYOUT"] = layout
+        dynamodb = _installLocalDynamoDB()
+        _loadWords(_getTable("WORD_TABLE"), words, workers=1)
+        with contextlib.redirect_stdout(io.StringIO()):
+            totals = playGame(dynamodb, words)
+        for name, (requests, round_trips, read_units, write_units) in totals.items():
+            print("{:<8} {:<12} {:>12.2f} {:>8.2f} {:>8.2f}".format(
+                layout, name, float(round_trips) / requests, read_units / requests, write_units / requests))
+        _setResource(None)
+    os.environ.pop("STORAGE_LAYOUT")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Measures lookup latency and memory footprint of the in-memory dictionary index
+against a plain python set of the same words.
+
+    python benchmarks/bench_word_index.py
+"""
+import random
+import sys
+from common import loadWords, timeit
+from word_index import WordIndex
+from word_artifact import WordArtifact
+
+
+def setSize(words):
+    return sys.getsizeof(words) + sum(sys.getsizeof(w) for w in words)
+
+
+def main():
+    words = loadWords()
+    artifact = WordArtifact()
+    rng = random.Random(0)
+    print("artifact: {} bytes mapped for all lengths".format(artifact.nbytes))
+    print("{:>6} {:>7} {:>12} {:>12} {:>12} {:>12} {:>14}".format(
+        "length", "words", "index bytes", "set bytes", "hit (us)", "miss (us)", "artifact (us)"))
+    for word_length in range(5, 9):
+        same_length = [w for w in words if len(w) == word_length]
+        index = WordIndex(word_length, same_length)
+        probes = [rng.choice(same_length) for _ in range(1000)]
+        misses = ["".join(rng.choice("qxzj") for _ in range(word_length)) for _ in range(1000)]
+        hit = timeit(lambda: [p in index for p in probes], 100) / len(probes)
+        miss = timeit(lambda: [p in index for p in misses], 100) / len(misses)
+        mapped = timeit(lambda: [p in artifact for p in probes], 100) / len(probes)
+        print("{:>6} {:>7} {:>12} {:>12} {:>12.2f} {:>12.2f} {:>14.2f}".format(
+            word_length, len(index), index.nbytes, setSize(set(same_length)), hit, miss, mapped))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Throughput of the word table with and without sharding, on the in-memory stand-in with per-partition
+throttling: every partition of the table and of its ordinal index accepts PARTITION_RATE requests per
+second, like the fixed throughput of a DynamoDB partition scaled down.
+For every layout, the whole dictionary is bulk loaded, then THREADS clients play 5 letter games for
+SECONDS: one random pick (createGame) for every PICK_EVERY validation reads (guess), backing off
+when throttled.
+
+    python benchmarks/bench_word_shards.py
+"""
+import contextlib
+import io
+import os
+import random
+import threading
+import time
+from botocore.exceptions import ClientError
+from common import loadWords
+import word_shards
+import wordle_utils
+from local_dynamodb import LocalDynamoDB, _createWordleTables
+from word_loader import _loadWords
+from word_shards import WordLayout, _getRandomWord
+
+PARTITION_RATE = 200
+LATENCY = 0.002
+THREADS = 16
+SECONDS = 3.0
+PICK_EVERY = 5
+
+
+def client(table, layout, words, deadline, totals, lock, seed):
+    rng = random.Random(seed)
+    done = throttled = 0
+    n = 0
+    while time.monotonic() < deadline:
+        n += 1
+        if n % PICK_EVERY == 0:
+            ok = _getRandomWord(table, 5)["success"]
+        else:
+            try:
+                table.get_item(Key=layout.key(rng.choice(words)))
+                ok = True
+            except ClientError:
+                ok = False
+        if ok:
+            done += 1
+        else:
+            throttled += 1
+            time.sleep(rng.uniform(0, 0.02))
+    with lock:
+        totals[0] += done
+        totals[1] += throttled
+
+
+def run(shards, words):
+    os.environ["WORD_SHARDS"] = str(shards)
+    word_shards._shard_counts.clear()
+    wordle_utils._counts.clear()
+    layout = WordLayout(shards)
+    dynamodb = _createWordleTables(LocalDynamoDB(latency=LATENCY, partition_rate=PARTITION_RATE, seed=1))
+    table = dynamodb.Table(os.environ["WORD_TABLE"])
+    load = _loadWords(table, words, workers=8, layout=layout)
+    five = [word for word in words if len(word) == 5]
+    totals = [0, 0]
+    lock = threading.Lock()
+    deadline = time.monotonic() + SECONDS
+    threads = [threading.Thread(target=client, args=(table, layout, five, deadline, totals, lock, seed)) for seed in range(THREADS)]
+    # _getRandomWord prints the throttling errors it returns
+    with contextlib.redirect_stdout(io.StringIO()):
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    return load, totals[0] / SECONDS, totals[1] / float(max(1, totals[0] + totals[1]))
+
+
+def main():
+    words = loadWords()
+    print("{} words, {} requests/s per partition, {} clients, {:.0f} ms per call".format(len(words), PARTITION_RATE, THREADS, LATENCY * 1000))
+    print("{:>7} {:>9} {:>13} {:>12} {:>11}".format("shards", "load s", "load retries", "5 letter/s", "throttled"))
+    for shards in (0, 4, 8, 16):
+        load, rate, throttled = run(shards, words)
+        print("{:>7} {:>9.2f} {:>13} {:>12.0f} {:>10.1%}".format(shards or "-", load["seconds"], load["retries"], rate, throttled))
+
+
+if __name__ == "__main__":
+    main()
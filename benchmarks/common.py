@@ -0,0 +1,41 @@
+"""
+Shared helpers for the benchmark scripts. Puts the lambda/ directory on the import path
+so that the benchmarks exercise the same modules the Lambda functions ship with, and the
+root of the repository for the in-memory DynamoDB stand-in.
+"""
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LAMBDA_DIR = os.path.join(ROOT_DIR, "lambda")
+for path in (ROOT_DIR, LAMBDA_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+
+def loadWords():
+    """
+    Returns every word of the compiled dictionary artifact shipped with the Lambda functions.
+    """
+    from word_artifact import WordArtifact
+    artifact = WordArtifact()
+    return [word for word_length in artifact.lengths() for word in artifact.words(word_length)]
+
+
+def timeit(fn, repeat):
+    """
+    Calls fn repeat times and returns the mean duration of one call in microseconds.
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def itemSize(value):
+    """
+    Approximates the size DynamoDB bills for an item or attribute value, see local_dynamodb._itemSize.
+    """
+    from local_dynamodb import _itemSize
+    return _itemSize(value)
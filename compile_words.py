@@ -0,0 +1,92 @@
+"""
+Compiles a raw word list into the dictionary artifact shipped with the Lambda functions.
+
+Words are normalized to lowercase, filtered to 5-8 ascii letters and deduplicated.
+When the previous artifact is given, every word keeps its ordinal and new words are appended
+after the existing ones, so game state that refers to ordinals stays valid across versions.
+
+    python compile_words.py                                      # dictionary/words.txt -> lambda/words.bin
+    python compile_words.py --source more.txt --previous lambda/words.bin
+"""
+import argparse
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(ROOT_DIR, "lambda"))
+from word_artifact import WordArtifact, _writeArtifact, DEFAULT_ARTIFACT_PATH
+
+DEFAULT_SOURCE = os.path.join(ROOT_DIR, "dictionary", "words.txt")
+MIN_WORD_LENGTH = 5
+MAX_WORD_LENGTH = 8
+
+
+def normalize(lines):
+    """
+    Yields the valid words of a raw word source, lowercased and without duplicates.
+    """
+    seen = set()
+    for line in lines:
+        word = line.strip().lower()
+        if MIN_WORD_LENGTH <= len(word) <= MAX_WORD_LENGTH and word.isalpha() and word.isascii() and word not in seen:
+            seen.add(word)
+            yield word
+
+
+def compileWords(words, previous=None):
+    """
+    Assigns ordinals to the words, appending to the ordinals of a previous artifact.
+
+    Args:
+        words (iterable): Normalized words
+        previous (WordArtifact, optional): The artifact whose ordinals must be kept
+
+    Returns:
+        tuple: (version, words_by_length, generations_by_length)
+    """
+    words_by_length = {}
+    generations_by_length = {}
+    version = 1
+    if previous is not None:
+        version = previous.version + 1
+        for word_length in previous.lengths():
+            words_by_length[word_length] = list(previous.words(word_length))
+            generations_by_length[word_length] = previous.generations(word_length)
+    known = set(word for words in words_by_length.values() for word in words)
+    for word in words:
+        if word not in known:
+            known.add(word)
+            words_by_length.setdefault(len(word), []).append(word)
+    for word_length, same_length in words_by_length.items():
+        generations = generations_by_length.setdefault(word_length, [])
+        if len(generations) == 0 or generations[-1] != len(same_length):
+            generations.append(len(same_length))
+    return version, words_by_length, generations_by_length
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile a word list into the Wordle dictionary artifact.")
+    parser.add_argument("--source", default=DEFAULT_SOURCE, help="text file with one word per line")
+    parser.add_argument("--out", default=DEFAULT_ARTIFACT_PATH, help="artifact to write")
+    parser.add_argument("--previous", help="artifact whose ordinals are kept, new words are appended to it")
+    args = parser.parse_args()
+
+    previous = WordArtifact(args.previous) if args.previous else None
+    with open(args.source) as f:
+        source = list(normalize(f))
+    version, words_by_length, generations_by_length = compileWords(source, previous)
+    if previous is not None:
+        source_words = set(source)
+        kept = sum(1 for l in previous.lengths() for w in previous.words(l) if w not in source_words)
+        if kept > 0:
+            print("kept {} words missing from the source to preserve their ordinals".format(kept))
+    _writeArtifact(args.out, words_by_length, version, generations_by_length)
+
+    artifact = WordArtifact(args.out)
+    print("wrote {} version {} sha256 {}".format(args.out, artifact.version, artifact.checksum))
+    for word_length in artifact.lengths():
+        print("  {}: {} words, generations {}".format(word_length, artifact.count(word_length), artifact.generations(word_length)))
+
+
+if __name__ == "__main__":
+    main()
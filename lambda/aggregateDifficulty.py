@@ -0,0 +1,17 @@
+from wordle_runtime import _getTable
+from metrics import _instrumented, _count
+from difficulty import DifficultyAggregator
+
+
+# Consumes the stream of the game table, or of the user table in the single table layout. Every invocation
+# is one micro-batch of records, folded into the difficulty table with one write per TRANSACTION_LIMIT
+# distinct words (see difficulty.py).
+# A failed flush raises, so the batch is retried by the event source mapping; the writes of a batch are
+# idempotent, so the transactions that already committed are not applied twice.
+@_instrumented("aggregateDifficulty")
+def handler(event, context):
+    aggregator = DifficultyAggregator(_getTable("DIFFICULTY_TABLE"))
+    stats = aggregator.fold(event.get("Records", []))
+    for name, value in stats.items():
+        _count(name, value)
+    return stats
@@ -0,0 +1,128 @@
+import random
+from wordle_utils import _decodeResponse, GREEN, GREY
+from word_artifact import _getWordArtifact
+from word_index import _getWordIndex
+
+# Candidate index for hints: which dictionary words still fit the responses of a game.
+# Bit i of every bitset stands for word i of the length (its ordinal in the artifact), and
+# bitsets are python ints, so a filter is a handful of big-int ANDs whatever the dictionary size.
+MAX_SAMPLE = 20
+
+# Per-length indexes, built once per warm container from the dictionary
+_indexes = {}
+
+
+class CandidateIndex:
+    """
+    Positional bitsets over the words of a single length:
+        at[i][c]        words with letter c at position i
+        at_least[c][k]  words containing letter c at least k times (k = 1 is letter-present)
+
+    Args:
+        word_length (int): The length of the words
+        words (list): The words, bit i standing for words[i]
+    """
+
+    def __init__(self, word_length, words):
+        self.word_length = word_length
+        self.words = list(words)
+        self.count = len(self.words)
+        self.all = (1 << self.count) - 1
+        positions = [dict() for _ in range(word_length)]
+        counts = {}
+        for ordinal, word in enumerate(self.words):
+            seen = {}
+            for pos, c in enumerate(word):
+                positions[pos].setdefault(c, []).append(ordinal)
+                seen[c] = seen.get(c, 0) + 1
+            for c, n in seen.items():
+                for k in range(1, n + 1):
+                    counts.setdefault((c, k), []).append(ordinal)
+        self.at = [dict((c, self._bitset(ordinals)) for c, ordinals in position.items()) for position in positions]
+        self.at_least = {}
+        for (c, k), ordinals in counts.items():
+            self.at_least.setdefault(c, {})[k] = self._bitset(ordinals)
+
+    def _bitset(self, ordinals):
+        bits = bytearray((self.count + 7) // 8)
+        for ordinal in ordinals:
+            bits[ordinal >> 3] |= 1 << (ordinal & 7)
+        return int.from_bytes(bytes(bits), "little")
+
+    def _atLeast(self, c, k):
+        if k <= 0:
+            return self.all
+        return self.at_least.get(c, {}).get(k, 0)
+
+    def filter(self, guesses, responses):
+        """
+        Returns the bitset of the words consistent with every guess and response of a game.
+
+        Args:
+            guesses (list): The guesses of the game
+            responses (list): Their stored responses, base-3 encoded or legacy strings
+
+        Returns:
+            int: The bitset of the remaining candidates
+        """
+        bits = self.all
+        for guess, stored in zip(guesses, responses):
+            response = _decodeResponse(stored, self.word_length)
+            found = {}
+            greys = set()
+            for pos, c in enumerate(guess):
+                at = self.at[pos].get(c, 0)
+                if response[pos] == GREEN:
+                    bits &= at
+                    found[c] = found.get(c, 0) + 1
+                else:
+                    # a yellow or grey letter is not at this position
+                    bits &= self.all ^ at
+                    if response[pos] == GREY:
+                        greys.add(c)
+                    else:
+                        found[c] = found.get(c, 0) + 1
+            for c, k in found.items():
+                bits &= self._atLeast(c, k)
+            for c in greys:
+                # a grey letter appears exactly as many times as it was found
+                bits &= self.all ^ self._atLeast(c, found.get(c, 0) + 1)
+        return bits
+
+    def cardinality(self, bits):
+        return bin(bits).count("1")
+
+    def sample(self, bits, k, rng=None):
+        """
+        Returns up to k words of a bitset, drawn at random, in dictionary order.
+        """
+        if k <= 0 or bits == 0:
+            return []
+        ordinals = [idx for idx, bit in enumerate(reversed(bin(bits)[2:])) if bit == "1"]
+        chosen = (rng or random).sample(ordinals, min(k, len(ordinals)))
+        return [self.words[ordinal] for ordinal in sorted(chosen)]
+
+
+def _getCandidateIndex(table, word_length):
+    """
+    Returns the CandidateIndex for the given length, built on first use from the dictionary
+    artifact, or from the word table index when the artifact is missing.
+
+    Args:
+        table (DynamoDB.Table): The DynamoDB word table object
+        word_length (int): The length of the words
+
+    Returns:
+        CandidateIndex: The index of all the words of this length
+    """
+    index = _indexes.get(word_length)
+    if index is None:
+        artifact = _getWordArtifact()
+        if artifact is not None:
+            words = artifact.words(word_length)
+        else:
+            word_index = _getWordIndex(table, word_length)
+            words = [word_index.word(idx) for idx in range(len(word_index))]
+        index = CandidateIndex(word_length, words)
+        _indexes[word_length] = index
+    return index
@@ -0,0 +1,184 @@
+import os
+import time
+from boto3.dynamodb.types import TypeSerializer
+from wordle_runtime import _getTable
+from metrics import _instrumented, _count
+from wordle_utils import _errorCode, _gameExpiry, IN_PROGRESS, EXPIRES_AT, FINISHED_GAME_TTL
+from item_cache import VERSION
+from history import _packGameItem, GAMES, GAMES_COUNT
+
+# Scheduled job moving finished games out of the game table. Every finished game that ended at
+# least COMPACT_AFTER seconds ago is appended, as one byte, to the history item of its user and
+# deleted, in one transaction per user. The TTL of the game is the safety net if a game is never
+# compacted. Games that no user points to any more (eg. left behind by concurrent createGame
+# calls) are deleted, and legacy games written without user_id or TTL are given a TTL.
+COMPACT_AFTER = int(os.environ.get("COMPACT_AFTER", str(24 * 3600)))
+# Games deleted per transaction, which also updates the history item and possibly the user
+TRANSACTION_GAMES = 98
+# Stop scanning when less than this many milliseconds of the invocation are left
+DEADLINE_MARGIN_MS = 10000
+
+PROJECTION = "game_id, user_id, #status, word_length, attempts_left, hard_mode, #expires_at, #version"
+PROJECTION_NAMES = {"#status": "status", "#expires_at": EXPIRES_AT, "#version": VERSION}
+
+_serializer = TypeSerializer()
+
+
+def _serialize(values):
+    return dict((name, _serializer.serialize(value)) for name, value in values.items())
+
+
+def _compactUser(gameTable, userTable, historyTable, user_id, games, user, stats):
+    """
+    Moves finished games of one user into the history table, TRANSACTION_GAMES games per transaction.
+    If the user still points to one of them, the pointer is cleared in the same transaction, as deleteGame does.
+    A transaction is cancelled if any game or the user changed since it was read, and retried by the next run.
+    """
+    client = historyTable.meta.client
+    for start in range(0, len(games), TRANSACTION_GAMES):
+        chunk = games[start:start + TRANSACTION_GAMES]
+        actions = [{"Update": {
+            "TableName": historyTable.table_name,
+            "Key": _serialize({"user_id": user_id}),
+            "UpdateExpression": "SET #games = list_append(if_not_exists(#games, :empty), :chunk) ADD #games_count :count",
+            "ExpressionAttributeNames": {"#games": GAMES, "#games_count": GAMES_COUNT},
+            "ExpressionAttributeValues": _serialize({
+                ":empty": [],
+                ":chunk": [bytes(bytearray(_packGameItem(game) for game in chunk))],
+                ":count": len(chunk),
+            }),
+        }}]
+        if any(game["game_id"] == user["game_id"] for game in chunk):
+            actions.append({"Update": {
+                "TableName": userTable.table_name,
+                "Key": _serialize({"user_id": user_id}),
+                "UpdateExpression": "SET game_id = :none, #version = if_not_exists(#version, :zero) + :one",
+                "ConditionExpression": "game_id = :game_id",
+                "ExpressionAttributeNames": {"#version": VERSION},
+                "ExpressionAttributeValues": _serialize({":none": "", ":game_id": user["game_id"], ":zero": 0, ":one": 1}),
+            }})
+        for game in chunk:
+            actions.append({"Delete": {
+                "TableName": gameTable.table_name,
+                "Key": _serialize({"game_id": game["game_id"]}),
+                "ConditionExpression": "#status = :status",
+                "ExpressionAttributeNames": {"#status": "status"},
+                "ExpressionAttributeValues": _serialize({":status": game["status"]}),
+            }})
+        try:
+            client.transact_write_items(TransactItems=actions)
+        except Exception as e:
+            if _errorCode(e) == "TransactionCanceledException":
+                stats["conflicts"] += 1
+                continue
+            print(e)
+            stats["errors"] += 1
+            continue
+        stats["compacted"] += len(chunk)
+
+
+def _deleteOrphan(gameTable, game, stats):
+    """
+    Deletes a game that no user points to, unless it was played since it was read.
+    """
+    try:
+        gameTable.delete_item(
+            Key={"game_id": game["game_id"]},
+            ConditionExpression="#status = :status AND #version = :version",
+            ExpressionAttributeNames={"#status": "status", "#version": VERSION},
+            ExpressionAttributeValues={":status": game["status"], ":version": game[VERSION]},
+        )
+        stats["orphans_deleted"] += 1
+    except Exception as e:
+        if _errorCode(e) == "ConditionalCheckFailedException":
+            stats["conflicts"] += 1
+            return
+        print(e)
+        stats["errors"] += 1
+
+
+def _expireLegacy(gameTable, game, now, stats):
+    """
+    Gives a TTL to a game written before games carried their user and TTL.
+    """
+    try:
+        gameTable.update_item(
+            Key={"game_id": game["game_id"]},
+            UpdateExpression="SET #expires_at = :expires_at",
+            ConditionExpression="attribute_exists(game_id) AND attribute_not_exists(#expires_at)",
+            ExpressionAttributeNames={"#expires_at": EXPIRES_AT},
+            ExpressionAttributeValues={":expires_at": _gameExpiry(game["status"], now)},
+        )
+        stats["legacy_expiring"] += 1
+    except Exception as e:
+        if _errorCode(e) != "ConditionalCheckFailedException":
+            print(e)
+            stats["errors"] += 1
+
+
+def compactGames(gameTable, userTable, historyTable, now=None, remaining_ms=None):
+    """
+    Runs one pass of the compaction job over the game table, one scan page at a time.
+
+    Args:
+        gameTable (DynamoDB.Table): The game table
+        userTable (DynamoDB.Table): The user table
+        historyTable (DynamoDB.Table): The history table
+        now (int, optional): The current epoch time in seconds. Defaults to the clock.
+        remaining_ms (callable, optional): Returns the milliseconds left to run, eg. context.get_remaining_time_in_millis
+
+    Returns:
+        dict: Counts of scanned, compacted, orphans_deleted and legacy_expiring games, conflicts and errors,
+        and whether the whole table was scanned (complete)
+    """
+    if now is None:
+        now = int(time.time())
+    # a finished game ended FINISHED_GAME_TTL before it expires
+    compact_before = now + FINISHED_GAME_TTL - COMPACT_AFTER
+    stats = {"scanned": 0, "compacted": 0, "orphans_deleted": 0, "legacy_expiring": 0, "conflicts": 0, "errors": 0, "complete": False}
+    scan_args = {"ProjectionExpression": PROJECTION, "ExpressionAttributeNames": PROJECTION_NAMES}
+    while True:
+        if remaining_ms is not None and remaining_ms() < DEADLINE_MARGIN_MS:
+            return stats
+        response = gameTable.scan(**scan_args)
+        finished = {}
+        active = {}
+        for game in response["Items"]:
+            stats["scanned"] += 1
+            if "user_id" not in game:
+                if EXPIRES_AT not in game:
+                    _expireLegacy(gameTable, game, now, stats)
+            elif game["status"] == IN_PROGRESS:
+                active.setdefault(game["user_id"], []).append(game)
+            elif int(game.get(EXPIRES_AT, 0)) <= compact_before:
+                finished.setdefault(game["user_id"], []).append(game)
+
+        for user_id in sorted(set(finished) | set(active)):
+            user = userTable.get_item(Key={"user_id": user_id}, ProjectionExpression="game_id", ConsistentRead=True).get("Item")
+            if user is None:
+                # nobody can read the games or the history of a missing user, there is nothing to keep
+                for game in active.get(user_id, []) + finished.get(user_id, []):
+                    _deleteOrphan(gameTable, game, stats)
+                continue
+            for game in active.get(user_id, []):
+                if game["game_id"] != user["game_id"]:
+                    _deleteOrphan(gameTable, game, stats)
+            if user_id in finished:
+                # oldest first, the scan returns games in the random order of their ids
+                finished[user_id].sort(key=lambda game: (int(game.get(EXPIRES_AT, 0)), game["game_id"]))
+                _compactUser(gameTable, userTable, historyTable, user_id, finished[user_id], user, stats)
+
+        if "LastEvaluatedKey" not in response:
+            stats["complete"] = True
+            return stats
+        scan_args["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+@_instrumented("compactGames")
+def handler(event, context):
+    remaining_ms = getattr(context, "get_remaining_time_in_millis", None)
+    stats = compactGames(_getTable("GAME_TABLE"), _getTable("USER_TABLE"), _getTable("HISTORY_TABLE"), remaining_ms=remaining_ms)
+    for name, value in stats.items():
+        if name != "complete":
+            _count(name, value)
+    return stats
@@ -1,9 +1,17 @@
 import json
-import boto3
 import uuid
 import os
 from enum import Enum
-from wordle_utils import _http_response, _getItem, _putItem, _getRandomItem, ResponseStatus, ApplicationStatus, IN_PROGRESS
+from wordle_runtime import _getTable
+from metrics import _instrumented, _mark
+from wordle_utils import _http_response, _gameView, _putItem, _gameExpiry, ResponseStatus, ApplicationStatus, IN_PROGRESS, EXPIRES_AT
+from item_cache import _getCachedItem, _cacheItem, _nextVersion, VERSION
+from hard_mode import Constraints, CONSTRAINTS
+from word_artifact import _getWordArtifact
+from word_shards import _getRandomWord
+from word_sequence import _nextSequenceWord, _nextTierWord
+from word_tiers import _getWordTiers, TIERS
+from single_table import _singleTable, _migrateUser, GAME, GAME_ITEM_ONLY
 
 # check is string represents an integer
 def isInt(s):
@@ -13,6 +21,7 @@ def isInt(s):
     except ValueError:
         return False
 
+@_instrumented("createGame")
 def handler(event, context):
     # Validate request and request parameters
     if "queryStringParameters" not in event or event["pathParameters"] is None or "pathParameters" not in event or event["queryStringParameters"] is None:
@@ -26,62 +35,111 @@ def handler(event, context):
     user_id = pathParams["user_id"]
     word_length = queryParams["word_length"]
     hard_mode = queryParams["hard_mode"]
+    difficulty = queryParams.get("difficulty")
     if(not isInt(word_length) or int(word_length) < 5 or int(word_length) > 8):
         return _http_response(ResponseStatus.MALFORMED_REQUEST, "Word length must be and integer between 5 and 8", ApplicationStatus.INPUT_ERROR)
     if(hard_mode != "1" and hard_mode != "0"):
         return _http_response(ResponseStatus.MALFORMED_REQUEST, "Hard mode must be 1 or 0", ApplicationStatus.INPUT_ERROR)
+    if(difficulty is not None and difficulty not in TIERS):
+        return _http_response(ResponseStatus.MALFORMED_REQUEST, "Difficulty must be one of {}".format(", ".join(TIERS)), ApplicationStatus.INPUT_ERROR)
     
-    dynamodb = boto3.resource('dynamodb')
-    userTable = dynamodb.Table(os.environ['USER_TABLE'])
-    gameTable = dynamodb.Table(os.environ['GAME_TABLE'])
-    wordTable = dynamodb.Table(os.environ['WORD_TABLE'])
+    userTable = _getTable("USER_TABLE")
+    gameTable = _getTable("GAME_TABLE")
+    wordTable = _getTable("WORD_TABLE")
 
-    # Check if user exists
-    result = _getItem(userTable, "user_id", user_id)
+    # Check if user exists. The user is rewritten below, so it is read from the table rather than the cache,
+    # with a strongly consistent read so the rewrite does not undo a recent write
+    result = _getCachedItem(userTable, "user_id", user_id, refresh=True, consistent=True)
     if not result["success"]:
         return _http_response(result["status"], result["response"], result["application_status"])
     userObject = result["response"]
+    single = _singleTable()
     
-    # Check if user already has an active game
-    result = _getItem(gameTable, "game_id", userObject["game_id"])
-    if result["success"] and result["response"]["status"] == IN_PROGRESS:
+    # Check if user already has an active game. A cached game still in progress may have ended elsewhere, so it is read again.
+    # In the single table layout the game is embedded in the user item, after migrating a user of the tables layout
+    # whose game still exists
+    if single:
+        if userObject["game_id"] and GAME not in userObject:
+            result = _migrateUser(userTable, gameTable, userObject)
+            if result["success"]:
+                userObject = result["response"]
+            elif result["application_status"] != ApplicationStatus.INPUT_ERROR:
+                return _http_response(result["status"], result["response"], result["application_status"])
+        active = userObject.get(GAME, {}).get("status") == IN_PROGRESS
+    else:
+        result = _getCachedItem(gameTable, "game_id", userObject["game_id"], expect=lambda game: game["status"] != IN_PROGRESS, attributes=["status"])
+        active = result["success"] and result["response"]["status"] == IN_PROGRESS
+    if active:
         return _http_response(ResponseStatus.NOT_AUTHORISED, "User already has an active game, cannot create a new game", ApplicationStatus.NOT_AUTHORISED)
 
 
+    _mark("read")
+
     # Generate game id
     game_id = str(uuid.uuid4())
     
-    # Get random word
-    result = _getRandomItem(wordTable, "word_length", int(word_length))
-    if not result["success"]:
-        return _http_response(result["status"], result["response"], result["application_status"])
-    word = result["response"]["word"]
+    # Pick the next word of the user's sequence for this length, or for the difficulty tier of this length,
+    # which advances the counter kept in the user item written below. Without the dictionary artifact, a random
+    # word is read from the table, and without the tier index the difficulty is ignored
+    artifact = _getWordArtifact()
+    tiers = _getWordTiers() if difficulty is not None else None
+    if tiers is None or artifact is None or tiers.count(int(word_length), difficulty) == 0:
+        difficulty = None
+    if difficulty is not None:
+        word = _nextTierWord(artifact, tiers, userObject, int(word_length), difficulty)
+    elif artifact is not None and artifact.count(int(word_length)) > 0:
+        word = _nextSequenceWord(artifact, userObject, int(word_length))
+    else:
+        result = _getRandomWord(wordTable, int(word_length))
+        if not result["success"]:
+            return _http_response(result["status"], result["response"], result["application_status"])
+        word = result["response"]["word"]
+    _mark("pick_word")
     
     # Create game object
     attempts_left = int(word_length)+1
     gameObject = {
         "game_id": game_id,
+        "user_id": user_id,
         "hard_mode": hard_mode,
         "attempts_left": str(attempts_left),
         "word_length": word_length,
         "word": word,
         "status": IN_PROGRESS,
         "guesses": [],
-        "responses": []
+        "responses": [],
+        EXPIRES_AT: _gameExpiry(IN_PROGRESS),
+        VERSION: 1
     }
 
-    # Update user object and write to DB
+    # The difficulty the word was picked for is kept with the game and returned with it
+    if difficulty is not None:
+        gameObject["difficulty"] = difficulty
+
+    # Hard mode games track the constraints revealed by their responses, starting with none
+    if hard_mode == "1":
+        gameObject[CONSTRAINTS] = Constraints.empty(int(word_length)).encode()
+
+    # Update user object and write to DB. In the single table layout the new game replaces the finished one
+    # in the user item, already added to the history when it ended, and this is the only write
     userObject["game_id"] = game_id
+    userObject[VERSION] = _nextVersion(userObject)
+    if single:
+        userObject[GAME] = dict((name, value) for name, value in gameObject.items() if name not in GAME_ITEM_ONLY)
     result = _putItem(userTable, userObject)
     # return _http_response(result["response_code"])
     if not result["success"]:
         return _http_response(result["status"], result["response"], result["application_status"])
+    _cacheItem(userTable, "user_id", userObject)
     
 
     # Write game object to DB
-    result = _putItem(gameTable, gameObject)
-    if not result["success"]:
-        return _http_response(result["status"], result["response"], result["application_status"])
+    if not single:
+        result = _putItem(gameTable, gameObject)
+        if not result["success"]:
+            return _http_response(result["status"], result["response"], result["application_status"])
+        _cacheItem(gameTable, "game_id", gameObject)
+    _mark("write")
 
     # Return game object
-    return _http_response(ResponseStatus.CREATED, result["response"], result["application_status"])
\ No newline at end of file
+    return _http_response(ResponseStatus.CREATED, _gameView(gameObject), result["application_status"])
\ No newline at end of file
@@ -1,23 +1,27 @@
 import json
-import boto3
 import uuid
 import os
-from wordle_utils import _http_response, _putItem, ResponseStatus, ApplicationStatus
+from wordle_runtime import _getTable
+from metrics import _instrumented
+from wordle_utils import _http_response, _userView, _putItem, ResponseStatus, ApplicationStatus
+from item_cache import _cacheItem, VERSION
 
 
+@_instrumented("createUser")
 def handler(event, context):
         
-        dynamodb = boto3.resource('dynamodb')
-        userTable = dynamodb.Table(os.environ['USER_TABLE'])
+        userTable = _getTable("USER_TABLE")
         
         user_id = str(uuid.uuid4())
         new_item = {
             "user_id": user_id,
-            "game_id": ""
+            "game_id": "",
+            VERSION: 1
         }
 
         reply = _putItem(userTable, new_item)
         if not reply["success"]:
             return _http_response( reply["status"], reply["response"], reply["application_status"])
+        _cacheItem(userTable, "user_id", new_item)
         
-        return _http_response(ResponseStatus.CREATED, reply["response"], reply["application_status"])
\ No newline at end of file
+        return _http_response(ResponseStatus.CREATED, _userView(new_item), reply["application_status"])
\ No newline at end of file
@@ -1,9 +1,13 @@
 import json
-import boto3
 import os
 from enum import Enum
-from wordle_utils import _http_response, _getItem, _putItem, _deleteItem, ResponseStatus, ApplicationStatus
+from wordle_runtime import _getTable
+from metrics import _instrumented
+from wordle_utils import _http_response, _putItem, _deleteItem, ResponseStatus, ApplicationStatus
+from item_cache import _getCachedItem, _cacheItem, _evictItem, _nextVersion, VERSION
+from single_table import _singleTable, GAME
 
+@_instrumented("deleteGame")
 def handler(event, context):
     
     # Validate request and request parameters
@@ -14,15 +18,15 @@ def handler(event, context):
     if "user_id" not in pathParams or "game_id" not in pathParams:
         return _http_response(ResponseStatus.MALFORMED_REQUEST, "Missing required URL parameters", ApplicationStatus.MISSING_PARAMETERS)
     
-    dynamoClient = boto3.resource("dynamodb")
-    userTable = dynamoClient.Table(os.environ["USER_TABLE"])
-    gameTable = dynamoClient.Table(os.environ["GAME_TABLE"])
+    userTable = _getTable("USER_TABLE")
+    gameTable = _getTable("GAME_TABLE")
 
     game_id = pathParams["game_id"]
     user_id = pathParams["user_id"]
 
-    # Check if user exists
-    reply = _getItem(userTable, "user_id", user_id)
+    # Check if user exists. The user is rewritten below, so it is read from the table rather than the cache,
+    # with a strongly consistent read so the rewrite does not undo a recent write
+    reply = _getCachedItem(userTable, "user_id", user_id, refresh=True, consistent=True)
     if not reply["success"]:
         return _http_response(reply["status"],reply["response"], reply["application_status"])
     
@@ -32,16 +36,22 @@ def handler(event, context):
     if(user_game_id!=game_id):
         return _http_response(ResponseStatus.NOT_AUTHORISED, "This user is not allowed to access this game", ApplicationStatus.NOT_AUTHORISED)
 
-    # delete game
-    reply = _deleteItem(gameTable, "game_id", game_id)
-    if not reply["success"]:
-        return _http_response(reply["status"],reply["response"], reply["application_status"])
+    # delete game. In the single table layout it is removed from the user item by the update below,
+    # unless the user was not migrated yet and still points to the game table
+    if not _singleTable() or GAME not in user:
+        reply = _deleteItem(gameTable, "game_id", game_id)
+        if not reply["success"]:
+            return _http_response(reply["status"],reply["response"], reply["application_status"])
+        _evictItem(gameTable, game_id)
 
     # update user
+    user.pop(GAME, None)
     user["game_id"] = ""
+    user[VERSION] = _nextVersion(user)
     reply = _putItem(userTable, user)
     if not reply["success"]:
         return _http_response(reply["status"],reply["response"], reply["application_status"])
+    _cacheItem(userTable, "user_id", user)
     
     # return success
     return _http_response(ResponseStatus.OK, "Game deleted successfully",ApplicationStatus.OK)
\ No newline at end of file
@@ -0,0 +1,314 @@
+import argparse
+import hashlib
+import json
+import os
+import random
+import struct
+import sys
+import time
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from wordle_utils import _errorCode, WON, LOST, IN_PROGRESS
+from single_table import GAME
+
+# Global per-word difficulty statistics, folded from finished-game events.
+#
+# Events come in micro-batches, from the stream of the game table (a game going from IN_PROGRESS
+# to WON or LOST), of the user table in the single table layout, or from a JSONL replay file.
+# A DifficultyAggregator sums the events of a batch per word in memory and flushes the sums
+# as ADD updates, TRANSACTION_LIMIT words per TransactWriteItems call, so the writes of a flush
+# depend on the number of distinct words in the batch, not on the number of events behind them.
+# Every word has SHARDS counter items in the difficulty table (partition key word, sort key shard)
+# and a flush writes to a single shard, so concurrent aggregators rarely update the same items.
+#
+# The transactions of one flush are not atomic together, and a stream batch that fails part way is
+# redelivered whole by the event source mapping. So every transaction of a stream batch carries a
+# ClientRequestToken derived from the sequence numbers of the batch and the index of the transaction,
+# and its shard is derived from that token: a redelivered batch repeats the same requests, and DynamoDB
+# does not apply again the ones that already committed. Batches without sequence numbers (replays) write
+# to random shards without a token.
+#
+# _buildDifficultyTable sums the shards into a DifficultyTable, one byte per word ordinal of the dictionary
+# artifact, which is what createGame can load.
+SHARD = "shard"
+PLAYED = "played"
+WINS = "wins"
+GUESSES = "guesses"
+SHARDS = int(os.environ.get("DIFFICULTY_SHARDS", "8"))
+# Items per TransactWriteItems call
+TRANSACTION_LIMIT = 100
+FLUSH_ATTEMPTS = 3
+# Seconds before retrying a conflicting transaction, doubled on every attempt
+CONFLICT_BACKOFF = 0.05
+FINISHED = (WON, LOST)
+
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+
+def _gameEvent(record):
+    """
+    Returns the finished-game event of a DynamoDB stream record of the game table, or of the user table
+    in the single table layout where the game is embedded in the user item under "game", or None if the
+    record is not a game ending. JSONL replay lines that are already events are returned as they are.
+
+    Returns:
+        dict: {"word", "status", "guesses"} or None
+    """
+    if "eventName" not in record:
+        return record if record.get("status") in FINISHED else None
+    if record["eventName"] != "MODIFY":
+        return None
+    old = record["dynamodb"].get("OldImage", {})
+    new = record["dynamodb"].get("NewImage", {})
+    if GAME in new:
+        # a new game replacing a finished one is not a game ending
+        new = new[GAME]["M"]
+        old = old.get(GAME, {}).get("M", {})
+        if old.get("game_id") != new.get("game_id"):
+            return None
+    status = new.get("status", {}).get("S")
+    if old.get("status", {}).get("S") != IN_PROGRESS or status not in FINISHED:
+        return None
+    word_length = int(_deserializer.deserialize(new["word_length"]))
+    attempts_left = int(_deserializer.deserialize(new["attempts_left"]))
+    return {"word": new["word"]["S"], "status": status, "guesses": word_length + 1 - attempts_left}
+
+
+class DifficultyAggregator:
+    """
+    Sums finished-game events per word and flushes the sums into the difficulty table.
+
+    Args:
+        table (DynamoDB.Table): The DynamoDB difficulty table object
+        shards (int): The number of counter items per word
+        rng (random.Random): Picks the shard of the flushes of batches without a token
+    """
+
+    def __init__(self, table, shards=SHARDS, rng=None):
+        self.table = table
+        self.shards = shards
+        self.rng = rng or random.Random()
+        self.pending = {}
+        self.stats = {"events": 0, "ignored": 0, "flushes": 0, "transactions": 0, "words_written": 0, "conflicts": 0}
+
+    def add(self, event):
+        if event is None:
+            self.stats["ignored"] += 1
+            return
+        counters = self.pending.get(event["word"])
+        if counters is None:
+            counters = self.pending[event["word"]] = [0, 0, 0]
+        counters[0] += 1
+        if event["status"] == WON:
+            counters[1] += 1
+            counters[2] += int(event["guesses"])
+        self.stats["events"] += 1
+
+    def fold(self, records):
+        """
+        Adds a micro-batch of stream records or events and flushes it.
+        """
+        for record in records:
+            self.add(_gameEvent(record))
+        self.flush(_batchToken(records))
+        return self.stats
+
+    def flush(self, token=None):
+        """
+        Writes the pending sums, TRANSACTION_LIMIT words per TransactWriteItems call.
+
+        Args:
+            token (str, optional): Identifies the batch, see _batchToken. Makes every call idempotent
+        """
+        words = sorted(self.pending)
+        for index, start in enumerate(range(0, len(words), TRANSACTION_LIMIT)):
+            request_token = _chunkToken(token, index) if token is not None else None
+            self._write(words[start:start + TRANSACTION_LIMIT], request_token)
+        if words:
+            self.stats["flushes"] += 1
+            self.stats["words_written"] += len(words)
+        self.pending = {}
+
+    def _write(self, words, token=None):
+        """
+        Adds the sums of the given words to one shard in a single transaction. With a token, the shard
+        is derived from it and a conflict with a concurrent flush is retried with the same request, so
+        the token still matches it. Without one, the shard is random and a conflict is retried on another.
+        """
+        client = self.table.meta.client
+        for attempt in range(FLUSH_ATTEMPTS):
+            shard = int(token, 16) % self.shards if token is not None else self.rng.randrange(self.shards)
+            actions = []
+            for word in words:
+                played, wins, guesses = self.pending[word]
+                actions.append({"Update": {
+                    "TableName": self.table.table_name,
+                    "Key": {"word": {"S": word}, SHARD: _serializer.serialize(shard)},
+                    "UpdateExpression": "ADD #played :played, #wins :wins, #guesses :guesses",
+                    "ExpressionAttributeNames": {"#played": PLAYED, "#wins": WINS, "#guesses": GUESSES},
+                    "ExpressionAttributeValues": {":played": _serializer.serialize(played),
+                                                  ":wins": _serializer.serialize(wins),
+                                                  ":guesses": _serializer.serialize(guesses)},
+                }})
+            kwargs = {"ClientRequestToken": token} if token is not None else {}
+            try:
+                client.transact_write_items(TransactItems=actions, **kwargs)
+                self.stats["transactions"] += 1
+                return
+            except Exception as e:
+                if _errorCode(e) != "TransactionCanceledException" or attempt == FLUSH_ATTEMPTS - 1:
+                    raise
+                self.stats["conflicts"] += 1
+                if token is not None:
+                    time.sleep(CONFLICT_BACKOFF * 2 ** attempt)
+
+
+def _batchToken(records):
+    """
+    Returns a digest of the stream sequence numbers of a batch of records, the same every time the
+    batch is delivered, or None if some record has none (eg. replayed events).
+    """
+    sequence_numbers = [record.get("dynamodb", {}).get("SequenceNumber") for record in records]
+    if not sequence_numbers or None in sequence_numbers:
+        return None
+    return hashlib.sha256(",".join(sequence_numbers).encode()).hexdigest()
+
+
+def _chunkToken(token, index):
+    """
+    Returns the ClientRequestToken of the index-th transaction of a batch, 32 hex digits
+    (DynamoDB accepts up to 36 characters).
+    """
+    return hashlib.sha256("{}:{}".format(token, index).encode()).hexdigest()[:32]
+
+
+class DifficultyTable:
+    """
+    Compact difficulty of every word, one byte per ordinal of the dictionary artifact:
+    0 when the word was never played, otherwise 1 (always guessed first) to 255 (never guessed),
+    scaling the mean number of guesses of the word, a loss counting as word_length + 2 guesses.
+
+    Args:
+        scores (dict): Word length -> bytes, indexed by ordinal
+    """
+    MAGIC = b"WDIF"
+    HEADER = struct.Struct("<4sH")
+    SECTION = struct.Struct("<BI")
+
+    def __init__(self, scores):
+        self.scores = scores
+
+    def score(self, word_length, ordinal):
+        return self.scores[word_length][ordinal]
+
+    def encode(self):
+        parts = [self.HEADER.pack(self.MAGIC, len(self.scores))]
+        for word_length in sorted(self.scores):
+            parts.append(self.SECTION.pack(word_length, len(self.scores[word_length])))
+            parts.append(bytes(self.scores[word_length]))
+        return b"".join(parts)
+
+    @classmethod
+    def decode(cls, data):
+        magic, lengths = cls.HEADER.unpack_from(data, 0)
+        if magic != cls.MAGIC:
+            raise ValueError("Not a difficulty table")
+        offset = cls.HEADER.size
+        scores = {}
+        for _ in range(lengths):
+            word_length, count = cls.SECTION.unpack_from(data, offset)
+            offset += cls.SECTION.size
+            scores[word_length] = bytes(data[offset:offset + count])
+            offset += count
+        return cls(scores)
+
+
+def _difficultyScore(word_length, played, wins, guesses):
+    if played == 0:
+        return 0
+    mean = float(guesses + (played - wins) * (word_length + 2)) / played
+    return 1 + int(round((mean - 1) / (word_length + 1) * 254))
+
+
+def _buildDifficultyTable(items, artifact):
+    """
+    Sums the shards of the difficulty table into a DifficultyTable over the words of the artifact.
+    Words that are not in the artifact any more are left out.
+
+    Args:
+        items (iterable): The items of the difficulty table
+        artifact (WordArtifact): The dictionary artifact
+
+    Returns:
+        DifficultyTable: The difficulty of every word of the artifact
+    """
+    totals = {}
+    for item in items:
+        counters = totals.setdefault(item["word"], [0, 0, 0])
+        counters[0] += int(item.get(PLAYED, 0))
+        counters[1] += int(item.get(WINS, 0))
+        counters[2] += int(item.get(GUESSES, 0))
+    scores = dict((word_length, bytearray(artifact.count(word_length))) for word_length in artifact.lengths())
+    for word, (played, wins, guesses) in totals.items():
+        ordinal = artifact.ordinal(word)
+        if ordinal is not None:
+            scores[len(word)][ordinal] = _difficultyScore(len(word), played, wins, guesses)
+    return DifficultyTable(dict((word_length, bytes(score)) for word_length, score in scores.items()))
+
+
+def _scanItems(table):
+    kwargs = {}
+    while True:
+        response = table.scan(**kwargs)
+        for item in response["Items"]:
+            yield item
+        if "LastEvaluatedKey" not in response:
+            return
+        kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def _replay(aggregator, lines, batch_size):
+    """
+    Folds a JSONL replay, one event or stream record per line, in micro-batches of batch_size lines.
+    """
+    batch = []
+    for line in lines:
+        if line.strip():
+            batch.append(json.loads(line))
+        if len(batch) >= batch_size:
+            aggregator.fold(batch)
+            batch = []
+    aggregator.fold(batch)
+    return aggregator.stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Aggregate finished games into the word difficulty table.")
+    parser.add_argument("command", choices=["replay", "build"], help="replay a JSONL file of events, or build the compact table")
+    parser.add_argument("path", help="replay: the JSONL file, - for stdin. build: the output file, eg. lambda/difficulty.bin")
+    parser.add_argument("--table", default=os.environ.get("DIFFICULTY_TABLE"), help="difficulty table name, defaults to $DIFFICULTY_TABLE")
+    parser.add_argument("--endpoint-url", help="DynamoDB endpoint, eg. http://localhost:8000 for DynamoDB Local")
+    parser.add_argument("--region", default=os.environ.get("REGION", "us-east-1"))
+    parser.add_argument("--batch-size", type=int, default=100000, help="events per micro-batch")
+    args = parser.parse_args()
+
+    import boto3
+    from wordle_runtime import DYNAMODB_CONFIG
+    resource = boto3.resource("dynamodb", region_name=args.region, endpoint_url=args.endpoint_url, config=DYNAMODB_CONFIG)
+    table = resource.Table(args.table)
+    if args.command == "replay":
+        start = time.monotonic()
+        lines = sys.stdin if args.path == "-" else open(args.path)
+        stats = _replay(DifficultyAggregator(table), lines, args.batch_size)
+        stats["seconds"] = round(time.monotonic() - start, 3)
+        print(json.dumps(stats))
+    else:
+        from word_artifact import WordArtifact
+        difficulty = _buildDifficultyTable(_scanItems(table), WordArtifact())
+        with open(args.path, "wb") as f:
+            f.write(difficulty.encode())
+        print(json.dumps(dict((word_length, sum(1 for score in scores if score)) for word_length, scores in difficulty.scores.items())))
+
+
+if __name__ == "__main__":
+    main()
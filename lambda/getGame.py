@@ -1,10 +1,13 @@
 import json
-import boto3
 import os
 from enum import Enum
-from wordle_utils import _http_response, _getItem, ResponseStatus, ApplicationStatus
+from wordle_runtime import _getTable
+from metrics import _instrumented
+from wordle_utils import _http_response, _gameView, ResponseStatus, ApplicationStatus
+from single_table import _getUserGame
 
 
+@_instrumented("getGame")
 def handler(event, context):
 
     # Validate request and request parameters
@@ -15,28 +18,17 @@ def handler(event, context):
     if "user_id" not in pathParams or "game_id" not in pathParams:
         return _http_response(ResponseStatus.MALFORMED_REQUEST, "Missing required URL parameters", ApplicationStatus.MISSING_PARAMETERS)
     
-    dynamoClient = boto3.resource("dynamodb")
-    userTable = dynamoClient.Table(os.environ["USER_TABLE"])
-    gameTable = dynamoClient.Table(os.environ["GAME_TABLE"])
+    userTable = _getTable("USER_TABLE")
+    gameTable = _getTable("GAME_TABLE")
 
     game_id = pathParams["game_id"]
     user_id = pathParams["user_id"]
 
-    # Check if user exists
-    reply = _getItem(userTable, "user_id", user_id)
-    if not reply["success"]:
-        return _http_response(reply["status"],reply["response"], reply["application_status"])
-    
-    # Check if user is authorised to access this game
-    user = reply["response"]
-    user_game_id = user["game_id"]
-    if(user_game_id!=game_id):
-        return _http_response(ResponseStatus.NOT_AUTHORISED, "This user is not allowed to access this game", ApplicationStatus.NOT_AUTHORISED)
-
-    # Get game
-    reply = _getItem(gameTable, "game_id", game_id)
+    # Get the game, checking that the user exists and is authorised to access it. A cached user playing
+    # another game is read again, it may have started this one elsewhere
+    reply = _getUserGame(userTable, gameTable, user_id, game_id)
     if not reply["success"]:
         return _http_response(reply["status"],reply["response"], reply["application_status"])
     
     # Return game
-    return _http_response(ResponseStatus.OK, reply["response"], reply["application_status"])
\ No newline at end of file
+    return _http_response(ResponseStatus.OK, _gameView(reply["response"]), reply["application_status"], event=event)
\ No newline at end of file
@@ -0,0 +1,48 @@
+from wordle_runtime import _getTable
+from metrics import _instrumented, _mark
+from wordle_utils import _http_response, ResponseStatus, ApplicationStatus
+from single_table import _getUserGame
+from candidate_index import _getCandidateIndex, MAX_SAMPLE
+
+
+@_instrumented("getHint")
+def handler(event, context):
+
+    # Validate request and request parameters
+    if "pathParameters" not in event or event["pathParameters"] is None:
+        return _http_response(ResponseStatus.MALFORMED_REQUEST, "Missing URL parameters", ApplicationStatus.MISSING_PARAMETERS)
+
+    pathParams = event["pathParameters"]
+    if "user_id" not in pathParams or "game_id" not in pathParams:
+        return _http_response(ResponseStatus.MALFORMED_REQUEST, "Missing required URL parameters", ApplicationStatus.MISSING_PARAMETERS)
+
+    # Optional number of remaining words to return along with the count
+    queryParams = event.get("queryStringParameters") or {}
+    sample = queryParams.get("sample", "0")
+    if not sample.isdigit() or int(sample) > MAX_SAMPLE:
+        return _http_response(ResponseStatus.MALFORMED_REQUEST, "Sample must be an integer between 0 and {}".format(MAX_SAMPLE), ApplicationStatus.INPUT_ERROR)
+
+    userTable = _getTable("USER_TABLE")
+    gameTable = _getTable("GAME_TABLE")
+    wordTable = _getTable("WORD_TABLE")
+
+    game_id = pathParams["game_id"]
+    user_id = pathParams["user_id"]
+
+    # Get the responses of the game, checking that the user is authorised to access it
+    reply = _getUserGame(userTable, gameTable, user_id, game_id, attributes=["word_length", "guesses", "responses"])
+    if not reply["success"]:
+        return _http_response(reply["status"],reply["response"], reply["application_status"])
+    game = reply["response"]
+    _mark("read")
+
+    # Filter the dictionary with the responses of the game
+    index = _getCandidateIndex(wordTable, int(game["word_length"]))
+    remaining = index.filter(game["guesses"], game["responses"])
+    hint = {"game_id": game_id, "remaining": index.cardinality(remaining)}
+    if int(sample) > 0:
+        hint["sample"] = index.sample(remaining, int(sample))
+    _mark("filter")
+
+    # Return hint
+    return _http_response(ResponseStatus.OK, hint, ApplicationStatus.OK, event=event)
@@ -0,0 +1,27 @@
+from wordle_runtime import _getTable
+from metrics import _instrumented
+from wordle_utils import _http_response, ResponseStatus, ApplicationStatus
+from history import _getHistory
+
+
+@_instrumented("getHistory")
+def handler(event, context):
+
+    # Validate request and request parameters
+    if "pathParameters" not in event or event["pathParameters"] is None:
+        return _http_response(ResponseStatus.MALFORMED_REQUEST, "Missing URL parameters", ApplicationStatus.MISSING_PARAMETERS)
+
+    pathParams = event["pathParameters"]
+    if "user_id" not in pathParams:
+        return _http_response(ResponseStatus.MALFORMED_REQUEST, "Missing required URL parameters", ApplicationStatus.MISSING_PARAMETERS)
+
+    historyTable = _getTable("HISTORY_TABLE")
+
+    # The compacted games of the user, in the order they were compacted. Games finished
+    # since the last compaction are still in the game table and not listed yet.
+    reply = _getHistory(historyTable, pathParams["user_id"])
+    if not reply["success"]:
+        return _http_response(reply["status"], reply["response"], reply["application_status"])
+
+    # Return history
+    return _http_response(ResponseStatus.OK, reply["response"], reply["application_status"], event=event)
@@ -1,11 +1,14 @@
 import json
-import boto3
 import os
 from enum import Enum
 from urllib.parse import urljoin
-from wordle_utils import _http_response, _getItem, ResponseStatus, ApplicationStatus
+from wordle_runtime import _getTable
+from metrics import _instrumented
+from wordle_utils import _http_response, ResponseStatus, ApplicationStatus
+from single_table import _getUserGame
 
 
+@_instrumented("getHome")
 def handler(event, context):
 
     # If no query parameters are provided, return the home page
@@ -16,26 +19,15 @@ def handler(event, context):
     if "user_id" not in queryParams or "game_id" not in queryParams:
         return _http_response(ResponseStatus.OK, "Successfully retrieved home page", ApplicationStatus.OK)
     
-    dynamoClient = boto3.resource("dynamodb")
-    userTable = dynamoClient.Table(os.environ["USER_TABLE"])
-    gameTable = dynamoClient.Table(os.environ["GAME_TABLE"])
+    userTable = _getTable("USER_TABLE")
+    gameTable = _getTable("GAME_TABLE")
 
     game_id = queryParams["game_id"]
     user_id = queryParams["user_id"]
 
-    # Check if user exists
-    reply = _getItem(userTable, "user_id", user_id)
-    if not reply["success"]:
-        return _http_response(reply["status"],reply["response"], reply["application_status"])
-    
-    # Check if user is allowed to access this game
-    user = reply["response"]
-    user_game_id = user["game_id"]
-    if(user_game_id!=game_id):
-        return _http_response(ResponseStatus.NOT_AUTHORISED, "This user is not allowed to access this game", ApplicationStatus.NOT_AUTHORISED)
-
-    # Check if game exists
-    reply = _getItem(gameTable, "game_id", game_id)
+    # Check that the user exists, is allowed to access this game and that the game exists.
+    # A cached user playing another game is read again, it may have started this one elsewhere
+    reply = _getUserGame(userTable, gameTable, user_id, game_id, attributes=["game_id"])
     if not reply["success"]:
         return _http_response(reply["status"],reply["response"], reply["application_status"])
     
@@ -0,0 +1,26 @@
+from wordle_runtime import _getTable
+from metrics import _instrumented
+from wordle_utils import _http_response, ResponseStatus, ApplicationStatus
+from user_stats import _getStats
+
+
+@_instrumented("getStats")
+def handler(event, context):
+
+    # Validate request and request parameters
+    if "pathParameters" not in event or event["pathParameters"] is None:
+        return _http_response(ResponseStatus.MALFORMED_REQUEST, "Missing URL parameters", ApplicationStatus.MISSING_PARAMETERS)
+
+    pathParams = event["pathParameters"]
+    if "user_id" not in pathParams:
+        return _http_response(ResponseStatus.MALFORMED_REQUEST, "Missing required URL parameters", ApplicationStatus.MISSING_PARAMETERS)
+
+    historyTable = _getTable("HISTORY_TABLE")
+
+    # The counters are maintained by guess, so this is a single GetItem however many games the user played
+    reply = _getStats(historyTable, pathParams["user_id"])
+    if not reply["success"]:
+        return _http_response(reply["status"], reply["response"], reply["application_status"])
+
+    # Return statistics
+    return _http_response(ResponseStatus.OK, reply["response"], reply["application_status"], event=event)
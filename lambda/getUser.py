@@ -1,10 +1,13 @@
 import json
-import boto3
 import os
 from enum import Enum
-from wordle_utils import _http_response, _getItem, ResponseStatus, ApplicationStatus
+from wordle_runtime import _getTable
+from metrics import _instrumented
+from wordle_utils import _http_response, _userView, ResponseStatus, ApplicationStatus
+from item_cache import _getCachedItem
 
 
+@_instrumented("getUser")
 def handler(event, context):
     
     # validate request and request parameters
@@ -15,15 +18,14 @@ def handler(event, context):
     if "user_id" not in pathParams:
         return _http_response(ResponseStatus.MALFORMED_REQUEST, "Missing required URL parameters", ApplicationStatus.MISSING_PARAMETERS)
     
-    dynamoClient = boto3.resource("dynamodb")
-    userTable = dynamoClient.Table(os.environ["USER_TABLE"])
+    userTable = _getTable("USER_TABLE")
 
     user_id = event["pathParameters"]["user_id"]
 
     # Check if user exists
-    reply = _getItem(userTable, "user_id", user_id)
+    reply = _getCachedItem(userTable, "user_id", user_id)
     if not reply["success"]:
         return _http_response(reply["status"],reply["response"], reply["application_status"])
 
     # Return user
-    return _http_response(ResponseStatus.OK, reply["response"], reply["application_status"])
\ No newline at end of file
+    return _http_response(ResponseStatus.OK, _userView(reply["response"]), reply["application_status"], event=event)
\ No newline at end of file
@@ -1,26 +1,32 @@
 import json
-import boto3
 import os
-from ast import literal_eval
 from enum import Enum, EnumMeta
-from wordle_utils import _http_response, _getItem, _putItem, ResponseStatus, ApplicationStatus, GREEN, GREY, YELLOW, IN_PROGRESS, WON, LOST
+from wordle_runtime import _getTable
+from metrics import _instrumented, _mark
+from wordle_utils import _http_response, _updateItem, _encodeResponse, _gameView, _gameExpiry, ResponseStatus, ApplicationStatus, GREEN, GREY, YELLOW, IN_PROGRESS, WON, LOST, EXPIRES_AT
+from word_index import _isDictionaryWord
+from item_cache import _nextVersion, VERSION
+from user_stats import _resultUpdate, _recordGameResult, _recordMaxStreak
+from hard_mode import _gameConstraints, CONSTRAINTS
+from history import _packGameItem
+from single_table import _getUserGame, _cacheUserGame, _endUserGame, GAME
 
 
-def valid(wordTable, word, word_length, hard_mode, guesses, responses):
+def valid(wordTable, word, word_length, hard_mode, constraints=None):
     """
     Verifies that the following properties are true:
     1. Word is of the right length
     2. Word contains only alphabets
     3. Word is present in the Wordle Dictionary
-    4. If hard mode is enabled, the guess contains all the correct letters in the right position from the previous guess
+    4. If hard mode is enabled, the guess satisfies every constraint revealed by the previous responses:
+    green letters at their position, yellow letters at least as many times as found, and no letter more times than allowed
 
     Args:
         wordTable (DynamoDB.Table): The DynamoDB table object
         word (str): The guess word to be validated
         word_length (int): The length of the word
         hard_mode (str): The hard mode flag
-        guesses (list): The list of guesses made so far. eg. ["quest", "hello"]
-        responses (list): The list of responses for the guesses made so far. eg. ["['GREEN', 'GREY', 'GREEN', 'YELLOW', 'GREEN']", "['GREY', 'GREY', 'GREY', 'YELLOW', 'GREEN']"]
+        constraints (Constraints, optional): The hard mode constraints of the game, see hard_mode.py. Required in hard mode.
     
     Returns:
         dict: A dictionary object containing a success flag and a message
@@ -32,17 +38,13 @@ def valid(wordTable, word, word_length, hard_mode, guesses, responses):
         if not c.isalpha():
             return {"success": False, "message": "Invalid input character"}
     
-    reply = _getItem(wordTable, "word_length", int(word_length), "word", word)
-    if not reply["success"]:
+    if not _isDictionaryWord(wordTable, word):
         return {"success": False, "message": "Word not found in Wordle Dictionary"}
     
-    if hard_mode=="1" and len(guesses)>0:
-        response = literal_eval(responses[-1]) # Convert string to list ["GREEN", "YELLOW", ..]
-        guess = guesses[-1] # "quest"
-        for idx in range(len(word)):
-            print(response[idx], " ", word[idx], " ", guess[idx])
-            if response[idx]==GREEN and word[idx]!=guess[idx]:
-                return {"success":False, "message": "Correct letters not included in the guess under hard mode."}
+    if hard_mode=="1":
+        message = constraints.check(word)
+        if message is not None:
+            return {"success":False, "message": message}
     
     return {"success": True}
 
@@ -84,6 +86,100 @@ def getGuessResponse(guess, target):
         return res
 
 
+def applyGuesses(gameTable, game, guesses, responses, attempts_left, status, user=None, historyTable=None):
+    """
+    Appends guesses and their responses to a game with a single conditional write.
+    The write fails with a CONFLICT if the game changed since it was read.
+    It also pushes back the TTL of the game, to FINISHED_GAME_TTL once the game is over,
+    and stores the hard mode constraints updated with the new responses.
+    In the single table layout the game is embedded in the user item, which is written instead (it has no TTL).
+    A write ending that game also records it in the statistics and the history of the user, in the same
+    transaction (see single_table._endUserGame).
+
+    Args:
+        gameTable (DynamoDB.Table): The DynamoDB game table object, or the user table object in the single table layout
+        game (dict): The game item the guesses were validated against
+        guesses (list): The guesses to append, in order
+        responses (list): The responses of the guesses, as lists of colours(str)
+        attempts_left (int): The attempts left after the guesses
+        status (str): The status of the game after the guesses
+        user (dict, optional): The user item holding the game, in the single table layout. Defaults to None.
+        historyTable (DynamoDB.Table, optional): The DynamoDB history table object, in the single table layout. Defaults to HISTORY_TABLE.
+
+    Returns:
+        dict: The reply of _updateItem, with the updated game item as its response and, with user, the updated user item as "user"
+    """
+    # game attributes are nested in the GAME map of the user item in the single table layout
+    prefix = "#game." if user is not None else ""
+    update_expression = ("SET {0}#guesses = list_append({0}#guesses, :guesses), {0}#responses = list_append({0}#responses, :responses), "
+                         "{0}#attempts_left = :attempts_left, {0}#status = :status, "
+                         "#version = if_not_exists(#version, :zero) + :one").format(prefix)
+    condition_expression = "{0}#attempts_left = :read_attempts_left AND {0}#status = :in_progress".format(prefix)
+    expression_values = {
+        ":guesses": guesses,
+        ":responses": [_encodeResponse(response) for response in responses],
+        ":attempts_left": str(attempts_left),
+        ":status": status,
+        ":read_attempts_left": game["attempts_left"],
+        ":in_progress": IN_PROGRESS,
+        ":zero": 0,
+        ":one": 1,
+    }
+    expression_names = {
+        "#guesses": "guesses",
+        "#responses": "responses",
+        "#attempts_left": "attempts_left",
+        "#status": "status",
+        "#version": VERSION,
+    }
+    if user is None:
+        key = {"game_id": game["game_id"]}
+        update_expression += ", #expires_at = :expires_at"
+        expression_values[":expires_at"] = _gameExpiry(status)
+        expression_names["#expires_at"] = EXPIRES_AT
+    else:
+        key = {"user_id": user["user_id"]}
+        condition_expression += " AND #game.#game_id = :game_id"
+        expression_values[":game_id"] = game["game_id"]
+        expression_names["#game"] = GAME
+        expression_names["#game_id"] = "game_id"
+    if game["hard_mode"] == "1":
+        constraints = _gameConstraints(game)
+        for guess, response in zip(guesses, responses):
+            constraints.add(guess, response)
+        update_expression += ", {}#constraints = :constraints".format(prefix)
+        expression_values[":constraints"] = constraints.encode()
+        expression_names["#constraints"] = CONSTRAINTS
+    if user is not None and status != IN_PROGRESS:
+        # a transaction returns no item, so the written game is built from the one read
+        ended = dict(game, guesses=list(game["guesses"]) + list(guesses), responses=list(game["responses"]) + expression_values[":responses"],
+                     attempts_left=expression_values[":attempts_left"], status=status)
+        if ":constraints" in expression_values:
+            ended[CONSTRAINTS] = expression_values[":constraints"]
+        word_length = int(game["word_length"])
+        result = _resultUpdate(user["user_id"], word_length, word_length + 1 - attempts_left, status, packed=_packGameItem(ended))
+        update = {"Key": key, "UpdateExpression": update_expression, "ConditionExpression": condition_expression,
+                  "ExpressionAttributeNames": expression_names, "ExpressionAttributeValues": expression_values}
+        reply = _endUserGame(gameTable, historyTable or _getTable("HISTORY_TABLE"), update, result)
+        if reply["success"]:
+            reply["user"] = dict(user, **{GAME: ended, VERSION: _nextVersion(user)})
+            reply["response"] = ended
+        return reply
+    reply = _updateItem(
+        gameTable,
+        key,
+        update_expression,
+        expression_values,
+        condition_expression=condition_expression,
+        expression_names=expression_names,
+    )
+    if reply["success"] and user is not None:
+        reply["user"] = reply["response"]
+        reply["response"] = reply["user"][GAME]
+    return reply
+
+
+@_instrumented("guess")
 def handler(event, context):
     
     # Validate the request and request parameters
@@ -95,55 +191,72 @@ def handler(event, context):
     if "user_id" not in pathParams or "game_id" not in pathParams or "guess" not in queryParams:
         return _http_response(ResponseStatus.MALFORMED_REQUEST, "Missing required URL parameters", ApplicationStatus.MISSING_PARAMETERS)
     
-    dynamoClient = boto3.resource("dynamodb")
-    userTable = dynamoClient.Table(os.environ['USER_TABLE'])
-    gameTable = dynamoClient.Table(os.environ['GAME_TABLE'])
-    wordTable = dynamoClient.Table(os.environ['WORD_TABLE'])
+    userTable = _getTable("USER_TABLE")
+    gameTable = _getTable("GAME_TABLE")
+    wordTable = _getTable("WORD_TABLE")
 
     user_id = pathParams["user_id"]
     game_id = pathParams["game_id"]
     guess = queryParams["guess"]
     
-    # check mapping between game id and user id
-    reply = _getItem(userTable, "user_id", user_id)
-    if not reply["success"]:
-        return _http_response(reply["status"],reply["response"], reply["application_status"])
-    user = reply["response"]
-    if(user["game_id"]!=game_id):
-        return _http_response(ResponseStatus.NOT_AUTHORISED, "This user is not allowed to access this game id", ApplicationStatus.NOT_AUTHORISED)
-    
-    # check if game exists
-    reply = _getItem(gameTable, "game_id", game_id)
-    if not reply["success"]:
-        return _http_response(reply["status"],reply["response"], reply["application_status"])
-    game = reply["response"]
-
-    # check if game is over
-    attempts_left = int(game["attempts_left"])
-    if game["status"]!=IN_PROGRESS or attempts_left<=0:
-        return _http_response(ResponseStatus.MALFORMED_REQUEST, game, ApplicationStatus.GAME_OVER)
-
-    # validate guess
-    word_length = int(game["word_length"])
-    result = valid(wordTable, guess, word_length, game["hard_mode"], game["guesses"], game["responses"])
-    if not result["success"]:
-        return _http_response(ResponseStatus.MALFORMED_REQUEST, result["message"], ApplicationStatus.INPUT_ERROR)
-    
-    # Get a response for the guess and update the game
-    guessResponse = getGuessResponse(guess, game["word"])
-    attempts_left -= 1
-    if guessResponse == [GREEN for c in game["word"]]:
-        game["status"] = WON
-    elif attempts_left == 0:
-        game["status"] = LOST
-    game["guesses"].append(guess)
-    game["responses"].append(str(guessResponse))
-    game["attempts_left"]=str(attempts_left)
-    
-    # Write the updated game to the database
-    reply = _putItem(gameTable, game)
+    # A guess applied by another container fails the conditional write of a cached game,
+    # in which case the game is read again from the table, strongly consistent so the read sees that guess,
+    # and the guess retried once
+    refresh = False
+    while True:
+        # check mapping between game id and user id and read the game. A cached user playing another game
+        # is read again, it may have started this one in another container. In the single table layout
+        # the user item holds the game and is the only item read and written
+        reply = _getUserGame(userTable, gameTable, user_id, game_id, refresh=refresh)
+        if not reply["success"]:
+            return _http_response(reply["status"],reply["response"], reply["application_status"])
+        game = reply["response"]
+        user = reply.get("user")
+        cached = reply["cached"]
+        _mark("read_game")
+
+        # check if game is over
+        attempts_left = int(game["attempts_left"])
+        if game["status"]!=IN_PROGRESS or attempts_left<=0:
+            return _http_response(ResponseStatus.MALFORMED_REQUEST, _gameView(game), ApplicationStatus.GAME_OVER)
+
+        # validate guess
+        word_length = int(game["word_length"])
+        constraints = _gameConstraints(game) if game["hard_mode"]=="1" else None
+        result = valid(wordTable, guess, word_length, game["hard_mode"], constraints)
+        if not result["success"]:
+            return _http_response(ResponseStatus.MALFORMED_REQUEST, result["message"], ApplicationStatus.INPUT_ERROR)
+        
+        # Get a response for the guess and the next state of the game
+        guessResponse = getGuessResponse(guess, game["word"])
+        status = IN_PROGRESS
+        attempts_left -= 1
+        if guessResponse == [GREEN for c in game["word"]]:
+            status = WON
+        elif attempts_left == 0:
+            status = LOST
+        _mark("validate")
+
+        # Apply the guess in a single conditional write. The condition fails if another guess
+        # was applied since the game was read, so rapid double submits cannot overwrite each other.
+        reply = applyGuesses(gameTable if user is None else userTable, game, [guess], [guessResponse], attempts_left, status, user=user)
+        _mark("write")
+        if not reply["success"] and reply["status"] == ResponseStatus.CONFLICT and cached:
+            refresh = True
+            continue
+        break
     if not reply["success"]:
         return _http_response(reply["status"], reply["response"], reply["application_status"])
+    _cacheUserGame(userTable, gameTable, reply)
+
+    # A guess ending the game adds it to the statistics of the user. The game is already saved, so a failure here
+    # is only logged. In the single table layout the transaction ending the game recorded it, but for a longer streak
+    if status != IN_PROGRESS:
+        if user is None:
+            _recordGameResult(_getTable("HISTORY_TABLE"), user_id, word_length, word_length + 1 - attempts_left, status)
+        elif status == WON:
+            _recordMaxStreak(_getTable("HISTORY_TABLE"), user_id)
+        _mark("stats")
     
     # Return the updated game
-    return _http_response(ResponseStatus.CREATED, reply["response"], reply["application_status"])
+    return _http_response(ResponseStatus.CREATED, _gameView(reply["response"]), reply["application_status"], event=event)
@@ -0,0 +1,145 @@
+import json
+from wordle_runtime import _getTable
+from metrics import _instrumented, _mark, _count
+from wordle_utils import _http_response, _requestBody, _gameView, ResponseStatus, ApplicationStatus, GREEN, IN_PROGRESS, WON, LOST
+from guess import valid, getGuessResponse, applyGuesses
+from user_stats import _recordGameResult, _recordMaxStreak
+from hard_mode import _gameConstraints
+from single_table import _getUserGame, _cacheUserGame
+
+# Upper bound on the guesses of one request, a game never takes more than 9 valid ones
+MAX_BATCH_GUESSES = 20
+
+
+def parseGuesses(event):
+    """
+    Reads the ordered list of guesses from a request body of the form {"guesses": ["crane", "slate"]}
+
+    Args:
+        event (dict): The API Gateway event
+
+    Returns:
+        list: The guesses, or None if the body is missing or malformed
+    """
+    try:
+        body = _requestBody(event)
+        if body is None:
+            return None
+        guesses = json.loads(body).get("guesses")
+    except (ValueError, AttributeError) as e:
+        print(e)
+        return None
+    if not isinstance(guesses, list) or not all(isinstance(guess, str) for guess in guesses):
+        return None
+    return guesses
+
+
+def scoreGuesses(wordTable, game, guesses):
+    """
+    Validates and scores guesses in order against a game, as if they had been submitted one by one.
+    Invalid guesses are reported and skipped, and guesses after the game is WON or LOST are not applied.
+
+    Args:
+        wordTable (DynamoDB.Table): The DynamoDB table object
+        game (dict): The game item
+        guesses (list): The guesses in submission order
+
+    Returns:
+        tuple: (applied guesses, their responses, attempts left, status, per guess results)
+    """
+    word_length = int(game["word_length"])
+    attempts_left = int(game["attempts_left"])
+    status = game["status"]
+    constraints = _gameConstraints(game) if game["hard_mode"] == "1" else None
+    applied = []
+    responses = []
+    results = []
+    for guess in guesses:
+        if status != IN_PROGRESS or attempts_left <= 0:
+            results.append({"guess": guess, "status": ApplicationStatus.GAME_OVER.name})
+            continue
+        result = valid(wordTable, guess, word_length, game["hard_mode"], constraints)
+        if not result["success"]:
+            results.append({"guess": guess, "status": ApplicationStatus.INPUT_ERROR.name, "message": result["message"]})
+            continue
+        guessResponse = getGuessResponse(guess, game["word"])
+        attempts_left -= 1
+        if guessResponse == [GREEN for c in game["word"]]:
+            status = WON
+        elif attempts_left == 0:
+            status = LOST
+        applied.append(guess)
+        responses.append(guessResponse)
+        if constraints is not None:
+            constraints.add(guess, guessResponse)
+        results.append({"guess": guess, "status": ApplicationStatus.OK.name, "response": str(guessResponse)})
+    return applied, responses, attempts_left, status, results
+
+
+@_instrumented("guessBatch")
+def handler(event, context):
+
+    # Validate the request and request parameters
+    if "pathParameters" not in event or event["pathParameters"] is None:
+        return _http_response(ResponseStatus.MALFORMED_REQUEST, "Missing URL parameters", ApplicationStatus.MISSING_PARAMETERS)
+
+    pathParams = event["pathParameters"]
+    if "user_id" not in pathParams or "game_id" not in pathParams:
+        return _http_response(ResponseStatus.MALFORMED_REQUEST, "Missing required URL parameters", ApplicationStatus.MISSING_PARAMETERS)
+
+    guesses = parseGuesses(event)
+    if guesses is None or len(guesses) == 0:
+        return _http_response(ResponseStatus.MALFORMED_REQUEST, "Request body must be {\"guesses\": [...]} with at least one guess", ApplicationStatus.MISSING_PARAMETERS)
+    if len(guesses) > MAX_BATCH_GUESSES:
+        return _http_response(ResponseStatus.MALFORMED_REQUEST, "At most {} guesses can be submitted at once".format(MAX_BATCH_GUESSES), ApplicationStatus.INPUT_ERROR)
+
+    userTable = _getTable("USER_TABLE")
+    gameTable = _getTable("GAME_TABLE")
+    wordTable = _getTable("WORD_TABLE")
+
+    user_id = pathParams["user_id"]
+    game_id = pathParams["game_id"]
+
+    # As in guess, the mapping between game id and user id is checked with the read of the game,
+    # and a conflicting write against a cached game is retried once from a fresh, consistent read
+    refresh = False
+    while True:
+        reply = _getUserGame(userTable, gameTable, user_id, game_id, refresh=refresh)
+        if not reply["success"]:
+            return _http_response(reply["status"],reply["response"], reply["application_status"])
+        game = reply["response"]
+        user = reply.get("user")
+        cached = reply["cached"]
+        _mark("read_game")
+
+        if game["status"]!=IN_PROGRESS or int(game["attempts_left"])<=0:
+            return _http_response(ResponseStatus.MALFORMED_REQUEST, _gameView(game), ApplicationStatus.GAME_OVER)
+
+        applied, responses, attempts_left, status, results = scoreGuesses(wordTable, game, guesses)
+        _mark("validate")
+        if len(applied) == 0:
+            return _http_response(ResponseStatus.MALFORMED_REQUEST, {"game": _gameView(game), "results": results}, ApplicationStatus.INPUT_ERROR)
+
+        # Every valid guess is persisted by one conditional write
+        reply = applyGuesses(gameTable if user is None else userTable, game, applied, responses, attempts_left, status, user=user)
+        _mark("write")
+        _count("guesses_applied", len(applied))
+        if not reply["success"] and reply["status"] == ResponseStatus.CONFLICT and cached:
+            refresh = True
+            continue
+        break
+    if not reply["success"]:
+        return _http_response(reply["status"], reply["response"], reply["application_status"])
+    _cacheUserGame(userTable, gameTable, reply)
+
+    # As in guess, a batch ending the game adds it to the statistics of the user
+    if status != IN_PROGRESS:
+        word_length = int(game["word_length"])
+        if user is None:
+            _recordGameResult(_getTable("HISTORY_TABLE"), user_id, word_length, word_length + 1 - attempts_left, status)
+        elif status == WON:
+            _recordMaxStreak(_getTable("HISTORY_TABLE"), user_id)
+        _mark("stats")
+
+    # Return the updated game and the outcome of every guess
+    return _http_response(ResponseStatus.CREATED, {"game": _gameView(reply["response"]), "results": results}, reply["application_status"], event=event)
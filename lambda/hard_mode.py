@@ -0,0 +1,120 @@
+from wordle_utils import _decodeResponse, GREEN, GREY
+
+# Hard mode rules, accumulated over all the responses of a game:
+#   - a GREEN letter must be guessed again at the same position
+#   - a letter must appear at least as many times as it was GREEN or YELLOW in any one response
+#   - a letter that also got a GREY appears exactly that many times, which caps its count
+# The game item keeps the constraints in CONSTRAINTS as one short string, updated by every guess:
+#   "<greens>|<minimum counts>|<maximum counts>", eg. "c...e|a1c1e1|e1s0"
+# where greens has one letter per known position and UNKNOWN elsewhere, and the counts are
+# letter/digit pairs. Checking a guess then costs one pass over it, whatever the number of guesses.
+CONSTRAINTS = "constraints"
+UNKNOWN = "."
+SEPARATOR = "|"
+
+GREEN_MESSAGE = "Correct letters not included in the guess under hard mode."
+YELLOW_MESSAGE = "Letters revealed by earlier responses not included in the guess under hard mode."
+CAP_MESSAGE = "Guess uses a letter more times than earlier responses allow under hard mode."
+
+
+class Constraints:
+    """
+    Hard mode constraints of a game.
+
+    Args:
+        greens (list): The letter known at each position, or UNKNOWN
+        minimum (dict): Letter -> minimum number of occurrences
+        maximum (dict): Letter -> maximum number of occurrences
+    """
+
+    def __init__(self, greens, minimum=None, maximum=None):
+        self.greens = greens
+        self.minimum = minimum or {}
+        self.maximum = maximum or {}
+
+    @classmethod
+    def empty(cls, word_length):
+        return cls([UNKNOWN] * word_length)
+
+    @classmethod
+    def decode(cls, stored):
+        """
+        Reads constraints from their stored form, eg. Constraints.decode("c...e|a1c1e1|e1s0")
+        """
+        greens, minimum, maximum = stored.split(SEPARATOR)
+        return cls(list(greens), _decodeCounts(minimum), _decodeCounts(maximum))
+
+    def encode(self):
+        return SEPARATOR.join(["".join(self.greens), _encodeCounts(self.minimum), _encodeCounts(self.maximum)])
+
+    def add(self, guess, response):
+        """
+        Adds what a response reveals about the word.
+
+        Args:
+            guess (str): The guess word
+            response (list): The response to the guess, as a list of colours(str)
+        """
+        found = {}
+        greys = set()
+        for idx, c in enumerate(guess):
+            if response[idx] == GREY:
+                greys.add(c)
+                continue
+            if response[idx] == GREEN:
+                self.greens[idx] = c
+            found[c] = found.get(c, 0) + 1
+        for c, count in found.items():
+            if count > self.minimum.get(c, 0):
+                self.minimum[c] = count
+        for c in greys:
+            self.maximum[c] = found.get(c, 0)
+        return self
+
+    def check(self, word):
+        """
+        Verifies that a guess satisfies the constraints.
+
+        Returns:
+            str: None if the guess is allowed, otherwise the message explaining why it is not
+        """
+        counts = {}
+        for idx, c in enumerate(word):
+            if self.greens[idx] != UNKNOWN and self.greens[idx] != c:
+                return GREEN_MESSAGE
+            counts[c] = counts.get(c, 0) + 1
+        for c, count in self.minimum.items():
+            if counts.get(c, 0) < count:
+                return YELLOW_MESSAGE
+        for c, count in self.maximum.items():
+            if counts.get(c, 0) > count:
+                return CAP_MESSAGE
+        return None
+
+
+def _encodeCounts(counts):
+    return "".join("{}{}".format(c, counts[c]) for c in sorted(counts))
+
+
+def _decodeCounts(stored):
+    return dict((stored[idx], int(stored[idx + 1])) for idx in range(0, len(stored), 2))
+
+
+def _gameConstraints(game):
+    """
+    Returns the hard mode constraints of a game item. Games created before the constraints were
+    stored have them compiled once from their guesses and responses.
+
+    Args:
+        game (dict): The game item
+
+    Returns:
+        Constraints: The constraints accumulated over the guesses of the game
+    """
+    if CONSTRAINTS in game:
+        return Constraints.decode(game[CONSTRAINTS])
+    word_length = int(game["word_length"])
+    constraints = Constraints.empty(word_length)
+    for guess, response in zip(game["guesses"], game["responses"]):
+        constraints.add(guess, _decodeResponse(response, word_length))
+    return constraints
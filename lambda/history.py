@@ -0,0 +1,88 @@
+from wordle_utils import ResponseStatus, ApplicationStatus, WON, LOST
+
+# Per-user history of finished games, written by the compaction job (compactGames.py).
+# Each game is packed into a single byte:
+#   bits 0-1  word length - 5
+#   bits 2-5  guesses used (0 to 9)
+#   bit  6    1 if the game was won
+#   bit  7    1 if the game was played in hard mode
+# A history item holds the bytes in GAMES, a list with one binary chunk per compaction, and the
+# number of games in GAMES_COUNT, so reading the whole history of a user is a single GetItem.
+GAMES = "games"
+GAMES_COUNT = "games_count"
+MIN_WORD_LENGTH = 5
+
+
+def _packGame(word_length, guesses, won, hard_mode):
+    """
+    Packs one finished game into a byte, eg. _packGame(5, 4, True, False) -> 0x50
+
+    Args:
+        word_length (int): The length of the word, between 5 and 8
+        guesses (int): The number of guesses used, between 0 and 9
+        won (bool): Whether the game was won
+        hard_mode (bool): Whether the game was played in hard mode
+
+    Returns:
+        int: The packed game
+    """
+    return (int(word_length) - MIN_WORD_LENGTH) | (int(guesses) << 2) | (int(bool(won)) << 6) | (int(bool(hard_mode)) << 7)
+
+
+def _unpackGame(packed):
+    """
+    Converts a packed game back into the form returned by the API.
+
+    Args:
+        packed (int): A byte written by _packGame
+
+    Returns:
+        dict: word_length, guesses, result (WON/LOST) and hard_mode ("1"/"0")
+    """
+    return {
+        "word_length": (packed & 0x3) + MIN_WORD_LENGTH,
+        "guesses": (packed >> 2) & 0xF,
+        "result": WON if packed & 0x40 else LOST,
+        "hard_mode": "1" if packed & 0x80 else "0",
+    }
+
+
+def _packGameItem(game):
+    """
+    Packs a finished game item. Only game_id, word_length, attempts_left, status and hard_mode are needed,
+    so the compaction job reads games with a projection and never loads their guesses.
+    """
+    word_length = int(game["word_length"])
+    guesses = word_length + 1 - int(game["attempts_left"])
+    return _packGame(word_length, guesses, game["status"] == WON, game["hard_mode"] == "1")
+
+
+def _historyBytes(item):
+    """
+    Returns the packed games of a history item, oldest first.
+    """
+    # boto3 reads binary attributes as Binary objects and the local stand-in as bytes
+    return b"".join(bytes(getattr(chunk, "value", chunk)) for chunk in item.get(GAMES, []))
+
+
+def _getHistory(historyTable, user_id):
+    """
+    Reads the compacted history of a user with a single GetItem. A user without history gets an empty one.
+
+    Args:
+        historyTable (DynamoDB.Table): The DynamoDB table object
+        user_id (str): The id of the user
+
+    Returns:
+        dict: The history (user_id, games_count, games) if successful, otherwise a dictionary object containing an error message and status code
+    """
+    try:
+        itemObject = historyTable.get_item(Key={"user_id": user_id})
+    except Exception as e:
+        print(e)
+        error_message = "Exception while getting history of user_id: {} from {}".format(user_id, historyTable.table_name)
+        return {"success": False, "response": error_message, "status": ResponseStatus.INTERNAL_ERROR, "application_status": ApplicationStatus.DATABASE_ERROR}
+    item = itemObject.get("Item", {})
+    games = [_unpackGame(packed) for packed in bytearray(_historyBytes(item))]
+    history = {"user_id": user_id, GAMES_COUNT: len(games), GAMES: games}
+    return {"success": True, "response": history, "application_status": ApplicationStatus.OK}
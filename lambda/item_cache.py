@@ -0,0 +1,168 @@
+import copy
+import os
+import time
+from collections import OrderedDict
+from wordle_utils import _getItem, ApplicationStatus, WON, LOST
+from metrics import _count
+
+# Read-through cache of user and game items, kept for the lifetime of a warm container.
+# Items carry a VERSION attribute that every write increments; the cache never replaces an item
+# with an older version of itself, so a slow read cannot undo a write made by this container.
+# Writes made by other containers are picked up when the entry expires after ITEM_CACHE_TTL
+# seconds, or earlier when a conditional write fails against the newer version.
+# Finished games never change, so they are kept until evicted.
+# An item read with a projection is cached with the list of its attributes, and only serves
+# lookups for a subset of them; it never replaces the whole item at the same version.
+VERSION = "version"
+ITEM_CACHE_SIZE = int(os.environ.get("ITEM_CACHE_SIZE", "1024"))
+ITEM_CACHE_TTL = float(os.environ.get("ITEM_CACHE_TTL", "5"))
+ITEM_CACHE_ENABLED = os.environ.get("ITEM_CACHE", "1") != "0"
+
+
+def _version(item):
+    return int(item.get(VERSION, 0))
+
+
+class ItemCache:
+    """
+    Bounded LRU cache of items with a per entry expiry.
+    Items are copied in and out, so callers may modify what they get.
+
+    Args:
+        max_items (int): Number of items kept, the least recently used one is evicted first
+        ttl (float): Seconds a mutable item is served from the cache
+    """
+
+    def __init__(self, max_items=ITEM_CACHE_SIZE, ttl=ITEM_CACHE_TTL):
+        self.max_items = max_items
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+
+    def get(self, key, attributes=None):
+        """
+        Returns a copy of the cached item, or None if it is missing, expired or was cached
+        without some of the requested attributes.
+        """
+        entry = self._entries.get(key)
+        if entry is None or not _covers(entry[2], attributes):
+            self.misses += 1
+            return None
+        item, expires, _ = entry
+        if expires is not None and time.monotonic() > expires:
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return copy.deepcopy(item)
+
+    def put(self, key, item, attributes=None):
+        """
+        Caches the item unless a newer version of it is already cached, or the same version
+        with more attributes.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            if _version(entry[0]) > _version(item):
+                return
+            if _version(entry[0]) == _version(item) and not _covers(attributes, entry[2]):
+                return
+        expires = None if item.get("status") in (WON, LOST) else time.monotonic() + self.ttl
+        self._entries[key] = (copy.deepcopy(item), expires, None if attributes is None else frozenset(attributes))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_items:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+            _count("cache_evictions")
+
+    def evict(self, key):
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "items": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / float(lookups), 4) if lookups > 0 else 0.0,
+            "expirations": self.expirations,
+            "evictions": self.evictions,
+        }
+
+
+def _covers(cached, requested):
+    """
+    Tells if an entry cached with the attributes cached (None for whole items) holds the requested ones.
+    """
+    return cached is None or (requested is not None and cached.issuperset(requested))
+
+
+_cache = ItemCache()
+
+
+def _getCachedItem(table, pk_name, pk_value, refresh=False, expect=None, attributes=None, consistent=False):
+    """
+    Retrieves an item like _getItem, serving it from the container cache when possible.
+
+    Args:
+        table (DynamoDB.Table): The DynamoDB table object
+        pk_name (str): The name of the primary key
+        pk_value (str): The value of the primary key
+        refresh (bool, optional): Read the table even if the item is cached. Defaults to False.
+        expect (function, optional): A check the item is expected to pass, eg. that the user plays the requested game.
+            A cached item failing it may be stale, so it is read again from the table before being returned.
+        attributes (list, optional): The attributes the caller uses. VERSION is always read with them.
+            A cached item may hold more. Defaults to None, the whole item.
+        consistent (bool, optional): Make a strongly consistent read when the table is read. Defaults to False.
+
+    Returns:
+        dict: The reply of _getItem, with "cached" set to True if the item came from the cache
+    """
+    key = (table.table_name, pk_value)
+    if attributes is not None and VERSION not in attributes:
+        attributes = list(attributes) + [VERSION]
+    if ITEM_CACHE_ENABLED and not refresh:
+        item = _cache.get(key, attributes)
+        if item is not None and (expect is None or expect(item)):
+            _count("cache_hits")
+            return {"success": True, "response": item, "application_status": ApplicationStatus.OK, "cached": True}
+    _count("cache_misses")
+    reply = _getItem(table, pk_name, pk_value, attributes=attributes, consistent=consistent)
+    reply["cached"] = False
+    if reply["success"] and ITEM_CACHE_ENABLED:
+        _cache.put(key, reply["response"], attributes)
+    return reply
+
+
+def _cacheItem(table, pk_name, item):
+    """
+    Caches an item this container has just written, so the next read is served locally.
+    """
+    if ITEM_CACHE_ENABLED:
+        _cache.put((table.table_name, item[pk_name]), item)
+
+
+def _evictItem(table, pk_value):
+    """
+    Drops an item from the cache, eg. after deleting it.
+    """
+    _cache.evict((table.table_name, pk_value))
+
+
+def _nextVersion(item):
+    """
+    Returns the version to store with the next write of the item.
+    """
+    return _version(item) + 1
+
+
+def _cacheStats():
+    return _cache.stats()
@@ -0,0 +1,224 @@
+import functools
+import json
+import os
+import threading
+import time
+from wordle_utils import _errorCode
+
+# Per-invocation instrumentation. Every handler wrapped with _instrumented prints one JSON line
+# when it returns, in CloudWatch Embedded Metric Format, so the numbers are both searchable in
+# the logs and extracted as metrics without any API call. The line carries the latency of the
+# invocation and of each phase marked with _mark, the number, latency and consumed capacity of
+# the DynamoDB calls made through the tables of wordle_runtime, or the client of their meta
+# attribute, and any counters added with _count.
+METRICS_ENABLED = os.environ.get("METRICS", "1") != "0"
+METRICS_NAMESPACE = os.environ.get("METRICS_NAMESPACE", "Wordle")
+# Number of DynamoDB calls detailed individually in a metrics line, the rest only count in the totals
+MAX_DETAILED_CALLS = 20
+
+READ_OPERATIONS = ("get_item", "query", "scan")
+WRITE_OPERATIONS = ("put_item", "update_item", "delete_item")
+OPERATION_NAMES = {"get_item": "GetItem", "query": "Query", "scan": "Scan",
+                   "put_item": "PutItem", "update_item": "UpdateItem", "delete_item": "DeleteItem",
+                   "batch_write_item": "BatchWriteItem", "transact_write_items": "TransactWriteItems"}
+
+_cold_start = True
+_current = None
+_lock = threading.Lock()
+
+
+class Invocation:
+    """
+    Measurements of the invocation in progress.
+    """
+
+    def __init__(self, handler_name, request_id=None):
+        self.handler_name = handler_name
+        self.request_id = request_id
+        self.start = time.perf_counter()
+        self.last_mark = self.start
+        self.phases = {}
+        self.counters = {}
+        self.calls = []
+        self.db_calls = 0
+        self.db_seconds = 0.0
+        self.rcu = 0.0
+        self.wcu = 0.0
+        self.errors = 0
+
+    def recordCall(self, operation, table_name, seconds, capacity, error=None):
+        with _lock:
+            self.db_calls += 1
+            self.db_seconds += seconds
+            if operation in READ_OPERATIONS:
+                self.rcu += capacity
+            else:
+                self.wcu += capacity
+            if error is not None:
+                self.errors += 1
+            if len(self.calls) < MAX_DETAILED_CALLS:
+                call = {"op": OPERATION_NAMES[operation], "table": table_name, "ms": round(seconds * 1000, 3), "cu": capacity}
+                if error is not None:
+                    call["error"] = error
+                self.calls.append(call)
+
+    def line(self, status_code, cold_start):
+        duration = time.perf_counter() - self.start
+        metrics = [("duration_ms", "Milliseconds"), ("db_ms", "Milliseconds"), ("db_calls", "Count"),
+                   ("rcu", "Count"), ("wcu", "Count")]
+        return {
+            "_aws": {
+                "Timestamp": int(time.time() * 1000),
+                "CloudWatchMetrics": [{
+                    "Namespace": METRICS_NAMESPACE,
+                    "Dimensions": [["handler"]],
+                    "Metrics": [{"Name": name, "Unit": unit} for name, unit in metrics],
+                }],
+            },
+            "handler": self.handler_name,
+            "request_id": self.request_id,
+            "status_code": status_code,
+            "cold_start": cold_start,
+            "duration_ms": round(duration * 1000, 3),
+            "db_ms": round(self.db_seconds * 1000, 3),
+            "db_calls": self.db_calls,
+            "db_errors": self.errors,
+            "rcu": self.rcu,
+            "wcu": self.wcu,
+            "phases": {name: round(seconds * 1000, 3) for name, seconds in self.phases.items()},
+            "counters": self.counters,
+            "calls": self.calls,
+        }
+
+
+def _instrumented(handler_name):
+    """
+    Decorates a Lambda handler so that each invocation emits one metrics line.
+
+    Args:
+        handler_name (str): The handler dimension of the metrics, eg. "guess"
+    """
+    def decorate(handler):
+        if not METRICS_ENABLED:
+            return handler
+
+        @functools.wraps(handler)
+        def wrapper(event, context):
+            global _current, _cold_start
+            _current = Invocation(handler_name, getattr(context, "aws_request_id", None))
+            status_code = None
+            try:
+                response = handler(event, context)
+                if isinstance(response, dict):
+                    status_code = response.get("statusCode")
+                return response
+            finally:
+                invocation, _current = _current, None
+                cold_start, _cold_start = _cold_start, False
+                print(json.dumps(invocation.line(status_code, cold_start)))
+        return wrapper
+    return decorate
+
+
+def _mark(phase):
+    """
+    Ends a phase of the current invocation: the time since the previous mark, or since the
+    invocation started, is added to the phase. eg. _mark("read") after reading the game.
+    """
+    invocation = _current
+    if invocation is None:
+        return
+    now = time.perf_counter()
+    invocation.phases[phase] = invocation.phases.get(phase, 0.0) + now - invocation.last_mark
+    invocation.last_mark = now
+
+
+def _count(name, value=1):
+    """
+    Adds to a counter of the current invocation, eg. _count("cache_hits").
+    """
+    invocation = _current
+    if invocation is not None:
+        invocation.counters[name] = invocation.counters.get(name, 0) + value
+
+
+def _currentInvocation():
+    return _current
+
+
+def _instrument(operation, method, tableName):
+    """
+    Wraps a DynamoDB call so that it requests its consumed capacity and is timed into the current invocation.
+
+    Args:
+        operation (str): The name of the method, eg. "get_item"
+        method (callable): The method of the table or client
+        tableName (callable): Returns the name of the table(s) of a call from its keyword arguments
+    """
+    def call(**kwargs):
+        invocation = _current
+        if invocation is None:
+            return method(**kwargs)
+        kwargs.setdefault("ReturnConsumedCapacity", "TOTAL")
+        start = time.perf_counter()
+        try:
+            response = method(**kwargs)
+        except Exception as e:
+            invocation.recordCall(operation, tableName(kwargs), time.perf_counter() - start, 0.0, _errorCode(e) or type(e).__name__)
+            raise
+        consumed = response.get("ConsumedCapacity", {})
+        # calls on several tables return a list, with the capacity of every table
+        if isinstance(consumed, list):
+            capacity = sum(entry.get("CapacityUnits", 0.0) for entry in consumed)
+        else:
+            capacity = consumed.get("CapacityUnits", 0.0)
+        invocation.recordCall(operation, tableName(kwargs), time.perf_counter() - start, capacity)
+        return response
+    return call
+
+
+class InstrumentedTable:
+    """
+    Wraps a DynamoDB Table so that every item and query call requests its consumed capacity
+    and is timed into the current invocation, as are the batch and transaction calls of the client
+    reached through table.meta.client. Other attributes are those of the wrapped table.
+    """
+
+    def __init__(self, table):
+        self._table = table
+        for operation in READ_OPERATIONS + WRITE_OPERATIONS:
+            setattr(self, operation, _instrument(operation, getattr(table, operation), lambda kwargs: table.table_name))
+        self.meta = InstrumentedMeta(table.meta)
+
+    def __getattr__(self, name):
+        return getattr(self._table, name)
+
+
+class InstrumentedMeta:
+    """
+    The meta attribute of an InstrumentedTable, whose client is an InstrumentedClient.
+    """
+
+    def __init__(self, meta):
+        self._meta = meta
+        self.client = InstrumentedClient(meta.client)
+
+    def __getattr__(self, name):
+        return getattr(self._meta, name)
+
+
+class InstrumentedClient:
+    """
+    Wraps a DynamoDB client so that its batch and transaction calls are recorded like the table calls.
+    """
+
+    def __init__(self, client):
+        self._client = client
+        self.batch_write_item = _instrument("batch_write_item", client.batch_write_item,
+                                            lambda kwargs: ",".join(sorted(kwargs["RequestItems"])))
+        self.transact_write_items = _instrument("transact_write_items", client.transact_write_items,
+                                                lambda kwargs: ",".join(sorted(set(list(action.values())[0]["TableName"]
+                                                                                   for action in kwargs["TransactItems"]))))
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
@@ -1,46 +1,41 @@
 import json
-import boto3
 import uuid
 import os
-# import requests
-import random
+import time
 from enum import Enum
+from wordle_runtime import _getTable
+from metrics import _instrumented, _count
 from wordle_utils import _http_response, ResponseStatus, ApplicationStatus
+from word_loader import _loadWords, TableCheckpoint
+from word_artifact import _getWordArtifact
 
+# Seconds kept in reserve to finish the in flight batches and save the checkpoint
+DEADLINE_MARGIN = 5
+LOADER_WORKERS = 8
 
-def handler(event, context):
-    # word_site = "https://www.mit.edu/~ecprice/wordlist.10000"
-
-    # response = requests.get(word_site)
-    # words = response.content.splitlines()
-    # words = [i for i in words if len(i)>=5 or len(i)<=8]
-    words = ['aaron', 'about', 'above', 'abuse', 'acids', 'acres', 'actor', 'acute', 'adams', 'added', 'admin', 'admit', 'adobe', 'adopt', 'adult', 'after', 'again', 'agent', 'aging', 'agree', 'ahead', 'aimed', 'alarm', 'album', 'alert', 'alias', 'alice', 'alien', 'align', 'alike', 'alive', 'allah', 'allan', 'allen', 'allow', 'alloy', 'alone', 'along', 'alpha', 'alter', 'amber', 'amend', 'amino', 'among', 'angel', 'anger', 'angle', 'angry', 'anime', 'annex', 'annie', 'apart', 'apnic', 'apple', 'apply', 'april', 'areas', 'arena', 'argue', 'arise', 'armed', 'armor', 'array', 'arrow', 'aruba', 'ascii', 'asian', 'aside', 'asked', 'asset', 'atlas', 'audio', 'audit', 'autos', 'avoid', 'award', 'aware', 'awful', 'babes', 'bacon', 'badge', 'badly', 'baker', 'balls', 'bands', 'banks', 'barry', 'based', 'bases', 'basic', 'basin', 'basis', 'batch', 'baths', 'beach', 'beads', 'beans', 'bears', 'beast', 'beats', 'began', 'begin', 'begun', 'being', 'belle', 'belly', 'below', 'belts', 'bench', 'berry', 'betty', 'bible', 'bikes', 'bills', 'billy', 'bingo', 'birds', 'birth', 'bitch', 'black', 'blade', 'blair', 'blake', 'blame', 'blank', 'blast', 'blend', 'bless', 'blind', 'blink', 'block', 'blogs', 'blond', 'blood', 'bloom', 'blues', 'board', 'boats', 'bobby', 'bonds', 'bones', 'bonus', 'boobs', 'books', 'boost', 'booth', 'boots', 'booty', 'bored', 'bound', 'boxed', 'boxes', 'brain', 'brake', 'brand', 'brass', 'brave', 'bread', 'break', 'breed', 'brian', 'brick', 'bride', 'brief', 'bring', 'broad', 'broke', 'brook', 'brown', 'bruce', 'brush', 'bryan', 'bucks', 'buddy', 'build', 'built', 'bunch', 'bunny', 'burke', 'burns', 'burst', 'buses', 'busty', 'butts', 'buyer', 'bytes', 'cabin', 'cable', 'cache', 'cakes', 'calif', 'calls', 'camel', 'camps', 'canal', 'candy', 'canon', 'cards', 'carey', 'cargo', 'carlo', 'carol', 'carry', 'cases', 'casey', 'casio', 'catch', 'cause', 'cedar', 'cells', 'cents', 'chain', 'chair', 'chaos', 'charm', 'chart', 'chase', 'cheap', 'cheat', 'check', 'chess', 'chest', 'chevy', 'chick', 'chief', 'child', 'chile', 'china', 'chips', 'choir', 'chose', 'chris', 'chuck', 'cindy', 'cisco', 'cited', 'civic', 'civil', 'claim', 'clara', 'clark', 'class', 'clean', 'clear', 'clerk', 'click', 'cliff', 'climb', 'clips', 'clock', 'clone', 'close', 'cloth', 'cloud', 'clubs', 'coach', 'coast', 'cocks', 'codes', 'cohen', 'coins', 'colin', 'colon', 'color', 'combo', 'comes', 'comic', 'condo', 'congo', 'const', 'coral', 'corps', 'costa', 'costs', 'could', 'count', 'court', 'cover', 'crack', 'craft', 'craig', 'craps', 'crash', 'crazy', 'cream', 'creek', 'crest', 'crime', 'crops', 'cross', 'crowd', 'crown', 'crude', 'cubic', 'curve', 'cyber', 'cycle', 'czech', 'daddy', 'daily', 'dairy', 'daisy', 'dance', 'danny', 'dated', 'dates', 'david', 'davis', 'deals', 'dealt', 'death', 'debug', 'debut', 'decor', 'delay', 'delhi', 'delta', 'dense', 'depot', 'depth', 'derby', 'derek', 'devel', 'devil', 'devon', 'diana', 'diane', 'diary', 'dicke', 'dicks', 'diego', 'diffs', 'digit', 'dildo', 'dirty', 'disco', 'discs', 'disks', 'dodge', 'doing', 'dolls', 'donna', 'donor', 'doors', 'doubt', 'dover', 'dozen', 'draft', 'drain', 'drama', 'drawn', 'draws', 'dream', 'dress', 'dried', 'drill', 'drink', 'drive', 'drops', 'drove', 'drugs', 'drums', 'drunk', 'dryer', 'dubai', 'dutch', 'dying', 'dylan', 'eagle', 'early', 'earth', 'ebony', 'ebook', 'eddie', 'edgar', 'edges', 'egypt', 'eight', 'elder', 'elect', 'elite', 'ellen', 'ellis', 'elvis', 'emacs', 'email', 'emily', 'empty', 'ended', 'endif', 'enemy', 'enjoy', 'enter', 'entry', 'epson', 'equal', 'error', 'essay', 'essex', 'euros', 'evans', 'event', 'every', 'exact', 'exams', 'excel', 'exist', 'extra', 'faced', 'faces', 'facts', 'fails', 'fairy', 'faith', 'falls', 'false', 'fancy', 'fares', 'farms', 'fatal', 'fatty', 'fault', 'favor', 'fears', 'feeds', 'feels', 'fence', 'ferry', 'fever', 'fewer', 'fiber', 'fibre', 'field', 'fifth', 'fifty', 'fight', 'filed', 'files', 'filme', 'films', 'final', 'finds', 'fired', 'fires', 'firms', 'first', 'fixed', 'fixes', 'flags', 'flame', 'flash', 'fleet', 'flesh', 'float', 'flood', 'floor', 'flour', 'flows', 'floyd', 'fluid', 'flush', 'flyer', 'focal', 'focus', 'folks', 'fonts', 'foods', 'force', 'forge', 'forms', 'forth', 'forty', 'forum', 'fotos', 'found', 'frame', 'frank', 'fraud', 'fresh', 'front', 'frost', 'fruit', 'fully', 'funds', 'funky', 'funny', 'fuzzy', 'gains', 'games', 'gamma', 'gates', 'gauge', 'genes', 'genre', 'ghana', 'ghost', 'giant', 'gifts', 'girls', 'given', 'gives', 'glass', 'glenn', 'globe', 'glory', 'gnome', 'goals', 'going', 'gonna', 'goods', 'gotta', 'grace', 'grade', 'grain', 'grams', 'grand', 'grant', 'graph', 'grass', 'grave', 'great', 'greek', 'green', 'grill', 'gross', 'group', 'grove', 'grown', 'grows', 'guard', 'guess', 'guest', 'guide', 'guild', 'hairy', 'haiti', 'hands', 'handy', 'happy', 'harry', 'haven', 'hayes', 'heads', 'heard', 'heart', 'heath', 'heavy', 'helen', 'hello', 'helps', 'hence', 'henry', 'herbs', 'highs', 'hills', 'hindu', 'hints', 'hired', 'hobby', 'holds', 'holes', 'holly', 'homes', 'honda', 'honey', 'honor', 'hoped', 'hopes', 'horny', 'horse', 'hosts', 'hotel', 'hours', 'house', 'howto', 'human', 'humor', 'icons', 'idaho', 'ideal', 'ideas', 'image', 'inbox', 'index', 'india', 'indie', 'inner', 'input', 'intel', 'inter', 'intro', 'iraqi', 'irish', 'isaac', 'islam', 'issue', 'italy', 'items', 'ivory', 'jacob', 'james', 'jamie', 'janet', 'japan', 'jason', 'jeans', 'jenny', 'jerry', 'jesse', 'jesus', 'jewel', 'jimmy', 'johns', 'joins', 'joint', 'jokes', 'jones', 'joyce', 'judge', 'juice', 'julia', 'julie', 'karen', 'karma', 'kathy', 'katie', 'keeps', 'keith', 'kelly', 'kenny', 'kenya', 'kerry', 'kevin', 'kills', 'kinda', 'kinds', 'kings', 'kitty', 'klein', 'knife', 'knock', 'known', 'knows', 'kodak', 'korea', 'label', 'labor', 'laden', 'lakes', 'lamps', 'lance', 'lands', 'lanes', 'lanka', 'large', 'larry', 'laser', 'later', 'latex', 'latin', 'laugh', 'laura', 'layer', 'leads', 'learn', 'lease', 'least', 'leave', 'leeds', 'legal', 'lemon', 'leone', 'level', 'lewis', 'lexus', 'light', 'liked', 'likes', 'limit', 'linda', 'lined', 'lines', 'links', 'linux', 'lions', 'lists', 'lived', 'liver', 'lives', 'lloyd', 'loads', 'loans', 'lobby', 'local', 'locks', 'lodge', 'logan', 'logic', 'login', 'logos', 'looks', 'loops', 'loose', 'lopez', 'lotus', 'louis', 'loved', 'lover', 'loves', 'lower', 'lucas', 'lucia', 'lucky', 'lunch', 'lycos', 'lying', 'lyric', 'macro', 'magic', 'mails', 'maine', 'major', 'maker', 'makes', 'males', 'malta', 'mambo', 'manga', 'manor', 'maple', 'march', 'marco', 'mardi', 'maria', 'marie', 'mario', 'marks', 'mason', 'match', 'maybe', 'mayor', 'mazda', 'meals', 'means', 'meant', 'medal', 'media', 'meets', 'menus', 'mercy', 'merge', 'merit', 'merry', 'metal', 'meter', 'metro', 'meyer', 'miami', 'micro', 'might', 'milan', 'miles', 'milfs', 'mills', 'minds', 'mines', 'minor', 'minus', 'mixed', 'mixer', 'model', 'modem', 'modes', 'money', 'monte', 'month', 'moore', 'moral', 'moses', 'motel', 'motor', 'mount', 'mouse', 'mouth', 'moved', 'moves', 'movie', 'mpegs', 'msgid', 'multi', 'music', 'myers', 'mysql', 'nails', 'naked', 'named', 'names', 'nancy', 'nasty', 'naval', 'needs', 'nepal', 'nerve', 'never', 'newer', 'newly', 'niger', 'night', 'nikon', 'noble', 'nodes', 'noise', 'nokia', 'north', 'noted', 'notes', 'notre', 'novel', 'nurse', 'nylon', 'oasis', 'occur', 'ocean', 'offer', 'often', 'older', 'olive', 'omaha', 'omega', 'onion', 'opens', 'opera', 'orbit', 'order', 'organ', 'oscar', 'other', 'ought', 'outer', 'owned', 'owner', 'oxide', 'ozone', 'packs', 'pages', 'paint', 'pairs', 'panel', 'panic', 'pants', 'paper', 'papua', 'paris', 'parks', 'parts', 'party', 'pasta', 'paste', 'patch', 'paths', 'patio', 'paxil', 'peace', 'pearl', 'peers', 'penis', 'penny', 'perry', 'perth', 'peter', 'phase', 'phone', 'photo', 'phpbb', 'piano', 'picks', 'piece', 'pills', 'pilot', 'pipes', 'pitch', 'pixel', 'pizza', 'place', 'plain', 'plane', 'plans', 'plant', 'plate', 'plays', 'plaza', 'plots', 'poems', 'point', 'poker', 'polar', 'polls', 'pools', 'porno', 'ports', 'posts', 'pound', 'power', 'press', 'price', 'pride', 'prime', 'print', 'prior', 'prize', 'probe', 'promo', 'proof', 'proud', 'prove', 'proxy', 'pulse', 'pumps', 'punch', 'puppy', 'purse', 'pussy', 'qatar', 'queen', 'query', 'quest', 'queue', 'quick', 'quiet', 'quilt', 'quite', 'quote', 'races', 'racks', 'radar', 'radio', 'raise', 'rally', 'ralph', 'ranch', 'randy', 'range', 'ranks', 'rapid', 'rated', 'rates', 'ratio', 'reach', 'reads', 'ready', 'realm', 'rebel', 'refer', 'rehab', 'relax', 'relay', 'remix', 'renew', 'reply', 'reset', 'retro', 'rhode', 'rider', 'rides', 'ridge', 'right', 'rings', 'risks', 'river', 'roads', 'robin', 'robot', 'rocks', 'rocky', 'roger', 'roles', 'rolls', 'roman', 'rooms', 'roots', 'roses', 'rouge', 'rough', 'round', 'route', 'rover', 'royal', 'rugby', 'ruled', 'rules', 'rural', 'safer', 'sagem', 'saint', 'salad', 'salem', 'sales', 'sally', 'salon', 'samba', 'samoa', 'sandy', 'santa', 'sanyo', 'sarah', 'satin', 'sauce', 'saudi', 'saved', 'saver', 'saves', 'sbjct', 'scale', 'scary', 'scene', 'scoop', 'scope', 'score', 'scott', 'scout', 'screw', 'scuba', 'seats', 'seeds', 'seeks', 'seems', 'sells', 'sends', 'sense', 'serum', 'serve', 'setup', 'seven', 'shade', 'shaft', 'shake', 'shall', 'shame', 'shape', 'share', 'shark', 'sharp', 'sheep', 'sheer', 'sheet', 'shelf', 'shell', 'shift', 'shine', 'ships', 'shirt', 'shock', 'shoes', 'shoot', 'shops', 'shore', 'short', 'shots', 'shown', 'shows', 'sides', 'sight', 'sigma', 'signs', 'silly', 'simon', 'since', 'singh', 'sites', 'sixth', 'sized', 'sizes', 'skill', 'skins', 'skirt', 'skype', 'slave', 'sleep', 'slide', 'slope', 'slots', 'sluts', 'small', 'smart', 'smell', 'smile', 'smith', 'smoke', 'snake', 'socks', 'solar', 'solid', 'solve', 'songs', 'sonic', 'sorry', 'sorts', 'souls', 'sound', 'south', 'space', 'spain', 'spank', 'sparc', 'spare', 'speak', 'specs', 'speed', 'spell', 'spend', 'spent', 'sperm', 'spice', 'spies', 'spine', 'split', 'spoke', 'sport', 'spots', 'spray', 'squad', 'stack', 'staff', 'stage', 'stamp', 'stand', 'stars', 'start', 'state', 'stats', 'stays', 'steal', 'steam', 'steel', 'steps', 'steve', 'stick', 'still', 'stock', 'stone', 'stood', 'stops', 'store', 'storm', 'story', 'strap', 'strip', 'stuck', 'study', 'stuff', 'style', 'sucks', 'sudan', 'sugar', 'suite', 'suits', 'sunny', 'super', 'surge', 'susan', 'sweet', 'swift', 'swing', 'swiss', 'sword', 'syria', 'table', 'tahoe', 'taken', 'takes', 'tales', 'talks', 'tamil', 'tampa', 'tanks', 'tapes', 'tasks', 'taste', 'taxes', 'teach', 'teams', 'tears', 'teddy', 'teens', 'teeth', 'tells', 'terms', 'terry', 'tests', 'texas', 'texts', 'thank', 'thats', 'theft', 'their', 'theme', 'there', 'these', 'thick', 'thing', 'think', 'third', 'thong', 'those', 'three', 'throw', 'thumb', 'tiger', 'tight', 'tiles', 'timer', 'times', 'tions', 'tired', 'tires', 'title', 'today', 'token', 'tokyo', 'tommy', 'toner', 'tones', 'tools', 'tooth', 'topic', 'total', 'touch', 'tough', 'tours', 'tower', 'towns', 'toxic', 'trace', 'track', 'tract', 'tracy', 'trade', 'trail', 'train', 'trans', 'trash', 'treat', 'trees', 'trend', 'trial', 'tribe', 'trick', 'tried', 'tries', 'trips', 'trout', 'truck', 'truly', 'trunk', 'trust', 'truth', 'tubes', 'tulsa', 'tumor', 'tuner', 'tunes', 'turbo', 'turns', 'tvcom', 'twice', 'twiki', 'twins', 'twist', 'tyler', 'types', 'ultra', 'uncle', 'under', 'union', 'units', 'unity', 'until', 'upper', 'upset', 'urban', 'usage', 'users', 'using', 'usual', 'utils', 'valid', 'value', 'valve', 'vault', 'vegas', 'venue', 'verde', 'verse', 'video', 'views', 'villa', 'vinyl', 'viral', 'virus', 'visit', 'vista', 'vital', 'vocal', 'voice', 'volvo', 'voted', 'votes', 'vsnet', 'wages', 'wagon', 'wales', 'walks', 'walls', 'wanna', 'wants', 'waste', 'watch', 'water', 'watts', 'waves', 'wayne', 'weeks', 'weird', 'wells', 'welsh', 'wendy', 'whale', 'whats', 'wheat', 'wheel', 'where', 'which', 'while', 'white', 'whole', 'whore', 'whose', 'wider', 'width', 'wiley', 'winds', 'wines', 'wings', 'wired', 'wires', 'witch', 'wives', 'woman', 'women', 'woods', 'words', 'works', 'world', 'worry', 'worse', 'worst', 'worth', 'would', 'wound', 'wrist', 'write', 'wrong', 'wrote', 'xanax', 'xerox', 'xhtml', 'yacht', 'yahoo', 'yards', 'years', 'yeast', 'yemen', 'yield', 'young', 'yours', 'youth', 'yukon', 'zdnet', 'zones']
-
-    words+=['abroad', 'absent', 'accent', 'accept', 'access', 'across', 'acting', 'action', 'active', 'actors', 'actual', 'adding', 'adidas', 'adipex', 'adjust', 'adrian', 'adults', 'advert', 'advice', 'advise', 'adware', 'aerial', 'affair', 'affect', 'afford', 'afraid', 'africa', 'agency', 'agenda', 'agents', 'agreed', 'agrees', 'alaska', 'albany', 'albert', 'albums', 'alerts', 'alfred', 'allied', 'allows', 'almost', 'alpine', 'alumni', 'always', 'amanda', 'amazon', 'ambien', 'amount', 'analog', 'anchor', 'andale', 'andrea', 'andrew', 'angela', 'angels', 'angola', 'animal', 'annual', 'answer', 'anyone', 'anyway', 'apache', 'apollo', 'appeal', 'appear', 'approx', 'arabia', 'arabic', 'arcade', 'arctic', 'argued', 'arnold', 'around', 'arrest', 'arrive', 'arthur', 'artist', 'ashley', 'asking', 'aspect', 'aspnet', 'assess', 'assets', 'assign', 'assist', 'assume', 'assure', 'asthma', 'athens', 'atomic', 'attach', 'attack', 'attend', 'auburn', 'august', 'aurora', 'austin', 'author', 'autumn', 'avatar', 'avenue', 'awards', 'babies', 'backed', 'backup', 'bailey', 'baking', 'ballet', 'ballot', 'banana', 'banned', 'banner', 'barbie', 'barely', 'barnes', 'barrel', 'basics', 'basket', 'batman', 'battle', 'beauty', 'beaver', 'became', 'become', 'before', 'begins', 'behalf', 'behind', 'beings', 'belief', 'belize', 'belkin', 'belong', 'berlin', 'beside', 'better', 'beyond', 'bhutan', 'bidder', 'bigger', 'bikini', 'binary', 'bishop', 'blacks', 'blades', 'blocks', 'blonde', 'bloody', 'boards', 'bodies', 'border', 'boring', 'bosnia', 'boston', 'bother', 'bottle', 'bottom', 'bought', 'boxing', 'brakes', 'branch', 'brands', 'brazil', 'breach', 'breaks', 'breast', 'breath', 'breeds', 'bridal', 'bridge', 'briefs', 'bright', 'brings', 'broken', 'broker', 'bronze', 'brooks', 'browse', 'brunei', 'brutal', 'bryant', 'bubble', 'budget', 'buffer', 'bufing', 'builds', 'bullet', 'bumper', 'bundle', 'burden', 'bureau', 'buried', 'burner', 'burton', 'butler', 'butter', 'button', 'buyers', 'buying', 'cables', 'cached', 'called', 'calvin', 'camera', 'campus', 'canada', 'cancel', 'cancer', 'candle', 'cannon', 'canvas', 'canyon', 'carbon', 'career', 'caring', 'carlos', 'carmen', 'carpet', 'carter', 'casino', 'castle', 'casual', 'cattle', 'caught', 'caused', 'causes', 'cayman', 'celebs', 'celtic', 'cement', 'census', 'center', 'centre', 'chains', 'chairs', 'chance', 'change', 'chapel', 'charge', 'charms', 'charts', 'cheats', 'checks', 'cheers', 'cheese', 'cheque', 'cherry', 'chicks', 'choice', 'choose', 'chorus', 'chosen', 'christ', 'chrome', 'chubby', 'church', 'cialis', 'cinema', 'circle', 'circus', 'cities', 'claims', 'claire', 'clarke', 'clause', 'clicks', 'client', 'clinic', 'clocks', 'closed', 'closer', 'closes', 'clouds', 'cloudy', 'coated', 'coding', 'coffee', 'collar', 'colony', 'colors', 'colour', 'column', 'combat', 'comedy', 'comics', 'coming', 'commit', 'common', 'compaq', 'comply', 'condos', 'config', 'cooked', 'cookie', 'cooler', 'cooper', 'copied', 'copies', 'copper', 'corner', 'corpus', 'cotton', 'counts', 'county', 'couple', 'coupon', 'course', 'courts', 'covers', 'cowboy', 'cradle', 'crafts', 'create', 'credit', 'crimes', 'crisis', 'cruise', 'cursor', 'curtis', 'curves', 'custom', 'cycles', 'cyprus', 'dakota', 'dallas', 'damage', 'danger', 'daniel', 'danish', 'darwin', 'dating', 'dayton', 'deadly', 'dealer', 'deaths', 'debate', 'debian', 'decade', 'decent', 'decide', 'deemed', 'deeper', 'deeply', 'defeat', 'defend', 'define', 'degree', 'delays', 'delete', 'deluxe', 'demand', 'denial', 'denied', 'dennis', 'dental', 'denver', 'depend', 'deputy', 'desert', 'design', 'desire', 'detail', 'detect', 'device', 'dialog', 'diesel', 'differ', 'digest', 'dildos', 'dining', 'dinner', 'direct', 'dishes', 'disney', 'divide', 'divine', 'diving', 'doctor', 'dollar', 'domain', 'donald', 'donate', 'donors', 'dosage', 'double', 'dozens', 'dragon', 'dreams', 'drinks', 'driven', 'driver', 'drives', 'dublin', 'duncan', 'durham', 'during', 'duties', 'eagles', 'earned', 'easier', 'easily', 'easter', 'eating', 'ebooks', 'edited', 'editor', 'edward', 'effect', 'effort', 'either', 'eleven', 'emails', 'eminem', 'empire', 'employ', 'enable', 'ending', 'energy', 'engage', 'engine', 'enough', 'ensure', 'enters', 'entire', 'entity', 'enzyme', 'equity', 'erotic', 'errors', 'escape', 'escort', 'essays', 'estate', 'ethics', 'ethnic', 'eugene', 'europe', 'events', 'exceed', 'except', 'excess', 'excuse', 'exempt', 'exists', 'exotic', 'expand', 'expect', 'expert', 'export', 'extend', 'extent', 'extras', 'fabric', 'facial', 'facing', 'factor', 'failed', 'fairly', 'fallen', 'family', 'famous', 'farmer', 'faster', 'father', 'favors', 'favour', 'fellow', 'female', 'fetish', 'fields', 'figure', 'filing', 'filled', 'filter', 'finals', 'finder', 'finest', 'finger', 'finish', 'finite', 'fiscal', 'fisher', 'fitted', 'flavor', 'fleece', 'flickr', 'flight', 'floors', 'floppy', 'floral', 'flower', 'flying', 'folder', 'follow', 'forbes', 'forced', 'forces', 'forest', 'forget', 'forgot', 'formal', 'format', 'formed', 'former', 'forums', 'fossil', 'foster', 'fought', 'fourth', 'framed', 'frames', 'france', 'fraser', 'freely', 'freeze', 'french', 'friday', 'fridge', 'friend', 'frozen', 'fruits', 'fucked', 'funded', 'fusion', 'future', 'gained', 'galaxy', 'gaming', 'garage', 'garcia', 'garden', 'garlic', 'garmin', 'gather', 'gender', 'geneva', 'genius', 'genome', 'genres', 'gentle', 'gently', 'george', 'gerald', 'german', 'giants', 'gibson', 'giving', 'glance', 'global', 'gloves', 'golden', 'google', 'gordon', 'gospel', 'gossip', 'gothic', 'gotten', 'grades', 'graham', 'grande', 'granny', 'grants', 'graphs', 'gratis', 'greece', 'greene', 'groove', 'ground', 'groups', 'growth', 'guards', 'guests', 'guided', 'guides', 'guilty', 'guinea', 'guitar', 'guyana', 'habits', 'hacker', 'hammer', 'handed', 'handle', 'hansen', 'happen', 'harbor', 'harder', 'hardly', 'harley', 'harold', 'harper', 'harris', 'harvey', 'having', 'hawaii', 'hazard', 'headed', 'header', 'health', 'hearts', 'heated', 'heater', 'heaven', 'hebrew', 'height', 'helena', 'helmet', 'helped', 'hentai', 'herald', 'herbal', 'hereby', 'herein', 'heroes', 'hidden', 'higher', 'highly', 'hiking', 'hilton', 'hiring', 'hockey', 'holdem', 'holder', 'hollow', 'holmes', 'honest', 'honors', 'hoping', 'horror', 'horses', 'hosted', 'hostel', 'hotels', 'hourly', 'houses', 'howard', 'hudson', 'hughes', 'humans', 'hunger', 'hungry', 'hunter', 'hybrid', 'ignore', 'images', 'immune', 'impact', 'import', 'impose', 'incest', 'inches', 'income', 'indeed', 'indian', 'indoor', 'infant', 'inform', 'injury', 'inkjet', 'inline', 'inputs', 'insert', 'inside', 'intake', 'intend', 'intent', 'invest', 'invite', 'island', 'israel', 'issued', 'issues', 'italia', 'italic', 'itself', 'itunes', 'jacket', 'jackie', 'jaguar', 'jeremy', 'jersey', 'jewish', 'johnny', 'joined', 'jordan', 'joseph', 'joshua', 'judges', 'julian', 'jungle', 'junior', 'justin', 'kansas', 'kelkoo', 'kernel', 'kidney', 'kijiji', 'killed', 'killer', 'kinase', 'knight', 'knives', 'korean', 'kruger', 'kuwait', 'labels', 'labour', 'ladder', 'ladies', 'lambda', 'laptop', 'larger', 'lately', 'latest', 'latina', 'latino', 'latter', 'latvia', 'launch', 'lauren', 'lawyer', 'layers', 'layout', 'leader', 'league', 'leaves', 'legacy', 'legend', 'lender', 'length', 'lenses', 'leslie', 'lesser', 'lesson', 'letter', 'levels', 'liable', 'lights', 'likely', 'limits', 'linear', 'linked', 'liquid', 'listed', 'listen', 'little', 'living', 'loaded', 'locale', 'locate', 'locked', 'logged', 'lolita', 'london', 'lonely', 'longer', 'looked', 'lookup', 'losing', 'losses', 'louise', 'lounge', 'lovely', 'lovers', 'loving', 'lowest', 'luther', 'luxury', 'lyrics', 'madrid', 'magnet', 'maiden', 'mailed', 'mailto', 'mainly', 'makers', 'makeup', 'making', 'malawi', 'manage', 'manner', 'manual', 'marble', 'marcus', 'margin', 'mariah', 'marina', 'marine', 'marion', 'marked', 'marker', 'market', 'martha', 'martin', 'marvel', 'master', 'mating', 'matrix', 'matter', 'mature', 'median', 'medium', 'meetup', 'member', 'memory', 'mental', 'mentor', 'merely', 'merger', 'metals', 'meters', 'method', 'metres', 'metric', 'mexico', 'michel', 'middle', 'mighty', 'miller', 'milton', 'mining', 'minute', 'mirror', 'missed', 'mixing', 'mobile', 'models', 'modems', 'modern', 'modify', 'module', 'moment', 'monaco', 'monday', 'monica', 'monkey', 'monroe', 'months', 'morgan', 'morris', 'moscow', 'mostly', 'motels', 'mother', 'motion', 'motors', 'mounts', 'movers', 'movies', 'moving', 'msgstr', 'mumbai', 'munich', 'murder', 'murphy', 'murray', 'muscle', 'museum', 'muslim', 'mutual', 'myrtle', 'myself', 'namely', 'naples', 'narrow', 'nascar', 'nasdaq', 'nathan', 'nation', 'native', 'nature', 'nearby', 'nearly', 'needed', 'needle', 'nelson', 'nested', 'neural', 'nevada', 'newark', 'newbie', 'newest', 'newton', 'nextel', 'nickel', 'nicole', 'nights', 'nipple', 'nissan', 'nobody', 'normal', 'norman', 'norton', 'norway', 'notice', 'notify', 'notion', 'novels', 'nudist', 'nudity', 'number', 'nurses', 'nutten', 'nvidia', 'object', 'obtain', 'occurs', 'offers', 'office', 'offset', 'oldest', 'oliver', 'online', 'opened', 'optics', 'option', 'oracle', 'orange', 'orders', 'oregon', 'orgasm', 'origin', 'others', 'ottawa', 'outlet', 'output', 'owners', 'oxford', 'oxygen', 'packed', 'packet', 'palace', 'palmer', 'pamela', 'panama', 'panels', 'papers', 'parade', 'parcel', 'parent', 'parish', 'parker', 'partly', 'passed', 'passes', 'pastor', 'patent', 'patrol', 'payday', 'paying', 'paypal', 'peeing', 'pencil', 'people', 'pepper', 'period', 'permit', 'person', 'petite', 'phases', 'philip', 'phones', 'photos', 'phrase', 'picked', 'pickup', 'picnic', 'pieces', 'pierce', 'pierre', 'pillow', 'pixels', 'placed', 'places', 'plains', 'planes', 'planet', 'plants', 'plasma', 'plates', 'played', 'player', 'please', 'pledge', 'plenty', 'plugin', 'pocket', 'poetry', 'points', 'poland', 'police', 'policy', 'polish', 'portal', 'porter', 'posing', 'postal', 'posted', 'poster', 'potato', 'potter', 'pounds', 'powder', 'powell', 'powers', 'prague', 'praise', 'prayer', 'prefer', 'prefix', 'pretty', 'priced', 'prices', 'priest', 'prince', 'prints', 'prison', 'prizes', 'profit', 'prompt', 'proper', 'proved', 'proven', 'prozac', 'public', 'pubmed', 'puerto', 'pulled', 'pupils', 'purple', 'pursue', 'pushed', 'puzzle', 'python', 'quebec', 'queens', 'quoted', 'quotes', 'rabbit', 'rachel', 'racial', 'racing', 'radios', 'radius', 'raised', 'raises', 'random', 'ranges', 'ranked', 'rapids', 'rarely', 'rather', 'rating', 'ratios', 'reader', 'really', 'realty', 'reason', 'rebate', 'recall', 'recent', 'recipe', 'record', 'redeem', 'reduce', 'refers', 'refine', 'reform', 'refund', 'refuse', 'regard', 'reggae', 'regime', 'region', 'reject', 'relate', 'relief', 'reload', 'remain', 'remark', 'remedy', 'remind', 'remote', 'remove', 'render', 'rental', 'repair', 'repeat', 'report', 'rescue', 'resist', 'resort', 'result', 'resume', 'retail', 'retain', 'return', 'reveal', 'review', 'reward', 'rhythm', 'ribbon', 'riders', 'riding', 'rights', 'rising', 'rivers', 'robert', 'robots', 'robust', 'rocket', 'rogers', 'roland', 'rolled', 'roller', 'ronald', 'roster', 'rotary', 'rounds', 'router', 'routes', 'rubber', 'ruling', 'runner', 'russia', 'rwanda', 'sacred', 'saddam', 'safari', 'safely', 'safety', 'saints', 'salary', 'salmon', 'sample', 'samuel', 'sandra', 'saturn', 'savage', 'saving', 'saying', 'scales', 'scenes', 'scenic', 'schema', 'scheme', 'school', 'scored', 'scores', 'scotia', 'screen', 'script', 'scroll', 'sealed', 'search', 'season', 'second', 'secret', 'sector', 'secure', 'seeing', 'seeker', 'seemed', 'select', 'seller', 'senate', 'sender', 'senior', 'sensor', 'serbia', 'serial', 'series', 'served', 'server', 'serves', 'settle', 'severe', 'sewing', 'sexcam', 'sexual', 'shades', 'shadow', 'shaped', 'shapes', 'shared', 'shares', 'sharon', 'shaved', 'sheets', 'shield', 'shirts', 'shorts', 'should', 'showed', 'shower', 'sierra', 'signal', 'signed', 'signup', 'silent', 'silver', 'simple', 'simply', 'singer', 'single', 'sister', 'skiing', 'skills', 'skirts', 'sleeps', 'sleeve', 'slides', 'slight', 'slovak', 'slowly', 'smooth', 'soccer', 'social', 'socket', 'sodium', 'solely', 'solved', 'sorted', 'sought', 'sounds', 'source', 'soviet', 'spaces', 'speaks', 'spears', 'speech', 'speeds', 'sphere', 'spider', 'spirit', 'spoken', 'sports', 'spouse', 'spread', 'spring', 'sprint', 'square', 'squirt', 'stable', 'stages', 'stamps', 'stands', 'starts', 'stated', 'states', 'static', 'status', 'stayed', 'steady', 'stereo', 'steven', 'sticks', 'sticky', 'stocks', 'stolen', 'stones', 'stored', 'stores', 'strain', 'strand', 'stream', 'street', 'stress', 'strict', 'strike', 'string', 'strips', 'stroke', 'strong', 'struck', 'struct', 'stuart', 'studio', 'stupid', 'styles', 'stylus', 'subaru', 'submit', 'subtle', 'sudden', 'suffer', 'suited', 'suites', 'summer', 'summit', 'sunday', 'sunset', 'superb', 'supply', 'surely', 'surrey', 'survey', 'sussex', 'suzuki', 'sweden', 'switch', 'sydney', 'symbol', 'syntax', 'system', 'tables', 'tablet', 'tackle', 'tagged', 'taiwan', 'taking', 'talent', 'talked', 'target', 'tariff', 'tattoo', 'taught', 'taylor', 'techno', 'temple', 'tenant', 'tender', 'tennis', 'terror', 'tested', 'thanks', 'thehun', 'themes', 'theory', 'thesis', 'things', 'thinks', 'thirty', 'thomas', 'thongs', 'though', 'thread', 'threat', 'throat', 'thrown', 'throws', 'thumbs', 'ticket', 'tigers', 'timber', 'timely', 'timing', 'tissue', 'titans', 'titled', 'titles', 'titten', 'tobago', 'toilet', 'tomato', 'tongue', 'topics', 'totals', 'toward', 'towers', 'toyota', 'tracks', 'trader', 'trades', 'trails', 'trains', 'trance', 'tranny', 'trauma', 'travel', 'travis', 'treaty', 'trembl', 'trends', 'trials', 'tribal', 'tribes', 'tricks', 'triple', 'trivia', 'troops', 'trucks', 'trusts', 'trying', 'tucson', 'tuning', 'tunnel', 'turkey', 'turned', 'turner', 'turtle', 'twelve', 'twenty', 'twinks', 'typing', 'uganda', 'ultram', 'unable', 'unions', 'unique', 'united', 'unless', 'unlike', 'unlock', 'unwrap', 'update', 'upload', 'urgent', 'useful', 'vacuum', 'vagina', 'valium', 'valley', 'valued', 'values', 'valves', 'varied', 'varies', 'vector', 'velvet', 'vendor', 'venice', 'venues', 'verbal', 'verify', 'vernon', 'versus', 'vertex', 'vessel', 'viagra', 'victim', 'victor', 'videos', 'vienna', 'viewed', 'viewer', 'viking', 'villas', 'violin', 'virgin', 'virtue', 'vision', 'visits', 'visual', 'vocals', 'voices', 'volume', 'voters', 'voting', 'voyeur', 'voyuer', 'wagner', 'waiver', 'walked', 'walker', 'wallet', 'walnut', 'walter', 'wanted', 'warned', 'warner', 'warren', 'washer', 'waters', 'watson', 'wealth', 'weapon', 'webcam', 'weblog', 'weekly', 'weight', 'wesley', 'wheels', 'whilst', 'wicked', 'widely', 'willow', 'wilson', 'window', 'winner', 'winter', 'wiring', 'wisdom', 'wishes', 'within', 'wizard', 'womens', 'wonder', 'wooden', 'worked', 'worker', 'worlds', 'worthy', 'wright', 'writer', 'writes', 'yamaha', 'yearly', 'yellow', 'yields', 'zambia', 'zoloft', 'zoning', 'zshops']
-
-    words+=['ability', 'abraham', 'absence', 'academy', 'accepts', 'account', 'accused', 'achieve', 'acquire', 'acrobat', 'acrylic', 'actions', 'actress', 'adapted', 'adapter', 'adaptor', 'address', 'adopted', 'advance', 'adverse', 'advised', 'advisor', 'affairs', 'affects', 'african', 'against', 'airfare', 'airline', 'airport', 'alabama', 'albania', 'alberta', 'alcohol', 'algebra', 'algeria', 'alleged', 'allergy', 'allowed', 'already', 'altered', 'amateur', 'amazing', 'ambient', 'amended', 'america', 'amongst', 'amounts', 'ampland', 'anaheim', 'analyst', 'analyze', 'anatomy', 'ancient', 'andorra', 'andreas', 'andrews', 'angeles', 'animals', 'another', 'answers', 'antenna', 'anthony', 'antigua', 'antique', 'antonio', 'anxiety', 'anybody', 'anymore', 'anytime', 'apparel', 'appeals', 'appears', 'applied', 'applies', 'approve', 'aquatic', 'archive', 'arising', 'arizona', 'armenia', 'arrange', 'arrival', 'arrived', 'arrives', 'article', 'artists', 'artwork', 'aspects', 'assault', 'assists', 'assumed', 'assumes', 'assured', 'atlanta', 'attacks', 'attempt', 'attract', 'auction', 'auditor', 'austria', 'authors', 'average', 'awarded', 'awesome', 'backing', 'baghdad', 'bahamas', 'bahrain', 'balance', 'balloon', 'bangbus', 'bangkok', 'banking', 'banners', 'baptist', 'barbara', 'bargain', 'barrier', 'baskets', 'battery', 'beaches', 'bearing', 'beatles', 'because', 'becomes', 'bedding', 'bedford', 'bedroom', 'beijing', 'belarus', 'belfast', 'belgium', 'beliefs', 'believe', 'belongs', 'beneath', 'benefit', 'bennett', 'bermuda', 'bernard', 'besides', 'betting', 'between', 'beverly', 'bicycle', 'bidding', 'biggest', 'billing', 'billion', 'binding', 'biology', 'bizarre', 'bizrate', 'blanket', 'blessed', 'blocked', 'blogger', 'blowing', 'blowjob', 'boating', 'bolivia', 'bondage', 'booking', 'boolean', 'borders', 'borough', 'bottles', 'boulder', 'bouquet', 'bowling', 'bracket', 'bradley', 'brandon', 'breasts', 'bridges', 'briefly', 'bristol', 'britain', 'british', 'britney', 'broader', 'brokers', 'brother', 'brought', 'browser', 'budgets', 'buffalo', 'builder', 'bukkake', 'burning', 'buttons', 'cabinet', 'calcium', 'calgary', 'calling', 'cameras', 'cameron', 'camping', 'candles', 'capable', 'capital', 'capitol', 'captain', 'capture', 'cardiac', 'cardiff', 'careers', 'careful', 'carried', 'carrier', 'carries', 'carroll', 'cartoon', 'casinos', 'casting', 'catalog', 'causing', 'caution', 'ceiling', 'centers', 'central', 'centres', 'century', 'ceramic', 'certain', 'chamber', 'chances', 'changed', 'changes', 'channel', 'chapter', 'charged', 'charger', 'charges', 'charity', 'charles', 'charlie', 'charter', 'chassis', 'cheaper', 'checked', 'chelsea', 'chester', 'chicago', 'chicken', 'chinese', 'choices', 'chronic', 'circles', 'circuit', 'citizen', 'claimed', 'clarity', 'classes', 'classic', 'cleaner', 'cleanup', 'cleared', 'clearly', 'clients', 'climate', 'clinics', 'clinton', 'closely', 'closest', 'closing', 'closure', 'clothes', 'cluster', 'cnetcom', 'coaches', 'coastal', 'coating', 'coleman', 'collect', 'college', 'collins', 'cologne', 'colored', 'colours', 'columns', 'combine', 'comfort', 'command', 'comment', 'commons', 'compact', 'company', 'compare', 'compete', 'compile', 'complex', 'compute', 'concept', 'concern', 'concert', 'concord', 'conduct', 'confirm', 'connect', 'consent', 'consist', 'console', 'consult', 'contact', 'contain', 'content', 'contest', 'context', 'control', 'convert', 'cookies', 'cooking', 'cooling', 'copying', 'cornell', 'corners', 'correct', 'costume', 'cottage', 'council', 'counsel', 'counted', 'counter', 'country', 'coupled', 'couples', 'coupons', 'courage', 'courier', 'courses', 'covered', 'created', 'creates', 'creator', 'credits', 'cricket', 'critics', 'croatia', 'crucial', 'cruises', 'crystal', 'cuisine', 'culture', 'cumshot', 'curious', 'current', 'custody', 'customs', 'cutting', 'cycling', 'damaged', 'damages', 'dancing', 'dealers', 'dealing', 'deborah', 'decades', 'decided', 'decimal', 'declare', 'decline', 'default', 'defects', 'defence', 'defense', 'deficit', 'defined', 'defines', 'degrees', 'delayed', 'deleted', 'delight', 'deliver', 'demands', 'denmark', 'density', 'depends', 'deposit', 'derived', 'deserve', 'designs', 'desired', 'desktop', 'despite', 'destiny', 'destroy', 'details', 'detroit', 'deutsch', 'develop', 'deviant', 'devices', 'devoted', 'diagram', 'diamond', 'dietary', 'digital', 'diploma', 'disable', 'discuss', 'disease', 'display', 'dispute', 'distant', 'diverse', 'divided', 'divorce', 'doctors', 'dollars', 'domains', 'donated', 'douglas', 'drawing', 'dressed', 'dresses', 'drivers', 'driving', 'dropped', 'durable', 'dynamic', 'earlier', 'earning', 'eastern', 'eclipse', 'ecology', 'economy', 'ecuador', 'editing', 'edition', 'editors', 'edwards', 'effects', 'efforts', 'elderly', 'elected', 'electro', 'elegant', 'element', 'elliott', 'embassy', 'emerald', 'emperor', 'enabled', 'enables', 'endless', 'enemies', 'engaged', 'engines', 'england', 'english', 'enhance', 'enjoyed', 'enlarge', 'enquiry', 'ensures', 'entered', 'entries', 'episode', 'equally', 'erotica', 'escorts', 'essence', 'estates', 'estonia', 'eternal', 'ethical', 'evening', 'evident', 'exactly', 'examine', 'example', 'excerpt', 'excited', 'exclude', 'execute', 'exhaust', 'exhibit', 'existed', 'expects', 'expedia', 'expense', 'experts', 'expired', 'expires', 'explain', 'explore', 'exports', 'exposed', 'express', 'extends', 'extract', 'extreme', 'fabrics', 'factors', 'factory', 'faculty', 'failing', 'failure', 'falling', 'fantasy', 'farmers', 'farming', 'fashion', 'fastest', 'fathers', 'feature', 'federal', 'feeding', 'feeling', 'females', 'ferrari', 'fiction', 'fifteen', 'fighter', 'figured', 'figures', 'filling', 'filters', 'finally', 'finance', 'finding', 'findlaw', 'fingers', 'finland', 'finnish', 'firefox', 'fishing', 'fisting', 'fitness', 'fitting', 'flights', 'florida', 'florist', 'flowers', 'focused', 'focuses', 'folders', 'folding', 'follows', 'footage', 'foreign', 'forests', 'forever', 'formats', 'forming', 'formula', 'fortune', 'forward', 'founded', 'founder', 'framing', 'francis', 'freebsd', 'freedom', 'freight', 'friends', 'fucking', 'fujitsu', 'funding', 'funeral', 'further', 'futures', 'gabriel', 'gadgets', 'gallery', 'garbage', 'gardens', 'gateway', 'gazette', 'general', 'generic', 'genesis', 'genetic', 'genuine', 'geology', 'georgia', 'germany', 'getting', 'gilbert', 'glasgow', 'glasses', 'glucose', 'gourmet', 'grammar', 'granted', 'graphic', 'gratuit', 'gravity', 'greater', 'greatly', 'gregory', 'grenada', 'griffin', 'grocery', 'grounds', 'growing', 'guitars', 'habitat', 'halfcom', 'halifax', 'hamburg', 'hampton', 'handjob', 'handled', 'handles', 'hanging', 'happens', 'harbour', 'harmful', 'harmony', 'harvard', 'harvest', 'hazards', 'headers', 'heading', 'headset', 'healing', 'healthy', 'hearing', 'heather', 'heating', 'heavily', 'heights', 'helpful', 'helping', 'herself', 'hewlett', 'highest', 'highway', 'himself', 'history', 'hitachi', 'hitting', 'hobbies', 'holders', 'holding', 'holiday', 'holland', 'hopkins', 'horizon', 'hormone', 'hostels', 'hosting', 'hotmail', 'hottest', 'housing', 'houston', 'however', 'hundred', 'hungary', 'hunting', 'husband', 'hygiene', 'hyundai', 'iceland', 'ignored', 'illegal', 'illness', 'imagine', 'imaging', 'impacts', 'implied', 'implies', 'imports', 'imposed', 'improve', 'include', 'indexed', 'indexes', 'indiana', 'indians', 'indices', 'induced', 'infants', 'initial', 'injured', 'inquire', 'inquiry', 'insects', 'insider', 'insight', 'install', 'instant', 'instead', 'insulin', 'insured', 'integer', 'intense', 'interim', 'invalid', 'invited', 'invoice', 'involve', 'ireland', 'islamic', 'islands', 'israeli', 'italian', 'jackets', 'jackson', 'jamaica', 'january', 'jeffrey', 'jelsoft', 'jessica', 'jewelry', 'johnson', 'joining', 'journal', 'journey', 'jumping', 'justice', 'justify', 'karaoke', 'katrina', 'keeping', 'kennedy', 'kenneth', 'keyword', 'killing', 'kingdom', 'kissing', 'kitchen', 'knights', 'knowing', 'labeled', 'landing', 'laptops', 'largely', 'largest', 'lasting', 'latinas', 'laundry', 'lawsuit', 'lawyers', 'leaders', 'leading', 'learned', 'leasing', 'leather', 'leaving', 'lebanon', 'lecture', 'legally', 'legends', 'leisure', 'lenders', 'lending', 'leonard', 'lesbian', 'lessons', 'letters', 'letting', 'levitra', 'lexmark', 'liberal', 'liberia', 'liberty', 'library', 'licence', 'license', 'licking', 'lighter', 'limited', 'lincoln', 'lindsay', 'linking', 'listing', 'livecam', 'livesex', 'loading', 'locally', 'located', 'locator', 'locking', 'lodging', 'logging', 'logical', 'longest', 'looking', 'lottery', 'luggage', 'machine', 'madison', 'madness', 'madonna', 'magical', 'mailing', 'mailman', 'managed', 'manager', 'mandate', 'manuals', 'mapping', 'marilyn', 'markers', 'markets', 'marking', 'married', 'martial', 'massage', 'massive', 'masters', 'matched', 'matches', 'matters', 'matthew', 'maximum', 'meaning', 'measure', 'medical', 'medline', 'meeting', 'melissa', 'members', 'memphis', 'mention', 'mercury', 'message', 'methods', 'mexican', 'michael', 'midwest', 'mileage', 'million', 'mineral', 'minimal', 'minimum', 'minolta', 'minutes', 'miracle', 'mirrors', 'missile', 'missing', 'mission', 'mistake', 'mixture', 'mobiles', 'modular', 'modules', 'moldova', 'moments', 'monitor', 'monster', 'montana', 'monthly', 'morning', 'morocco', 'mothers', 'mounted', 'mozilla', 'muscles', 'museums', 'musical', 'muslims', 'mustang', 'myanmar', 'mysimon', 'myspace', 'mystery', 'namibia', 'nations', 'natural', 'naughty', 'nearest', 'neither', 'nervous', 'network', 'neutral', 'newport', 'newscom', 'niagara', 'nigeria', 'nipples', 'nirvana', 'norfolk', 'nothing', 'noticed', 'notices', 'novelty', 'nowhere', 'nuclear', 'numbers', 'numeric', 'nursery', 'nursing', 'oakland', 'obesity', 'objects', 'observe', 'obvious', 'october', 'offense', 'offered', 'officer', 'offices', 'offline', 'olympic', 'olympus', 'ongoing', 'ontario', 'opening', 'operate', 'opinion', 'opposed', 'optical', 'optimal', 'optimum', 'options', 'ordered', 'organic', 'origins', 'orlando', 'orleans', 'outcome', 'outdoor', 'outline', 'outlook', 'outputs', 'outside', 'overall', 'pacific', 'package', 'packard', 'packets', 'packing', 'painful', 'painted', 'panties', 'parents', 'parking', 'partial', 'parties', 'partner', 'passage', 'passing', 'passion', 'passive', 'patches', 'patents', 'patient', 'patrick', 'pattern', 'payable', 'payment', 'payroll', 'penalty', 'pendant', 'pending', 'penguin', 'pension', 'pentium', 'peoples', 'percent', 'perfect', 'perform', 'perfume', 'perhaps', 'periods', 'permits', 'persian', 'persons', 'phantom', 'philips', 'phoenix', 'phrases', 'physics', 'picking', 'picture', 'pioneer', 'pirates', 'pissing', 'placing', 'planets', 'planned', 'planner', 'plastic', 'playboy', 'players', 'playing', 'pleased', 'plugins', 'pockets', 'podcast', 'pointed', 'pointer', 'pokemon', 'polymer', 'pontiac', 'popular', 'porsche', 'portion', 'possess', 'postage', 'posters', 'posting', 'pottery', 'poultry', 'poverty', 'powered', 'prairie', 'prayers', 'precise', 'predict', 'prefers', 'premier', 'premium', 'prepaid', 'prepare', 'present', 'pressed', 'preston', 'prevent', 'preview', 'pricing', 'primary', 'printed', 'printer', 'privacy', 'private', 'problem', 'proceed', 'process', 'produce', 'product', 'profile', 'profits', 'program', 'project', 'promise', 'promote', 'prophet', 'propose', 'protect', 'protein', 'protest', 'proudly', 'provide', 'publish', 'pulling', 'purpose', 'pursuit', 'pushing', 'putting', 'puzzles', 'qualify', 'quality', 'quantum', 'quarter', 'queries', 'quickly', 'quizzes', 'radical', 'railway', 'rainbow', 'raising', 'raleigh', 'rangers', 'ranging', 'ranking', 'rapidly', 'ratings', 'raymond', 'reached', 'reaches', 'readers', 'readily', 'reading', 'reality', 'realize', 'realtor', 'reasons', 'rebates', 'rebecca', 'rebound', 'receipt', 'receive', 'recipes', 'records', 'recover', 'redhead', 'reduced', 'reduces', 'refined', 'reflect', 'reforms', 'refresh', 'refused', 'regards', 'regions', 'regular', 'related', 'relates', 'release', 'relying', 'remains', 'remarks', 'removal', 'removed', 'renewal', 'rentals', 'rentcom', 'repairs', 'replace', 'replica', 'replied', 'replies', 'reports', 'reprint', 'request', 'require', 'reserve', 'resolve', 'resorts', 'respect', 'respond', 'restore', 'results', 'resumes', 'retired', 'retreat', 'returns', 'reunion', 'reuters', 'reveals', 'revenge', 'revenue', 'reverse', 'reviews', 'revised', 'rewards', 'richard', 'roberts', 'rolling', 'romance', 'romania', 'roughly', 'routers', 'routine', 'routing', 'royalty', 'running', 'runtime', 'russell', 'russian', 'sailing', 'samples', 'samsung', 'satisfy', 'savings', 'scanned', 'scanner', 'schemes', 'scholar', 'schools', 'science', 'scoring', 'scratch', 'screens', 'scripts', 'seafood', 'seasons', 'seating', 'seattle', 'seconds', 'secrets', 'section', 'sectors', 'secured', 'seekers', 'seeking', 'segment', 'sellers', 'selling', 'seminar', 'senator', 'sending', 'senegal', 'seniors', 'sensors', 'serious', 'servers', 'service', 'serving', 'session', 'setting', 'settled', 'seventh', 'several', 'shadows', 'shakira', 'shannon', 'sharing', 'shelter', 'shemale', 'sheriff', 'sherman', 'shipped', 'shopper', 'shorter', 'shortly', 'showers', 'showing', 'shuttle', 'siemens', 'signals', 'signing', 'silence', 'silicon', 'similar', 'simpson', 'singing', 'singles', 'sisters', 'sitemap', 'sitting', 'skating', 'skilled', 'smaller', 'smilies', 'smoking', 'society', 'solaris', 'soldier', 'solomon', 'solving', 'somalia', 'somehow', 'someone', 'soonest', 'sources', 'spanish', 'spatial', 'speaker', 'special', 'species', 'specify', 'spencer', 'spirits', 'sponsor', 'springs', 'spyware', 'stadium', 'stanley', 'started', 'starter', 'startup', 'stating', 'station', 'statute', 'staying', 'stephen', 'stevens', 'stewart', 'sticker', 'stomach', 'stopped', 'storage', 'stories', 'strange', 'streams', 'streets', 'stretch', 'strikes', 'strings', 'stripes', 'student', 'studied', 'studies', 'studios', 'stuffed', 'stylish', 'subject', 'sublime', 'succeed', 'success', 'sucking', 'suggest', 'suicide', 'summary', 'sunrise', 'support', 'suppose', 'supreme', 'surface', 'surfing', 'surgeon', 'surgery', 'surname', 'surplus', 'surveys', 'survive', 'suspect', 'swedish', 'symbols', 'systems', 'tablets', 'tactics', 'talking', 'targets', 'teacher', 'teaches', 'teenage', 'telecom', 'telling', 'tension', 'terrace', 'terrain', 'testing', 'textile', 'texture', 'theater', 'theatre', 'theorem', 'therapy', 'thereby', 'thereof', 'thermal', 'thomson', 'thought', 'threads', 'threats', 'through', 'thunder', 'tickets', 'tiffany', 'timothy', 'tobacco', 'toddler', 'tonight', 'toolbar', 'toolbox', 'toolkit', 'topless', 'toronto', 'torture', 'toshiba', 'totally', 'touched', 'touring', 'tourism', 'tourist', 'towards', 'tracked', 'tracker', 'tractor', 'trading', 'traffic', 'tragedy', 'trailer', 'trained', 'trainer', 'transit', 'travels', 'treated', 'tribune', 'tribute', 'trigger', 'trinity', 'triumph', 'trouble', 'trusted', 'trustee', 'tsunami', 'tuesday', 'tuition', 'tunisia', 'turkish', 'turning', 'twisted', 'typical', 'ukraine', 'unified', 'uniform', 'unknown', 'unusual', 'updated', 'updates', 'upgrade', 'upskirt', 'uruguay', 'usually', 'utility', 'utilize', 'vaccine', 'vampire', 'vanilla', 'variety', 'various', 'varying', 'vatican', 'vehicle', 'vendors', 'venture', 'verizon', 'vermont', 'version', 'vessels', 'veteran', 'victims', 'victory', 'vietnam', 'viewers', 'viewing', 'village', 'vincent', 'vintage', 'violent', 'virtual', 'viruses', 'visible', 'visited', 'visitor', 'vitamin', 'voltage', 'volumes', 'waiting', 'walking', 'wallace', 'wanting', 'warming', 'warning', 'warrant', 'warrior', 'washing', 'watched', 'watches', 'weapons', 'wearing', 'weather', 'webcams', 'webcast', 'weblogs', 'webpage', 'website', 'webster', 'wedding', 'weekend', 'weights', 'welcome', 'welding', 'welfare', 'western', 'whereas', 'whether', 'wichita', 'william', 'willing', 'windows', 'windsor', 'winners', 'winning', 'winston', 'without', 'witness', 'workers', 'working', 'workout', 'worried', 'worship', 'wrapped', 'writers', 'writing', 'written', 'wyoming', 'younger', 'zealand']
 
-    words+=['aberdeen', 'abortion', 'absolute', 'abstract', 'academic', 'accepted', 'accessed', 'accident', 'accounts', 'accuracy', 'accurate', 'achieved', 'acoustic', 'acquired', 'actively', 'activity', 'actually', 'adapters', 'adaptive', 'addition', 'adelaide', 'adequate', 'adjacent', 'adjusted', 'admitted', 'adoption', 'advanced', 'advances', 'advisors', 'advisory', 'advocacy', 'advocate', 'affected', 'agencies', 'aircraft', 'airlines', 'airplane', 'airports', 'alliance', 'allowing', 'although', 'aluminum', 'american', 'americas', 'analyses', 'analysis', 'analysts', 'analyzed', 'anderson', 'animated', 'announce', 'annoying', 'annually', 'answered', 'antibody', 'antiques', 'anything', 'anywhere', 'apparent', 'appeared', 'appendix', 'applying', 'approach', 'approval', 'approved', 'aquarium', 'archived', 'archives', 'argument', 'arkansas', 'arranged', 'arrested', 'arrivals', 'articles', 'artistic', 'asbestos', 'assembly', 'assessed', 'assigned', 'assisted', 'assuming', 'athletes', 'athletic', 'atlantic', 'attached', 'attacked', 'attempts', 'attended', 'attitude', 'attorney', 'auckland', 'auctions', 'audience', 'aviation', 'avoiding', 'bachelor', 'bacteria', 'balanced', 'barbados', 'bargains', 'barriers', 'baseball', 'baseline', 'basement', 'basename', 'bathroom', 'becoming', 'bedrooms', 'beginner', 'behavior', 'believed', 'believes', 'benefits', 'benjamin', 'berkeley', 'beverage', 'biblical', 'birthday', 'bleeding', 'blocking', 'bloggers', 'blogging', 'blowjobs', 'bookings', 'bookmark', 'botswana', 'boundary', 'boutique', 'bracelet', 'bradford', 'branches', 'breaking', 'breeding', 'briefing', 'brighton', 'bringing', 'brisbane', 'broadway', 'brochure', 'brooklyn', 'brothers', 'browsers', 'browsing', 'brunette', 'brussels', 'budapest', 'builders', 'building', 'bulgaria', 'bulletin', 'business', 'cabinets', 'cadillac', 'calendar', 'cambodia', 'cameroon', 'campaign', 'campbell', 'canadian', 'canberra', 'capacity', 'captured', 'carnival', 'carolina', 'caroline', 'carriers', 'carrying', 'cartoons', 'cashiers', 'cassette', 'catalogs', 'catalyst', 'category', 'catering', 'catholic', 'cellular', 'cemetery', 'centered', 'ceremony', 'chairman', 'chambers', 'champion', 'changing', 'channels', 'chapters', 'chargers', 'charging', 'charming', 'cheapest', 'checking', 'checkout', 'chemical', 'children', 'choosing', 'chrysler', 'churches', 'cingular', 'circuits', 'circular', 'citation', 'citizens', 'civilian', 'classics', 'cleaners', 'cleaning', 'clearing', 'clicking', 'climbing', 'clinical', 'clothing', 'clusters', 'coaching', 'collapse', 'colleges', 'colombia', 'colonial', 'colorado', 'columbia', 'columbus', 'combined', 'combines', 'commands', 'comments', 'commerce', 'commonly', 'compared', 'compiled', 'compiler', 'complete', 'composed', 'composer', 'compound', 'computed', 'computer', 'concepts', 'concerns', 'concerts', 'conclude', 'concrete', 'conflict', 'confused', 'congress', 'consider', 'consists', 'consoles', 'constant', 'consumer', 'contacts', 'contains', 'contents', 'contests', 'continue', 'contract', 'contrary', 'contrast', 'controls', 'cookbook', 'cordless', 'cornwall', 'cosmetic', 'costumes', 'cottages', 'councils', 'counters', 'counties', 'counting', 'courtesy', 'coverage', 'covering', 'crawford', 'creating', 'creation', 'creative', 'creature', 'criminal', 'criteria', 'critical', 'crossing', 'cultural', 'cultures', 'cumshots', 'currency', 'customer', 'cylinder', 'darkness', 'database', 'daughter', 'davidson', 'deadline', 'dealtime', 'december', 'decision', 'declared', 'declined', 'decrease', 'deferred', 'defining', 'delaware', 'delivers', 'delivery', 'democrat', 'dentists', 'deposits', 'describe', 'designed', 'designer', 'desktops', 'detailed', 'detected', 'detector', 'deutsche', 'develops', 'diabetes', 'dialogue', 'diameter', 'diamonds', 'directed', 'directly', 'director', 'disabled', 'disagree', 'disaster', 'disclose', 'discount', 'discover', 'discrete', 'diseases', 'disorder', 'dispatch', 'displays', 'disposal', 'disputes', 'distance', 'distinct', 'district', 'dividend', 'division', 'doctrine', 'document', 'domestic', 'dominant', 'donation', 'download', 'downtown', 'drainage', 'dramatic', 'drawings', 'dressing', 'drilling', 'drinking', 'duration', 'dynamics', 'earliest', 'earnings', 'earrings', 'economic', 'editions', 'edmonton', 'educated', 'egyptian', 'election', 'electric', 'electron', 'elements', 'elephant', 'eligible', 'embedded', 'emerging', 'emirates', 'emission', 'emotions', 'emphasis', 'employed', 'employee', 'employer', 'enabling', 'enclosed', 'encoding', 'endorsed', 'engaging', 'engineer', 'enhanced', 'enjoying', 'enormous', 'enrolled', 'ensemble', 'ensuring', 'entering', 'entirely', 'entities', 'entitled', 'entrance', 'envelope', 'epinions', 'episodes', 'equality', 'equation', 'equipped', 'ericsson', 'estimate', 'ethernet', 'ethiopia', 'european', 'evaluate', 'everyday', 'everyone', 'evidence', 'examined', 'examines', 'examples', 'exchange', 'exciting', 'excluded', 'executed', 'exercise', 'exhibits', 'existing', 'expanded', 'expansys', 'expected', 'expenses', 'explains', 'explicit', 'explorer', 'exposure', 'extended', 'exterior', 'external', 'fabulous', 'facility', 'failures', 'familiar', 'families', 'favorite', 'featured', 'features', 'february', 'feedback', 'feelings', 'festival', 'fighters', 'fighting', 'filename', 'finances', 'findings', 'finished', 'fioricet', 'firewall', 'firewire', 'firmware', 'fixtures', 'flashers', 'flashing', 'flexible', 'floating', 'flooring', 'florence', 'florists', 'focusing', 'followed', 'football', 'footwear', 'forecast', 'forestry', 'formerly', 'fountain', 'fraction', 'franklin', 'freeware', 'frequent', 'friendly', 'frontier', 'function', 'gambling', 'gamecube', 'gamespot', 'gangbang', 'gasoline', 'gathered', 'generate', 'generous', 'genetics', 'geometry', 'glossary', 'gorgeous', 'governor', 'graduate', 'graphics', 'grateful', 'greatest', 'greeting', 'guardian', 'guidance', 'hamilton', 'handbags', 'handbook', 'handheld', 'handjobs', 'handling', 'handmade', 'happened', 'hardcore', 'hardware', 'hardwood', 'harrison', 'hartford', 'hawaiian', 'headline', 'hearings', 'heritage', 'highland', 'highways', 'hispanic', 'historic', 'holdings', 'holidays', 'homeland', 'homeless', 'homepage', 'hometown', 'homework', 'honduras', 'honolulu', 'horrible', 'hospital', 'humanity', 'humidity', 'hundreds', 'hydrogen', 'identify', 'identity', 'illinois', 'impaired', 'imperial', 'imported', 'improved', 'incident', 'included', 'includes', 'incoming', 'increase', 'incurred', 'indicate', 'indirect', 'industry', 'infected', 'infinite', 'informal', 'informed', 'infrared', 'injuries', 'innocent', 'inserted', 'insights', 'inspired', 'instance', 'integral', 'intended', 'interact', 'interest', 'interior', 'internal', 'internet', 'interval', 'intimate', 'intranet', 'invasion', 'investor', 'invision', 'involved', 'involves', 'isolated', 'istanbul', 'italiano', 'japanese', 'jennifer', 'johnston', 'jonathan', 'journals', 'judgment', 'judicial', 'junction', 'juvenile', 'kentucky', 'keyboard', 'keywords', 'kingston', 'knitting', 'language', 'latitude', 'laughing', 'launched', 'launches', 'lawrence', 'learners', 'learning', 'lectures', 'lesbians', 'licensed', 'licenses', 'lifetime', 'lighting', 'likewise', 'limiting', 'lingerie', 'listings', 'literacy', 'literary', 'location', 'logitech', 'machines', 'magazine', 'magnetic', 'mainland', 'maintain', 'majority', 'malaysia', 'maldives', 'managers', 'managing', 'manitoba', 'manually', 'marathon', 'margaret', 'maritime', 'marriage', 'marriott', 'marshall', 'maryland', 'matching', 'material', 'mattress', 'maximize', 'mcdonald', 'measured', 'measures', 'medicaid', 'medicare', 'medicine', 'medieval', 'meetings', 'membrane', 'memorial', 'memories', 'mercedes', 'merchant', 'messages', 'metadata', 'metallic', 'michelle', 'michigan', 'midlands', 'midnight', 'military', 'millions', 'minerals', 'minimize', 'minister', 'ministry', 'minority', 'missions', 'missouri', 'mistakes', 'mistress', 'mitchell', 'mobility', 'modeling', 'moderate', 'modified', 'moisture', 'momentum', 'monetary', 'mongolia', 'monitors', 'montreal', 'moreover', 'morrison', 'mortgage', 'motorola', 'mountain', 'mounting', 'movement', 'multiple', 'musician', 'national', 'naturals', 'navigate', 'nebraska', 'necklace', 'negative', 'neighbor', 'netscape', 'networks', 'nicholas', 'nickname', 'nintendo', 'nitrogen', 'normally', 'northern', 'notebook', 'notified', 'november', 'numerous', 'observed', 'observer', 'obtained', 'occasion', 'occupied', 'occurred', 'offering', 'officers', 'official', 'offshore', 'oklahoma', 'olympics', 'openings', 'operated', 'operates', 'operator', 'opinions', 'opponent', 'opposite', 'optimize', 'optional', 'ordering', 'ordinary', 'organize', 'oriental', 'oriented', 'original', 'outcomes', 'outdoors', 'outlined', 'outreach', 'overcome', 'overhead', 'overseas', 'overview', 'packages', 'painting', 'pakistan', 'paradise', 'paraguay', 'parallel', 'parental', 'particle', 'partners', 'passport', 'password', 'patients', 'patricia', 'patterns', 'pavilion', 'payments', 'peaceful', 'pensions', 'performs', 'periodic', 'personal', 'peterson', 'petition', 'pharmacy', 'phillips', 'physical', 'pictures', 'pipeline', 'planners', 'planning', 'plastics', 'platform', 'platinum', 'playback', 'playlist', 'pleasant', 'pleasure', 'plumbing', 'plymouth', 'podcasts', 'pointing', 'policies', 'polished', 'politics', 'portable', 'portions', 'portland', 'portrait', 'portugal', 'position', 'positive', 'possible', 'possibly', 'postcard', 'postings', 'potatoes', 'powerful', 'practice', 'precious', 'pregnant', 'premiere', 'premises', 'prepared', 'presence', 'presents', 'preserve', 'pressing', 'pressure', 'previews', 'previous', 'princess', 'printers', 'printing', 'priority', 'prisoner', 'probably', 'problems', 'proceeds', 'produced', 'producer', 'produces', 'products', 'profiles', 'programs', 'progress', 'projects', 'promised', 'promises', 'promoted', 'promotes', 'promptly', 'propecia', 'properly', 'property', 'proposal', 'proposed', 'prospect', 'prostate', 'proteins', 'protocol', 'provided', 'provider', 'provides', 'province', 'publicly', 'purchase', 'purposes', 'pursuant', 'quantity', 'quarters', 'question', 'railroad', 'rankings', 'rational', 'reaching', 'reaction', 'readings', 'realized', 'realtors', 'received', 'receiver', 'receives', 'recently', 'receptor', 'recorded', 'recorder', 'recovery', 'reducing', 'referral', 'referred', 'reflects', 'refugees', 'regarded', 'regional', 'register', 'registry', 'rejected', 'relating', 'relation', 'relative', 'released', 'releases', 'relevant', 'reliable', 'reliance', 'religion', 'remained', 'remedies', 'remember', 'reminder', 'removing', 'rendered', 'repeated', 'replaced', 'reported', 'reporter', 'reprints', 'republic', 'requests', 'required', 'requires', 'research', 'reseller', 'reserved', 'reserves', 'resident', 'resolved', 'resource', 'response', 'restored', 'restrict', 'resulted', 'retailer', 'retained', 'retrieve', 'returned', 'revealed', 'revenues', 'reviewed', 'reviewer', 'revision', 'reynolds', 'richards', 'richmond', 'ringtone', 'robinson', 'romantic', 'roommate', 'rotation', 'roulette', 'routines', 'salaries', 'salvador', 'sampling', 'sandwich', 'sapphire', 'saturday', 'savannah', 'scanners', 'scanning', 'scenario', 'schedule', 'scholars', 'sciences', 'scotland', 'scottish', 'searched', 'searches', 'seasonal', 'sections', 'securely', 'security', 'segments', 'selected', 'semester', 'seminars', 'senators', 'sentence', 'separate', 'sequence', 'services', 'sessions', 'settings', 'sexually', 'shanghai', 'shemales', 'shepherd', 'shipment', 'shipping', 'shooting', 'shoppers', 'shopping', 'shoulder', 'showcase', 'simpsons', 'situated', 'sleeping', 'slightly', 'slovakia', 'slovenia', 'snapshot', 'softball', 'software', 'soldiers', 'solution', 'somebody', 'somerset', 'somewhat', 'southern', 'spanking', 'speakers', 'speaking', 'specials', 'specific', 'spectrum', 'speeches', 'spelling', 'spending', 'sponsors', 'sporting', 'springer', 'staffing', 'standard', 'standing', 'stanford', 'starring', 'starting', 'stations', 'statutes', 'steering', 'sterling', 'stickers', 'stopping', 'straight', 'stranger', 'strategy', 'strength', 'strictly', 'striking', 'stronger', 'strongly', 'struggle', 'students', 'studying', 'stunning', 'subjects', 'suburban', 'suddenly', 'suffered', 'suggests', 'suitable', 'sullivan', 'sunshine', 'superior', 'supplied', 'supplier', 'supplies', 'supports', 'supposed', 'surfaces', 'surgeons', 'surgical', 'surprise', 'surround', 'survival', 'survivor', 'swimming', 'swingers', 'switched', 'switches', 'symantec', 'sympathy', 'symphony', 'symptoms', 'syndrome', 'synopsis', 'syracuse', 'talented', 'tanzania', 'targeted', 'taxation', 'teachers', 'teaching', 'template', 'temporal', 'terminal', 'terrible', 'textbook', 'textiles', 'thailand', 'theaters', 'theology', 'theories', 'thinking', 'thinkpad', 'thompson', 'thorough', 'thoughts', 'thousand', 'threaded', 'thriller', 'throwing', 'thursday', 'timeline', 'titanium', 'together', 'tomatoes', 'tomorrow', 'township', 'tracking', 'trailers', 'trainers', 'training', 'tramadol', 'transfer', 'transmit', 'traveler', 'travesti', 'treasure', 'treasury', 'treating', 'triangle', 'tribunal', 'trinidad', 'tropical', 'trustees', 'tutorial', 'ultimate', 'universe', 'unlikely', 'unsigned', 'untitled', 'upcoming', 'updating', 'upgrades', 'uploaded', 'upskirts', 'username', 'vacation', 'validity', 'valuable', 'variable', 'variance', 'vehicles', 'velocity', 'ventures', 'verified', 'versions', 'vertical', 'veterans', 'vibrator', 'victoria', 'villages', 'violence', 'virginia', 'visiting', 'visitors', 'vitamins', 'warcraft', 'warnings', 'warranty', 'warriors', 'watching', 'webshots', 'websites', 'weddings', 'weekends', 'weighted', 'wellness', 'whatever', 'whenever', 'wherever', 'wildlife', 'williams', 'wireless', 'wishlist', 'workflow', 'workshop', 'worldcat', 'worldsex', 'wrapping', 'writings', 'yourself', 'zimbabwe']
-
-    # shuffle the words so that they are not in alphabetical order
-    random.Random(4).shuffle(words)
-    
-    # only populate the first 500 words
-    # TODO: Find a way to populate more words.
-    words = words[:500]
-    dynamodb = boto3.resource('dynamodb')
-    wordTable = dynamodb.Table(os.environ['WORD_TABLE'])
-
-    # batch write the words into the table
+@_instrumented("populateWords")
+def handler(event, context):
+    # The words come from the compiled dictionary artifact, see compile_words.py
+    artifact = _getWordArtifact()
+    if artifact is None:
+        return _http_response(ResponseStatus.INTERNAL_ERROR, "Dictionary artifact is missing or corrupt", ApplicationStatus.INPUT_ERROR)
+    words = (word for word_length in artifact.lengths() for word in artifact.words(word_length))
+
+    # Load all the words, stopping early enough to answer before the API Gateway timeout.
+    # A load cut short by the deadline is checkpointed in the word table and resumed by the next call.
+    wordTable = _getTable("WORD_TABLE")
+    deadline = None
+    if context is not None:
+        deadline = time.monotonic() + context.get_remaining_time_in_millis() / 1000.0 - DEADLINE_MARGIN
     try:
-        with wordTable.batch_writer() as batch:
-            for word in words:
-                batch.put_item(Item={
-                    "word_length": len(word),
-                    "word": word.lower(),
-                })
+        stats = _loadWords(wordTable, words, workers=LOADER_WORKERS, checkpoint=TableCheckpoint(wordTable), deadline=deadline)
     except Exception as e:
         print(e)
         return _http_response(ResponseStatus.INTERNAL_ERROR, "Failed to populate words table", ApplicationStatus.DATABASE_ERROR)
+    _count("items_written", stats["items_written"])
+    _count("retries", stats["retries"])
+    if not stats["complete"]:
+        return _http_response(ResponseStatus.ACCEPTED, "Partially populated words table, call again to resume", ApplicationStatus.OK)
     # return a success message
     return _http_response(ResponseStatus.CREATED, "Successfully populated words table", ApplicationStatus.OK)
\ No newline at end of file
@@ -0,0 +1,93 @@
+import base64
+import gzip
+import json
+import os
+
+# Encoding of the HTTP response bodies.
+#
+# Items are never serialized as they come from DynamoDB: every resource has a view, a whitelist
+# of its exposed fields compiled once with the converter of each field, so internal attributes
+# (the secret word of a game in progress, TTLs, versions, ...) cannot leak into a response. Views
+# also convert the Decimal numbers of DynamoDB where they are known to be (eg. the statistics go
+# through int()), so the serializer needs no fallback hook called on every unknown value.
+# The body is serialized with orjson when it is installed, and with the json module otherwise.
+# Bodies of at least GZIP_MIN_BYTES are gzipped for clients sending "Accept-Encoding: gzip",
+# and returned base64 encoded as API Gateway expects binary bodies.
+GZIP_MIN_BYTES = int(os.environ.get("GZIP_MIN_BYTES", "1024"))
+GZIP_LEVEL = 6
+
+try:
+    if os.environ.get("RESPONSE_JSON", "orjson") != "orjson":
+        raise ImportError("json backend requested")
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode("utf-8")
+    JSON_BACKEND = "orjson"
+except ImportError:
+    _encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+    def _dumps(obj):
+        return _encoder.encode(obj)
+    JSON_BACKEND = "json"
+
+
+def _string(value):
+    return value
+
+
+def _strings(values):
+    return list(values)
+
+
+def _view(fields):
+    """
+    Compiles the view of a resource: a function returning the whitelisted fields of an item,
+    each passed through its converter. Fields missing from the item are left out.
+
+    Args:
+        fields (list): (name, converter) pairs, in the order of the response
+
+    Returns:
+        function: item (dict) -> dict
+    """
+    fields = tuple(fields)
+
+    def render(item):
+        view = {}
+        for name, convert in fields:
+            if name in item:
+                view[name] = convert(item[name])
+        return view
+    return render
+
+
+def _encodeBody(message, application_status):
+    return _dumps({"message": message, "status": application_status.name})
+
+
+def _acceptsGzip(event):
+    headers = (event or {}).get("headers") or {}
+    for name, value in headers.items():
+        if name.lower() == "accept-encoding":
+            return "gzip" in value.lower()
+    return False
+
+
+def _compressResponse(response_object, event):
+    """
+    Gzips the body of a response in place if it is large enough and the request accepts it.
+
+    Args:
+        response_object (dict): The HTTP response object, with a str body
+        event (dict): The API Gateway event of the request
+    """
+    body = response_object["body"]
+    if len(body) < GZIP_MIN_BYTES or not _acceptsGzip(event):
+        return response_object
+    response_object["body"] = base64.b64encode(gzip.compress(body.encode("utf-8"), GZIP_LEVEL)).decode("ascii")
+    response_object["isBase64Encoded"] = True
+    headers = response_object.setdefault("headers", {})
+    headers["Content-Encoding"] = "gzip"
+    headers["Content-Type"] = "application/json"
+    return response_object
@@ -0,0 +1,45 @@
+import importlib
+from wordle_utils import _http_response, ResponseStatus, ApplicationStatus
+
+# Single function deployment: API Gateway sends every request to this handler, which dispatches
+# on the resource path and method to the handler of the per-function layout. All endpoints then
+# share the same warm containers. Handler modules are imported on first use, so a cold start
+# only pays for the modules of the request that triggered it.
+ROUTES = {
+    ("/", "GET"): "getHome",
+    ("/words", "POST"): "populateWords",
+    ("/users", "POST"): "createUser",
+    ("/users/{user_id}", "GET"): "getUser",
+    ("/users/{user_id}/history", "GET"): "getHistory",
+    ("/users/{user_id}/stats", "GET"): "getStats",
+    ("/users/{user_id}/games", "POST"): "createGame",
+    ("/users/{user_id}/games/{game_id}", "GET"): "getGame",
+    ("/users/{user_id}/games/{game_id}", "DELETE"): "deleteGame",
+    ("/users/{user_id}/games/{game_id}/guess", "POST"): "guess",
+    ("/users/{user_id}/games/{game_id}/guesses", "POST"): "guessBatch",
+    ("/users/{user_id}/games/{game_id}/hint", "GET"): "getHint",
+}
+
+# Handler functions imported so far, by module name
+_handlers = {}
+
+
+def _getHandler(module_name):
+    handler = _handlers.get(module_name)
+    if handler is None:
+        handler = importlib.import_module(module_name).handler
+        _handlers[module_name] = handler
+    return handler
+
+
+def handler(event, context):
+    resource = event.get("resource")
+    method = event.get("httpMethod")
+    if resource is not None and resource != "/":
+        resource = resource.rstrip("/")
+    module_name = ROUTES.get((resource, method))
+    if module_name is None:
+        if any(route == resource for route, _ in ROUTES):
+            return _http_response(ResponseStatus.METHOD_NOT_ALLOWED, "Method {} not allowed on {}".format(method, resource), ApplicationStatus.INPUT_ERROR)
+        return _http_response(ResponseStatus.NOT_FOUND, "No route for {} {}".format(method, resource), ApplicationStatus.INPUT_ERROR)
+    return _getHandler(module_name)(event, context)
@@ -0,0 +1,238 @@
+import argparse
+import json
+import os
+import time
+from boto3.dynamodb.types import TypeSerializer
+from wordle_runtime import _getTable
+from metrics import _mark
+from wordle_utils import _errorCode, _getItem, ResponseStatus, ApplicationStatus, IN_PROGRESS, EXPIRES_AT
+from item_cache import _getCachedItem, _cacheItem, _nextVersion, VERSION
+from history import _packGameItem, GAMES, GAMES_COUNT
+
+# Storage layouts, selected with the STORAGE_LAYOUT environment variable (cdk deploy -c storage_layout=single).
+#
+# TABLES, the default, keeps users and games in their own tables: a game request reads the user, to check
+# that it plays the game, and then the game. SINGLE embeds the active game in the user item, under GAME, so
+# getGame, getHome, getHint, guess and guessBatch read one item and write at most that item. A game that ends
+# is appended to the history item of its user by the statistics update made in both layouts, and stays
+# embedded until the next createGame replaces it, so the compaction job has nothing to move.
+# Users written in the TABLES layout point to a game of the game table. They are migrated the first time a
+# handler reads them, or ahead of time by `python lambda/single_table.py migrate`: one transaction embeds
+# the game, deletes it from the game table and, if it is finished, appends it to the history.
+TABLES = "tables"
+SINGLE = "single"
+GAME = "game"
+# Attributes of a game item that are not part of the embedded game
+GAME_ITEM_ONLY = ("user_id", EXPIRES_AT, VERSION)
+
+_serializer = TypeSerializer()
+
+
+def _serialize(values):
+    return dict((name, _serializer.serialize(value)) for name, value in values.items())
+
+
+def _singleTable():
+    return os.environ.get("STORAGE_LAYOUT", TABLES) == SINGLE
+
+
+def _notAuthorised():
+    return {"success": False, "response": "This user is not allowed to access this game", "status": ResponseStatus.NOT_AUTHORISED, "application_status": ApplicationStatus.NOT_AUTHORISED}
+
+
+def _getUserGame(userTable, gameTable, user_id, game_id, attributes=None, refresh=False):
+    """
+    Reads the game of a user, checking that the user plays it, in either storage layout.
+    In the tables layout, the user is read and then the game. In the single table layout, the user item holds the game.
+
+    Args:
+        userTable (DynamoDB.Table): The DynamoDB user table object
+        gameTable (DynamoDB.Table): The DynamoDB game table object
+        user_id (str): The id of the user
+        game_id (str): The id of the game
+        attributes (list, optional): The attributes of the game the caller uses, in the tables layout. Defaults to None, the whole game.
+        refresh (bool, optional): Read the game, or the user holding it, with a strongly consistent read rather than from the cache.
+            Defaults to False.
+
+    Returns:
+        dict: The reply of _getCachedItem with the game as response and, in the single table layout, the user item as "user"
+    """
+    playing = lambda user: user["game_id"] == game_id
+    if not _singleTable():
+        reply = _getCachedItem(userTable, "user_id", user_id, expect=playing, attributes=["game_id"])
+        if not reply["success"]:
+            return reply
+        if not playing(reply["response"]):
+            return _notAuthorised()
+        _mark("read_user")
+        return _getCachedItem(gameTable, "game_id", game_id, refresh=refresh, consistent=refresh, attributes=attributes)
+
+    reply = _getCachedItem(userTable, "user_id", user_id, expect=playing, refresh=refresh, consistent=refresh)
+    if not reply["success"]:
+        return reply
+    user = reply["response"]
+    if not playing(user):
+        return _notAuthorised()
+    _mark("read_user")
+    cached = reply["cached"]
+    if GAME not in user:
+        reply = _migrateUser(userTable, gameTable, user)
+        if not reply["success"]:
+            return reply
+        user = reply["response"]
+        cached = False
+    return {"success": True, "response": user[GAME], "user": user, "cached": cached, "application_status": ApplicationStatus.OK}
+
+
+def _cacheUserGame(userTable, gameTable, reply):
+    """
+    Caches the item written by applyGuesses: the user holding the game in the single table layout, otherwise the game.
+    """
+    if "user" in reply:
+        _cacheItem(userTable, "user_id", reply["user"])
+    else:
+        _cacheItem(gameTable, "game_id", reply["response"])
+
+
+def _endUserGame(userTable, historyTable, update, result):
+    """
+    Makes the write ending the game embedded in a user item and the update of the history item recording
+    that game (see user_stats._resultUpdate) in one transaction. The next createGame replaces the game in the
+    user item, so a game that ended without reaching the history would be lost.
+
+    Args:
+        userTable (DynamoDB.Table): The DynamoDB user table object
+        historyTable (DynamoDB.Table): The DynamoDB history table object
+        update (dict): The Key, UpdateExpression, ConditionExpression, ExpressionAttributeNames and ExpressionAttributeValues of the user write
+        result (dict): The update of the history item, as returned by user_stats._resultUpdate
+
+    Returns:
+        dict: A success reply, without item since a transaction returns none, otherwise a dictionary object containing an error
+        message and status code. A failed condition on the user is reported with ResponseStatus.CONFLICT.
+    """
+    actions = []
+    for table, write in ((userTable, update), (historyTable, result)):
+        action = dict(write, TableName=table.table_name, Key=_serialize(write["Key"]))
+        action["ExpressionAttributeValues"] = _serialize(write["ExpressionAttributeValues"])
+        actions.append({"Update": action})
+    try:
+        userTable.meta.client.transact_write_items(TransactItems=actions)
+    except Exception as e:
+        reasons = getattr(e, "response", {}).get("CancellationReasons", [])
+        if _errorCode(e) == "TransactionCanceledException" and reasons and reasons[0].get("Code") == "ConditionalCheckFailed":
+            error_message = "Item in {} was modified by another request".format(userTable.table_name)
+            return {"success": False, "response": error_message, "status": ResponseStatus.CONFLICT, "application_status": ApplicationStatus.CONFLICT}
+        print(e)
+        error_message = "An exception occured while ending the game of user_id: {}".format(update["Key"]["user_id"])
+        return {"success": False, "response": error_message, "status": ResponseStatus.INTERNAL_ERROR, "application_status": ApplicationStatus.DATABASE_ERROR}
+    return {"success": True, "status": ResponseStatus.OK, "application_status": ApplicationStatus.OK}
+
+
+def _migrateUser(userTable, gameTable, user, historyTable=None):
+    """
+    Embeds the game a user of the tables layout points to into the user item, in one transaction that also
+    deletes the game item and, for a finished game, appends it to the history of the user (its statistics
+    were recorded when it ended). The transaction is cancelled if the user or the game changed since they were
+    read, in which case the user is read again.
+
+    Args:
+        userTable (DynamoDB.Table): The DynamoDB user table object
+        gameTable (DynamoDB.Table): The DynamoDB game table object
+        user (dict): The whole user item, with a game_id and without GAME
+        historyTable (DynamoDB.Table, optional): The DynamoDB history table object. Defaults to HISTORY_TABLE.
+
+    Returns:
+        dict: The migrated user item as response if successful, otherwise a dictionary object containing an error message and status code
+    """
+    historyTable = historyTable or _getTable("HISTORY_TABLE")
+    reply = _getItem(gameTable, "game_id", user["game_id"], consistent=True)
+    if not reply["success"]:
+        return reply
+    game = reply["response"]
+    embedded = dict((name, value) for name, value in game.items() if name not in GAME_ITEM_ONLY)
+    actions = [{"Update": {
+        "TableName": userTable.table_name,
+        "Key": _serialize({"user_id": user["user_id"]}),
+        "UpdateExpression": "SET #game = :game, #version = if_not_exists(#version, :zero) + :one",
+        "ConditionExpression": "game_id = :game_id AND attribute_not_exists(#game)",
+        "ExpressionAttributeNames": {"#game": GAME, "#version": VERSION},
+        "ExpressionAttributeValues": _serialize({":game": embedded, ":game_id": game["game_id"], ":zero": 0, ":one": 1}),
+    }}, {"Delete": {
+        "TableName": gameTable.table_name,
+        "Key": _serialize({"game_id": game["game_id"]}),
+        "ConditionExpression": "#status = :status AND attempts_left = :attempts_left",
+        "ExpressionAttributeNames": {"#status": "status"},
+        "ExpressionAttributeValues": _serialize({":status": game["status"], ":attempts_left": game["attempts_left"]}),
+    }}]
+    if game["status"] != IN_PROGRESS:
+        actions.append({"Update": {
+            "TableName": historyTable.table_name,
+            "Key": _serialize({"user_id": user["user_id"]}),
+            "UpdateExpression": "SET #games = list_append(if_not_exists(#games, :empty), :chunk) ADD #games_count :one",
+            "ExpressionAttributeNames": {"#games": GAMES, "#games_count": GAMES_COUNT},
+            "ExpressionAttributeValues": _serialize({":empty": [], ":chunk": [bytes(bytearray([_packGameItem(game)]))], ":one": 1}),
+        }})
+    try:
+        userTable.meta.client.transact_write_items(TransactItems=actions)
+    except Exception as e:
+        if _errorCode(e) != "TransactionCanceledException":
+            print(e)
+            error_message = "Exception while migrating user_id: {} to the single table layout".format(user["user_id"])
+            return {"success": False, "response": error_message, "status": ResponseStatus.INTERNAL_ERROR, "application_status": ApplicationStatus.DATABASE_ERROR}
+        # migrated or played by another request meanwhile
+        reply = _getCachedItem(userTable, "user_id", user["user_id"], refresh=True, consistent=True)
+        if reply["success"] and GAME not in reply["response"]:
+            return {"success": False, "response": "Game of user_id: {} was modified by another request".format(user["user_id"]), "status": ResponseStatus.CONFLICT, "application_status": ApplicationStatus.CONFLICT}
+        return reply
+    migrated = dict(user)
+    migrated[GAME] = embedded
+    migrated[VERSION] = _nextVersion(user)
+    _cacheItem(userTable, "user_id", migrated)
+    return {"success": True, "response": migrated, "application_status": ApplicationStatus.OK}
+
+
+def _migrateUsers(userTable, gameTable, historyTable):
+    """
+    Migrates every user of the tables layout, scanning the user table page by page. Users without a game or
+    already migrated are skipped, so an interrupted run is simply run again.
+
+    Returns:
+        dict: Counts of scanned, migrated, failed and skipped users
+    """
+    stats = {"scanned": 0, "migrated": 0, "failed": 0, "skipped": 0}
+    scan_args = {}
+    while True:
+        response = userTable.scan(**scan_args)
+        for user in response["Items"]:
+            stats["scanned"] += 1
+            if GAME in user or not user.get("game_id"):
+                stats["skipped"] += 1
+                continue
+            reply = _migrateUser(userTable, gameTable, user, historyTable)
+            stats["migrated" if reply["success"] else "failed"] += 1
+        if "LastEvaluatedKey" not in response:
+            return stats
+        scan_args["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Migrate the users of the tables layout to the single table layout.")
+    parser.add_argument("command", choices=["migrate"])
+    parser.add_argument("--user-table", default=os.environ.get("USER_TABLE"), help="defaults to $USER_TABLE")
+    parser.add_argument("--game-table", default=os.environ.get("GAME_TABLE"), help="defaults to $GAME_TABLE")
+    parser.add_argument("--history-table", default=os.environ.get("HISTORY_TABLE"), help="defaults to $HISTORY_TABLE")
+    parser.add_argument("--endpoint-url", help="DynamoDB endpoint, eg. http://localhost:8000 for DynamoDB Local")
+    parser.add_argument("--region", default=os.environ.get("REGION", "us-east-1"))
+    args = parser.parse_args()
+
+    import boto3
+    from wordle_runtime import DYNAMODB_CONFIG
+    resource = boto3.resource("dynamodb", region_name=args.region, endpoint_url=args.endpoint_url, config=DYNAMODB_CONFIG)
+    start = time.monotonic()
+    stats = _migrateUsers(resource.Table(args.user_table), resource.Table(args.game_table), resource.Table(args.history_table))
+    stats["seconds"] = round(time.monotonic() - start, 3)
+    print(json.dumps(stats))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+from wordle_utils import _errorCode, _projection, ResponseStatus, ApplicationStatus, WON
+from history import GAMES, GAMES_COUNT
+
+# Per-user statistics, kept in the history item of the user (see history.py) and updated with
+# atomic counters when a guess ends a game, so they never require reading past games.
+# The guess distribution is one flat counter per word length and outcome, eg. "dist_5_3" counts
+# the 5 letter games won in 3 guesses and "dist_5_X" the lost ones. Flat attributes can be
+# incremented by ADD without creating a nested map first.
+PLAYED = "played"
+WINS = "wins"
+STREAK = "streak"
+MAX_STREAK = "max_streak"
+LOST_KEY = "X"
+WORD_LENGTHS = range(5, 9)
+
+
+def _distributionAttribute(word_length, guesses):
+    return "dist_{}_{}".format(word_length, guesses)
+
+
+DISTRIBUTION_ATTRIBUTES = [_distributionAttribute(word_length, guesses)
+                           for word_length in WORD_LENGTHS
+                           for guesses in [str(n) for n in range(1, word_length + 2)] + [LOST_KEY]]
+STATS_ATTRIBUTES = [PLAYED, WINS, STREAK, MAX_STREAK] + DISTRIBUTION_ATTRIBUTES
+
+
+def _resultUpdate(user_id, word_length, guesses, status, packed=None):
+    """
+    Returns the update of the history item of a user adding a finished game to the statistics:
+    a win extends the current streak and a loss resets it. In the single table layout the game is
+    also appended to the history by the same update, since it is not kept in the game table for
+    the compaction job. The maximum streak is left to _recordGameResult and _recordMaxStreak.
+
+    Args:
+        user_id (str): The id of the user
+        word_length (int): The length of the word
+        guesses (int): The number of guesses used
+        status (str): WON/LOST
+        packed (int, optional): The game packed by _packGameItem, to append to the history. Defaults to None.
+
+    Returns:
+        dict: The Key, UpdateExpression, ExpressionAttributeNames and ExpressionAttributeValues arguments of update_item
+    """
+    won = status == WON
+    names = {"#played": PLAYED, "#streak": STREAK,
+             "#distribution": _distributionAttribute(word_length, guesses if won else LOST_KEY)}
+    values = {":one": 1}
+    sets = []
+    adds = ["#played :one", "#distribution :one"]
+    if won:
+        names["#wins"] = WINS
+        adds += ["#wins :one", "#streak :one"]
+    else:
+        values[":zero"] = 0
+        sets.append("#streak = :zero")
+    if packed is not None:
+        names["#games"] = GAMES
+        names["#games_count"] = GAMES_COUNT
+        values[":empty"] = []
+        values[":chunk"] = [bytes(bytearray([packed]))]
+        sets.append("#games = list_append(if_not_exists(#games, :empty), :chunk)")
+        adds.append("#games_count :one")
+    update_expression = "ADD " + ", ".join(adds)
+    if sets:
+        update_expression = "SET " + ", ".join(sets) + " " + update_expression
+    return {
+        "Key": {"user_id": user_id},
+        "UpdateExpression": update_expression,
+        "ExpressionAttributeNames": names,
+        "ExpressionAttributeValues": values,
+    }
+
+
+def _recordGameResult(historyTable, user_id, word_length, guesses, status, packed=None):
+    """
+    Adds a finished game to the statistics of its user, see _resultUpdate.
+    The maximum streak costs a second, conditional write only when it is beaten.
+
+    Args:
+        historyTable (DynamoDB.Table): The DynamoDB table object
+        user_id (str): The id of the user
+        word_length (int): The length of the word
+        guesses (int): The number of guesses used
+        status (str): WON/LOST
+        packed (int, optional): The game packed by _packGameItem, to append to the history. Defaults to None.
+
+    Returns:
+        dict: The updated statistics if successful, otherwise a dictionary object containing an error message and status code
+    """
+    try:
+        response = historyTable.update_item(ReturnValues="ALL_NEW", **_resultUpdate(user_id, word_length, guesses, status, packed))
+        stats = response["Attributes"]
+        streak = int(stats.get(STREAK, 0))
+        if streak > int(stats.get(MAX_STREAK, 0)):
+            try:
+                historyTable.update_item(
+                    Key={"user_id": user_id},
+                    UpdateExpression="SET #max_streak = :streak",
+                    ConditionExpression="attribute_not_exists(#max_streak) OR #max_streak < :streak",
+                    ExpressionAttributeNames={"#max_streak": MAX_STREAK},
+                    ExpressionAttributeValues={":streak": streak},
+                )
+            except Exception as e:
+                # a longer streak was recorded meanwhile
+                if _errorCode(e) != "ConditionalCheckFailedException":
+                    raise
+            stats[MAX_STREAK] = streak
+        return {"success": True, "response": stats, "status": ResponseStatus.OK, "application_status": ApplicationStatus.OK}
+    except Exception as e:
+        print(e)
+        error_message = "An exception occured while updating the statistics of user_id: {} in {}".format(user_id, historyTable.table_name)
+        return {"success": False, "response": error_message, "status": ResponseStatus.INTERNAL_ERROR, "application_status": ApplicationStatus.DATABASE_ERROR}
+
+
+def _recordMaxStreak(historyTable, user_id):
+    """
+    Raises the maximum streak of a user to the current streak when it is longer, for a win recorded by a
+    transaction (see single_table._endUserGame), which does not return the new streak. The two attributes
+    are compared by the condition of the write, which only changes the item when the maximum is beaten.
+    A failure is only logged: the win itself is recorded.
+
+    Args:
+        historyTable (DynamoDB.Table): The DynamoDB table object
+        user_id (str): The id of the user
+    """
+    try:
+        historyTable.update_item(
+            Key={"user_id": user_id},
+            UpdateExpression="SET #max_streak = #streak",
+            ConditionExpression="attribute_not_exists(#max_streak) OR #max_streak < #streak",
+            ExpressionAttributeNames={"#max_streak": MAX_STREAK, "#streak": STREAK},
+        )
+    except Exception as e:
+        if _errorCode(e) != "ConditionalCheckFailedException":
+            print(e)
+
+
+def _statsView(user_id, item):
+    """
+    Returns the statistics of a history item as exposed by the API, with a zero for every missing counter.
+    """
+    distribution = {}
+    for word_length in WORD_LENGTHS:
+        distribution[str(word_length)] = dict(
+            (guesses, int(item.get(_distributionAttribute(word_length, guesses), 0)))
+            for guesses in [str(n) for n in range(1, word_length + 2)] + [LOST_KEY])
+    return {
+        "user_id": user_id,
+        PLAYED: int(item.get(PLAYED, 0)),
+        WINS: int(item.get(WINS, 0)),
+        STREAK: int(item.get(STREAK, 0)),
+        MAX_STREAK: int(item.get(MAX_STREAK, 0)),
+        "distribution": distribution,
+    }
+
+
+def _getStats(historyTable, user_id):
+    """
+    Reads the statistics of a user with a single GetItem, projected on the counters so the packed
+    games of the same item are not transferred.
+
+    Args:
+        historyTable (DynamoDB.Table): The DynamoDB table object
+        user_id (str): The id of the user
+
+    Returns:
+        dict: The statistics if successful, otherwise a dictionary object containing an error message and status code
+    """
+    projection, names = _projection(STATS_ATTRIBUTES)
+    try:
+        itemObject = historyTable.get_item(Key={"user_id": user_id}, ProjectionExpression=projection, ExpressionAttributeNames=names)
+    except Exception as e:
+        print(e)
+        error_message = "Exception while getting statistics of user_id: {} from {}".format(user_id, historyTable.table_name)
+        return {"success": False, "response": error_message, "status": ResponseStatus.INTERNAL_ERROR, "application_status": ApplicationStatus.DATABASE_ERROR}
+    return {"success": True, "response": _statsView(user_id, itemObject.get("Item", {})), "application_status": ApplicationStatus.OK}
@@ -0,0 +1,196 @@
+import hashlib
+import mmap
+import os
+import struct
+import sys
+
+# Compiled dictionary artifact, built by compile_words.py. Layout (little endian):
+#
+#   header       magic "WRDL", format u16, version u32, lengths u16, sha256 of everything after the header
+#   directory    one entry per word length: length u8, pad u8, generations u16, count u32,
+#                records offset u32, sorted offset u32, generations offset u32
+#   records      count fixed width ascii records per length, in ordinal order
+#   sorted       count u32 ordinals per length, ordered by word, for binary search
+#   generations  u32 cumulative word counts, one per dictionary version that added words of this length
+#
+# Ordinals are append-only across versions: a recompile keeps every existing word at its ordinal
+# and appends new words, recording the new total as a generation.
+MAGIC = b"WRDL"
+FORMAT = 1
+HEADER = struct.Struct("<4sHIH32s")
+DIRECTORY_ENTRY = struct.Struct("<BBHIIII")
+UINT32 = struct.Struct("<I")
+
+DEFAULT_ARTIFACT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "words.bin")
+
+# Loaded once per container, see _getWordArtifact
+_artifact = None
+
+
+class ArtifactError(Exception):
+    pass
+
+
+def _align(offset):
+    return (offset + 3) & ~3
+
+
+def _writeArtifact(path, words_by_length, version, generations_by_length):
+    """
+    Writes a dictionary artifact.
+
+    Args:
+        path (str): The file to write
+        words_by_length (dict): word_length -> list of words in ordinal order
+        version (int): The dictionary version
+        generations_by_length (dict): word_length -> list of cumulative counts, the last one being len(words)
+    """
+    lengths = sorted(words_by_length)
+    sections = []
+    offset = HEADER.size + DIRECTORY_ENTRY.size * len(lengths)
+    directory = []
+    for word_length in lengths:
+        words = words_by_length[word_length]
+        generations = generations_by_length[word_length]
+        records = "".join(words).encode("ascii")
+        ordered = b"".join(UINT32.pack(ordinal) for ordinal in sorted(range(len(words)), key=words.__getitem__))
+        counts = b"".join(UINT32.pack(count) for count in generations)
+        offsets = []
+        for section in (records, ordered, counts):
+            padded = _align(offset)
+            sections.append(b"\0" * (padded - offset) + section)
+            offsets.append(padded)
+            offset = padded + len(section)
+        directory.append(DIRECTORY_ENTRY.pack(word_length, 0, len(generations), len(words), *offsets))
+    payload = b"".join(directory) + b"".join(sections)
+    header = HEADER.pack(MAGIC, FORMAT, version, len(lengths), hashlib.sha256(payload).digest())
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header + payload)
+    os.replace(tmp_path, path)
+
+
+class _LengthSection:
+    def __init__(self, data, buffer, word_length, generations, count, records_offset, sorted_offset, generations_offset):
+        self.word_length = word_length
+        self.count = count
+        self.data = data
+        self.records_offset = records_offset
+        if sys.byteorder == "little":
+            self.sorted = buffer[sorted_offset:sorted_offset + 4 * count].cast("I")
+        else:
+            self.sorted = [UINT32.unpack_from(buffer, sorted_offset + 4 * idx)[0] for idx in range(count)]
+        self.generations = [UINT32.unpack_from(buffer, generations_offset + 4 * idx)[0] for idx in range(generations)]
+
+    def record(self, ordinal):
+        start = self.records_offset + ordinal * self.word_length
+        return self.data[start:start + self.word_length]
+
+
+class WordArtifact:
+    """
+    Read-only view of a compiled dictionary artifact.
+    The file is memory-mapped and the records are read in place, without copying them into python objects.
+    """
+
+    def __init__(self, path=DEFAULT_ARTIFACT_PATH, verify=True):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        buffer = memoryview(self._mmap)
+        if len(buffer) < HEADER.size:
+            raise ArtifactError("{} is too small to be a word artifact".format(path))
+        magic, fmt, self.version, lengths, checksum = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC or fmt != FORMAT:
+            raise ArtifactError("{} is not a format {} word artifact".format(path, FORMAT))
+        if verify and hashlib.sha256(buffer[HEADER.size:]).digest() != checksum:
+            raise ArtifactError("{} failed its checksum".format(path))
+        self.checksum = checksum.hex()
+        self._sections = {}
+        for idx in range(lengths):
+            entry = DIRECTORY_ENTRY.unpack_from(buffer, HEADER.size + idx * DIRECTORY_ENTRY.size)
+            word_length, _, generations, count, records_offset, sorted_offset, generations_offset = entry
+            self._sections[word_length] = _LengthSection(self._mmap, buffer, word_length, generations, count,
+                                                         records_offset, sorted_offset, generations_offset)
+
+    def lengths(self):
+        return sorted(self._sections)
+
+    def count(self, word_length):
+        """
+        Returns the number of words of the given length, 0 for unsupported lengths.
+        """
+        section = self._sections.get(word_length)
+        return section.count if section else 0
+
+    def generations(self, word_length):
+        """
+        Returns the cumulative word counts of every dictionary version that added words of this length.
+        """
+        section = self._sections.get(word_length)
+        return list(section.generations) if section else []
+
+    def word(self, word_length, ordinal):
+        """
+        Returns the word with the given ordinal, eg. word(5, 0) -> "aaron"
+        """
+        section = self._sections[word_length]
+        if ordinal < 0 or ordinal >= section.count:
+            raise IndexError("No word of length {} with ordinal {}".format(word_length, ordinal))
+        return section.record(ordinal).decode("ascii")
+
+    def words(self, word_length):
+        """
+        Yields the words of the given length in ordinal order.
+        """
+        for ordinal in range(self.count(word_length)):
+            yield self.word(word_length, ordinal)
+
+    def ordinal(self, word):
+        """
+        Returns the ordinal of the word, or None if it is not in the dictionary.
+        """
+        section = self._sections.get(len(word))
+        if section is None:
+            return None
+        try:
+            key = word.encode("ascii")
+        except UnicodeEncodeError:
+            return None
+        lo = 0
+        hi = section.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            ordinal = section.sorted[mid]
+            record = section.record(ordinal)
+            if record < key:
+                lo = mid + 1
+            elif record > key:
+                hi = mid
+            else:
+                return ordinal
+        return None
+
+    def __contains__(self, word):
+        return self.ordinal(word) is not None
+
+    @property
+    def nbytes(self):
+        return len(self._mmap)
+
+
+def _getWordArtifact():
+    """
+    Returns the dictionary artifact of this container, mapping it on first use.
+    The path can be overridden with the WORD_ARTIFACT environment variable.
+
+    Returns:
+        WordArtifact: The artifact, or None if it is missing or corrupt
+    """
+    global _artifact
+    if _artifact is None:
+        try:
+            _artifact = WordArtifact(os.environ.get("WORD_ARTIFACT", DEFAULT_ARTIFACT_PATH))
+        except (OSError, ArtifactError) as e:
+            print(e)
+            return None
+    return _artifact
@@ -0,0 +1,150 @@
+import os
+import time
+from wordle_utils import _getItem
+from word_artifact import _getWordArtifact
+from word_shards import _getWordLayout, _gather
+
+# Dictionary lookup modes, selected with the WORD_LOOKUP environment variable.
+# "artifact" answers from the compiled dictionary shipped with the function, "index" from an
+# in-memory index loaded from the word table, and "table" with a GetItem on the word table.
+WORD_LOOKUP_ARTIFACT = "artifact"
+WORD_LOOKUP_INDEX = "index"
+WORD_LOOKUP_TABLE = "table"
+
+# Seconds after which a warm container reloads its index, so that newly populated words become visible
+WORD_INDEX_TTL = int(os.environ.get("WORD_INDEX_TTL", "600"))
+
+# Per-length indexes, built once per warm container. Maps word_length -> (WordIndex, load time)
+_indexes = {}
+
+
+class WordIndex:
+    """
+    Sorted, packed dictionary of words of a single length.
+
+    The words are stored back to back in one bytes object, so the index costs
+    word_length bytes per word instead of one python str object per word.
+    Membership is answered with a binary search over the fixed width records.
+    """
+
+    def __init__(self, word_length, words):
+        self.word_length = word_length
+        records = sorted(set(word.lower().encode("ascii") for word in words if len(word) == word_length))
+        self.count = len(records)
+        self.packed = b"".join(records)
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, word):
+        if len(word) != self.word_length:
+            return False
+        try:
+            key = word.encode("ascii")
+        except UnicodeEncodeError:
+            return False
+        packed = self.packed
+        width = self.word_length
+        lo = 0
+        hi = self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            record = packed[mid * width:(mid + 1) * width]
+            if record < key:
+                lo = mid + 1
+            elif record > key:
+                hi = mid
+            else:
+                return True
+        return False
+
+    def word(self, idx):
+        """
+        Returns the word stored at position idx of the sorted index.
+        """
+        width = self.word_length
+        return self.packed[idx * width:(idx + 1) * width].decode("ascii")
+
+    @property
+    def nbytes(self):
+        """
+        Number of bytes used by the packed word records.
+        """
+        return len(self.packed)
+
+
+def _loadWordIndex(table, word_length):
+    """
+    Builds a WordIndex from every word of the given length in the word table.
+    Follows LastEvaluatedKey so that partitions larger than one page are read completely.
+    With a sharded word table the shards of the length are queried in parallel.
+
+    Args:
+        table (DynamoDB.Table): The DynamoDB word table object
+        word_length (int): The length of the words to load
+
+    Returns:
+        WordIndex: The index of all the words of this length
+    """
+    layout = _getWordLayout()
+    pages = _gather(lambda partition: _queryWords(table, layout.partition_key, partition), layout.partitions(word_length))
+    return WordIndex(word_length, [word for words in pages for word in words])
+
+
+def _queryWords(table, partition_key, partition):
+    words = []
+    query_args = {
+        "KeyConditionExpression": "#partition = :partition",
+        "ProjectionExpression": "#word",
+        "ExpressionAttributeNames": {"#partition": partition_key, "#word": "word"},
+        "ExpressionAttributeValues": {":partition": partition},
+    }
+    while True:
+        response = table.query(**query_args)
+        words.extend(item["word"] for item in response["Items"])
+        if "LastEvaluatedKey" not in response:
+            return words
+        query_args["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def _getWordIndex(table, word_length):
+    """
+    Returns the WordIndex for the given length, loading it from the word table on first use
+    and again once it is older than WORD_INDEX_TTL seconds.
+    """
+    entry = _indexes.get(word_length)
+    now = time.monotonic()
+    if entry is None or now - entry[1] > WORD_INDEX_TTL:
+        entry = (_loadWordIndex(table, word_length), now)
+        _indexes[word_length] = entry
+    return entry[0]
+
+
+def _isDictionaryWord(table, word):
+    """
+    Checks if the word is present in the Wordle Dictionary.
+    By default the check is answered from the memory-mapped dictionary artifact. WORD_LOOKUP=index
+    uses an index of the word table loaded into the container, and WORD_LOOKUP=table a GetItem on the
+    word table. Each mode falls back to the next one if its data cannot be loaded.
+
+    Args:
+        table (DynamoDB.Table): The DynamoDB word table object
+        word (str): The word to look up
+
+    Returns:
+        bool: True if the word is in the dictionary, False otherwise
+    """
+    mode = os.environ.get("WORD_LOOKUP", WORD_LOOKUP_ARTIFACT)
+    if mode == WORD_LOOKUP_ARTIFACT:
+        artifact = _getWordArtifact()
+        if artifact is not None:
+            return word in artifact
+        mode = WORD_LOOKUP_INDEX
+    if mode == WORD_LOOKUP_INDEX:
+        try:
+            return word in _getWordIndex(table, len(word))
+        except Exception as e:
+            print(e)
+    layout = _getWordLayout()
+    reply = _getItem(table, layout.partition_key, layout.partition(word), "word", word)
+    return reply["success"]
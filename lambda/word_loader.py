@@ -0,0 +1,283 @@
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from wordle_utils import _errorCode, ORDINAL, COUNT
+from word_shards import WordLayout, _getWordLayout, SHARD_COUNTS
+
+# DynamoDB accepts at most 25 put requests per BatchWriteItem call
+BATCH_SIZE = 25
+MIN_WORD_LENGTH = 5
+MAX_WORD_LENGTH = 8
+
+# Backoff for unprocessed items and throttled batches: full jitter, capped exponential
+BACKOFF_BASE = 0.05
+BACKOFF_CAP = 5.0
+MAX_ATTEMPTS = 10
+RETRYABLE_ERRORS = ("ProvisionedThroughputExceededException", "ThrottlingException", "RequestLimitExceeded", "InternalServerError")
+
+# Sort key of the checkpoint record kept in the METADATA_PARTITION of the word table
+CHECKPOINT_KEY = "#loader"
+
+
+def _wordItems(words, layout=None):
+    """
+    Normalizes a stream of words into word table items, assigning dense per-partition ordinals in stream order.
+    Words outside MIN_WORD_LENGTH..MAX_WORD_LENGTH, non alphabetic words and duplicates are skipped.
+    The count record of every length, with the counts of its shards in a sharded layout, is yielded once the stream is exhausted.
+
+    Args:
+        words (iterable): The raw words, eg. the lines of a file
+        layout (WordLayout, optional): The keys of the word table. Defaults to the word_length layout.
+
+    Yields:
+        dict: Items to write to the word table
+    """
+    layout = layout or WordLayout(0)
+    seen = set()
+    counts = {}
+    for word in words:
+        word = word.strip().lower()
+        if len(word) < MIN_WORD_LENGTH or len(word) > MAX_WORD_LENGTH or not word.isalpha() or not word.isascii():
+            continue
+        if word in seen:
+            continue
+        seen.add(word)
+        partition = layout.partition(word)
+        ordinal = counts.get(partition, 0)
+        counts[partition] = ordinal + 1
+        item = layout.key(word)
+        item[ORDINAL] = ordinal
+        yield item
+    for word_length in sorted(set(len(word) for word in seen)):
+        item = layout.metadataKey(str(word_length))
+        shard_counts = [counts.get(partition, 0) for partition in layout.partitions(word_length)]
+        item[COUNT] = sum(shard_counts)
+        if layout.shards:
+            item[SHARD_COUNTS] = shard_counts
+        yield item
+
+
+def _batches(items, skip_batches=0):
+    """
+    Groups items into numbered batches of BATCH_SIZE, dropping the first skip_batches batches.
+    """
+    batch = []
+    batch_number = 0
+    for item in items:
+        batch.append(item)
+        if len(batch) == BATCH_SIZE:
+            if batch_number >= skip_batches:
+                yield batch_number, batch
+            batch_number += 1
+            batch = []
+    if len(batch) > 0 and batch_number >= skip_batches:
+        yield batch_number, batch
+
+
+class TableCheckpoint:
+    """
+    Keeps the number of fully written batches in a record of the word table itself,
+    so a Lambda invocation can resume the load started by an earlier one.
+    """
+
+    def __init__(self, table, layout=None):
+        self.table = table
+        self.key = (layout or _getWordLayout()).metadataKey(CHECKPOINT_KEY)
+
+    def load(self):
+        item = self.table.get_item(Key=self.key).get("Item")
+        return int(item["batches"]) if item else 0
+
+    def save(self, batches):
+        self.table.put_item(Item=dict(self.key, batches=batches))
+
+    def clear(self):
+        self.table.delete_item(Key=self.key)
+
+
+class FileCheckpoint:
+    """
+    Keeps the number of fully written batches in a local JSON file, for command line runs.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return 0
+        with open(self.path) as f:
+            return json.load(f)["batches"]
+
+    def save(self, batches):
+        with open(self.path, "w") as f:
+            json.dump({"batches": batches}, f)
+
+    def clear(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class BulkLoader:
+    """
+    Writes a stream of items into a DynamoDB table with BatchWriteItem calls spread over a thread pool.
+
+    Unprocessed items and throttled calls are retried with jittered exponential backoff.
+    Progress is recorded in a checkpoint as the number of leading batches that are fully written,
+    so a run stopped by its deadline resumes at that batch. Items are written with idempotent puts,
+    so batches written after the checkpoint are simply written again on resume.
+    """
+
+    def __init__(self, table, workers=8, checkpoint=None, checkpoint_every=20):
+        self.table = table
+        self.client = table.meta.client
+        self.workers = workers
+        self.checkpoint = checkpoint
+        self.checkpoint_every = checkpoint_every
+        self.retries = 0
+        self._lock = threading.Lock()
+
+    def _writeBatch(self, batch):
+        request = {self.table.table_name: [{"PutRequest": {"Item": item}} for item in batch]}
+        for attempt in range(MAX_ATTEMPTS):
+            try:
+                response = self.client.batch_write_item(RequestItems=request)
+                request = response.get("UnprocessedItems") or {}
+                if len(request) == 0:
+                    return
+            except Exception as e:
+                if _errorCode(e) not in RETRYABLE_ERRORS:
+                    raise
+            with self._lock:
+                self.retries += 1
+            time.sleep(random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt)))
+        raise RuntimeError("Batch not written after {} attempts".format(MAX_ATTEMPTS))
+
+    def load(self, items, deadline=None):
+        """
+        Writes the items, resuming after the checkpointed batches.
+
+        Args:
+            items (iterable): The items to write, in the same order on every run
+            deadline (float, optional): time.monotonic() value after which no new batch is started
+
+        Returns:
+            dict: Load statistics; "complete" is False if the deadline stopped the load early
+        """
+        start = time.monotonic()
+        first_batch = self.checkpoint.load() if self.checkpoint else 0
+        watermark = first_batch
+        done = set()
+        written = 0
+        complete = True
+        in_flight = {}
+
+        def collect(futures):
+            nonlocal watermark, written
+            for future in futures:
+                batch_number, size = in_flight.pop(future)
+                future.result()
+                done.add(batch_number)
+                written += size
+            previous = watermark
+            while watermark in done:
+                done.remove(watermark)
+                watermark += 1
+            if self.checkpoint and watermark // self.checkpoint_every > previous // self.checkpoint_every:
+                self.checkpoint.save(watermark)
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                for batch_number, batch in _batches(items, first_batch):
+                    if deadline is not None and time.monotonic() > deadline:
+                        complete = False
+                        break
+                    if len(in_flight) >= self.workers * 2:
+                        finished, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                        collect(finished)
+                    in_flight[pool.submit(self._writeBatch, batch)] = (batch_number, len(batch))
+                finished, _ = wait(list(in_flight))
+                collect(finished)
+        except Exception:
+            # keep the progress made so far, the failed batch is retried by the next run
+            if self.checkpoint:
+                self.checkpoint.save(watermark)
+            raise
+
+        if self.checkpoint:
+            if complete:
+                self.checkpoint.clear()
+            else:
+                self.checkpoint.save(watermark)
+        seconds = time.monotonic() - start
+        return {
+            "complete": complete,
+            "items_written": written,
+            "batches_written": watermark,
+            "retries": self.retries,
+            "seconds": round(seconds, 3),
+            "items_per_second": round(written / seconds, 1) if seconds > 0 else 0.0,
+        }
+
+
+def _loadWords(table, words, workers=8, checkpoint=None, deadline=None, layout=None):
+    """
+    Loads a stream of raw words into the word table. See _wordItems and BulkLoader.
+    The layout defaults to the one selected by WORD_SHARDS. With a sharded layout the items of every
+    batch fall in several shards, so the parallel batches spread their writes over the partitions.
+    """
+    loader = BulkLoader(table, workers=workers, checkpoint=checkpoint)
+    return loader.load(_wordItems(words, layout or _getWordLayout()), deadline=deadline)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk load a word list into the Wordle word table.")
+    parser.add_argument("--words", help="text file with one word per line, defaults to the compiled dictionary artifact")
+    parser.add_argument("--table", default=os.environ.get("WORD_TABLE"), help="word table name, defaults to $WORD_TABLE")
+    parser.add_argument("--endpoint-url", help="DynamoDB endpoint, eg. http://localhost:8000 for DynamoDB Local")
+    parser.add_argument("--region", default=os.environ.get("REGION", "us-east-1"))
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--shards", type=int, default=int(os.environ.get("WORD_SHARDS", "0")), help="shards per word length, 0 for the word_length layout, defaults to $WORD_SHARDS")
+    parser.add_argument("--checkpoint", default=".word_loader_checkpoint.json", help="file recording the progress of the load")
+    parser.add_argument("--seconds", type=float, help="stop starting new batches after this many seconds")
+    parser.add_argument("--local", action="store_true", help="load into an in-memory stand-in table, to measure the loader itself")
+    parser.add_argument("--latency", type=float, default=0.0, help="with --local, milliseconds added to every call")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="with --local, fraction of calls that are throttled")
+    parser.add_argument("--partition-rate", type=float, default=0.0, help="with --local, items per second a partition accepts before throttling")
+    args = parser.parse_args()
+
+    layout = WordLayout(args.shards)
+    if args.local:
+        # the stand-in is not part of the lambda asset, it lives at the root of the repository
+        sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        from local_dynamodb import LocalDynamoDB
+        dynamodb = LocalDynamoDB(latency=args.latency / 1000.0, throttle_rate=args.throttle_rate, partition_rate=args.partition_rate)
+        table = dynamodb.create_table(args.table or "WordTable", layout.partition_key, "word")
+        checkpoint = None
+    else:
+        import boto3
+        from wordle_runtime import DYNAMODB_CONFIG
+        resource = boto3.resource("dynamodb", region_name=args.region, endpoint_url=args.endpoint_url, config=DYNAMODB_CONFIG)
+        table = resource.Table(args.table)
+        checkpoint = FileCheckpoint(args.checkpoint)
+    deadline = time.monotonic() + args.seconds if args.seconds else None
+    if args.words is None:
+        from word_artifact import WordArtifact
+        artifact = WordArtifact()
+        words = (word for word_length in artifact.lengths() for word in artifact.words(word_length))
+        stats = _loadWords(table, words, workers=args.workers, checkpoint=checkpoint, deadline=deadline, layout=layout)
+    else:
+        with open(args.words) as f:
+            stats = _loadWords(table, f, workers=args.workers, checkpoint=checkpoint, deadline=deadline, layout=layout)
+    if args.local:
+        stats["calls"] = dynamodb.summary()
+    print(json.dumps(stats))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+import hashlib
+import os
+
+# Per-user word sequence. The n-th game of a user for a word length plays the word with ordinal
+# _sequenceOrdinal(user_id, word_length, n, generations), a permutation of the ordinals keyed by
+# the user, so a user does not see a word twice before playing every word of that length.
+# The user item only keeps, in SEQUENCE, the number of games started per length and, next to it
+# under "<length>/cycle", the cycle in progress and the count it started at.
+#
+# Ordinals are append-only (see word_artifact.py): every dictionary version that added words
+# of a length is a generation, covering the ordinals between the previous cumulative count and
+# its own. The sequence plays the generations in order, each shuffled on its own, so adding words
+# never moves the words of the generations a user already started. Once every word was played
+# the sequence starts over with a new shuffle. A cycle is located by its stored start, not by
+# dividing the counter by the current word count, so words added in the middle of a later cycle
+# extend that cycle instead of shifting its positions.
+SEQUENCE = "sequence"
+# Suffix of the entry recording [cycle, count at its start] next to a counter of SEQUENCE
+CYCLE = "/cycle"
+# Suffix of the entry recording the build of the tier index a tiered counter walks
+BUILD = "/build"
+# Mixed into the keys so the sequence of a user cannot be derived from the user_id alone
+SEQUENCE_SECRET = os.environ.get("WORD_SEQUENCE_SECRET", "")
+FEISTEL_ROUNDS = 4
+
+
+def _roundKey(key, round_number, value):
+    digest = hashlib.blake2b(value.to_bytes(8, "little"), digest_size=8, key=key, person=bytes([round_number]) * 16).digest()
+    return int.from_bytes(digest, "little")
+
+
+def _feistel(value, half_bits, key):
+    """
+    Balanced Feistel network over the 2 * half_bits bit integers, a bijection for any key.
+    """
+    mask = (1 << half_bits) - 1
+    left = value >> half_bits
+    right = value & mask
+    for round_number in range(FEISTEL_ROUNDS):
+        left, right = right, left ^ (_roundKey(key, round_number, right) & mask)
+    return (left << half_bits) | right
+
+
+def _permute(index, size, key):
+    """
+    Maps index to its position in a keyed permutation of range(size).
+    The Feistel network permutes the smallest power of 4 covering size, and values falling outside
+    of range(size) are walked through the permutation again until they land inside. Since the
+    domain is less than 4 times size, a few steps are expected.
+
+    Args:
+        index (int): The position in the sequence, 0 <= index < size
+        size (int): The number of elements to permute
+        key (bytes): The key of the permutation
+
+    Returns:
+        int: The permuted value, 0 <= value < size
+    """
+    half_bits = max(1, ((size - 1).bit_length() + 1) // 2)
+    value = _feistel(index, half_bits, key)
+    while value >= size:
+        value = _feistel(value, half_bits, key)
+    return value
+
+
+def _sequenceKey(user_id, word_length, generation, cycle):
+    seed = "{}:{}:{}:{}:{}".format(SEQUENCE_SECRET, user_id, word_length, generation, cycle)
+    return hashlib.blake2b(seed.encode("utf-8"), digest_size=32).digest()
+
+
+def _sequenceOrdinal(user_id, word_length, position, generations, cycle=0):
+    """
+    Returns the ordinal of the word at a position of a cycle of a user's sequence, in O(number of generations).
+
+    Args:
+        user_id (str): The id of the user
+        word_length (int): The length of the word
+        position (int): The number of games of this length the user started before in this cycle
+        generations (list): Cumulative word counts of the dictionary generations, see WordArtifact.generations
+        cycle (int, optional): The number of times the user played every word of this length
+
+    Returns:
+        int: The ordinal of the word
+    """
+    start = 0
+    for generation, end in enumerate(generations):
+        if position < end - start:
+            return start + _permute(position, end - start, _sequenceKey(user_id, word_length, generation, cycle))
+        position -= end - start
+        start = end
+    raise IndexError("No position {} in a sequence of {} words".format(position, generations[-1]))
+
+
+def _advance(sequence, name, size):
+    """
+    Advances a counter of a sequence map and returns the cycle and position of the game it counts.
+    A new cycle starts once the position reaches the current size. A counter stored without its cycle
+    is assumed to have always had the current size.
+
+    Args:
+        sequence (dict): The sequence map of the user, modified in place
+        name (str): The counter, eg. "5"
+        size (int): The number of words the sequence walks
+
+    Returns:
+        tuple: (cycle, position)
+    """
+    n = int(sequence.get(name, 0))
+    if name + CYCLE in sequence:
+        cycle, start = [int(value) for value in sequence[name + CYCLE]]
+    else:
+        cycle = n // size
+        start = cycle * size
+    if n - start >= size:
+        cycle, start = cycle + 1, n
+    sequence[name] = n + 1
+    sequence[name + CYCLE] = [cycle, start]
+    return cycle, n - start
+
+
+def _nextSequenceWord(artifact, user, word_length):
+    """
+    Picks the word of the next game of a user and advances the user's counter for the length.
+    The user item is modified in place and has to be written back by the caller.
+
+    Args:
+        artifact (WordArtifact): The dictionary artifact
+        user (dict): The user item
+        word_length (int): The length of the word
+
+    Returns:
+        str: The word of the new game
+    """
+    sequence = dict(user.get(SEQUENCE, {}))
+    generations = artifact.generations(word_length)
+    cycle, position = _advance(sequence, str(word_length), generations[-1])
+    user[SEQUENCE] = sequence
+    return artifact.word(word_length, _sequenceOrdinal(user["user_id"], word_length, position, generations, cycle))
+
+
+def _nextTierWord(artifact, tiers, user, word_length, tier):
+    """
+    Picks the word of the next game of a user in a difficulty tier, see word_tiers.py, and advances
+    the user's counter for the length and tier, eg. "5:easy". The counter walks a keyed permutation
+    of the tier as the plain sequence walks one of the generations, so the pick is O(1) and a user
+    does not see a word of the tier twice before playing all of them. The plain and tiered sequences
+    are independent, so a word may come up once in each.
+    A rebuilt index reshuffles the words between the tiers, so the permutation is keyed on the build
+    of the index, recorded next to the counter, and the counter starts over when the build changes.
+    The user item is modified in place and has to be written back by the caller.
+
+    Args:
+        artifact (WordArtifact): The dictionary artifact
+        tiers (WordTiers): The tier index
+        user (dict): The user item
+        word_length (int): The length of the word
+        tier (str): One of word_tiers.TIERS
+
+    Returns:
+        str: The word of the new game
+    """
+    name = "{}:{}".format(word_length, tier)
+    sequence = dict(user.get(SEQUENCE, {}))
+    if sequence.get(name + BUILD) != tiers.build:
+        sequence.pop(name, None)
+        sequence.pop(name + CYCLE, None)
+        sequence[name + BUILD] = tiers.build
+    size = tiers.count(word_length, tier)
+    cycle, position = _advance(sequence, name, size)
+    index = _permute(position, size, _sequenceKey(user["user_id"], name, tiers.build, cycle))
+    user[SEQUENCE] = sequence
+    return artifact.word(word_length, tiers.ordinal(word_length, tier, index))
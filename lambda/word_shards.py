@@ -0,0 +1,149 @@
+import os
+import secrets
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from wordle_utils import _queryPartition, _getRandomItem, ResponseStatus, ApplicationStatus, ORDINAL_INDEX, ORDINAL, METADATA_PARTITION, COUNT_TTL
+
+# Optional sharded layout of the word table, selected with the WORD_SHARDS environment variable.
+#
+# With word_length as the partition key the whole dictionary lives in four partitions, and every random
+# pick and validation read of a 5 letter word lands on the same one. With WORD_SHARDS=n the partition
+# key is WORD_SHARD, a "length#shard" string where the shard of a word is the crc32 of the word modulo n,
+# so a point lookup still computes its partition and the words of a length are spread over n partitions.
+# Every shard numbers its words with its own dense ordinals, and the count record of a length in the metadata
+# partition, "0", also lists the count of each of its shards.
+# A random pick reads that record (cached like the unsharded counts), draws an ordinal over the total and
+# resolves it in the shard it falls in, so picks spread over the shards in proportion to their sizes.
+# Reading every word of a length, for the word index or a pick without count record, queries its shards in
+# parallel threads. The count records are not sharded: one record per length keeps the read of a cold
+# container to one GetItem, where a record per shard made every cold container hit the metadata partition
+# once per shard.
+# WORD_SHARDS=0, the default, keeps the word_length layout.
+WORD_SHARD = "word_shard"
+SHARDED_METADATA_PARTITION = "0"
+SHARD_COUNTS = "shard_counts"
+GATHER_WORKERS = 8
+
+# Per-shard counts, cached for COUNT_TTL seconds. Maps (table name, word_length) -> (counts, load time)
+_shard_counts = {}
+
+
+class WordLayout:
+    """
+    Keys of the word table items for a number of shards, 0 being the word_length layout.
+
+    Args:
+        shards (int): The number of partitions per word length
+    """
+
+    def __init__(self, shards):
+        self.shards = shards
+        self.partition_key = WORD_SHARD if shards else "word_length"
+        self.metadata_partition = SHARDED_METADATA_PARTITION if shards else METADATA_PARTITION
+
+    def shard(self, word):
+        return zlib.crc32(word.encode("utf-8")) % self.shards
+
+    def partition(self, word):
+        if not self.shards:
+            return len(word)
+        return "{}#{}".format(len(word), self.shard(word))
+
+    def partitions(self, word_length):
+        if not self.shards:
+            return [word_length]
+        return ["{}#{}".format(word_length, shard) for shard in range(self.shards)]
+
+    def key(self, word):
+        return {self.partition_key: self.partition(word), "word": word}
+
+    def metadataKey(self, name):
+        return {self.partition_key: self.metadata_partition, "word": name}
+
+
+def _getWordLayout():
+    return WordLayout(int(os.environ.get("WORD_SHARDS", "0")))
+
+
+def _gather(fn, values, workers=GATHER_WORKERS):
+    """
+    Calls fn on every value in parallel threads and returns the results in the order of the values.
+    """
+    values = list(values)
+    if len(values) == 1:
+        return [fn(values[0])]
+    with ThreadPoolExecutor(max_workers=min(workers, len(values))) as pool:
+        return list(pool.map(fn, values))
+
+
+def _shardCounts(table, layout, word_length):
+    """
+    Returns the number of words of every shard of a length, in the order of layout.partitions,
+    or None if the length has no count record for this number of shards.
+    """
+    cache_key = (table.table_name, word_length)
+    cached = _shard_counts.get(cache_key)
+    if cached is not None and time.monotonic() - cached[1] < COUNT_TTL:
+        return cached[0]
+    item = table.get_item(Key=layout.metadataKey(str(word_length))).get("Item")
+    if item is None or len(item.get(SHARD_COUNTS, [])) != layout.shards:
+        return None
+    counts = [int(count) for count in item[SHARD_COUNTS]]
+    _shard_counts[cache_key] = (counts, time.monotonic())
+    return counts
+
+
+def _queryShards(table, layout, word_length):
+    """
+    Reads every word item of a length, querying its shards in parallel.
+    """
+    pages = _gather(lambda partition: _queryPartition(table, layout.partition_key, partition), layout.partitions(word_length))
+    return [item for items in pages for item in items]
+
+
+def _getRandomWord(table, word_length):
+    """
+    Retrieves a random word item of the given length from the word table, in either layout.
+    See _getRandomItem for the word_length layout.
+
+    Args:
+        table (DynamoDB.Table): The DynamoDB word table object
+        word_length (int): The length of the word
+
+    Returns:
+        dict: The word item as a dictionary object if successful, otherwise a dictionary object containing an error message and status code
+    """
+    layout = _getWordLayout()
+    if not layout.shards:
+        return _getRandomItem(table, "word_length", word_length)
+    try:
+        # A missing ordinal means the cached counts are stale, so retry once with fresh counts
+        for attempt in range(2):
+            counts = _shardCounts(table, layout, word_length)
+            if counts is None:
+                items = _queryShards(table, layout, word_length)
+                if len(items) == 0:
+                    break
+                return {"success": True, "response": items[secrets.randbelow(len(items))], "application_status": ApplicationStatus.OK}
+            if sum(counts) == 0:
+                break
+            ordinal = secrets.randbelow(sum(counts))
+            for partition, count in zip(layout.partitions(word_length), counts):
+                if ordinal < count:
+                    break
+                ordinal -= count
+            response = table.query(
+                IndexName=ORDINAL_INDEX,
+                KeyConditionExpression="#partition = :partition AND #ordinal = :ordinal",
+                ExpressionAttributeNames={"#partition": WORD_SHARD, "#ordinal": ORDINAL},
+                ExpressionAttributeValues={":partition": partition, ":ordinal": ordinal}
+            )
+            if len(response["Items"]) > 0:
+                return {"success": True, "response": response["Items"][0], "application_status": ApplicationStatus.OK}
+            _shard_counts.pop((table.table_name, word_length), None)
+        return {"success": False, "response": "No items found in {}".format(table.table_name), "status": ResponseStatus.INTERNAL_ERROR, "application_status": ApplicationStatus.INPUT_ERROR}
+    except Exception as e:
+        print(e)
+        error_message = "Exception while getting a word of length {} from {}".format(word_length, table.table_name)
+        return {"success": False, "response": error_message, "status": ResponseStatus.INTERNAL_ERROR, "application_status": ApplicationStatus.DATABASE_ERROR}
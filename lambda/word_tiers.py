@@ -0,0 +1,132 @@
+import hashlib
+import os
+import struct
+
+# Difficulty tiers of the dictionary, built offline by score_words.py. Layout (little endian):
+#
+#   header     magic "WTIR", format u16, artifact version u32, lengths u16, tiers u8
+#   sections   one per word length: length u8, then the u32 word count of every tier,
+#              then the u32 ordinals of every tier, tier after tier, easiest words first
+#
+# A tier is a flat array of artifact ordinals, so the word at a position of a tier is read in place,
+# in O(1), and createGame picks from a tier without scanning the dictionary or reading the word table.
+# Ordinals are append-only (see word_artifact.py), so tiers built on an older artifact stay valid
+# and only miss the words added since; score_words.py is run again to rank them.
+# The header version is the one of the artifact, which a new scoring of the same artifact keeps, so
+# an index is identified by its build, a digest of its tiers. The tiered sequences are keyed on it.
+MAGIC = b"WTIR"
+FORMAT = 1
+HEADER = struct.Struct("<4sHIHB")
+LENGTH = struct.Struct("<B")
+UINT32 = struct.Struct("<I")
+TIERS = ("easy", "medium", "hard")
+
+DEFAULT_TIERS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "word_tiers.bin")
+
+# Loaded once per container, see _getWordTiers
+_tiers = None
+
+
+class WordTiers:
+    """
+    Read-only view of a tier index, the ordinals of the words of each tier and word length.
+
+    Args:
+        data (bytes): An encoded tier index, see encode
+    """
+
+    def __init__(self, data):
+        magic, fmt, self.version, lengths, tier_count = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or fmt != FORMAT or tier_count != len(TIERS):
+            raise ValueError("Not a format {} tier index".format(FORMAT))
+        self._data = data
+        self.build = hashlib.blake2b(bytes(data[HEADER.size:]), digest_size=8).hexdigest()
+        # Maps word_length -> [(offset of the first ordinal, count)] per tier
+        self._sections = {}
+        offset = HEADER.size
+        for _ in range(lengths):
+            word_length, = LENGTH.unpack_from(data, offset)
+            offset += LENGTH.size
+            counts = [UINT32.unpack_from(data, offset + tier * UINT32.size)[0] for tier in range(tier_count)]
+            offset += tier_count * UINT32.size
+            tiers = []
+            for count in counts:
+                tiers.append((offset, count))
+                offset += count * UINT32.size
+            self._sections[word_length] = tiers
+
+    def lengths(self):
+        return sorted(self._sections)
+
+    def count(self, word_length, tier):
+        """
+        Returns the number of words of a tier, 0 for unsupported lengths.
+        """
+        section = self._sections.get(word_length)
+        return section[TIERS.index(tier)][1] if section else 0
+
+    def ordinal(self, word_length, tier, index):
+        """
+        Returns the ordinal of the index-th word of a tier.
+        """
+        offset, count = self._sections[word_length][TIERS.index(tier)]
+        if index < 0 or index >= count:
+            raise IndexError("No word {} in the {} tier of length {}".format(index, tier, word_length))
+        return UINT32.unpack_from(self._data, offset + index * UINT32.size)[0]
+
+    def ordinals(self, word_length, tier):
+        return [self.ordinal(word_length, tier, index) for index in range(self.count(word_length, tier))]
+
+    @classmethod
+    def encode(cls, version, tiers):
+        """
+        Encodes tiers into the bytes of a tier index.
+
+        Args:
+            version (int): The version of the artifact the ordinals refer to
+            tiers (dict): Word length -> one list of ordinals per tier of TIERS
+
+        Returns:
+            bytes: The encoded index
+        """
+        parts = [HEADER.pack(MAGIC, FORMAT, version, len(tiers), len(TIERS))]
+        for word_length in sorted(tiers):
+            parts.append(LENGTH.pack(word_length))
+            parts.extend(UINT32.pack(len(ordinals)) for ordinals in tiers[word_length])
+            parts.extend(UINT32.pack(ordinal) for ordinals in tiers[word_length] for ordinal in ordinals)
+        return b"".join(parts)
+
+
+def _splitTiers(scores):
+    """
+    Splits the ordinals of one word length into TIERS of equal size by increasing score.
+    Ties are broken by ordinal, so the split does not depend on the order of the scores.
+
+    Args:
+        scores (list): The difficulty score of every ordinal
+
+    Returns:
+        list: One list of ordinals per tier
+    """
+    ranked = sorted(range(len(scores)), key=lambda ordinal: (scores[ordinal], ordinal))
+    bounds = [len(ranked) * tier // len(TIERS) for tier in range(len(TIERS) + 1)]
+    return [ranked[bounds[tier]:bounds[tier + 1]] for tier in range(len(TIERS))]
+
+
+def _getWordTiers():
+    """
+    Returns the tier index of this container, reading it on first use.
+    The path can be overridden with the WORD_TIERS environment variable.
+
+    Returns:
+        WordTiers: The index, or None if it is missing or corrupt
+    """
+    global _tiers
+    if _tiers is None:
+        try:
+            with open(os.environ.get("WORD_TIERS", DEFAULT_TIERS_PATH), "rb") as f:
+                _tiers = WordTiers(f.read())
+        except (OSError, ValueError, struct.error) as e:
+            print(e)
+            return None
+    return _tiers
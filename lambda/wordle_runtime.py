@@ -0,0 +1,70 @@
+import os
+import boto3
+from botocore.config import Config
+from metrics import InstrumentedTable, METRICS_ENABLED
+
+# Connection settings for the DynamoDB client shared by all handlers in a container.
+# Keep-alive lets warm invocations reuse the TLS connection opened by earlier ones.
+MAX_POOL_CONNECTIONS = int(os.environ.get("DYNAMODB_MAX_POOL_CONNECTIONS", "10"))
+CONNECT_TIMEOUT = float(os.environ.get("DYNAMODB_CONNECT_TIMEOUT", "2"))
+READ_TIMEOUT = float(os.environ.get("DYNAMODB_READ_TIMEOUT", "5"))
+MAX_ATTEMPTS = int(os.environ.get("DYNAMODB_MAX_ATTEMPTS", "3"))
+
+DYNAMODB_CONFIG = Config(
+    max_pool_connections=MAX_POOL_CONNECTIONS,
+    connect_timeout=CONNECT_TIMEOUT,
+    read_timeout=READ_TIMEOUT,
+    tcp_keepalive=True,
+    retries={"max_attempts": MAX_ATTEMPTS, "mode": "standard"},
+)
+
+# Created lazily on first use and kept for the lifetime of the container
+_resource = None
+_tables = {}
+
+
+def _getResource():
+    """
+    Returns the DynamoDB service resource of this container, creating it on first use.
+
+    Returns:
+        DynamoDB.ServiceResource: The shared DynamoDB resource
+    """
+    global _resource
+    if _resource is None:
+        _resource = boto3.resource("dynamodb", region_name=os.environ.get("REGION"), config=DYNAMODB_CONFIG)
+    return _resource
+
+
+def _getTable(table_env_name):
+    """
+    Returns the Table object for the table named by an environment variable, eg. "USER_TABLE".
+    Table objects are created once per container and reused by later invocations.
+    Unless metrics are disabled, the table records its calls into the metrics of the current invocation.
+
+    Args:
+        table_env_name (str): The name of the environment variable holding the table name
+
+    Returns:
+        DynamoDB.Table: The DynamoDB table object
+    """
+    table = _tables.get(table_env_name)
+    if table is None:
+        table = _getResource().Table(os.environ[table_env_name])
+        if METRICS_ENABLED:
+            table = InstrumentedTable(table)
+        _tables[table_env_name] = table
+    return table
+
+
+def _setResource(resource):
+    """
+    Replaces the DynamoDB resource of this container and drops the cached tables.
+    Used to point the handlers at a local stand-in for tests and benchmarks.
+
+    Args:
+        resource (DynamoDB.ServiceResource): The resource to use, or None to go back to boto3
+    """
+    global _resource
+    _resource = resource
+    _tables.clear()
@@ -1,14 +1,20 @@
-import json
-import uuid
+import base64
+import re
+import secrets
+import time
 import enum
+from response_encoder import _view, _string, _strings, _encodeBody, _compressResponse
 # HTTP response status codes
 class ResponseStatus(enum.Enum):
     OK = 200
     CREATED = 201
+    ACCEPTED = 202
     TEMPORARY_REDIRECT = 302
     MALFORMED_REQUEST = 400
     NOT_AUTHORISED = 403
     NOT_FOUND = 404
+    METHOD_NOT_ALLOWED = 405
+    CONFLICT = 409
     INTERNAL_ERROR = 500
 
 # Application Status Codes
@@ -20,6 +26,7 @@ class ApplicationStatus(enum.Enum):
     INPUT_ERROR = 5
     GAME_OVER = 6
     DATABASE_ERROR = 7
+    CONFLICT = 8
 
 # Game Status and Guess Colours
 GREY = "GREY"
@@ -29,31 +36,176 @@ IN_PROGRESS = "IN_PROGRESS"
 WON = "WON"
 LOST = "LOST"
 
+# Responses are stored as base-3 integers: position i contributes 3**i times the digit of its colour
+RESPONSE_DIGITS = [GREY, YELLOW, GREEN]
+_COLOUR_DIGIT = {GREY: 0, YELLOW: 1, GREEN: 2}
+_LEGACY_COLOUR = re.compile(r"[A-Z]+")
 
-def _http_response(response_status, response_message, application_status, headers=None):
+# Word table layout used for random word selection.
+# Every word carries a dense per-length ORDINAL, indexed by ORDINAL_INDEX, and the number of
+# words of each length is kept in a count record in the METADATA_PARTITION.
+ORDINAL_INDEX = "WordOrdinalIndex"
+ORDINAL = "ordinal"
+COUNT = "count"
+METADATA_PARTITION = 0
+COUNT_TTL = 60
+
+# Game expiry. Games carry their DynamoDB TTL in EXPIRES_AT (epoch seconds). An abandoned game
+# expires ACTIVE_GAME_TTL after its last guess and a finished game FINISHED_GAME_TTL after it ended,
+# which leaves the compaction job (compactGames.py) time to move it into the history table first.
+EXPIRES_AT = "expires_at"
+ACTIVE_GAME_TTL = 30 * 24 * 3600
+FINISHED_GAME_TTL = 7 * 24 * 3600
+
+# Per-container cache of partition counts. Maps (table name, partition value) -> (count, load time)
+_counts = {}
+
+
+def _http_response(response_status, response_message, application_status, headers=None, event=None):
     """
     Builds a HTTP response object using the response status and message provided.
+    Items must be passed through their view (eg. _gameView) before, see response_encoder.py.
 
     Args:
         response_status (ResponseStatus): The HTTP response status code
         response_message (str): The message to be returned in the HTTP response body
         headers (dict, optional): The HTTP response headers. Defaults to None.
+        event (dict, optional): The request, to gzip a large body if it accepts it. Defaults to None.
     
     Returns:
         dict: The HTTP response object
     """
     response_object = {
                 'statusCode': response_status.value,
-                'body': json.dumps({"message":response_message, "status": application_status.name})
+                'body': _encodeBody(response_message, application_status)
             }
     if headers is not None:
         response_object["headers"] = headers
+    if event is not None:
+        _compressResponse(response_object, event)
     return response_object
 
 
-def _getItem(table, pk_name, pk_value, sk_name=None, sk_value=None):
+def _requestBody(event):
+    """
+    Returns the body of a request as text. The API declares every media type binary so that the
+    functions can return gzipped bodies, so API Gateway hands request bodies over base64 encoded.
+    Handlers read their body through this function rather than from the event.
+
+    Args:
+        event (dict): The API Gateway event
+
+    Returns:
+        str: The body, or None if the request has none
+
+    Raises:
+        ValueError: If the body is not valid base64 or UTF-8
+    """
+    body = event.get("body")
+    if body is not None and event.get("isBase64Encoded"):
+        body = base64.b64decode(body).decode("utf-8")
+    return body
+
+
+def _gameExpiry(status, now=None):
+    """
+    Returns the TTL of a game item in the given status, eg. _gameExpiry(WON) is a week from now.
+
+    Args:
+        status (str): IN_PROGRESS/WON/LOST
+        now (int, optional): The current epoch time in seconds. Defaults to the clock.
+
+    Returns:
+        int: The epoch time in seconds at which DynamoDB may delete the game
+    """
+    if now is None:
+        now = int(time.time())
+    return int(now) + (ACTIVE_GAME_TTL if status == IN_PROGRESS else FINISHED_GAME_TTL)
+
+
+def _encodeResponse(response):
+    """
+    Encodes a response as a base-3 integer, eg. ["GREEN", "GREY", "YELLOW", "GREY", "GREY"] -> 11
+
+    Args:
+        response (list): Response as a list of colours(str)
+
+    Returns:
+        int: The encoded response
+    """
+    code = 0
+    for colour in reversed(response):
+        code = code * 3 + _COLOUR_DIGIT[colour]
+    return code
+
+
+def _decodeResponse(stored, word_length):
+    """
+    Converts a stored response back into a list of colours. Accepts the base-3 integer
+    written by _encodeResponse as well as the legacy "['GREEN', 'GREY', ...]" strings.
+
+    Args:
+        stored (int/Decimal/str): The response as stored in the game item
+        word_length (int): The length of the guess
+
+    Returns:
+        list: Response as a list of colours(str)
+    """
+    if isinstance(stored, str):
+        return _LEGACY_COLOUR.findall(stored)
+    code = int(stored)
+    response = []
+    for _ in range(word_length):
+        response.append(RESPONSE_DIGITS[code % 3])
+        code //= 3
+    return response
+
+
+_GAME_VIEW = _view([("game_id", _string), ("hard_mode", _string), ("attempts_left", _string), ("word_length", _string),
+                    ("status", _string), ("guesses", _strings), ("difficulty", _string)])
+_USER_VIEW = _view([("user_id", _string), ("game_id", _string)])
+
+
+def _gameView(game):
+    """
+    Returns the game as it is exposed by the API. The word is only revealed once the game is over.
+    Stored responses are rendered in their original "['GREEN', 'GREY', ...]" form whatever their storage encoding.
+
+    Args:
+        game (dict): The game item
+
+    Returns:
+        dict: The exposed fields of the game item for the HTTP response
+    """
+    view = _GAME_VIEW(game)
+    word_length = int(game["word_length"])
+    view["responses"] = [str(_decodeResponse(response, word_length)) for response in game["responses"]]
+    if game["status"] != IN_PROGRESS:
+        view["word"] = game["word"]
+    return view
+
+
+def _userView(user):
+    """
+    Returns the user as it is exposed by the API, without its version and word sequence counters.
+    """
+    return _USER_VIEW(user)
+
+
+def _projection(attributes):
+    """
+    Returns the ProjectionExpression and ExpressionAttributeNames reading the given attributes,
+    with every name aliased so reserved words such as status can be projected.
+    """
+    names = dict(("#p{}".format(idx), name) for idx, name in enumerate(attributes))
+    return ", ".join(names), names
+
+
+def _getItem(table, pk_name, pk_value, sk_name=None, sk_value=None, attributes=None, consistent=False):
     """
     Retrieves an item from the provided table using the provided primary key and sort key (if provided).
+    A projection only reduces the bytes transferred and deserialized: DynamoDB bills a read on the size
+    of the whole item, whereas a strongly consistent read costs twice the capacity of an eventual one.
 
     Args:
         table (DynamoDB.Table): The DynamoDB table object
@@ -61,6 +213,8 @@ def _getItem(table, pk_name, pk_value, sk_name=None, sk_value=None):
         pk_value (str/int): The value of the primary key
         sk_name (str, optional): The name of the sort key. Defaults to None.
         sk_value (str/int, optional): The value of the sort key. Defaults to None.
+        attributes (list, optional): The attributes to read. Defaults to None, the whole item.
+        consistent (bool, optional): Make a strongly consistent read. Defaults to False.
     
     Returns:
         dict: The item retrieved from the table as a dictionary object if successful, otherwise a dictionary object containing an error message and status code
@@ -70,9 +224,14 @@ def _getItem(table, pk_name, pk_value, sk_name=None, sk_value=None):
     }
     if sk_name is not None:
         key[sk_name] = sk_value
+    kwargs = {"Key": key}
+    if attributes is not None:
+        kwargs["ProjectionExpression"], kwargs["ExpressionAttributeNames"] = _projection(attributes)
+    if consistent:
+        kwargs["ConsistentRead"] = True
     
     try:
-        itemObject = table.get_item(Key=key)
+        itemObject = table.get_item(**kwargs)
         if "Item" in itemObject:
             return {"success":True, "response":itemObject["Item"], "application_status": ApplicationStatus.OK}
         else:
@@ -84,42 +243,94 @@ def _getItem(table, pk_name, pk_value, sk_name=None, sk_value=None):
         return {"success": False, "response": error_message, "status": ResponseStatus.INTERNAL_ERROR, "application_status": ApplicationStatus.DATABASE_ERROR}
 
 
-def _getRandomItem(table, partition_key, partition_key_value):
-    #TODO: CHeck if this works, if not dont include in this function
-    print(table.table_name)
+def _getItemCount(table, partition_key, partition_key_value, sort_key):
     """
-    Retrieves a random item from the provided table. Performs a scan
-    on the table using partition_key and partition_key_value to filter
-    the results. A random item is then selected from the results.
+    Returns the number of items in a partition, as recorded by its count record.
+    Count records live in the METADATA_PARTITION with the counted partition value as their sort key.
+    Counts are cached in the container for COUNT_TTL seconds.
+
+    Args:
+        table (DynamoDB.Table): The DynamoDB table object
+        partition_key (str): The name of the partition key
+        partition_key_value (int): The partition to count
+        sort_key (str): The name of the sort key
+
+    Returns:
+        int: The number of items in the partition, or None if the partition has no count record
+    """
+    cache_key = (table.table_name, partition_key_value)
+    cached = _counts.get(cache_key)
+    if cached is not None and time.monotonic() - cached[1] < COUNT_TTL:
+        return cached[0]
+    itemObject = table.get_item(Key={partition_key: METADATA_PARTITION, sort_key: str(partition_key_value)})
+    if "Item" not in itemObject:
+        return None
+    count = int(itemObject["Item"][COUNT])
+    _counts[cache_key] = (count, time.monotonic())
+    return count
+
+
+def _getRandomItem(table, partition_key, partition_key_value, sort_key="word"):
+    """
+    Retrieves a random item from the provided partition of the table.
+    Each item of the partition carries a dense ordinal (0..n-1) that is indexed by ORDINAL_INDEX,
+    so a uniformly random ordinal is drawn and resolved with a single query against the index.
+    Tables populated without ordinals fall back to reading the whole partition, page by page.
 
     Args:
         table (DynamoDB.Table): The DynamoDB table object
         partition_key (str): The name of the partition key
         partition_key_value (str/int): The value of the partition key
+        sort_key (str, optional): The name of the sort key. Defaults to "word".
     
     Returns:
         dict: The item retrieved from the table as a dictionary object if successful, otherwise a dictionary object containing an error message and status code
     """
     try:
-        keyConditionExpression = "{} = :partition_key_value".format(partition_key)
-        response = table.query(
-            KeyConditionExpression=keyConditionExpression,
-            ExpressionAttributeValues={':partition_key_value': partition_key_value}
-        )
-        items = response['Items']
-        n = len(items)
-        if n == 0:
-            return {"success":False, "response": "No items found in {}".format(table.table_name), "status": ResponseStatus.INTERNAL_ERROR, "application_status": ApplicationStatus.INPUT_ERROR}
-        else:
-            random_int = uuid.uuid4().int
-            idx = random_int % n
-            return {"success":True, "response": items[idx], "application_status": ApplicationStatus.OK}
+        # A missing ordinal means the cached count is stale, so retry once with a fresh count
+        for attempt in range(2):
+            n = _getItemCount(table, partition_key, partition_key_value, sort_key)
+            if n is None:
+                items = _queryPartition(table, partition_key, partition_key_value)
+                n = len(items)
+                if n == 0:
+                    break
+                return {"success":True, "response": items[secrets.randbelow(n)], "application_status": ApplicationStatus.OK}
+            if n == 0:
+                break
+            response = table.query(
+                IndexName=ORDINAL_INDEX,
+                KeyConditionExpression="{} = :partition_key_value AND #ordinal = :ordinal".format(partition_key),
+                ExpressionAttributeNames={"#ordinal": ORDINAL},
+                ExpressionAttributeValues={':partition_key_value': partition_key_value, ':ordinal': secrets.randbelow(n)}
+            )
+            if len(response["Items"]) > 0:
+                return {"success":True, "response": response["Items"][0], "application_status": ApplicationStatus.OK}
+            _counts.pop((table.table_name, partition_key_value), None)
+        return {"success":False, "response": "No items found in {}".format(table.table_name), "status": ResponseStatus.INTERNAL_ERROR, "application_status": ApplicationStatus.INPUT_ERROR}
     except Exception as e:
         print(e)
         error_message = "Exception while getting {}: {} from {}".format(partition_key, str(partition_key_value), table.table_name)
         return {"success": False, "response": error_message, "status": ResponseStatus.INTERNAL_ERROR, "application_status": ApplicationStatus.DATABASE_ERROR}
 
 
+def _queryPartition(table, partition_key, partition_key_value):
+    """
+    Reads every item of a partition, following LastEvaluatedKey across pages.
+    """
+    query_args = {
+        "KeyConditionExpression": "{} = :partition_key_value".format(partition_key),
+        "ExpressionAttributeValues": {':partition_key_value': partition_key_value}
+    }
+    items = []
+    while True:
+        response = table.query(**query_args)
+        items.extend(response['Items'])
+        if "LastEvaluatedKey" not in response:
+            return items
+        query_args["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
 def _putItem(table, item):
     """
     Inserts a new item into the provided table.
@@ -144,6 +355,54 @@ def _putItem(table, item):
         return {"success": False, "response": error_message, "status": ResponseStatus.INTERNAL_ERROR, "application_status": ApplicationStatus.DATABASE_ERROR}
 
 
+def _updateItem(table, key, update_expression, expression_values, condition_expression=None, expression_names=None):
+    """
+    Updates an item in place with an update expression, optionally guarded by a condition.
+
+    Args:
+        table (DynamoDB.Table): The DynamoDB table object
+        key (dict): The primary key of the item, eg. {"game_id": "..."}
+        update_expression (str): The update expression, eg. "SET #status = :status"
+        expression_values (dict): The values referenced by the expressions
+        condition_expression (str, optional): The condition the stored item must satisfy. Defaults to None.
+        expression_names (dict, optional): The attribute names referenced by the expressions. Defaults to None.
+
+    Returns:
+        dict: A dictionary object of the updated item if successful, otherwise a dictionary object containing an error message and status code.
+        A failed condition is reported with ResponseStatus.CONFLICT.
+    """
+    update_args = {
+        "Key": key,
+        "UpdateExpression": update_expression,
+        "ExpressionAttributeValues": expression_values,
+        "ReturnValues": "ALL_NEW",
+    }
+    if condition_expression is not None:
+        update_args["ConditionExpression"] = condition_expression
+    if expression_names is not None:
+        update_args["ExpressionAttributeNames"] = expression_names
+    try:
+        response = table.update_item(**update_args)
+        return {"success": True, "response": response["Attributes"], "status": ResponseStatus.OK, "application_status": ApplicationStatus.OK}
+    except Exception as e:
+        if _errorCode(e) == "ConditionalCheckFailedException":
+            error_message = "Item in {} was modified by another request".format(table.table_name)
+            return {"success": False, "response": error_message, "status": ResponseStatus.CONFLICT, "application_status": ApplicationStatus.CONFLICT}
+        print(e)
+        error_message = "An exception occured while updating item in {}".format(table.table_name)
+        return {"success": False, "response": error_message, "status": ResponseStatus.INTERNAL_ERROR, "application_status": ApplicationStatus.DATABASE_ERROR}
+
+
+def _errorCode(e):
+    """
+    Returns the DynamoDB error code of a botocore ClientError, or None for other exceptions.
+    """
+    response = getattr(e, "response", None)
+    if not isinstance(response, dict):
+        return None
+    return response.get("Error", {}).get("Code")
+
+
 def _deleteItem(table, item_id_name, item_id):
     """
     Deletes an item from the provided table using the provided primary key.
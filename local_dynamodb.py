@@ -0,0 +1,1050 @@
+"""
+In-memory stand-in for the subset of the DynamoDB Table API used by the handlers.
+
+It understands the expressions the project writes (key conditions, conditions, updates and
+projections), stores numbers as Decimal like boto3 does, pages query results, and reports
+consumed capacity. Every call is recorded, so tests and benchmarks can assert budgets such as
+"a guess makes at most 3 round trips", and latency, throttling (random, or of the partitions
+receiving more than a given rate of requests) and unprocessed batch items can be injected.
+
+Install it in place of boto3 without touching the handlers:
+
+    from local_dynamodb import _installLocalDynamoDB
+    dynamodb = _installLocalDynamoDB(latency=0.005)
+    guess.handler(event, None)
+    print(dynamodb.summary())
+
+It is also runnable as `python lambda/word_loader.py --local`. It is not part of the lambda asset, but
+imports the lambda helpers it mimics, so lambda/ has to be on the import path: tests/unit/conftest.py
+and benchmarks/common.py put it there.
+"""
+import copy
+import json
+import math
+import os
+import random
+import re
+import threading
+import time
+from decimal import Decimal
+from boto3.dynamodb.types import Binary, TypeDeserializer
+from botocore.exceptions import ClientError
+from wordle_utils import _errorCode, ORDINAL_INDEX, ORDINAL
+from word_shards import _getWordLayout
+
+# DynamoDB pages query and scan results at 1 MB
+PAGE_BYTES = 1024 * 1024
+READ_UNIT_BYTES = 4096
+WRITE_UNIT_BYTES = 1024
+BATCH_WRITE_LIMIT = 25
+TRANSACTION_LIMIT = 100
+
+
+def _itemSize(value):
+    """
+    Approximates the size DynamoDB bills for an item or attribute value: UTF-8 bytes for
+    strings, about one byte per two digits plus one for numbers, and 3 bytes of overhead
+    plus one byte per element for lists and maps.
+    """
+    if isinstance(value, dict):
+        return 3 + sum(len(k.encode("utf-8")) + _itemSize(v) + 1 for k, v in value.items())
+    if isinstance(value, list):
+        return 3 + sum(_itemSize(v) + 1 for v in value)
+    if isinstance(value, (set, frozenset)):
+        return sum(_itemSize(v) for v in value)
+    if isinstance(value, bool) or value is None:
+        return 1
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    digits = len(str(abs(int(value))))
+    return (digits + 1) // 2 + 1
+
+
+def _toStored(value):
+    """
+    Converts a python value the way boto3 serializes it: ints become Decimal and floats are rejected.
+    """
+    if isinstance(value, bool) or value is None or isinstance(value, (str, bytes, Decimal)):
+        return value
+    if isinstance(value, int):
+        return Decimal(value)
+    if isinstance(value, float):
+        raise TypeError("Float types are not supported. Use Decimal types instead.")
+    if isinstance(value, bytearray):
+        return bytes(value)
+    if isinstance(value, dict):
+        return {k: _toStored(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_toStored(v) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return set(_toStored(v) for v in value)
+    raise TypeError("Unsupported type {}".format(type(value)))
+
+
+def _deserialize(value):
+    """
+    Converts a map of low-level attribute values ({"S": "..."}) to the values the Table API stores.
+    """
+    deserializer = TypeDeserializer()
+    return _toStored(dict((name, _unwrapBinary(deserializer.deserialize(v))) for name, v in value.items()))
+
+
+def _unwrapBinary(value):
+    if isinstance(value, Binary):
+        return value.value
+    if isinstance(value, dict):
+        return dict((k, _unwrapBinary(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return [_unwrapBinary(v) for v in value]
+    if isinstance(value, set):
+        return set(_unwrapBinary(v) for v in value)
+    return value
+
+
+def _clientError(code, operation, message=""):
+    return ClientError({"Error": {"Code": code, "Message": message or code}}, operation)
+
+
+class Call:
+    """
+    One recorded request against the stand-in.
+    """
+    __slots__ = ("operation", "table", "items", "read_units", "write_units", "bytes_read", "bytes_written", "seconds", "error")
+
+    def __init__(self, operation, table):
+        self.operation = operation
+        self.table = table
+        self.items = 0
+        self.read_units = 0.0
+        self.write_units = 0.0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.seconds = 0.0
+        self.error = None
+
+    def __repr__(self):
+        return "Call({}, {}, items={}, rcu={}, wcu={}, read={}B, written={}B{})".format(
+            self.operation, self.table, self.items, self.read_units, self.write_units,
+            self.bytes_read, self.bytes_written, ", error=" + self.error if self.error else "")
+
+
+# ---------------------------------------------------------------------------------------------
+# Expressions
+# ---------------------------------------------------------------------------------------------
+
+_TOKEN = re.compile(r"\s*(?:(<>|<=|>=|[=<>(),.\[\]+-])|(#\w+)|(:\w+)|(\d+)|([A-Za-z_][\w-]*))")
+_KEYWORDS = {"AND", "OR", "NOT", "BETWEEN", "IN", "SET", "REMOVE", "ADD", "DELETE"}
+
+
+def _tokenize(expression):
+    tokens = []
+    position = 0
+    expression = expression.strip()
+    while position < len(expression):
+        match = _TOKEN.match(expression, position)
+        if match is None:
+            raise _clientError("ValidationException", "Expression", "Invalid expression: {}".format(expression))
+        symbol, name, value, number, word = match.groups()
+        if symbol:
+            tokens.append(("op", symbol))
+        elif name:
+            tokens.append(("name", name))
+        elif value:
+            tokens.append(("value", value))
+        elif number:
+            tokens.append(("number", int(number)))
+        elif word.upper() in _KEYWORDS:
+            tokens.append(("keyword", word.upper()))
+        else:
+            tokens.append(("word", word))
+        position = match.end()
+    return tokens
+
+
+class _Parser:
+    def __init__(self, expression, names, values):
+        self.tokens = _tokenize(expression)
+        self.position = 0
+        self.names = names or {}
+        self.values = values or {}
+
+    def peek(self, offset=0):
+        if self.position + offset < len(self.tokens):
+            return self.tokens[self.position + offset]
+        return (None, None)
+
+    def next(self):
+        token = self.peek()
+        self.position += 1
+        return token
+
+    def expect(self, kind, text=None):
+        token = self.next()
+        if token[0] != kind or (text is not None and token[1] != text):
+            raise _clientError("ValidationException", "Expression", "Expected {} but found {}".format(text or kind, token[1]))
+        return token
+
+    def accept(self, kind, text):
+        if self.peek() == (kind, text):
+            self.position += 1
+            return True
+        return False
+
+    def done(self):
+        return self.position >= len(self.tokens)
+
+    # paths and operands
+
+    def path(self):
+        kind, text = self.next()
+        if kind == "name":
+            if text not in self.names:
+                raise _clientError("ValidationException", "Expression", "Missing attribute name {}".format(text))
+            parts = [self.names[text]]
+        elif kind == "word":
+            parts = [text]
+        else:
+            raise _clientError("ValidationException", "Expression", "Expected an attribute but found {}".format(text))
+        while True:
+            if self.accept("op", "."):
+                kind, text = self.next()
+                parts.append(self.names[text] if kind == "name" else text)
+            elif self.accept("op", "["):
+                parts.append(self.expect("number")[1])
+                self.expect("op", "]")
+            else:
+                return ("path", parts)
+
+    def operand(self):
+        kind, text = self.peek()
+        if kind == "value":
+            self.next()
+            if text not in self.values:
+                raise _clientError("ValidationException", "Expression", "Missing attribute value {}".format(text))
+            return ("value", self.values[text])
+        if kind == "word" and self.peek(1) == ("op", "("):
+            self.next()
+            self.expect("op", "(")
+            args = [self.operand()]
+            while self.accept("op", ","):
+                args.append(self.operand())
+            self.expect("op", ")")
+            return ("call", text, args)
+        return self.path()
+
+    # conditions
+
+    def condition(self):
+        left = self.conjunction()
+        while self.accept("keyword", "OR"):
+            left = ("or", left, self.conjunction())
+        return left
+
+    def conjunction(self):
+        left = self.negation()
+        while self.accept("keyword", "AND"):
+            left = ("and", left, self.negation())
+        return left
+
+    def negation(self):
+        if self.accept("keyword", "NOT"):
+            return ("not", self.negation())
+        if self.accept("op", "("):
+            inner = self.condition()
+            self.expect("op", ")")
+            return inner
+        left = self.operand()
+        if left[0] == "call" and self.peek()[0] != "op":
+            return left
+        if self.accept("keyword", "BETWEEN"):
+            low = self.operand()
+            self.expect("keyword", "AND")
+            return ("between", left, low, self.operand())
+        if self.accept("keyword", "IN"):
+            self.expect("op", "(")
+            options = [self.operand()]
+            while self.accept("op", ","):
+                options.append(self.operand())
+            self.expect("op", ")")
+            return ("in", left, options)
+        kind, comparator = self.next()
+        if kind != "op" or comparator not in ("=", "<>", "<", "<=", ">", ">="):
+            raise _clientError("ValidationException", "Expression", "Expected a comparator but found {}".format(comparator))
+        return ("compare", comparator, left, self.operand())
+
+    # updates
+
+    def update(self):
+        actions = []
+        clause = None
+        while not self.done():
+            kind, text = self.peek()
+            if kind == "keyword" and text in ("SET", "REMOVE", "ADD", "DELETE"):
+                clause = text
+                self.next()
+                continue
+            if clause is None:
+                raise _clientError("ValidationException", "Expression", "Update expression must start with SET, REMOVE, ADD or DELETE")
+            target = self.path()
+            if clause == "SET":
+                self.expect("op", "=")
+                value = self.operand()
+                if self.peek() in (("op", "+"), ("op", "-")):
+                    sign = self.next()[1]
+                    value = ("arith", sign, value, self.operand())
+                actions.append(("SET", target, value))
+            elif clause == "REMOVE":
+                actions.append(("REMOVE", target, None))
+            else:
+                actions.append((clause, target, self.operand()))
+            self.accept("op", ",")
+        return actions
+
+    def projection(self):
+        paths = [self.path()]
+        while self.accept("op", ","):
+            paths.append(self.path())
+        return paths
+
+
+_MISSING = object()
+
+
+def _resolve(item, path):
+    value = item
+    for part in path[1]:
+        if isinstance(part, int):
+            if not isinstance(value, list) or part >= len(value):
+                return _MISSING
+            value = value[part]
+        else:
+            if not isinstance(value, dict) or part not in value:
+                return _MISSING
+            value = value[part]
+    return value
+
+
+def _assign(item, path, value):
+    parts = path[1]
+    target = item
+    for part in parts[:-1]:
+        target = target[part] if isinstance(part, int) else target.setdefault(part, {})
+    if isinstance(parts[-1], int) and parts[-1] >= len(target):
+        target.append(value)
+    else:
+        target[parts[-1]] = value
+
+
+def _remove(item, path):
+    parts = path[1]
+    target = item
+    for part in parts[:-1]:
+        target = _resolve({"_": target}, ("path", ["_", part]))
+        if target is _MISSING:
+            return
+    if isinstance(parts[-1], int):
+        if isinstance(target, list) and parts[-1] < len(target):
+            del target[parts[-1]]
+    elif isinstance(target, dict):
+        target.pop(parts[-1], None)
+
+
+def _evaluate(node, item):
+    kind = node[0]
+    if kind == "value":
+        return node[1]
+    if kind == "path":
+        return _resolve(item, node)
+    if kind == "call":
+        name, args = node[1], node[2]
+        if name == "attribute_exists":
+            return _evaluate(args[0], item) is not _MISSING
+        if name == "attribute_not_exists":
+            return _evaluate(args[0], item) is _MISSING
+        if name == "begins_with":
+            value = _evaluate(args[0], item)
+            return isinstance(value, (str, bytes)) and value.startswith(_evaluate(args[1], item))
+        if name == "contains":
+            value = _evaluate(args[0], item)
+            return value is not _MISSING and _evaluate(args[1], item) in value
+        if name == "size":
+            value = _evaluate(args[0], item)
+            return _MISSING if value is _MISSING else Decimal(len(value))
+        if name == "list_append":
+            first, second = _evaluate(args[0], item), _evaluate(args[1], item)
+            if first is _MISSING or second is _MISSING:
+                raise _clientError("ValidationException", "UpdateItem", "list_append of a missing attribute")
+            return list(first) + list(second)
+        if name == "if_not_exists":
+            value = _evaluate(args[0], item)
+            return _evaluate(args[1], item) if value is _MISSING else value
+        raise _clientError("ValidationException", "Expression", "Unsupported function {}".format(name))
+    if kind == "arith":
+        left, right = _evaluate(node[2], item), _evaluate(node[3], item)
+        if not isinstance(left, Decimal) or not isinstance(right, Decimal):
+            raise _clientError("ValidationException", "UpdateItem", "Arithmetic on a non number")
+        return left + right if node[1] == "+" else left - right
+    if kind == "and":
+        return _evaluate(node[1], item) and _evaluate(node[2], item)
+    if kind == "or":
+        return _evaluate(node[1], item) or _evaluate(node[2], item)
+    if kind == "not":
+        return not _evaluate(node[1], item)
+    if kind == "between":
+        value = _evaluate(node[1], item)
+        return _compare(">=", value, _evaluate(node[2], item)) and _compare("<=", value, _evaluate(node[3], item))
+    if kind == "in":
+        value = _evaluate(node[1], item)
+        return any(_compare("=", value, _evaluate(option, item)) for option in node[2])
+    if kind == "compare":
+        return _compare(node[1], _evaluate(node[2], item), _evaluate(node[3], item))
+    raise ValueError(kind)
+
+
+def _compare(comparator, left, right):
+    if left is _MISSING or right is _MISSING:
+        return comparator == "<>" and (left is _MISSING) != (right is _MISSING)
+    if comparator == "=":
+        return left == right
+    if comparator == "<>":
+        return left != right
+    if type(left) is not type(right):
+        return False
+    if comparator == "<":
+        return left < right
+    if comparator == "<=":
+        return left <= right
+    if comparator == ">":
+        return left > right
+    return left >= right
+
+
+def _project(item, paths):
+    projected = {}
+    for path in paths:
+        value = _resolve(item, path)
+        if value is not _MISSING:
+            _assign(projected, path, copy.deepcopy(value))
+    return projected
+
+
+def _keyEqualities(node, found):
+    """
+    Collects the attribute = :value terms of an AND-only key condition.
+    """
+    if node[0] == "and":
+        _keyEqualities(node[1], found)
+        _keyEqualities(node[2], found)
+    elif node[0] == "compare" and node[1] == "=" and node[2][0] == "path" and node[3][0] == "value":
+        found[node[2][1][0]] = node[3][1]
+    return found
+
+
+# ---------------------------------------------------------------------------------------------
+# Tables
+# ---------------------------------------------------------------------------------------------
+
+def _consumedCapacity(kwargs, table_units, response):
+    """
+    Adds the consumed capacity of a call on several tables to its response when it was requested,
+    as DynamoDB does: a list with the write units of every table.
+    """
+    if kwargs.get("ReturnConsumedCapacity", "NONE") in ("TOTAL", "INDEXES"):
+        response["ConsumedCapacity"] = [{"TableName": table_name, "CapacityUnits": units, "WriteCapacityUnits": units}
+                                        for table_name, units in sorted(table_units.items())]
+    return response
+
+
+class _Meta:
+    def __init__(self, client):
+        self.client = client
+
+
+class _Index:
+    def __init__(self, name, partition_key, sort_key):
+        self.name = name
+        self.partition_key = partition_key
+        self.sort_key = sort_key
+
+
+class LocalTable:
+    """
+    A table of the stand-in, with the method names and response shapes of boto3's DynamoDB.Table.
+    """
+
+    def __init__(self, dynamodb, table_name, partition_key, sort_key=None, indexes=None):
+        self.dynamodb = dynamodb
+        self.table_name = table_name
+        self.name = table_name
+        self.partition_key = partition_key
+        self.sort_key = sort_key
+        self.indexes = {index.name: index for index in (indexes or [])}
+        self.meta = _Meta(dynamodb)
+        # partition value -> sort value (or None) -> item
+        self.partitions = {}
+
+    # helpers
+
+    def _key(self, item, operation):
+        key_names = [self.partition_key] + ([self.sort_key] if self.sort_key else [])
+        for name in key_names:
+            if name not in item:
+                raise _clientError("ValidationException", operation, "Missing key attribute {}".format(name))
+            if item[name] == "":
+                raise _clientError("ValidationException", operation, "Key attribute {} is an empty string".format(name))
+        return _toStored(item[self.partition_key]), (_toStored(item[self.sort_key]) if self.sort_key else None)
+
+    def _get(self, key):
+        return self.partitions.get(key[0], {}).get(key[1])
+
+    def _keyOf(self, item):
+        key = {self.partition_key: item[self.partition_key]}
+        if self.sort_key:
+            key[self.sort_key] = item[self.sort_key]
+        return key
+
+    def _condition(self, kwargs, item, operation):
+        expression = kwargs.get("ConditionExpression")
+        if expression is None:
+            return
+        parser = _Parser(expression, kwargs.get("ExpressionAttributeNames"), _toStored(kwargs.get("ExpressionAttributeValues", {})))
+        if not _evaluate(parser.condition(), item or {}):
+            raise _clientError("ConditionalCheckFailedException", operation, "The conditional request failed")
+
+    def _capacity(self, kwargs, call, response):
+        mode = kwargs.get("ReturnConsumedCapacity", "NONE")
+        if mode in ("TOTAL", "INDEXES"):
+            units = call.read_units + call.write_units
+            capacity = {"TableName": self.table_name, "CapacityUnits": units}
+            if call.read_units:
+                capacity["ReadCapacityUnits"] = call.read_units
+            if call.write_units:
+                capacity["WriteCapacityUnits"] = call.write_units
+            response["ConsumedCapacity"] = capacity
+        response["ResponseMetadata"] = {"HTTPStatusCode": 200}
+        return response
+
+    def _throttle(self, partition_value, operation, index_name=None):
+        if not self.dynamodb._admit((self.table_name, index_name, partition_value)):
+            raise _clientError("ProvisionedThroughputExceededException", operation, "Partition {} exceeded its throughput".format(partition_value))
+
+    def _readUnits(self, size, consistent):
+        units = max(1, math.ceil(size / float(READ_UNIT_BYTES)))
+        return float(units) if consistent else units / 2.0
+
+    # API
+
+    def get_item(self, Key, **kwargs):
+        with self.dynamodb._request("GetItem", self.table_name) as call:
+            key = self._key(Key, "GetItem")
+            self._throttle(key[0], "GetItem")
+            item = self._get(key)
+            call.read_units = self._readUnits(_itemSize(item) if item else 0, kwargs.get("ConsistentRead", False))
+            response = {}
+            if item is not None:
+                call.items = 1
+                if "ProjectionExpression" in kwargs:
+                    parser = _Parser(kwargs["ProjectionExpression"], kwargs.get("ExpressionAttributeNames"), {})
+                    result = _project(item, parser.projection())
+                else:
+                    result = copy.deepcopy(item)
+                call.bytes_read = _itemSize(result)
+                response["Item"] = result
+            return self._capacity(kwargs, call, response)
+
+    def put_item(self, Item, **kwargs):
+        with self.dynamodb._request("PutItem", self.table_name) as call:
+            stored = _toStored(copy.deepcopy(Item))
+            key = self._key(stored, "PutItem")
+            self._throttle(key[0], "PutItem")
+            old = self._get(key)
+            self._condition(kwargs, old, "PutItem")
+            size = _itemSize(stored)
+            call.items = 1
+            call.bytes_written = size
+            call.write_units = float(max(1, math.ceil(max(size, _itemSize(old) if old else 0) / float(WRITE_UNIT_BYTES))))
+            self.partitions.setdefault(key[0], {})[key[1]] = stored
+            response = {}
+            if kwargs.get("ReturnValues") == "ALL_OLD" and old is not None:
+                response["Attributes"] = copy.deepcopy(old)
+            return self._capacity(kwargs, call, response)
+
+    def delete_item(self, Key, **kwargs):
+        with self.dynamodb._request("DeleteItem", self.table_name) as call:
+            key = self._key(Key, "DeleteItem")
+            self._throttle(key[0], "DeleteItem")
+            old = self._get(key)
+            self._condition(kwargs, old, "DeleteItem")
+            call.write_units = float(max(1, math.ceil((_itemSize(old) if old else 0) / float(WRITE_UNIT_BYTES))))
+            if old is not None:
+                call.items = 1
+                del self.partitions[key[0]][key[1]]
+            response = {}
+            if kwargs.get("ReturnValues") == "ALL_OLD" and old is not None:
+                response["Attributes"] = copy.deepcopy(old)
+            return self._capacity(kwargs, call, response)
+
+    def update_item(self, Key, **kwargs):
+        with self.dynamodb._request("UpdateItem", self.table_name) as call:
+            key = self._key(Key, "UpdateItem")
+            self._throttle(key[0], "UpdateItem")
+            old = self._get(key)
+            self._condition(kwargs, old, "UpdateItem")
+            item = copy.deepcopy(old) if old is not None else _toStored(copy.deepcopy(Key))
+            values = _toStored(kwargs.get("ExpressionAttributeValues", {}))
+            parser = _Parser(kwargs["UpdateExpression"], kwargs.get("ExpressionAttributeNames"), values)
+            updated = []
+            for action, path, operand in parser.update():
+                if path[1][0] in (self.partition_key, self.sort_key):
+                    raise _clientError("ValidationException", "UpdateItem", "Cannot update key attribute {}".format(path[1][0]))
+                current = _resolve(item, path)
+                if action == "SET":
+                    _assign(item, path, copy.deepcopy(_evaluate(operand, item)))
+                elif action == "REMOVE":
+                    _remove(item, path)
+                elif action == "ADD":
+                    value = _evaluate(operand, item)
+                    if isinstance(value, set):
+                        _assign(item, path, (set() if current is _MISSING else set(current)) | value)
+                    else:
+                        _assign(item, path, (Decimal(0) if current is _MISSING else current) + value)
+                elif action == "DELETE":
+                    if current is not _MISSING:
+                        _assign(item, path, set(current) - _evaluate(operand, item))
+                updated.append(path)
+            self.partitions.setdefault(key[0], {})[key[1]] = item
+            size = _itemSize(item)
+            call.items = 1
+            call.bytes_written = _itemSize(kwargs.get("ExpressionAttributeValues", {})) + len(kwargs["UpdateExpression"])
+            call.write_units = float(max(1, math.ceil(max(size, _itemSize(old) if old else 0) / float(WRITE_UNIT_BYTES))))
+            response = {}
+            return_values = kwargs.get("ReturnValues", "NONE")
+            if return_values == "ALL_NEW":
+                response["Attributes"] = copy.deepcopy(item)
+            elif return_values == "ALL_OLD" and old is not None:
+                response["Attributes"] = copy.deepcopy(old)
+            elif return_values == "UPDATED_NEW":
+                response["Attributes"] = _project(item, updated)
+            elif return_values == "UPDATED_OLD" and old is not None:
+                response["Attributes"] = _project(old, updated)
+            return self._capacity(kwargs, call, response)
+
+    def _rows(self, index_name, partition_value):
+        """
+        Returns the (sort value, item) rows of a partition of the table or of one of its indexes.
+        """
+        if index_name is None:
+            partition = self.partitions.get(partition_value, {})
+            return self.partition_key, self.sort_key, sorted(partition.items(), key=lambda row: (row[0] is not None, row[0]))
+        index = self.indexes[index_name]
+        rows = []
+        for partition in self.partitions.values():
+            for item in partition.values():
+                if item.get(index.partition_key) == partition_value and (index.sort_key is None or index.sort_key in item):
+                    rows.append((item.get(index.sort_key), item))
+        rows.sort(key=lambda row: (row[0] is not None, row[0], str(row[1].get(self.partition_key)), str(row[1].get(self.sort_key))))
+        return index.partition_key, index.sort_key, rows
+
+    def query(self, **kwargs):
+        with self.dynamodb._request("Query", self.table_name) as call:
+            values = _toStored(kwargs.get("ExpressionAttributeValues", {}))
+            names = kwargs.get("ExpressionAttributeNames")
+            condition = _Parser(kwargs["KeyConditionExpression"], names, values).condition()
+            index_name = kwargs.get("IndexName")
+            partition_key = self.indexes[index_name].partition_key if index_name else self.partition_key
+            equalities = _keyEqualities(condition, {})
+            if partition_key not in equalities:
+                raise _clientError("ValidationException", "Query", "Query condition missed key schema element: {}".format(partition_key))
+            self._throttle(equalities[partition_key], "Query", index_name)
+            _, sort_key, rows = self._rows(index_name, equalities[partition_key])
+            if not kwargs.get("ScanIndexForward", True):
+                rows.reverse()
+            return self._page(kwargs, call, rows, condition, names, sort_key, index_name)
+
+    def scan(self, **kwargs):
+        with self.dynamodb._request("Scan", self.table_name) as call:
+            rows = []
+            for partition_value in sorted(self.partitions, key=str):
+                partition = self.partitions[partition_value]
+                rows.extend(sorted(partition.items(), key=lambda row: (row[0] is not None, row[0])))
+            return self._page(kwargs, call, rows, None, kwargs.get("ExpressionAttributeNames"), self.sort_key, None)
+
+    def _page(self, kwargs, call, rows, condition, names, sort_key, index_name):
+        values = _toStored(kwargs.get("ExpressionAttributeValues", {}))
+        start = kwargs.get("ExclusiveStartKey")
+        if start is not None:
+            start_key = self._keyOf(_toStored(start))
+            for position, (_, item) in enumerate(rows):
+                if self._keyOf(item) == start_key:
+                    rows = rows[position + 1:]
+                    break
+        filter_condition = None
+        if "FilterExpression" in kwargs:
+            filter_condition = _Parser(kwargs["FilterExpression"], names, values).condition()
+        projection = None
+        if "ProjectionExpression" in kwargs:
+            projection = _Parser(kwargs["ProjectionExpression"], names, {}).projection()
+        limit = kwargs.get("Limit")
+        items = []
+        scanned = 0
+        size = 0
+        last = None
+        page_bytes = self.dynamodb.page_bytes
+        for _, item in rows:
+            if condition is not None and not _evaluate(condition, item):
+                continue
+            scanned += 1
+            size += _itemSize(item)
+            last = item
+            if filter_condition is None or _evaluate(filter_condition, item):
+                items.append(_project(item, projection) if projection else copy.deepcopy(item))
+            if (limit is not None and scanned >= limit) or size >= page_bytes:
+                break
+        else:
+            last = None
+        call.items = len(items)
+        call.read_units = self._readUnits(size, kwargs.get("ConsistentRead", False))
+        call.bytes_read = sum(_itemSize(item) for item in items)
+        response = {"Items": items, "Count": len(items), "ScannedCount": scanned}
+        if last is not None:
+            last_key = self._keyOf(last)
+            if index_name is not None:
+                index = self.indexes[index_name]
+                last_key[index.partition_key] = last[index.partition_key]
+                if index.sort_key:
+                    last_key[index.sort_key] = last[index.sort_key]
+            response["LastEvaluatedKey"] = copy.deepcopy(last_key)
+        return self._capacity(kwargs, call, response)
+
+    def batch_writer(self, overwrite_by_pkeys=None):
+        return _BatchWriter(self)
+
+    def items(self):
+        """
+        Returns a copy of every stored item, for assertions in tests.
+        """
+        with self.dynamodb._lock:
+            return [copy.deepcopy(item) for partition in self.partitions.values() for item in partition.values()]
+
+
+class _BatchWriter:
+    def __init__(self, table):
+        self.table = table
+        self.requests = []
+
+    def put_item(self, Item):
+        self.requests.append({"PutRequest": {"Item": Item}})
+        if len(self.requests) >= BATCH_WRITE_LIMIT:
+            self._flush()
+
+    def delete_item(self, Key):
+        self.requests.append({"DeleteRequest": {"Key": Key}})
+        if len(self.requests) >= BATCH_WRITE_LIMIT:
+            self._flush()
+
+    def _flush(self):
+        while self.requests:
+            batch, self.requests = self.requests[:BATCH_WRITE_LIMIT], self.requests[BATCH_WRITE_LIMIT:]
+            response = self.table.dynamodb.batch_write_item(RequestItems={self.table.table_name: batch})
+            self.requests.extend(response.get("UnprocessedItems", {}).get(self.table.table_name, []))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._flush()
+        return False
+
+
+class _RequestContext:
+    def __init__(self, dynamodb, call):
+        self.dynamodb = dynamodb
+        self.call = call
+
+    def __enter__(self):
+        dynamodb = self.dynamodb
+        self.start = time.perf_counter()
+        delay = dynamodb.latency(self.call.operation) if callable(dynamodb.latency) else dynamodb.latency
+        if delay:
+            time.sleep(delay)
+        dynamodb._lock.acquire()
+        if dynamodb.throttle_rate and dynamodb._random.random() < dynamodb.throttle_rate:
+            dynamodb._lock.release()
+            self.call.error = "ProvisionedThroughputExceededException"
+            self.call.seconds = time.perf_counter() - self.start
+            dynamodb._record(self.call)
+            raise _clientError("ProvisionedThroughputExceededException", self.call.operation)
+        return self.call
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.call.error = _errorCode(exc) or exc_type.__name__
+        self.dynamodb._lock.release()
+        self.call.seconds = time.perf_counter() - self.start
+        self.dynamodb._record(self.call)
+        return False
+
+
+class _NestedContext:
+    """
+    Context of a table call made by a transaction: no latency, throttling or recording of its own.
+    """
+
+    def __init__(self, call):
+        self.call = call
+
+    def __enter__(self):
+        return self.call
+
+    def __exit__(self, *exc):
+        return False
+
+
+class LocalDynamoDB:
+    """
+    The stand-in service. Works both as the boto3 DynamoDB resource (Table, batch_write_item)
+    and as the client reached through table.meta.client (batch_write_item, transact_write_items).
+
+    Args:
+        latency (float/callable, optional): Seconds slept by every call, or a function of the operation name
+        throttle_rate (float, optional): Probability that a call fails with ProvisionedThroughputExceededException
+        partition_rate (float, optional): Requests (items for batch writes) per second a partition of a table or
+            index accepts, with a burst of one second, before it is throttled. 0 for no limit.
+        unprocessed_rate (float, optional): Probability that a batch write request is returned as unprocessed
+        page_bytes (int, optional): Size at which query and scan results are paged
+        seed (int, optional): Seed of the injected failures
+    """
+
+    def __init__(self, latency=0.0, throttle_rate=0.0, unprocessed_rate=0.0, page_bytes=PAGE_BYTES, seed=None, partition_rate=0.0):
+        self.latency = latency
+        self.throttle_rate = throttle_rate
+        self.partition_rate = partition_rate
+        # (table name, index name, partition value) -> (tokens, time.monotonic() of the last refill)
+        self._buckets = {}
+        self.unprocessed_rate = unprocessed_rate
+        self.page_bytes = page_bytes
+        self.tables = {}
+        self.calls = []
+        self.meta = _Meta(self)
+        self._random = random.Random(seed)
+        self._lock = threading.RLock()
+        self._calls_lock = threading.Lock()
+        # set while a transaction applies its actions through the table methods
+        self._local = threading.local()
+        # ClientRequestToken -> the actions of the transaction that committed with it
+        self._tokens = {}
+
+    def _request(self, operation, table_name):
+        if getattr(self._local, "transaction", False):
+            return _NestedContext(Call(operation, table_name))
+        return _RequestContext(self, Call(operation, table_name))
+
+    def _admit(self, partition):
+        """
+        Takes one request from the token bucket of a partition. False if the partition is throttled.
+        """
+        if not self.partition_rate or getattr(self._local, "transaction", False):
+            return True
+        now = time.monotonic()
+        tokens, last = self._buckets.get(partition, (self.partition_rate, now))
+        tokens = min(self.partition_rate, tokens + (now - last) * self.partition_rate)
+        admitted = tokens >= 1
+        self._buckets[partition] = (tokens - 1 if admitted else tokens, now)
+        return admitted
+
+    def _record(self, call):
+        with self._calls_lock:
+            self.calls.append(call)
+
+    def create_table(self, table_name, partition_key, sort_key=None, indexes=None):
+        """
+        Creates a table. indexes is a list of (index name, partition key, sort key) tuples.
+        """
+        table = LocalTable(self, table_name, partition_key, sort_key,
+                           [_Index(name, pk, sk) for name, pk, sk in (indexes or [])])
+        self.tables[table_name] = table
+        return table
+
+    def Table(self, name):
+        if name not in self.tables:
+            raise _clientError("ResourceNotFoundException", "DescribeTable", "Requested resource not found: {}".format(name))
+        return self.tables[name]
+
+    def batch_write_item(self, RequestItems, **kwargs):
+        with self._request("BatchWriteItem", ",".join(sorted(RequestItems))) as call:
+            count = sum(len(requests) for requests in RequestItems.values())
+            if count > BATCH_WRITE_LIMIT:
+                raise _clientError("ValidationException", "BatchWriteItem", "Too many items requested for the BatchWriteItem call")
+            unprocessed = {}
+            table_units = {}
+            for table_name, requests in RequestItems.items():
+                table = self.Table(table_name)
+                for request in requests:
+                    if self.unprocessed_rate and self._random.random() < self.unprocessed_rate:
+                        unprocessed.setdefault(table_name, []).append(request)
+                        continue
+                    if "PutRequest" in request:
+                        stored = _toStored(copy.deepcopy(request["PutRequest"]["Item"]))
+                        key = table._key(stored, "BatchWriteItem")
+                        # like DynamoDB, the items of a throttled partition come back unprocessed
+                        if not self._admit((table_name, None, key[0])):
+                            unprocessed.setdefault(table_name, []).append(request)
+                            continue
+                        table.partitions.setdefault(key[0], {})[key[1]] = stored
+                        size = _itemSize(stored)
+                    else:
+                        key = table._key(request["DeleteRequest"]["Key"], "BatchWriteItem")
+                        old = table.partitions.get(key[0], {}).pop(key[1], None)
+                        size = _itemSize(old) if old else 0
+                    call.items += 1
+                    call.bytes_written += size
+                    units = float(max(1, math.ceil(size / float(WRITE_UNIT_BYTES))))
+                    call.write_units += units
+                    table_units[table_name] = table_units.get(table_name, 0.0) + units
+            return _consumedCapacity(kwargs, table_units, {"UnprocessedItems": unprocessed, "ResponseMetadata": {"HTTPStatusCode": 200}})
+
+    def transact_write_items(self, TransactItems, **kwargs):
+        """
+        Applies Put, Update, Delete and ConditionCheck actions, in the low-level attribute value
+        format of the client, all or none. A failed condition cancels the whole transaction with a
+        TransactionCanceledException listing the reason of each action. Like DynamoDB, every
+        action consumes twice the write units of the plain call.
+        A ClientRequestToken makes the call idempotent: repeating a committed transaction with the
+        same token succeeds without applying it again, while changing its actions fails with an
+        IdempotentParameterMismatchException. Tokens do not expire.
+        """
+        tables = sorted(set(list(action.values())[0]["TableName"] for action in TransactItems))
+        with self._request("TransactWriteItems", ",".join(tables)) as call:
+            if len(TransactItems) > TRANSACTION_LIMIT:
+                raise _clientError("ValidationException", "TransactWriteItems", "Member must have length less than or equal to {}".format(TRANSACTION_LIMIT))
+            token = kwargs.get("ClientRequestToken")
+            fingerprint = json.dumps(TransactItems, sort_keys=True, default=str)
+            if token is not None and token in self._tokens:
+                if self._tokens[token] != fingerprint:
+                    raise _clientError("IdempotentParameterMismatchException", "TransactWriteItems",
+                                       "Request parameters do not match the original request with this client token")
+                return {"ResponseMetadata": {"HTTPStatusCode": 200}}
+            actions = []
+            keys = set()
+            for transact_item in TransactItems:
+                (kind, action), = transact_item.items()
+                table = self.Table(action["TableName"])
+                request = dict((name, _deserialize(value) if name in ("Item", "Key", "ExpressionAttributeValues") else value)
+                               for name, value in action.items() if name != "TableName")
+                key = (table.table_name,) + table._key(request.get("Item", request.get("Key", {})), "TransactWriteItems")
+                if key in keys:
+                    raise _clientError("ValidationException", "TransactWriteItems", "Transaction request cannot include multiple operations on one item")
+                keys.add(key)
+                actions.append((kind, table, key, request))
+            snapshot = [(table, key, copy.deepcopy(table._get(key[1:]))) for _, table, key, _ in actions]
+            reasons = []
+            table_units = {}
+            failed = False
+            self._local.transaction = True
+            try:
+                for kind, table, key, request in actions:
+                    request["ReturnConsumedCapacity"] = "TOTAL"
+                    try:
+                        if kind == "ConditionCheck":
+                            table._condition(request, table._get(key[1:]), "TransactWriteItems")
+                            units = 1.0
+                        else:
+                            method = {"Put": table.put_item, "Update": table.update_item, "Delete": table.delete_item}[kind]
+                            units = method(**request)["ConsumedCapacity"]["CapacityUnits"]
+                        call.write_units += 2 * units
+                        table_units[table.table_name] = table_units.get(table.table_name, 0.0) + 2 * units
+                        call.items += 1
+                        reasons.append({"Code": "None"})
+                    except ClientError as e:
+                        if _errorCode(e) != "ConditionalCheckFailedException":
+                            raise
+                        failed = True
+                        reasons.append({"Code": "ConditionalCheckFailed", "Message": "The conditional request failed"})
+            finally:
+                self._local.transaction = False
+                if failed or len(reasons) < len(actions):
+                    for table, key, old in snapshot:
+                        partition = table.partitions.setdefault(key[1], {})
+                        if old is None:
+                            partition.pop(key[2], None)
+                        else:
+                            partition[key[2]] = old
+            if failed:
+                reasons.extend({"Code": "None"} for _ in range(len(actions) - len(reasons)))
+                error = _clientError("TransactionCanceledException", "TransactWriteItems",
+                                     "Transaction cancelled, please refer cancellation reasons for specific reasons")
+                error.response["CancellationReasons"] = reasons
+                raise error
+            if token is not None:
+                self._tokens[token] = fingerprint
+            return _consumedCapacity(kwargs, table_units, {"ResponseMetadata": {"HTTPStatusCode": 200}})
+
+    # call accounting
+
+    def reset(self):
+        """
+        Forgets the recorded calls, keeping the data.
+        """
+        with self._calls_lock:
+            self.calls = []
+
+    def callCount(self, operation=None, table_name=None):
+        return len([c for c in self.calls if (operation is None or c.operation == operation)
+                    and (table_name is None or c.table == table_name)])
+
+    def bytesWritten(self):
+        return sum(c.bytes_written for c in self.calls)
+
+    def summary(self):
+        """
+        Returns the totals of the recorded calls: round trips, per operation counts, capacity and bytes.
+        """
+        operations = {}
+        for c in self.calls:
+            operations[c.operation] = operations.get(c.operation, 0) + 1
+        return {
+            "round_trips": len(self.calls),
+            "operations": operations,
+            "read_units": sum(c.read_units for c in self.calls),
+            "write_units": sum(c.write_units for c in self.calls),
+            "bytes_read": sum(c.bytes_read for c in self.calls),
+            "bytes_written": self.bytesWritten(),
+            "errors": len([c for c in self.calls if c.error]),
+        }
+
+
+def _createWordleTables(dynamodb):
+    """
+    Creates the user, game, word, history and difficulty tables of DBStack in the stand-in, named after the
+    USER_TABLE, GAME_TABLE, WORD_TABLE, HISTORY_TABLE and DIFFICULTY_TABLE environment variables.
+    The word table has the layout selected by WORD_SHARDS.
+    """
+    layout = _getWordLayout()
+    os.environ.setdefault("USER_TABLE", "UserTable")
+    os.environ.setdefault("GAME_TABLE", "GameTable")
+    os.environ.setdefault("WORD_TABLE", "WordTable")
+    os.environ.setdefault("HISTORY_TABLE", "HistoryTable")
+    os.environ.setdefault("DIFFICULTY_TABLE", "DifficultyTable")
+    dynamodb.create_table(os.environ["USER_TABLE"], "user_id")
+    dynamodb.create_table(os.environ["GAME_TABLE"], "game_id")
+    dynamodb.create_table(os.environ["WORD_TABLE"], layout.partition_key, "word",
+                          indexes=[(ORDINAL_INDEX, layout.partition_key, ORDINAL)])
+    dynamodb.create_table(os.environ["HISTORY_TABLE"], "user_id")
+    dynamodb.create_table(os.environ["DIFFICULTY_TABLE"], "word", "shard")
+    return dynamodb
+
+
+def _installLocalDynamoDB(**options):
+    """
+    Creates a stand-in with the Wordle tables and makes wordle_runtime hand it to every handler.
+    Takes the keyword arguments of LocalDynamoDB.
+
+    Returns:
+        LocalDynamoDB: The installed stand-in
+    """
+    from wordle_runtime import _setResource
+    dynamodb = _createWordleTables(LocalDynamoDB(**options))
+    _setResource(dynamodb)
+    return dynamodb
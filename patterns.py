@@ -0,0 +1,184 @@
+"""
+Vectorized Wordle feedback engine.
+
+Words are encoded as uint8 arrays of letter indexes (a=0 .. z=25) and the feedback of a
+guess against a target is a base-3 integer code: position i contributes colour * 3**i with
+GREY=0, YELLOW=1 and GREEN=2. Codes follow the same rules as guess.getGuessResponse,
+including repeated letters, and fit in a uint16 for every supported word length (3**8 = 6561).
+
+The engine is meant for offline work (analytics, hints, simulation) and needs numpy,
+which is not part of the Lambda runtime.
+
+    python patterns.py --words words.txt --out build/patterns
+"""
+import argparse
+import os
+import numpy as np
+
+GREY_CODE = 0
+YELLOW_CODE = 1
+GREEN_CODE = 2
+COLOURS = ["GREY", "YELLOW", "GREEN"]
+
+# Guesses are scored in blocks so the (guesses, targets) intermediates stay small
+BLOCK_SIZE = 256
+
+
+def encodeWords(words):
+    """
+    Encodes a list of equal length lowercase words as a (n, word_length) uint8 array.
+
+    Args:
+        words (list): The words to encode
+
+    Returns:
+        numpy.ndarray: One row of letter indexes per word
+    """
+    if len(words) == 0:
+        return np.zeros((0, 0), dtype=np.uint8)
+    word_length = len(words[0])
+    buffer = "".join(words).encode("ascii")
+    if len(buffer) != word_length * len(words):
+        raise ValueError("All words must have the same length")
+    return (np.frombuffer(buffer, dtype=np.uint8).reshape(len(words), word_length) - ord("a")).astype(np.uint8)
+
+
+def decodePattern(code, word_length):
+    """
+    Converts a pattern code back into a response, eg. 242 -> ["GREEN", "GREEN", "GREEN", "GREEN", "GREEN"]
+
+    Args:
+        code (int): The base-3 pattern code
+        word_length (int): The length of the scored words
+
+    Returns:
+        list: Response as a list of colours(str)
+    """
+    code = int(code)
+    res = []
+    for _ in range(word_length):
+        res.append(COLOURS[code % 3])
+        code //= 3
+    return res
+
+
+def winningCode(word_length):
+    """
+    Returns the pattern code of an all GREEN response.
+    """
+    return 3 ** word_length - 1
+
+
+def _scoreBlock(guesses, targets):
+    """
+    Scores every guess of the block against every target. Both arguments are encoded words.
+
+    A non GREEN guess letter is YELLOW when the target has more unmatched copies of it than the
+    guess has already spent on earlier non GREEN positions, which is the left to right rule of
+    getGuessResponse expressed as (guesses, targets) array operations.
+    """
+    word_length = guesses.shape[1]
+    guess_letters = [guesses[:, idx, None] for idx in range(word_length)]
+    target_letters = [targets[None, :, idx] for idx in range(word_length)]
+    not_green = [guess_letters[idx] != target_letters[idx] for idx in range(word_length)]
+
+    codes = np.zeros((guesses.shape[0], targets.shape[0]), dtype=np.uint16)
+    for idx in range(word_length):
+        available = np.zeros(codes.shape, dtype=np.uint8)
+        for target_idx in range(word_length):
+            available += (guess_letters[idx] == target_letters[target_idx]) & not_green[target_idx]
+        spent = np.zeros(codes.shape, dtype=np.uint8)
+        for earlier_idx in range(idx):
+            spent += (guess_letters[earlier_idx] == guess_letters[idx]) & not_green[earlier_idx]
+        yellow = not_green[idx] & (spent < available)
+        power = 3 ** idx
+        codes += np.uint16(GREEN_CODE * power) * ~not_green[idx] + np.uint16(YELLOW_CODE * power) * yellow
+    return codes
+
+
+def patternMatrix(guesses, targets, out=None, block_size=BLOCK_SIZE):
+    """
+    Computes the pattern code of every guess against every target.
+
+    Args:
+        guesses (numpy.ndarray/list): Encoded guesses, or a list of words
+        targets (numpy.ndarray/list): Encoded targets, or a list of words
+        out (numpy.ndarray, optional): A (guesses, targets) uint16 array to fill, eg. a memory map
+        block_size (int, optional): Number of guesses scored per step
+
+    Returns:
+        numpy.ndarray: A (guesses, targets) uint16 array of pattern codes
+    """
+    if isinstance(guesses, list):
+        guesses = encodeWords(guesses)
+    if isinstance(targets, list):
+        targets = encodeWords(targets)
+    if guesses.shape[1] != targets.shape[1]:
+        raise ValueError("Guesses and targets must have the same length")
+    if out is None:
+        out = np.empty((guesses.shape[0], targets.shape[0]), dtype=np.uint16)
+    for start in range(0, guesses.shape[0], block_size):
+        out[start:start + block_size] = _scoreBlock(guesses[start:start + block_size], targets)
+    return out
+
+
+def patternFilePath(directory, word_length):
+    return os.path.join(directory, "patterns_{}.npy".format(word_length))
+
+
+def buildPatternFile(words, path):
+    """
+    Precomputes the full (words, words) pattern matrix of a dictionary into a .npy file.
+    Rows are guesses and columns are targets, both in the order of the words argument.
+    The matrix is written through a memory map, so it never has to fit in memory.
+
+    Args:
+        words (list): The dictionary words of a single length
+        path (str): The file to write
+
+    Returns:
+        numpy.memmap: The written matrix
+    """
+    matrix = np.lib.format.open_memmap(path, mode="w+", dtype=np.uint16, shape=(len(words), len(words)))
+    patternMatrix(words, words, out=matrix)
+    matrix.flush()
+    return matrix
+
+
+def loadPatternFile(path):
+    """
+    Memory-maps a pattern matrix written by buildPatternFile without reading it into memory.
+    """
+    return np.load(path, mmap_mode="r")
+
+
+def buildPatternFiles(words, directory, word_lengths=range(5, 9)):
+    """
+    Writes one pattern matrix per word length into directory.
+
+    Returns:
+        dict: word_length -> (sorted words, memory mapped matrix)
+    """
+    os.makedirs(directory, exist_ok=True)
+    matrices = {}
+    for word_length in word_lengths:
+        same_length = sorted(set(w for w in words if len(w) == word_length))
+        if len(same_length) == 0:
+            continue
+        matrices[word_length] = (same_length, buildPatternFile(same_length, patternFilePath(directory, word_length)))
+    return matrices
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute the Wordle pattern matrix of every word length.")
+    parser.add_argument("--words", required=True, help="text file with one word per line")
+    parser.add_argument("--out", required=True, help="directory for the patterns_<length>.npy files")
+    args = parser.parse_args()
+    with open(args.words) as f:
+        words = [line.strip().lower() for line in f if line.strip().isalpha()]
+    for word_length, (same_length, matrix) in buildPatternFiles(words, args.out).items():
+        print("{}: {} words, {} bytes".format(word_length, len(same_length), matrix.nbytes))
+
+
+if __name__ == "__main__":
+    main()
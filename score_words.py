@@ -0,0 +1,213 @@
+"""
+Scores the difficulty of every dictionary word offline and writes the tier index createGame picks from
+(see lambda/word_tiers.py).
+
+The difficulty of a word mixes two ranks among the words of its length, weighted by --weight:
+- commonness, from the counts of a word frequency list given with --frequencies ("word count" lines, words
+  missing from it count 0). Without one, the positional letter frequencies of the dictionary stand in for it:
+  a word made of letters often found at their positions is easier to come up with. The stand-in cannot tell a
+  proper noun from a common word, so it only counts when --weight is given; the weight defaults to 0 without
+  a frequency list
+- simulated solve length: the mean number of guesses of a casual player, who always guesses a random word
+  consistent with every response so far (the feedback rules of the game, scored by patterns.py), over --runs
+  games per word, a loss counting as word_length + 2 guesses. The entropy solver of solve.py finds almost
+  every word in 3 guesses, so it does not separate words. With --observed, words that have a score in the
+  difficulty table built by lambda/difficulty.py use the mean number of guesses of the players instead
+
+The words of each length are then split into TIERS of equal size, after ranking the proper nouns of --proper-nouns
+last: neither signal knows that a name such as aaron is a poor guess, so they go to the hard tier.
+
+    python score_words.py                                                # lambda/words.bin -> lambda/word_tiers.bin
+    python score_words.py --frequencies counts.txt --observed lambda/difficulty.bin --json
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import numpy as np
+import patterns
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(ROOT_DIR, "lambda"))
+from word_artifact import WordArtifact, DEFAULT_ARTIFACT_PATH
+from word_tiers import WordTiers, TIERS, DEFAULT_TIERS_PATH, _splitTiers
+
+DEFAULT_PROPER_NOUNS = os.path.join(ROOT_DIR, "dictionary", "proper_nouns.txt")
+# Weight of the commonness rank given a frequency list, the simulated solve length rank gets the rest
+COMMONNESS_WEIGHT = 0.5
+RUNS = 16
+
+
+def letterCommonness(words):
+    """
+    Returns the mean log frequency of the letters of every word at their positions, among the given words.
+    """
+    counts = [{} for _ in range(len(words[0]))]
+    for word in words:
+        for position, letter in enumerate(word):
+            counts[position][letter] = counts[position].get(letter, 0) + 1
+    return [sum(math.log(counts[position][letter] / float(len(words))) for position, letter in enumerate(word)) / len(word)
+            for word in words]
+
+
+def frequencyCommonness(words, frequencies):
+    """
+    Returns the log count of every word in a frequency list.
+    """
+    return [math.log1p(frequencies.get(word, 0)) for word in words]
+
+
+def casualSolveLengths(words, matrix, runs=RUNS, seed=0):
+    """
+    Simulates a casual player against every word: each guess is a random word consistent with the
+    responses so far. Since it can be the target, every game ends, but possibly after word_length + 1 guesses.
+
+    Args:
+        words (list): The words of one length, the guesses and the targets
+        matrix (numpy.ndarray): The pattern matrix of words against words
+        runs (int): Games per word
+        seed (int): Seed of the random guesses
+
+    Returns:
+        list: The mean number of guesses for every word, a loss counting as word_length + 2
+    """
+    word_length = len(words[0])
+    max_guesses = word_length + 1
+    winning_code = patterns.winningCode(word_length)
+    rng = np.random.default_rng(seed)
+    everything = np.arange(len(words))
+    lengths = []
+    for target in range(len(words)):
+        total = 0
+        for _ in range(runs):
+            candidates = everything
+            guesses = max_guesses + 1
+            for attempt in range(1, max_guesses + 1):
+                guess = candidates[rng.integers(len(candidates))]
+                code = matrix[guess, target]
+                if code == winning_code:
+                    guesses = attempt
+                    break
+                candidates = candidates[matrix[guess, candidates] == code]
+            total += guesses
+        lengths.append(total / float(runs))
+    return lengths
+
+
+def observedLengths(observed, word_length, count):
+    """
+    Returns the mean number of guesses of the players for every ordinal of a length, None for the words
+    the difficulty table has no score for. Inverts difficulty._difficultyScore.
+    """
+    scores = observed.scores.get(word_length, b"") if observed is not None else b""
+    return [1 + (scores[ordinal] - 1) * (word_length + 1) / 254.0 if ordinal < len(scores) and scores[ordinal] else None
+            for ordinal in range(count)]
+
+
+def _ranks(values):
+    """
+    Returns the rank of every value among the values, scaled to [0, 1], ties sharing their mean rank.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) < 2:
+        return np.zeros(len(values))
+    _, inverse, counts = np.unique(values, return_inverse=True, return_counts=True)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    return (starts + (counts - 1) / 2.0)[inverse] / (len(values) - 1)
+
+
+def scoreWords(words, commonness, solve_lengths, weight=COMMONNESS_WEIGHT):
+    """
+    Combines the commonness and solve length of the words of one length into difficulty scores in [0, 1].
+    """
+    return list(weight * (1 - _ranks(commonness)) + (1 - weight) * _ranks(solve_lengths))
+
+
+def buildTiers(artifact, frequencies=None, observed=None, weight=None, runs=RUNS, seed=0, proper_nouns=()):
+    """
+    Scores every word of the artifact and splits each length into tiers.
+
+    Args:
+        artifact (WordArtifact): The dictionary
+        frequencies (dict, optional): Word -> count. Defaults to the letter frequency stand-in
+        observed (DifficultyTable, optional): Player difficulty, replacing the simulation where known
+        weight (float, optional): Weight of the commonness rank. Defaults to COMMONNESS_WEIGHT with frequencies
+            and to 0 with the letter frequency stand-in
+        runs (int): Simulated games per word
+        seed (int): Seed of the simulation
+        proper_nouns (set, optional): Words ranked after all others
+
+    Returns:
+        tuple: (word length -> ordinals per tier, word length -> per tier statistics)
+    """
+    if weight is None:
+        weight = COMMONNESS_WEIGHT if frequencies else 0.0
+    tiers = {}
+    stats = {}
+    for word_length in artifact.lengths():
+        words = list(artifact.words(word_length))
+        if not words:
+            continue
+        commonness = frequencyCommonness(words, frequencies) if frequencies else letterCommonness(words)
+        simulated = casualSolveLengths(words, patterns.patternMatrix(words, words), runs, seed)
+        solve_lengths = [known if known is not None else length
+                         for known, length in zip(observedLengths(observed, word_length, len(words)), simulated)]
+        scores = scoreWords(words, commonness, solve_lengths, weight)
+        tiers[word_length] = _splitTiers([score + 1 if word in proper_nouns else score for word, score in zip(words, scores)])
+        stats[word_length] = dict((tier, {
+            "words": len(ordinals),
+            "mean_guesses": round(sum(solve_lengths[ordinal] for ordinal in ordinals) / float(len(ordinals)), 2) if ordinals else None,
+            "examples": [words[ordinal] for ordinal in ordinals[:3]],
+        }) for tier, ordinals in zip(TIERS, tiers[word_length]))
+    return tiers, stats
+
+
+def loadFrequencies(path):
+    frequencies = {}
+    with open(path) as f:
+        for line in f:
+            fields = line.split()
+            if len(fields) >= 2:
+                frequencies[fields[0].lower()] = frequencies.get(fields[0].lower(), 0) + float(fields[1])
+    return frequencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score the difficulty of the dictionary words and write the tier index.")
+    parser.add_argument("--artifact", default=DEFAULT_ARTIFACT_PATH)
+    parser.add_argument("--out", default=DEFAULT_TIERS_PATH, help="tier index to write")
+    parser.add_argument("--frequencies", help="word frequency list, one \"word count\" per line")
+    parser.add_argument("--observed", help="difficulty table built by lambda/difficulty.py, eg. lambda/difficulty.bin")
+    parser.add_argument("--weight", type=float,
+                        help="weight of commonness against solve length (default {} with --frequencies, 0 without)".format(COMMONNESS_WEIGHT))
+    parser.add_argument("--proper-nouns", default=DEFAULT_PROPER_NOUNS, help="words kept out of the easy tiers, one per line")
+    parser.add_argument("--runs", type=int, default=RUNS, help="simulated games per word")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="print the statistics of the tiers as JSON")
+    args = parser.parse_args()
+
+    artifact = WordArtifact(args.artifact)
+    frequencies = loadFrequencies(args.frequencies) if args.frequencies else None
+    observed = None
+    if args.observed:
+        from difficulty import DifficultyTable
+        with open(args.observed, "rb") as f:
+            observed = DifficultyTable.decode(f.read())
+    with open(args.proper_nouns) as f:
+        proper_nouns = set(line.strip().lower() for line in f if line.strip())
+    tiers, stats = buildTiers(artifact, frequencies, observed, args.weight, args.runs, args.seed, proper_nouns)
+    with open(args.out, "wb") as f:
+        f.write(WordTiers.encode(artifact.version, tiers))
+    if args.json:
+        print(json.dumps(stats))
+        return
+    print("{:>6} {:<7} {:>6} {:>13}  {}".format("length", "tier", "words", "mean guesses", "easiest words"))
+    for word_length, tier_stats in sorted(stats.items()):
+        for tier in TIERS:
+            print("{:>6} {:<7} {:>6} {:>13}  {}".format(word_length, tier, tier_stats[tier]["words"],
+                                                        tier_stats[tier]["mean_guesses"], " ".join(tier_stats[tier]["examples"])))
+
+
+if __name__ == "__main__":
+    main()
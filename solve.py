@@ -1,46 +1,62 @@
+"""
+Wordle simulation and solver.
+
+WordleGame, User and WordFactory simulate the game with the rules of the Lambda handlers on the
+compiled dictionary artifact. Solver is an entropy-maximizing guesser over precomputed pattern
+matrices (see patterns.py), and benchmark() runs it against every target of each word length
+across a process pool, to evaluate dictionary and hard-mode changes.
+
+    python solve.py                                   # play a 5 letter game in the terminal
+    python solve.py --bench                           # solve every word of lengths 5-8
+    python solve.py --bench --hard --lengths 5 6 --workers 4 --patterns build/patterns
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import patterns
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(ROOT_DIR, "lambda"))
+from word_artifact import WordArtifact
+
 DEBUG = True
+# Statuses used by getRes, see the notes on the game state below
+_STATUS = {patterns.COLOURS[patterns.GREY_CODE]: 3, patterns.COLOURS[patterns.YELLOW_CODE]: 1, patterns.COLOURS[patterns.GREEN_CODE]: 2}
+# Guesses whose entropy is computed per step, bounds the (guesses, patterns) histogram
+ENTROPY_BLOCK_SIZE = 128
+# Targets handed to a worker per task
+CHUNK_SIZE = 64
+
+
 class WordFactory:
-    fiveLetterWords = []
-    sixLetterWords = []
-    sevenLetterWords = []
-    eightLetterWords = []
+    words = {}
+    wordSets = {}
 
     @staticmethod
     def getWord(wordLen, index):
-        if wordLen == 5:
-            return WordFactory.fiveLetterWords[index]
-        elif wordLen == 6:
-            return WordFactory.sixLetterWords[index]
-        elif wordLen == 7:
-            return WordFactory.sevenLetterWords[index]
-        elif wordLen == 8:
-            return WordFactory.eightLetterWords[index]
-        else:
+        if wordLen not in WordFactory.words:
             raise Exception("Invalid word length")
-    
+        return WordFactory.words[wordLen][index]
+
     @staticmethod
-    def loadWords():
-        with open("five.txt", "r") as f:
-            WordFactory.fiveLetterWords = f.read().splitlines()
-        with open("six.txt", "r") as f:
-            WordFactory.sixLetterWords = f.read().splitlines()
-        with open("seven.txt", "r") as f:
-            WordFactory.sevenLetterWords = f.read().splitlines()
-        with open("eight.txt", "r") as f:
-            WordFactory.eightLetterWords = f.read().splitlines()
-    
+    def loadWords(artifact=None):
+        artifact = artifact or WordArtifact()
+        for wordLen in artifact.lengths():
+            WordFactory.words[wordLen] = list(artifact.words(wordLen))
+            WordFactory.wordSets[wordLen] = set(WordFactory.words[wordLen])
+
     @staticmethod
     def exists(word, wordLen):
-        if wordLen == 5:
-            return word in WordFactory.fiveLetterWords
-        elif wordLen == 6:
-            return word in WordFactory.sixLetterWords
-        elif wordLen == 7:
-            return word in WordFactory.sevenLetterWords
-        elif wordLen == 8:
-            return word in WordFactory.eightLetterWords
-        else:
+        if wordLen not in WordFactory.wordSets:
             raise Exception("Invalid word length")
+        return word in WordFactory.wordSets[wordLen]
+
+
 class User:
     game = None
     def __init__(self, name):
@@ -112,18 +128,11 @@ class WordleGame:
         return True
 
     def getRes(self, guess, target):
-        res=[]
-        idx=0
-        print(guess, " ",target)
-        for c in guess:
-            if c not in target:
-                res.append((c, 3))
-            elif target[idx]==c:
-                res.append((c, 2))
-            else:
-                res.append((c, 1))
-            idx+=1
-        return res
+        """
+        Scores the guess with the rules of guess.getGuessResponse, repeated letters included.
+        """
+        code = patterns.patternMatrix([guess], [target])[0, 0]
+        return [(c, _STATUS[colour]) for c, colour in zip(guess, patterns.decodePattern(code, len(guess)))]
 
     def guess(self, word):
         """
@@ -151,6 +160,150 @@ class WordleGame:
         return res
 
 
+class Solver:
+    """
+    Picks the guess that maximizes the expected information of its feedback over the remaining
+    candidates, ie. the entropy of the distribution of pattern codes it produces. Candidates are
+    index arrays into the word list, and feedback is read from the (guesses, targets) pattern
+    matrix, so no word is ever scored twice. Decisions only depend on the feedback seen so far,
+    so they are memoized as a decision tree shared by every target solved by this instance.
+
+    Args:
+        words (list): The dictionary words of one length, the allowed guesses and the possible targets
+        matrix (numpy.ndarray): The pattern matrix of words against words, see patterns.buildPatternFile
+        hard_mode (bool, optional): Only guess remaining candidates, which satisfies every hard mode rule
+    """
+
+    def __init__(self, words, matrix, hard_mode=False):
+        self.words = words
+        self.matrix = matrix
+        self.hard_mode = hard_mode
+        self.word_length = len(words[0])
+        self.pattern_count = 3 ** self.word_length
+        self.winning_code = patterns.winningCode(self.word_length)
+        self._tree = {}
+
+    def _entropy(self, guesses, candidates):
+        entropies = np.empty(len(guesses))
+        for start in range(0, len(guesses), ENTROPY_BLOCK_SIZE):
+            block = self.matrix[guesses[start:start + ENTROPY_BLOCK_SIZE]][:, candidates].astype(np.int64)
+            block += np.arange(block.shape[0])[:, None] * self.pattern_count
+            counts = np.bincount(block.ravel(), minlength=block.shape[0] * self.pattern_count)
+            p = counts.reshape(block.shape[0], self.pattern_count) / float(len(candidates))
+            logs = np.log2(p, out=np.zeros_like(p), where=p > 0)
+            entropies[start:start + block.shape[0]] = -(p * logs).sum(axis=1)
+        return entropies
+
+    def nextGuess(self, candidates, history=()):
+        """
+        Returns the index of the next guess.
+
+        Args:
+            candidates (numpy.ndarray): Indexes of the words still consistent with the feedback
+            history (tuple): The pattern codes received so far, the key of the decision tree
+        """
+        guess = self._tree.get(history)
+        if guess is not None:
+            return guess
+        if len(candidates) <= 2:
+            guess = int(candidates[0])
+        else:
+            guesses = candidates if self.hard_mode else np.arange(len(self.words))
+            scores = self._entropy(guesses, candidates)
+            # Break ties in favour of guesses that can win right away
+            scores += np.isin(guesses, candidates) / float(len(candidates))
+            guess = int(guesses[np.argmax(scores)])
+        self._tree[history] = guess
+        return guess
+
+    def solve(self, target, max_guesses=None):
+        """
+        Plays a game against the target.
+
+        Args:
+            target (int): Index of the target word
+            max_guesses (int, optional): Defaults to word length + 1, as in the game
+
+        Returns:
+            int: The number of guesses used, or None if the game was lost
+        """
+        max_guesses = max_guesses or self.word_length + 1
+        candidates = np.arange(len(self.words))
+        history = ()
+        for attempt in range(1, max_guesses + 1):
+            guess = self.nextGuess(candidates, history)
+            code = int(self.matrix[guess, target])
+            if code == self.winning_code:
+                return attempt
+            candidates = candidates[self.matrix[guess, candidates] == code]
+            history += (code,)
+        return None
+
+
+# Per process state of the benchmark workers, see _initWorker
+_solver = None
+
+
+def _initWorker(words, pattern_path, hard_mode):
+    global _solver
+    _solver = Solver(words, patterns.loadPatternFile(pattern_path), hard_mode)
+
+
+def _solveTargets(targets):
+    return [_solver.solve(target) for target in targets]
+
+
+def benchmark(word_length, artifact=None, workers=None, hard_mode=False, pattern_dir=None, limit=None):
+    """
+    Solves every target of one word length and reports the results.
+    The pattern matrix is written to a file once and memory-mapped by every worker process.
+
+    Args:
+        word_length (int): The word length to benchmark
+        artifact (WordArtifact, optional): The dictionary, defaults to the shipped artifact
+        workers (int, optional): Number of worker processes, defaults to the number of CPUs
+        hard_mode (bool, optional): Solve under hard mode
+        pattern_dir (str, optional): Directory where pattern matrices are kept between runs, defaults to a temporary one
+        limit (int, optional): Only solve the first limit targets
+
+    Returns:
+        dict: words, targets, mean_guesses, failure_rate, max_guesses, distribution, pattern_seconds, solve_seconds
+    """
+    artifact = artifact or WordArtifact()
+    words = list(artifact.words(word_length))
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        directory = pattern_dir or tmp_dir
+        os.makedirs(directory, exist_ok=True)
+        path = patterns.patternFilePath(directory, word_length)
+        start = time.perf_counter()
+        if not os.path.exists(path) or patterns.loadPatternFile(path).shape != (len(words), len(words)):
+            patterns.buildPatternFile(words, path)
+        pattern_seconds = time.perf_counter() - start
+
+        targets = list(range(len(words)))[:limit]
+        chunks = [targets[i:i + CHUNK_SIZE] for i in range(0, len(targets), CHUNK_SIZE)]
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=workers, initializer=_initWorker, initargs=(words, path, hard_mode)) as pool:
+            results = [guesses for chunk in pool.map(_solveTargets, chunks) for guesses in chunk]
+        solve_seconds = time.perf_counter() - start
+
+    solved = [guesses for guesses in results if guesses is not None]
+    distribution = {}
+    for guesses in solved:
+        distribution[guesses] = distribution.get(guesses, 0) + 1
+    return {
+        "word_length": word_length,
+        "words": len(words),
+        "targets": len(targets),
+        "mean_guesses": round(sum(solved) / float(len(solved)), 3) if solved else None,
+        "failure_rate": round(1 - len(solved) / float(len(targets)), 4) if targets else 0.0,
+        "max_guesses": max(solved) if solved else None,
+        "distribution": dict(sorted(distribution.items())),
+        "pattern_seconds": round(pattern_seconds, 2),
+        "solve_seconds": round(solve_seconds, 2),
+    }
+
+
 """
 word is sent as a word
 word state is returned as a list of tuples [('c', 0), ('a', 1), ('t', 0)]
@@ -178,24 +331,43 @@ def pretty_print_result(res):
             print(c+"(GRAY)", end=" ")
     print()
 
-if __name__=="__main__":
+def play(wordLen):
     WordFactory.loadWords()
     user = User("test")
-    user.createGame(5)
+    user.createGame(wordLen)
     while user.game.status == "IN_PROGRESS":
         guess = str(input())
         pretty_print_result(user.guess(guess))
-    
     print(user.game.status)
-    # guess = str(input())
-    # pretty_print_result(user.guess(guess))
-    # guess = str(input())
-    # pretty_print_result(user.guess(guess))
-    # guess = str(input())
-    # pretty_print_result(user.guess(guess))
-    # guess = str(input())
-    # pretty_print_result(user.guess(guess))
-    # guess = str(input())
-    # pretty_print_result(user.guess(guess))
-    
-    
\ No newline at end of file
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play Wordle in the terminal, or benchmark the solver on the whole dictionary.")
+    parser.add_argument("--bench", action="store_true", help="solve every target instead of playing")
+    parser.add_argument("--lengths", type=int, nargs="+", default=[5, 6, 7, 8])
+    parser.add_argument("--hard", action="store_true", help="solve under hard mode")
+    parser.add_argument("--workers", type=int, help="worker processes, defaults to the number of CPUs")
+    parser.add_argument("--patterns", help="directory keeping the pattern matrices between runs")
+    parser.add_argument("--limit", type=int, help="only solve the first targets of each length")
+    parser.add_argument("--json", action="store_true", help="print one JSON line per length")
+    args = parser.parse_args()
+
+    if not args.bench:
+        play(args.lengths[0])
+        return
+    artifact = WordArtifact()
+    if not args.json:
+        print("{:>6} {:>7} {:>12} {:>12} {:>5} {:>10} {:>10}".format(
+            "length", "targets", "mean guesses", "failure rate", "max", "patterns s", "solve s"))
+    for word_length in args.lengths:
+        result = benchmark(word_length, artifact, args.workers, args.hard, args.patterns, args.limit)
+        if args.json:
+            print(json.dumps(result))
+        else:
+            print("{:>6} {:>7} {:>12} {:>11.2%} {:>5} {:>10} {:>10}".format(
+                word_length, result["targets"], result["mean_guesses"], result["failure_rate"],
+                result["max_guesses"], result["pattern_seconds"], result["solve_seconds"]))
+
+
+if __name__=="__main__":
+    main()
@@ -0,0 +1,33 @@
+import os
+import sys
+
+# The Lambda handlers import their helpers as top level modules from the lambda/ asset directory.
+# The in-memory DynamoDB stand-in is not deployed, it lives at the root of the repository.
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+LAMBDA_DIR = os.path.join(ROOT_DIR, "lambda")
+for path in (ROOT_DIR, LAMBDA_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import pytest
+from local_dynamodb import _installLocalDynamoDB
+from word_artifact import WordArtifact
+from word_loader import _loadWords
+from wordle_runtime import _getTable, _setResource
+import item_cache
+from item_cache import ItemCache
+
+
+@pytest.fixture
+def dynamodb():
+    """
+    Installs the in-memory DynamoDB stand-in with the 5 letter words loaded, and an empty item cache.
+    Test modules override the environment it runs in with monkeypatch.setenv.
+    """
+    dynamodb = _installLocalDynamoDB()
+    _loadWords(_getTable("WORD_TABLE"), WordArtifact().words(5), workers=1)
+    item_cache._cache = ItemCache()
+    dynamodb.reset()
+    yield dynamodb
+    _setResource(None)
+    item_cache._cache = ItemCache()
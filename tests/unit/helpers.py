@@ -0,0 +1,47 @@
+"""
+Helpers shared by the test modules that play games through the handlers, against the dynamodb fixture of conftest.py.
+"""
+import json
+from wordle_runtime import _getTable
+from single_table import _singleTable, GAME
+import createUser
+import createGame
+import guess
+
+
+def body(response):
+    return json.loads(response["body"])["message"]
+
+
+def newUser():
+    return body(createUser.handler({}, None))["user_id"]
+
+
+def secretWord(user_id, game):
+    # the word of a game in progress is not exposed by the API
+    if _singleTable():
+        return _getTable("USER_TABLE").get_item(Key={"user_id": user_id})["Item"][GAME]["word"]
+    return _getTable("GAME_TABLE").get_item(Key={"game_id": game["game_id"]})["Item"]["word"]
+
+
+def newGame(user_id=None, **params):
+    """
+    Creates a 5 letter game, for a new user unless one is given. params override the query parameters.
+
+    Returns:
+        tuple: (user_id, the game as returned by createGame, with its "word")
+    """
+    if user_id is None:
+        user_id = newUser()
+    query = {"word_length": "5", "hard_mode": "0"}
+    query.update(params)
+    response = createGame.handler({"pathParameters": {"user_id": user_id}, "queryStringParameters": query}, None)
+    assert response["statusCode"] == 201
+    game = body(response)
+    game["word"] = secretWord(user_id, game)
+    return user_id, game
+
+
+def play(user_id, game_id, word):
+    return guess.handler({"pathParameters": {"user_id": user_id, "game_id": game_id},
+                          "queryStringParameters": {"guess": word}}, None)
@@ -0,0 +1,55 @@
+import json
+import random
+from word_artifact import WordArtifact
+from wordle_utils import _encodeResponse
+from candidate_index import CandidateIndex
+import getHint
+import guess
+from .helpers import newGame, play
+
+WORDS = list(WordArtifact().words(5))
+
+
+def bruteForce(guesses, responses):
+    return [word for word in WORDS
+            if all(_encodeResponse(guess.getGuessResponse(g, word)) == r for g, r in zip(guesses, responses))]
+
+
+def test_filter_matches_brute_force():
+    index = CandidateIndex(5, WORDS)
+    rng = random.Random(3)
+    for _ in range(30):
+        target = rng.choice(WORDS)
+        guesses = rng.sample(WORDS, rng.randint(0, 4))
+        responses = [_encodeResponse(guess.getGuessResponse(g, target)) for g in guesses]
+        remaining = index.filter(guesses, responses)
+        expected = bruteForce(guesses, responses)
+        assert index.cardinality(remaining) == len(expected)
+        assert target in expected
+        assert index.sample(remaining, len(WORDS)) == sorted(expected, key=WORDS.index)
+
+
+def test_repeated_letters():
+    index = CandidateIndex(5, ["eerie", "there", "genre", "reeve", "eerry"])
+    responses = [_encodeResponse(guess.getGuessResponse("genre", "eerie"))]
+    assert index.sample(index.filter(["genre"], responses), 5) == ["eerie", "reeve"]
+    # greys next to greens cap the count of e at exactly 3
+    responses = [_encodeResponse(guess.getGuessResponse("eeeee", "eerie"))]
+    assert index.sample(index.filter(["eeeee"], responses), 5) == ["eerie"]
+
+
+def test_hint_endpoint(dynamodb):
+    user_id, game = newGame()
+    path = {"user_id": user_id, "game_id": game["game_id"]}
+    hint = json.loads(getHint.handler({"pathParameters": path, "queryStringParameters": None}, None)["body"])["message"]
+    assert hint == {"game_id": game["game_id"], "remaining": len(WORDS)}
+    first = next(w for w in WORDS if w != game["word"])
+    play(user_id, game["game_id"], first)
+    dynamodb.reset()
+    hint = json.loads(getHint.handler({"pathParameters": path, "queryStringParameters": {"sample": "3"}}, None)["body"])["message"]
+    # the user and game were cached by the guess
+    assert dynamodb.summary()["round_trips"] == 0
+    assert hint["remaining"] == len(bruteForce([first], [_encodeResponse(guess.getGuessResponse(first, game["word"]))]))
+    assert len(hint["sample"]) == min(3, hint["remaining"])
+    response = getHint.handler({"pathParameters": path, "queryStringParameters": {"sample": "100"}}, None)
+    assert response["statusCode"] == 400
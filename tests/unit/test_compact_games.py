@@ -0,0 +1,138 @@
+import json
+import time
+import pytest
+from botocore.exceptions import ClientError
+from word_artifact import WordArtifact
+from wordle_runtime import _getTable
+from wordle_utils import ACTIVE_GAME_TTL, FINISHED_GAME_TTL
+from history import _packGame, _unpackGame
+import compactGames
+import createGame
+import getHistory
+import guessBatch
+from .helpers import newUser, newGame
+
+DAY = 24 * 3600
+
+
+def finishGame(user_id, hard_mode="0", win=True):
+    _, game = newGame(user_id, hard_mode=hard_mode)
+    wrong = next(w for w in WordArtifact().words(5) if w != game["word"])
+    guesses = [wrong, game["word"]] if win else [wrong] * 6
+    guessBatch.handler({"pathParameters": {"user_id": user_id, "game_id": game["game_id"]},
+                        "body": json.dumps({"guesses": guesses})}, None)
+    return game
+
+
+def compact(days_later=2):
+    return compactGames.compactGames(_getTable("GAME_TABLE"), _getTable("USER_TABLE"), _getTable("HISTORY_TABLE"),
+                                     now=int(time.time()) + days_later * DAY)
+
+
+def history(user_id):
+    return json.loads(getHistory.handler({"pathParameters": {"user_id": user_id}}, None)["body"])["message"]
+
+
+def test_pack_roundtrip():
+    for word_length in range(5, 9):
+        for guesses in range(word_length + 2):
+            packed = _packGame(word_length, guesses, guesses % 2 == 0, word_length % 2 == 1)
+            assert 0 <= packed < 256
+            assert _unpackGame(packed) == {"word_length": word_length, "guesses": guesses,
+                                           "result": "WON" if guesses % 2 == 0 else "LOST",
+                                           "hard_mode": "1" if word_length % 2 == 1 else "0"}
+
+
+def test_games_expire(dynamodb):
+    user_id = newUser()
+    now = int(time.time())
+    game = createGame.handler({"pathParameters": {"user_id": user_id},
+                               "queryStringParameters": {"word_length": "5", "hard_mode": "0"}}, None)
+    game = json.loads(game["body"])["message"]
+    stored = _getTable("GAME_TABLE").get_item(Key={"game_id": game["game_id"]})["Item"]
+    assert stored["user_id"] == user_id
+    assert abs(int(stored["expires_at"]) - now - ACTIVE_GAME_TTL) < 60
+    guessBatch.handler({"pathParameters": {"user_id": user_id, "game_id": game["game_id"]},
+                        "body": json.dumps({"guesses": [stored["word"]]})}, None)
+    stored = _getTable("GAME_TABLE").get_item(Key={"game_id": game["game_id"]})["Item"]
+    assert abs(int(stored["expires_at"]) - now - FINISHED_GAME_TTL) < 60
+
+
+def test_finished_games_move_to_history(dynamodb):
+    user_id = newUser()
+    finishGame(user_id, hard_mode="1", win=True)
+    last = finishGame(user_id, win=False)
+    dynamodb.reset()
+    stats = compact()
+    assert stats["compacted"] == 2 and stats["complete"] and stats["conflicts"] == 0
+    # one consistent user read and one transaction for the user
+    assert dynamodb.summary()["operations"] == {"Scan": 1, "GetItem": 1, "TransactWriteItems": 1}
+    assert _getTable("GAME_TABLE").items() == []
+    user = _getTable("USER_TABLE").get_item(Key={"user_id": user_id})["Item"]
+    assert user["game_id"] == "" and user["version"] > 3
+    assert last["game_id"] != ""
+
+    dynamodb.reset()
+    body = history(user_id)
+    assert dynamodb.summary()["operations"] == {"GetItem": 1}
+    assert body["games_count"] == 2
+    # both games ended within the same second, so their order is not known
+    assert sorted(body["games"], key=lambda game: game["guesses"]) == [
+        {"word_length": 5, "guesses": 2, "result": "WON", "hard_mode": "1"},
+        {"word_length": 5, "guesses": 6, "result": "LOST", "hard_mode": "0"}]
+
+    # later compactions append to the same item
+    finishGame(user_id)
+    compact()
+    assert history(user_id)["games_count"] == 3
+
+
+def test_recent_and_active_games_stay(dynamodb):
+    user_id = newUser()
+    finishGame(user_id)
+    assert compact(days_later=0)["compacted"] == 0
+    other = newUser()
+    createGame.handler({"pathParameters": {"user_id": other},
+                        "queryStringParameters": {"word_length": "5", "hard_mode": "0"}}, None)
+    stats = compact()
+    assert stats["compacted"] == 1 and stats["orphans_deleted"] == 0
+    assert [game["user_id"] for game in _getTable("GAME_TABLE").items()] == [other]
+    assert history(other) == {"user_id": other, "games_count": 0, "games": []}
+
+
+def test_orphans_and_legacy_games(dynamodb):
+    user_id = newUser()
+    createGame.handler({"pathParameters": {"user_id": user_id},
+                        "queryStringParameters": {"word_length": "5", "hard_mode": "0"}}, None)
+    gameTable = _getTable("GAME_TABLE")
+    orphan = dict(gameTable.items()[0], game_id="orphan")
+    gameTable.put_item(Item=orphan)
+    gameTable.put_item(Item=dict(orphan, game_id="missing-user", user_id="nobody"))
+    legacy = {"game_id": "legacy", "hard_mode": "0", "attempts_left": "0", "word_length": "5", "word": "adieu",
+              "status": "LOST", "guesses": [], "responses": []}
+    gameTable.put_item(Item=legacy)
+    stats = compact()
+    assert stats["orphans_deleted"] == 2 and stats["legacy_expiring"] == 1
+    remaining = dict((game["game_id"], game) for game in gameTable.items())
+    assert "orphan" not in remaining and "missing-user" not in remaining
+    assert "expires_at" in remaining["legacy"]
+    assert len(remaining) == 2
+
+
+def test_transaction_is_all_or_nothing(dynamodb):
+    user_id = newUser()
+    game = finishGame(user_id)
+    client = _getTable("GAME_TABLE").meta.client
+    before = _getTable("HISTORY_TABLE").items()
+    with pytest.raises(ClientError) as error:
+        client.transact_write_items(TransactItems=[
+            {"Update": {"TableName": "HistoryTable", "Key": {"user_id": {"S": user_id}},
+                        "UpdateExpression": "ADD games_count :one", "ExpressionAttributeValues": {":one": {"N": "1"}}}},
+            {"Delete": {"TableName": "GameTable", "Key": {"game_id": {"S": game["game_id"]}},
+                        "ConditionExpression": "#status = :status", "ExpressionAttributeNames": {"#status": "status"},
+                        "ExpressionAttributeValues": {":status": {"S": "IN_PROGRESS"}}}},
+        ])
+    assert error.value.response["Error"]["Code"] == "TransactionCanceledException"
+    assert [reason["Code"] for reason in error.value.response["CancellationReasons"]] == ["None", "ConditionalCheckFailed"]
+    assert _getTable("HISTORY_TABLE").items() == before
+    assert len(_getTable("GAME_TABLE").items()) == 1
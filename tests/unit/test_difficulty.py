@@ -0,0 +1,106 @@
+import io
+import json
+import random
+import pytest
+from botocore.exceptions import ClientError
+from word_artifact import WordArtifact
+from wordle_runtime import _getTable
+from difficulty import DifficultyAggregator, DifficultyTable, _buildDifficultyTable, _gameEvent, _replay, TRANSACTION_LIMIT
+import aggregateDifficulty
+
+
+def streamRecord(word, old_status, new_status, attempts_left, event_name="MODIFY", sequence_number=None):
+    image = {"game_id": {"S": "g"}, "word": {"S": word}, "word_length": {"S": str(len(word))},
+             "attempts_left": {"S": str(attempts_left)}}
+    record = {"eventName": event_name, "dynamodb": {
+        "OldImage": dict(image, status={"S": old_status}, attempts_left={"S": str(attempts_left + 1)}),
+        "NewImage": dict(image, status={"S": new_status})}}
+    if sequence_number is not None:
+        record["dynamodb"]["SequenceNumber"] = sequence_number
+    return record
+
+
+def totals(table):
+    found = {}
+    for item in table.items():
+        counters = found.setdefault(item["word"], [0, 0, 0])
+        counters[0] += int(item["played"])
+        counters[1] += int(item["wins"])
+        counters[2] += int(item["guesses"])
+    return found
+
+
+def test_only_game_endings_count():
+    assert _gameEvent(streamRecord("crane", "IN_PROGRESS", "WON", 3)) == {"word": "crane", "status": "WON", "guesses": 3}
+    assert _gameEvent(streamRecord("crane", "IN_PROGRESS", "IN_PROGRESS", 3)) is None
+    assert _gameEvent(streamRecord("crane", "WON", "WON", 3)) is None
+    assert _gameEvent(streamRecord("crane", "IN_PROGRESS", "LOST", 0, event_name="REMOVE")) is None
+    assert _gameEvent({"word": "crane", "status": "LOST", "guesses": 6}) == {"word": "crane", "status": "LOST", "guesses": 6}
+
+
+def test_stream_batch_is_one_write(dynamodb):
+    records = [streamRecord("crane", "IN_PROGRESS", "WON", 3)] * 40 + [streamRecord("crane", "IN_PROGRESS", "LOST", 0)] * 10 \
+        + [streamRecord("adieu", "IN_PROGRESS", "WON", 5)] * 5 + [streamRecord("adieu", "IN_PROGRESS", "IN_PROGRESS", 4)]
+    dynamodb.reset()
+    stats = aggregateDifficulty.handler({"Records": records}, None)
+    assert dynamodb.summary()["operations"] == {"TransactWriteItems": 1}
+    assert stats["events"] == 55 and stats["ignored"] == 1 and stats["transactions"] == 1
+    # guesses only sums the won games: 3 guesses with 3 attempts left, 1 with 5 left
+    assert totals(_getTable("DIFFICULTY_TABLE")) == {"crane": [50, 40, 120], "adieu": [5, 5, 5]}
+
+
+def test_flushes_are_sharded_and_bounded(dynamodb):
+    table = _getTable("DIFFICULTY_TABLE")
+    words = list(WordArtifact().words(5))[:250]
+    rng = random.Random(1)
+    events = [{"word": rng.choice(words), "status": "WON", "guesses": 4} for _ in range(5000)]
+    replay = io.StringIO("".join(json.dumps(event) + "\n" for event in events))
+    dynamodb.reset()
+    stats = _replay(DifficultyAggregator(table, shards=4, rng=random.Random(0)), replay, batch_size=1000)
+    calls = [call for call in dynamodb.calls if call.operation == "TransactWriteItems"]
+    assert len(calls) == stats["transactions"] and all(call.items <= TRANSACTION_LIMIT for call in calls)
+    # every micro-batch is summed before it is written, so no word is written twice by one flush
+    assert stats["flushes"] == 5 and stats["words_written"] <= 5 * 250
+    assert stats["events"] == 5000 and stats["words_written"] < 5000
+    assert set(int(item["shard"]) for item in table.items()) == set(range(4))
+    assert sum(counters[0] for counters in totals(table).values()) == 5000
+
+
+def test_redelivered_batch_counts_once(dynamodb, monkeypatch):
+    words = list(WordArtifact().words(5))[:TRANSACTION_LIMIT + 50]
+    records = [streamRecord(word, "IN_PROGRESS", "WON", 3, sequence_number=str(1000 + i)) for i, word in enumerate(words)]
+    transact_write_items = dynamodb.transact_write_items
+    calls = []
+
+    def failSecond(**kwargs):
+        calls.append(kwargs)
+        if len(calls) == 2:
+            raise ClientError({"Error": {"Code": "InternalServerError", "Message": "injected"}}, "TransactWriteItems")
+        return transact_write_items(**kwargs)
+
+    monkeypatch.setattr(dynamodb, "transact_write_items", failSecond)
+    with pytest.raises(ClientError):
+        aggregateDifficulty.handler({"Records": records}, None)
+    # the event source mapping delivers the same batch again
+    stats = aggregateDifficulty.handler({"Records": records}, None)
+    assert stats["transactions"] == 2
+    assert [call["ClientRequestToken"] for call in calls[2:]] == [call["ClientRequestToken"] for call in calls[:2]]
+    assert totals(_getTable("DIFFICULTY_TABLE")) == dict((word, [1, 1, 3]) for word in words)
+
+
+def test_compact_table(dynamodb):
+    table = _getTable("DIFFICULTY_TABLE")
+    artifact = WordArtifact()
+    easy, hard, lost = list(artifact.words(5))[:3]
+    aggregator = DifficultyAggregator(table)
+    for _ in range(2):
+        aggregator.fold([{"word": easy, "status": "WON", "guesses": 1},
+                         {"word": hard, "status": "WON", "guesses": 5},
+                         {"word": hard, "status": "LOST", "guesses": 6},
+                         {"word": lost, "status": "LOST", "guesses": 6}])
+    difficulty = DifficultyTable.decode(_buildDifficultyTable(table.items(), artifact).encode())
+    assert sorted(difficulty.scores) == artifact.lengths()
+    assert len(difficulty.scores[6]) == artifact.count(6)
+    scores = [difficulty.score(5, artifact.ordinal(word)) for word in (easy, hard, lost)]
+    assert scores[0] == 1 and scores[2] == 255 and 1 < scores[1] < 255
+    assert difficulty.score(5, artifact.ordinal(easy) + 10) == 0
@@ -0,0 +1,56 @@
+import base64
+import json
+from word_artifact import WordArtifact
+import guessBatch
+from .helpers import newGame
+
+
+def submit(user_id, game_id, guesses):
+    response = guessBatch.handler({"pathParameters": {"user_id": user_id, "game_id": game_id},
+                                   "body": json.dumps({"guesses": guesses})}, None)
+    return response["statusCode"], json.loads(response["body"])["message"]
+
+
+def test_batch_is_applied_with_one_write_and_stops_at_won(dynamodb):
+    user_id, game = newGame()
+    wrong = [w for w in WordArtifact().words(5) if w != game["word"]][:2]
+    dynamodb.reset()
+    status, body = submit(user_id, game["game_id"], [wrong[0], "zzzzz", wrong[1], game["word"], wrong[0]])
+    assert status == 201
+    assert [result["status"] for result in body["results"]] == ["OK", "INPUT_ERROR", "OK", "OK", "GAME_OVER"]
+    assert body["game"]["guesses"] == [wrong[0], wrong[1], game["word"]]
+    assert body["game"]["status"] == "WON"
+    assert body["results"][3]["response"] == str(["GREEN"] * 5)
+    # one write of the game, the others update the statistics of the won game
+    assert list(dynamodb.summary()["operations"]) == ["UpdateItem"]
+    assert dynamodb.callCount("UpdateItem", "GameTable") == 1
+
+
+def test_batch_stops_at_lost(dynamodb):
+    user_id, game = newGame()
+    wrong = next(w for w in WordArtifact().words(5) if w != game["word"])
+    status, body = submit(user_id, game["game_id"], [wrong] * 7)
+    assert status == 201
+    assert body["game"]["status"] == "LOST"
+    assert [result["status"] for result in body["results"]].count("GAME_OVER") == 1
+
+
+def test_batch_without_valid_guesses_is_rejected(dynamodb):
+    user_id, game = newGame()
+    status, body = submit(user_id, game["game_id"], ["zzzzz", "toolong"])
+    assert status == 400
+    assert body["game"]["guesses"] == []
+    response = guessBatch.handler({"pathParameters": {"user_id": user_id, "game_id": game["game_id"]}, "body": "{}"}, None)
+    assert response["statusCode"] == 400
+
+
+def test_base64_encoded_body(dynamodb):
+    user_id, game = newGame()
+    body = base64.b64encode(json.dumps({"guesses": [game["word"]]}).encode("utf-8")).decode("ascii")
+    response = guessBatch.handler({"pathParameters": {"user_id": user_id, "game_id": game["game_id"]},
+                                   "body": body, "isBase64Encoded": True}, None)
+    assert response["statusCode"] == 201
+    assert json.loads(response["body"])["message"]["game"]["status"] == "WON"
+    response = guessBatch.handler({"pathParameters": {"user_id": user_id, "game_id": game["game_id"]},
+                                   "body": "not base64!", "isBase64Encoded": True}, None)
+    assert response["statusCode"] == 400
@@ -0,0 +1,59 @@
+import json
+from word_artifact import WordArtifact
+from wordle_runtime import _getTable
+from wordle_utils import _encodeResponse
+from hard_mode import Constraints, _gameConstraints, GREEN_MESSAGE, YELLOW_MESSAGE, CAP_MESSAGE
+import guess
+from .helpers import newGame, play
+
+
+def test_constraints_accumulate():
+    constraints = Constraints.empty(5)
+    # "there" against "eerie": GREY GREY YELLOW YELLOW GREEN
+    constraints.add("there", guess.getGuessResponse("there", "eerie"))
+    assert constraints.encode() == "....e|e2r1|h0t0"
+    assert constraints.check("eerie") is None
+    assert constraints.check("thorn") == GREEN_MESSAGE
+    assert constraints.check("abate") == YELLOW_MESSAGE
+    assert constraints.check("there") == CAP_MESSAGE
+    # "genre" against "eerie": GREY GREEN GREY YELLOW GREEN, earlier constraints are kept
+    constraints.add("genre", guess.getGuessResponse("genre", "eerie"))
+    assert constraints.encode() == ".e..e|e2r1|g0h0n0t0"
+    assert Constraints.decode(constraints.encode()).encode() == constraints.encode()
+    assert constraints.check("eerie") is None
+    assert constraints.check("rebel") == GREEN_MESSAGE
+
+
+def test_every_target_satisfies_its_constraints():
+    words = list(WordArtifact().words(5))[:200]
+    for target in words[:20]:
+        constraints = Constraints.empty(5)
+        for word in words[20:40]:
+            constraints.add(word, guess.getGuessResponse(word, target))
+            assert constraints.check(target) is None
+
+
+def test_legacy_games_are_compiled_from_their_history():
+    responses = [guess.getGuessResponse(word, "eerie") for word in ("there", "genre")]
+    game = {"word_length": "5", "guesses": ["there", "genre"], "responses": [_encodeResponse(r) for r in responses]}
+    expected = Constraints.empty(5)
+    for word, response in zip(game["guesses"], responses):
+        expected.add(word, response)
+    assert _gameConstraints(game).encode() == expected.encode()
+
+
+def test_hard_mode_game_stores_its_constraints(dynamodb):
+    user_id, game = newGame(hard_mode="1")
+    stored = _getTable("GAME_TABLE").get_item(Key={"game_id": game["game_id"]})["Item"]
+    assert stored["constraints"] == ".....||" and "constraints" not in game
+    words = list(WordArtifact().words(5))
+    first = next(w for w in words if w != game["word"] and any(c in game["word"] for c in w))
+    response = play(user_id, game["game_id"], first)
+    assert response["statusCode"] == 201
+    stored = _getTable("GAME_TABLE").get_item(Key={"game_id": game["game_id"]})["Item"]
+    constraints = Constraints.decode(stored["constraints"])
+    assert constraints.encode() == Constraints.empty(5).add(first, guess.getGuessResponse(first, game["word"])).encode()
+    breaking = next(w for w in words if constraints.check(w) is not None)
+    response = play(user_id, game["game_id"], breaking)
+    assert response["statusCode"] == 400
+    assert json.loads(response["body"])["message"] == constraints.check(breaking)
@@ -0,0 +1,102 @@
+from word_artifact import WordArtifact
+from wordle_runtime import _getTable
+import item_cache
+from item_cache import ItemCache
+import createGame
+import getGame
+from .helpers import body, newGame, play
+
+
+def wrongWord(game):
+    return next(w for w in WordArtifact().words(5) if w != game["word"])
+
+
+def test_lru_eviction_ttl_and_versions(monkeypatch):
+    cache = ItemCache(max_items=2, ttl=10)
+    now = [100.0]
+    monkeypatch.setattr(item_cache.time, "monotonic", lambda: now[0])
+    cache.put("a", {"status": "IN_PROGRESS", "version": 2})
+    cache.put("b", {"status": "WON"})
+    cache.put("a", {"status": "IN_PROGRESS", "version": 1})
+    assert cache.get("a")["version"] == 2
+    now[0] += 60
+    assert cache.get("a") is None
+    assert cache.get("b") == {"status": "WON"}
+    cache.put("c", {})
+    cache.put("d", {})
+    assert cache.get("b") is None
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["hit_rate"] == 0.5
+
+
+def test_warm_guess_only_writes(dynamodb):
+    user_id, game = newGame()
+    dynamodb.reset()
+    response = play(user_id, game["game_id"], wrongWord(game))
+    assert response["statusCode"] == 201
+    assert dynamodb.summary()["operations"] == {"UpdateItem": 1}
+    assert item_cache._cacheStats()["hits"] >= 2
+
+
+def test_guess_applied_elsewhere_refreshes_the_cached_game(dynamodb):
+    user_id, game = newGame()
+    word = wrongWord(game)
+    # another container applies a guess, leaving this container's cached game stale
+    item_cache._cache, fresh = ItemCache(), item_cache._cache
+    play(user_id, game["game_id"], word)
+    item_cache._cache = fresh
+    response = play(user_id, game["game_id"], word)
+    assert response["statusCode"] == 201
+    assert body(response)["guesses"] == [word, word]
+    assert _getTable("GAME_TABLE").get_item(Key={"game_id": game["game_id"]})["Item"]["version"] == 3
+
+
+def test_new_game_started_elsewhere_is_visible(dynamodb):
+    user_id, game = newGame()
+    play(user_id, game["game_id"], game["word"])
+    # another container starts the next game
+    item_cache._cache, stale = ItemCache(), item_cache._cache
+    next_game = body(createGame.handler({"pathParameters": {"user_id": user_id},
+                                         "queryStringParameters": {"word_length": "5", "hard_mode": "0"}}, None))
+    item_cache._cache = stale
+    response = getGame.handler({"pathParameters": {"user_id": user_id, "game_id": next_game["game_id"]}}, None)
+    assert response["statusCode"] == 200
+    assert body(response)["game_id"] == next_game["game_id"]
+
+
+def test_projected_entries():
+    cache = ItemCache()
+    cache.put("u", {"game_id": "g", "version": 1}, ["game_id", "version"])
+    assert cache.get("u", ["game_id", "version"]) == {"game_id": "g", "version": 1}
+    # a projected entry cannot serve the whole item or other attributes
+    assert cache.get("u") is None
+    assert cache.get("u", ["status", "version"]) is None
+    # the whole item replaces it, and is not replaced by a projection of the same version
+    cache.put("u", {"game_id": "g", "status": "x", "version": 1})
+    cache.put("u", {"game_id": "g", "version": 1}, ["game_id", "version"])
+    assert cache.get("u", ["game_id", "version"]) == {"game_id": "g", "status": "x", "version": 1}
+    assert cache.get("u")["status"] == "x"
+
+
+def test_projections_save_bytes_not_capacity(dynamodb):
+    from wordle_utils import _getItem
+    user_id, game = newGame()
+    for _ in range(3):
+        play(user_id, game["game_id"], wrongWord(game))
+    item_cache._cache = ItemCache()
+    dynamodb.reset()
+    full = _getItem(_getTable("GAME_TABLE"), "game_id", game["game_id"])["response"]
+    projected = _getItem(_getTable("GAME_TABLE"), "game_id", game["game_id"], attributes=["status"])["response"]
+    consistent = _getItem(_getTable("GAME_TABLE"), "game_id", game["game_id"], attributes=["status"], consistent=True)
+    assert projected == {"status": full["status"]} and consistent["success"]
+    full_call, projected_call, consistent_call = dynamodb.calls
+    assert projected_call.bytes_read < full_call.bytes_read
+    # DynamoDB bills the whole item either way, and twice as much for a consistent read
+    assert projected_call.read_units == full_call.read_units
+    assert consistent_call.read_units == 2 * projected_call.read_units
+
+    # a guess reads only game_id from the user
+    dynamodb.reset()
+    play(user_id, game["game_id"], wrongWord(game))
+    user_read = [call for call in dynamodb.calls if call.table == "UserTable"][0]
+    assert user_read.bytes_read < 100
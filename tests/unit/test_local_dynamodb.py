@@ -0,0 +1,103 @@
+from decimal import Decimal
+import pytest
+from botocore.exceptions import ClientError
+from local_dynamodb import LocalDynamoDB, _itemSize
+from wordle_utils import _updateItem, _queryPartition, ResponseStatus
+
+
+@pytest.fixture
+def dynamodb():
+    return LocalDynamoDB()
+
+
+def test_items_round_trip_with_decimal_numbers(dynamodb):
+    table = dynamodb.create_table("Games", "game_id")
+    table.put_item(Item={"game_id": "g", "attempts_left": "6", "responses": [1, 242]})
+    item = table.get_item(Key={"game_id": "g"})["Item"]
+    assert item["responses"] == [Decimal(1), Decimal(242)]
+    assert "Item" not in table.get_item(Key={"game_id": "missing"})
+    with pytest.raises(TypeError):
+        table.put_item(Item={"game_id": "f", "score": 1.5})
+
+
+def test_update_expressions(dynamodb):
+    table = dynamodb.create_table("Games", "game_id")
+    table.put_item(Item={"game_id": "g", "guesses": [], "wins": 1, "status": "IN_PROGRESS"})
+    reply = _updateItem(
+        table, {"game_id": "g"},
+        "SET #guesses = list_append(#guesses, :guess), wins = wins + :one, streak = if_not_exists(streak, :zero) + :one "
+        "REMOVE #status ADD played :one",
+        {":guess": ["crane"], ":one": 1, ":zero": 0, ":in_progress": "IN_PROGRESS"},
+        condition_expression="attribute_exists(game_id) AND #status = :in_progress",
+        expression_names={"#guesses": "guesses", "#status": "status"},
+    )
+    assert reply["success"]
+    assert reply["response"] == {"game_id": "g", "guesses": ["crane"], "wins": 2, "streak": 1, "played": 1}
+
+    conflict = _updateItem(table, {"game_id": "g"}, "SET wins = :one", {":one": 1, ":in_progress": "IN_PROGRESS"},
+                           condition_expression="#status = :in_progress", expression_names={"#status": "status"})
+    assert conflict["status"] == ResponseStatus.CONFLICT
+    assert table.get_item(Key={"game_id": "g"})["Item"]["wins"] == 2
+
+
+def test_query_pages_projects_and_uses_indexes():
+    dynamodb = LocalDynamoDB(page_bytes=100)
+    table = dynamodb.create_table("Words", "word_length", "word", indexes=[("ByOrdinal", "word_length", "ordinal")])
+    words = ["crane", "slate", "about", "zesty", "mimic", "pious", "ghost", "fjord"]
+    for ordinal, word in enumerate(words):
+        table.put_item(Item={"word_length": 5, "word": word, "ordinal": ordinal})
+
+    items = _queryPartition(table, "word_length", 5)
+    assert [item["word"] for item in items] == sorted(words)
+    assert dynamodb.callCount("Query") > 1
+
+    response = table.query(IndexName="ByOrdinal", KeyConditionExpression="word_length = :l AND ordinal = :o",
+                           ExpressionAttributeValues={":l": 5, ":o": 3}, ProjectionExpression="#w",
+                           ExpressionAttributeNames={"#w": "word"})
+    assert response["Items"] == [{"word": "zesty"}]
+
+    response = table.query(KeyConditionExpression="word_length = :l AND begins_with(word, :p)",
+                           ExpressionAttributeValues={":l": 5, ":p": "p"})
+    assert [item["word"] for item in response["Items"]] == ["pious"]
+
+
+def test_calls_are_recorded_with_capacity(dynamodb):
+    table = dynamodb.create_table("Games", "game_id")
+    item = {"game_id": "g", "guesses": ["crane"] * 300}
+    response = table.put_item(Item=item, ReturnConsumedCapacity="TOTAL")
+    assert response["ConsumedCapacity"]["WriteCapacityUnits"] == 2.0
+    table.get_item(Key={"game_id": "g"}, ConsistentRead=True)
+    table.get_item(Key={"game_id": "g"})
+    summary = dynamodb.summary()
+    assert summary["operations"] == {"PutItem": 1, "GetItem": 2}
+    assert summary["read_units"] == 1.5
+    assert summary["bytes_written"] == _itemSize(item)
+
+
+def test_throttling_and_unprocessed_items_are_injected():
+    dynamodb = LocalDynamoDB(throttle_rate=1.0)
+    table = dynamodb.create_table("Games", "game_id")
+    with pytest.raises(ClientError) as error:
+        table.get_item(Key={"game_id": "g"})
+    assert error.value.response["Error"]["Code"] == "ProvisionedThroughputExceededException"
+    assert dynamodb.summary()["errors"] == 1
+
+    dynamodb = LocalDynamoDB(unprocessed_rate=1.0)
+    dynamodb.create_table("Games", "game_id")
+    response = dynamodb.meta.client.batch_write_item(RequestItems={"Games": [{"PutRequest": {"Item": {"game_id": "g"}}}]})
+    assert len(response["UnprocessedItems"]["Games"]) == 1
+
+
+def test_hot_partitions_are_throttled():
+    dynamodb = LocalDynamoDB(partition_rate=5)
+    table = dynamodb.create_table("Words", "word_length", "word")
+    for _ in range(5):
+        table.get_item(Key={"word_length": 5, "word": "crane"})
+    with pytest.raises(ClientError) as error:
+        table.get_item(Key={"word_length": 5, "word": "crane"})
+    assert error.value.response["Error"]["Code"] == "ProvisionedThroughputExceededException"
+    # other partitions keep their own rate
+    table.get_item(Key={"word_length": 6, "word": "abroad"})
+    items = [{"PutRequest": {"Item": {"word_length": 7, "word": "w{}".format(n)}}} for n in range(8)]
+    response = dynamodb.meta.client.batch_write_item(RequestItems={"Words": items})
+    assert len(response["UnprocessedItems"]["Words"]) == 3
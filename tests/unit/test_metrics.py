@@ -0,0 +1,104 @@
+import json
+import time
+from word_artifact import WordArtifact
+from word_loader import _loadWords
+from wordle_runtime import _getTable
+import item_cache
+from item_cache import ItemCache
+import metrics
+import compactGames
+import createGame
+import guess
+from .helpers import newUser, newGame, play, secretWord
+
+
+def metricsLines(output):
+    return [json.loads(line) for line in output.splitlines() if line.startswith('{"_aws"')]
+
+
+def test_one_metrics_line_per_invocation(dynamodb, capsys):
+    user_id = newUser()
+    item_cache._cache = ItemCache()
+    capsys.readouterr()
+    dynamodb.reset()
+    response = createGame.handler({"pathParameters": {"user_id": user_id},
+                                   "queryStringParameters": {"word_length": "5", "hard_mode": "0"}}, None)
+    game = json.loads(response["body"])["message"]
+    lines = metricsLines(capsys.readouterr().out)
+    assert len(lines) == 1
+    line = lines[0]
+    summary = dynamodb.summary()
+    assert line["handler"] == "createGame"
+    assert line["status_code"] == 201
+    assert line["db_calls"] == summary["round_trips"]
+    assert line["rcu"] == summary["read_units"]
+    assert line["wcu"] == summary["write_units"]
+    assert line["db_errors"] == 1  # the user has no game yet, so the game lookup uses an empty key
+    assert set(line["phases"]) == {"read", "pick_word", "write"}
+    assert line["duration_ms"] >= line["db_ms"]
+    assert line["_aws"]["CloudWatchMetrics"][0]["Dimensions"] == [["handler"]]
+
+    word = next(w for w in WordArtifact().words(5) if w != secretWord(user_id, game))
+    guess.handler({"pathParameters": {"user_id": user_id, "game_id": game["game_id"]},
+                   "queryStringParameters": {"guess": word}}, None)
+    line = metricsLines(capsys.readouterr().out)[0]
+    assert line["cold_start"] is False
+    assert line["counters"] == {"cache_hits": 2}
+    assert [call["op"] for call in line["calls"]] == ["UpdateItem"]
+    assert set(line["phases"]) == {"read_user", "read_game", "validate", "write"}
+
+
+def test_cache_evictions_are_counted(dynamodb, capsys):
+    item_cache._cache = ItemCache(max_items=1)
+    user_id, game = newGame()
+    capsys.readouterr()
+    play(user_id, game["game_id"], game["word"])
+    output = capsys.readouterr().out
+    # the user and the game do not fit together in the cache
+    line, = metricsLines(output)
+    assert line["counters"]["cache_evictions"] >= 1
+    assert len(output.splitlines()) == 1
+
+
+def test_calls_outside_invocations_are_not_recorded(dynamodb):
+    table = _getTable("USER_TABLE")
+    response = table.put_item(Item={"user_id": "u", "game_id": ""})
+    assert "ConsumedCapacity" not in response
+    assert metrics._currentInvocation() is None
+
+
+def test_batch_calls_are_recorded(dynamodb, capsys):
+    @metrics._instrumented("load")
+    def handler(event, context):
+        _loadWords(_getTable("WORD_TABLE"), list(WordArtifact().words(5))[:30], workers=1)
+        return {"statusCode": 200}
+
+    capsys.readouterr()
+    dynamodb.reset()
+    handler({}, None)
+    line = metricsLines(capsys.readouterr().out)[0]
+    summary = dynamodb.summary()
+    assert [call["op"] for call in line["calls"]] == ["BatchWriteItem"] * 2
+    assert line["calls"][0]["table"] == "WordTable"
+    assert line["db_calls"] == summary["round_trips"] == 2
+    assert line["wcu"] == summary["write_units"] > 0
+
+
+def test_transaction_calls_are_recorded(dynamodb, capsys):
+    user_id, game = newGame()
+    play(user_id, game["game_id"], game["word"])
+
+    @metrics._instrumented("compact")
+    def handler(event, context):
+        return compactGames.compactGames(_getTable("GAME_TABLE"), _getTable("USER_TABLE"), _getTable("HISTORY_TABLE"),
+                                         now=int(time.time()) + 2 * 24 * 3600)
+
+    capsys.readouterr()
+    dynamodb.reset()
+    handler({}, None)
+    line = metricsLines(capsys.readouterr().out)[0]
+    summary = dynamodb.summary()
+    transactions = [call for call in line["calls"] if call["op"] == "TransactWriteItems"]
+    assert [call["table"] for call in transactions] == ["GameTable,HistoryTable,UserTable"]
+    assert line["db_calls"] == summary["round_trips"]
+    assert line["wcu"] == summary["write_units"] > 0
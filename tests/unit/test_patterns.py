@@ -0,0 +1,32 @@
+import random
+import pytest
+
+np = pytest.importorskip("numpy")
+import patterns
+from guess import getGuessResponse
+
+REPEATED = ["eerie", "geese", "speed", "abbey", "llama", "hello", "allow", "queue", "level", "sheep"]
+
+
+def test_pattern_codes_match_guess_response():
+    rng = random.Random(1)
+    words = REPEATED + ["".join(rng.choice("abcdelms") for _ in range(5)) for _ in range(150)]
+    matrix = patterns.patternMatrix(words, words, block_size=17)
+    for g, guess in enumerate(words):
+        for t, target in enumerate(words):
+            assert patterns.decodePattern(matrix[g, t], 5) == getGuessResponse(guess, target)
+
+
+def test_winning_code_on_diagonal():
+    words = ["abroad", "accent", "banana", "bottle"]
+    matrix = patterns.patternMatrix(words, words)
+    assert (np.diag(matrix) == patterns.winningCode(6)).all()
+
+
+def test_pattern_file_is_memory_mapped(tmp_path):
+    words = ["crane", "slate", "eerie", "geese", "raise", "crate", "drain"]
+    matrices = patterns.buildPatternFiles(words + ["abroad", "accent"], str(tmp_path), word_lengths=[5, 6])
+    loaded = patterns.loadPatternFile(patterns.patternFilePath(str(tmp_path), 5))
+    assert isinstance(loaded, np.memmap)
+    assert (loaded == patterns.patternMatrix(sorted(words), sorted(words))).all()
+    assert matrices[6][1].shape == (2, 2)
@@ -0,0 +1,64 @@
+import collections
+import wordle_utils
+from wordle_utils import _getRandomItem
+
+
+class OrdinalWordTable:
+    """Word table with per-length ordinals and count records."""
+    table_name = "WordTable"
+
+    def __init__(self, words, with_counts=True):
+        self.items = {}
+        counts = collections.Counter()
+        for word in words:
+            self.items[(len(word), word)] = {"word_length": len(word), "word": word, "ordinal": counts[len(word)]}
+            counts[len(word)] += 1
+        if with_counts:
+            for word_length, count in counts.items():
+                self.items[(0, str(word_length))] = {"word_length": 0, "word": str(word_length), "count": count}
+        self.calls = collections.Counter()
+
+    def get_item(self, Key):
+        self.calls["get_item"] += 1
+        item = self.items.get((Key["word_length"], Key["word"]))
+        return {"Item": item} if item else {}
+
+    def query(self, **kwargs):
+        self.calls["query"] += 1
+        values = kwargs["ExpressionAttributeValues"]
+        items = [i for (length, _), i in sorted(self.items.items()) if length == values[":partition_key_value"]]
+        if "IndexName" in kwargs:
+            return {"Items": [i for i in items if i["ordinal"] == values[":ordinal"]]}
+        start = kwargs.get("ExclusiveStartKey", {}).get("idx", 0)
+        response = {"Items": items[start:start + 2]}
+        if start + 2 < len(items):
+            response["LastEvaluatedKey"] = {"idx": start + 2}
+        return response
+
+
+def test_random_word_uses_one_query_per_pick(monkeypatch):
+    monkeypatch.setattr(wordle_utils, "_counts", {})
+    table = OrdinalWordTable(["crane", "slate", "adieu", "abroad"])
+    seen = collections.Counter()
+    for _ in range(300):
+        reply = _getRandomItem(table, "word_length", 5)
+        assert reply["success"]
+        seen[reply["response"]["word"]] += 1
+    assert set(seen) == {"crane", "slate", "adieu"}
+    assert table.calls["get_item"] == 1
+    assert table.calls["query"] == 300
+
+
+def test_random_word_without_counts_reads_every_page(monkeypatch):
+    monkeypatch.setattr(wordle_utils, "_counts", {})
+    table = OrdinalWordTable(["crane", "slate", "adieu", "pious", "pilot"], with_counts=False)
+    seen = set()
+    for _ in range(200):
+        seen.add(_getRandomItem(table, "word_length", 5)["response"]["word"])
+    assert seen == {"crane", "slate", "adieu", "pious", "pilot"}
+
+
+def test_random_word_empty_partition(monkeypatch):
+    monkeypatch.setattr(wordle_utils, "_counts", {})
+    table = OrdinalWordTable(["crane"])
+    assert not _getRandomItem(table, "word_length", 7)["success"]
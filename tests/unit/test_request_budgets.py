@@ -0,0 +1,45 @@
+import json
+from word_artifact import WordArtifact
+import createGame
+from .helpers import body, newUser, newGame, play
+
+# Upper bounds on the DynamoDB work of one request. A change that adds a round trip or
+# rewrites whole items on the guess path should fail here before it reaches production.
+GUESS_ROUND_TRIPS = 3
+GUESS_WRITE_BYTES = 1024
+# A guess ending the game also updates the statistics, with a second write when it beats the maximum streak
+GAME_ENDING_GUESS_ROUND_TRIPS = GUESS_ROUND_TRIPS + 2
+CREATE_GAME_ROUND_TRIPS = 6
+
+
+def test_create_game_budget(dynamodb):
+    user_id = newUser()
+    dynamodb.reset()
+    response = createGame.handler({"pathParameters": {"user_id": user_id},
+                                   "queryStringParameters": {"word_length": "5", "hard_mode": "0"}}, None)
+    assert response["statusCode"] == 201
+    assert dynamodb.summary()["round_trips"] <= CREATE_GAME_ROUND_TRIPS
+
+
+def test_guess_budget(dynamodb):
+    user_id, game = newGame()
+    word = next(w for w in WordArtifact().words(5) if w != game["word"])
+    for attempt in range(3):
+        dynamodb.reset()
+        response = play(user_id, game["game_id"], word)
+        assert response["statusCode"] == 201
+        summary = dynamodb.summary()
+        assert summary["round_trips"] <= GUESS_ROUND_TRIPS
+        assert summary["operations"].get("PutItem", 0) == 0
+        assert summary["bytes_written"] <= GUESS_WRITE_BYTES
+    assert len(body(response)["guesses"]) == 3
+
+
+def test_winning_guess_ends_the_game(dynamodb):
+    user_id, game = newGame()
+    dynamodb.reset()
+    response = play(user_id, game["game_id"], game["word"])
+    assert dynamodb.summary()["round_trips"] <= GAME_ENDING_GUESS_ROUND_TRIPS
+    assert body(response)["status"] == "WON"
+    response = play(user_id, game["game_id"], game["word"])
+    assert json.loads(response["body"])["status"] == "GAME_OVER"
@@ -0,0 +1,59 @@
+import base64
+import gzip
+import json
+from decimal import Decimal
+from wordle_utils import _encodeResponse, _decodeResponse, _gameView, _userView, _http_response, ResponseStatus, ApplicationStatus, GREEN, GREY, YELLOW
+from guess import getGuessResponse
+
+
+def test_response_round_trip():
+    for guess, target in [("eerie", "geese"), ("chime", "chirp"), ("abroad", "accent"), ("thousand", "thursday")]:
+        response = getGuessResponse(guess, target)
+        code = _encodeResponse(response)
+        assert _decodeResponse(code, len(guess)) == response
+        assert _decodeResponse(Decimal(code), len(guess)) == response
+    assert _encodeResponse([GREEN, GREY, YELLOW, GREY, GREY]) == 11
+
+
+def test_legacy_responses_are_read():
+    legacy = str([GREEN, GREY, GREEN, YELLOW, GREEN])
+    assert _decodeResponse(legacy, 5) == [GREEN, GREY, GREEN, YELLOW, GREEN]
+
+
+def test_game_view_keeps_api_representation():
+    game = {
+        "game_id": "g",
+        "word_length": "5",
+        "status": "IN_PROGRESS",
+        "guesses": ["crane", "slate"],
+        "responses": [str([GREY, GREY, GREEN, GREY, GREEN]), Decimal(_encodeResponse([GREEN] * 5))],
+    }
+    view = _gameView(game)
+    assert view["responses"] == [str([GREY, GREY, GREEN, GREY, GREEN]), str([GREEN] * 5)]
+    assert isinstance(game["responses"][1], Decimal)
+
+
+def test_views_whitelist_fields():
+    game = {"game_id": "g", "user_id": "u", "hard_mode": "1", "attempts_left": "4", "word_length": "5", "word": "crane",
+            "status": "IN_PROGRESS", "guesses": ["slate"], "responses": [Decimal(_encodeResponse([GREY] * 5))],
+            "expires_at": Decimal(1700000000), "constraints": ".....||s0", "version": Decimal(3)}
+    view = _gameView(game)
+    assert set(view) == {"game_id", "hard_mode", "attempts_left", "word_length", "status", "guesses", "responses"}
+    # the word is revealed once the game is over
+    assert _gameView(dict(game, status="LOST"))["word"] == "crane"
+    assert _userView({"user_id": "u", "game_id": "g", "version": Decimal(2), "sequence": {"5": Decimal(4)}}) == {"user_id": "u", "game_id": "g"}
+    # the body encodes without any Decimal fallback
+    body = json.loads(_http_response(ResponseStatus.OK, view, ApplicationStatus.OK)["body"])
+    assert body == {"message": view, "status": "OK"}
+
+
+def test_large_bodies_are_gzipped_when_accepted():
+    message = {"games": [{"word_length": 5, "guesses": 4, "result": "WON", "hard_mode": "0"}] * 100}
+    plain = _http_response(ResponseStatus.OK, message, ApplicationStatus.OK, event={"headers": {}})
+    assert "isBase64Encoded" not in plain
+    zipped = _http_response(ResponseStatus.OK, message, ApplicationStatus.OK, event={"headers": {"accept-encoding": "gzip, deflate"}})
+    assert zipped["isBase64Encoded"] and zipped["headers"]["Content-Encoding"] == "gzip"
+    assert gzip.decompress(base64.b64decode(zipped["body"])).decode("utf-8") == plain["body"]
+    assert len(zipped["body"]) < len(plain["body"]) / 4
+    small = _http_response(ResponseStatus.OK, "ok", ApplicationStatus.OK, event={"headers": {"Accept-Encoding": "gzip"}})
+    assert "isBase64Encoded" not in small
@@ -0,0 +1,42 @@
+import json
+import aws_cdk as core
+import aws_cdk.assertions as assertions
+from local_dynamodb import _installLocalDynamoDB
+from wordle_runtime import _setResource
+from wordle_cdk.wordle_cdk_stack import WordleCdkStack
+import router
+
+
+def test_routes_to_the_handlers():
+    _installLocalDynamoDB()
+    try:
+        response = router.handler({"resource": "/users", "httpMethod": "POST"}, None)
+        assert response["statusCode"] == 201
+        user_id = json.loads(response["body"])["message"]["user_id"]
+        response = router.handler({"resource": "/users/{user_id}/", "httpMethod": "GET",
+                                   "pathParameters": {"user_id": user_id}}, None)
+        assert json.loads(response["body"])["message"]["user_id"] == user_id
+    finally:
+        _setResource(None)
+
+
+def test_unknown_routes():
+    assert router.handler({"resource": "/users", "httpMethod": "GET"}, None)["statusCode"] == 405
+    assert router.handler({"resource": "/games", "httpMethod": "GET"}, None)["statusCode"] == 404
+
+
+def test_every_route_has_a_handler():
+    for module_name in set(router.ROUTES.values()):
+        assert callable(router._getHandler(module_name))
+
+
+def test_single_function_stack():
+    app = core.App(context={"single_function": "true"})
+    stack = WordleCdkStack(app, "wordle-cdk")
+    template = assertions.Template.from_stack(stack.node.find_child("LambdaStack"))
+    # the router serves every endpoint, next to the scheduled compaction job and the stream aggregator
+    template.resource_count_is("AWS::Lambda::Function", 3)
+    template.has_resource_properties("AWS::Lambda::Function", {"Handler": "router.handler"})
+    template.has_resource_properties("AWS::Lambda::Function", {"Handler": "compactGames.handler"})
+    template.has_resource_properties("AWS::Lambda::Function", {"Handler": "aggregateDifficulty.handler"})
+    template.has_resource_properties("AWS::Lambda::EventSourceMapping", {"BatchSize": 10000, "StartingPosition": "LATEST"})
@@ -0,0 +1,193 @@
+import json
+import pytest
+from botocore.exceptions import ClientError
+from word_artifact import WordArtifact
+from wordle_runtime import _getTable
+import item_cache
+from item_cache import ItemCache
+from history import _getHistory
+from difficulty import _gameEvent
+from single_table import _migrateUsers, GAME
+import createGame
+import deleteGame
+import getGame
+import getHome
+from .helpers import newUser, newGame, play
+
+
+@pytest.fixture
+def dynamodb(dynamodb, monkeypatch):
+    monkeypatch.setenv("STORAGE_LAYOUT", "single")
+    return dynamodb
+
+
+def calls(dynamodb):
+    return [(call.operation, call.table) for call in dynamodb.calls]
+
+
+def test_create_game_writes_the_user_only(dynamodb):
+    user_id = newUser()
+    dynamodb.reset()
+    response = createGame.handler({"pathParameters": {"user_id": user_id},
+                                   "queryStringParameters": {"word_length": "5", "hard_mode": "0"}}, None)
+    game_id = json.loads(response["body"])["message"]["game_id"]
+    assert calls(dynamodb) == [("GetItem", "UserTable"), ("PutItem", "UserTable")]
+    assert dynamodb.tables["GameTable"].items() == []
+    user = _getTable("USER_TABLE").get_item(Key={"user_id": user_id})["Item"]
+    assert user["game_id"] == game_id and user[GAME]["game_id"] == game_id
+    assert "user_id" not in user[GAME] and "expires_at" not in user[GAME]
+
+
+def test_game_requests_read_one_item(dynamodb):
+    user_id, game = newGame()
+    word = next(w for w in WordArtifact().words(5) if w != game["word"])
+    game_id = game["game_id"]
+    path = {"user_id": user_id, "game_id": game_id}
+
+    item_cache._cache = ItemCache()
+    dynamodb.reset()
+    assert getGame.handler({"pathParameters": path}, None)["statusCode"] == 200
+    assert calls(dynamodb) == [("GetItem", "UserTable")]
+
+    item_cache._cache = ItemCache()
+    dynamodb.reset()
+    response = getHome.handler({"queryStringParameters": path, "path": "/v1"}, None)
+    assert response["statusCode"] == 302
+    assert calls(dynamodb) == [("GetItem", "UserTable")]
+
+    item_cache._cache = ItemCache()
+    dynamodb.reset()
+    response = play(user_id, game_id, word)
+    assert response["statusCode"] == 201
+    assert calls(dynamodb) == [("GetItem", "UserTable"), ("UpdateItem", "UserTable")]
+    assert json.loads(response["body"])["message"]["guesses"] == [word]
+
+    # the user written by the guess is cached, so the next request reads nothing
+    dynamodb.reset()
+    assert json.loads(getGame.handler({"pathParameters": path}, None)["body"])["message"]["guesses"] == [word]
+    assert calls(dynamodb) == []
+
+
+def test_other_users_cannot_access_the_game(dynamodb):
+    _, game = newGame()
+    other_id, _ = newGame()
+    response = getGame.handler({"pathParameters": {"user_id": other_id, "game_id": game["game_id"]}}, None)
+    assert response["statusCode"] == 403
+    response = play(other_id, game["game_id"], "crane")
+    assert response["statusCode"] == 403
+
+
+def test_finished_game_is_added_to_the_history(dynamodb):
+    user_id, game = newGame()
+    game_id = game["game_id"]
+    dynamodb.reset()
+    response = play(user_id, game_id, game["word"])
+    assert json.loads(response["body"])["message"]["status"] == "WON"
+    # the user is cached by createGame, so the guess only writes it, with the history in one transaction
+    assert calls(dynamodb)[0] == ("TransactWriteItems", "HistoryTable,UserTable")
+    history = _getHistory(_getTable("HISTORY_TABLE"), user_id)["response"]
+    assert history["games_count"] == 1 and history["games"][0]["result"] == "WON"
+    assert _getTable("HISTORY_TABLE").get_item(Key={"user_id": user_id})["Item"]["wins"] == 1
+
+    # the next game replaces the finished one in the user item
+    next_game_id = newGame(user_id)[1]["game_id"]
+    user = _getTable("USER_TABLE").get_item(Key={"user_id": user_id})["Item"]
+    assert next_game_id != game_id and user[GAME]["game_id"] == next_game_id
+    assert _getHistory(_getTable("HISTORY_TABLE"), user_id)["response"]["games_count"] == 1
+
+
+def test_game_does_not_end_without_its_history(dynamodb, monkeypatch):
+    user_id, game = newGame()
+    history = dynamodb.tables["HistoryTable"]
+    update_item = history.update_item
+    failures = [ClientError({"Error": {"Code": "ProvisionedThroughputExceededException", "Message": "injected"}},
+                            "UpdateItem")]
+
+    def update(**kwargs):
+        if failures:
+            raise failures.pop()
+        return update_item(**kwargs)
+
+    monkeypatch.setattr(history, "update_item", update)
+    assert play(user_id, game["game_id"], game["word"])["statusCode"] == 500
+    # the game is still in progress, so a new game cannot replace it before it is recorded
+    user = _getTable("USER_TABLE").get_item(Key={"user_id": user_id})["Item"]
+    assert user[GAME]["status"] == "IN_PROGRESS" and user[GAME]["guesses"] == []
+    assert _getHistory(_getTable("HISTORY_TABLE"), user_id)["response"]["games_count"] == 0
+
+    response = play(user_id, game["game_id"], game["word"])
+    assert json.loads(response["body"])["message"]["status"] == "WON"
+    assert _getHistory(_getTable("HISTORY_TABLE"), user_id)["response"]["games_count"] == 1
+
+
+def test_create_game_rejects_an_active_game(dynamodb):
+    user_id, _ = newGame()
+    response = createGame.handler({"pathParameters": {"user_id": user_id},
+                                   "queryStringParameters": {"word_length": "5", "hard_mode": "0"}}, None)
+    assert response["statusCode"] == 403
+
+
+def test_delete_game_removes_it_from_the_user(dynamodb):
+    user_id, game = newGame()
+    response = deleteGame.handler({"pathParameters": {"user_id": user_id, "game_id": game["game_id"]}}, None)
+    assert response["statusCode"] == 200
+    user = _getTable("USER_TABLE").get_item(Key={"user_id": user_id})["Item"]
+    assert user["game_id"] == "" and GAME not in user
+
+
+def test_users_of_the_tables_layout_are_migrated_when_read(dynamodb, monkeypatch):
+    monkeypatch.setenv("STORAGE_LAYOUT", "tables")
+    user_id, game = newGame()
+    game_id = game["game_id"]
+    word = next(w for w in WordArtifact().words(5) if w != game["word"])
+    play(user_id, game_id, word)
+
+    monkeypatch.setenv("STORAGE_LAYOUT", "single")
+    item_cache._cache = ItemCache()
+    response = getGame.handler({"pathParameters": {"user_id": user_id, "game_id": game_id}}, None)
+    assert json.loads(response["body"])["message"]["guesses"] == [word]
+    assert dynamodb.tables["GameTable"].items() == []
+    user = _getTable("USER_TABLE").get_item(Key={"user_id": user_id})["Item"]
+    assert user[GAME]["guesses"] == [word] and user[GAME]["attempts_left"] == "5"
+
+    # the migrated game is played in the single table layout
+    dynamodb.reset()
+    assert play(user_id, game_id, word)["statusCode"] == 201
+    assert calls(dynamodb) == [("UpdateItem", "UserTable")]
+
+
+def test_migrate_users(dynamodb, monkeypatch):
+    monkeypatch.setenv("STORAGE_LAYOUT", "tables")
+    finished_id, finished = newGame()
+    play(finished_id, finished["game_id"], finished["word"])
+    playing_id, _ = newGame()
+    newUser()
+
+    monkeypatch.setenv("STORAGE_LAYOUT", "single")
+    stats = _migrateUsers(_getTable("USER_TABLE"), _getTable("GAME_TABLE"), _getTable("HISTORY_TABLE"))
+    assert stats == {"scanned": 3, "migrated": 2, "failed": 0, "skipped": 1}
+    assert dynamodb.tables["GameTable"].items() == []
+    # the statistics of the finished game were recorded when it ended, the migration adds it to the history
+    history = _getHistory(_getTable("HISTORY_TABLE"), finished_id)["response"]
+    assert history["games_count"] == 1 and history["games"][0]["result"] == "WON"
+    assert _getHistory(_getTable("HISTORY_TABLE"), playing_id)["response"]["games_count"] == 0
+
+    # running it again changes nothing
+    stats = _migrateUsers(_getTable("USER_TABLE"), _getTable("GAME_TABLE"), _getTable("HISTORY_TABLE"))
+    assert stats == {"scanned": 3, "migrated": 0, "failed": 0, "skipped": 3}
+
+
+def test_user_stream_records_are_game_endings():
+    def image(game_id, status):
+        return {"user_id": {"S": "u"}, "game_id": {"S": game_id}, GAME: {"M": {
+            "game_id": {"S": game_id}, "word": {"S": "crane"}, "word_length": {"S": "5"},
+            "attempts_left": {"S": "3"}, "status": {"S": status}}}}
+
+    def record(old, new):
+        return {"eventName": "MODIFY", "dynamodb": {"OldImage": old, "NewImage": new}}
+
+    assert _gameEvent(record(image("g", "IN_PROGRESS"), image("g", "WON"))) == {"word": "crane", "status": "WON", "guesses": 3}
+    assert _gameEvent(record(image("g", "IN_PROGRESS"), image("g", "IN_PROGRESS"))) is None
+    # a new game replacing a finished one, and the migration of a finished game
+    assert _gameEvent(record(image("g", "WON"), image("h", "IN_PROGRESS"))) is None
+    assert _gameEvent(record({"user_id": {"S": "u"}, "game_id": {"S": "g"}}, image("g", "LOST"))) is None
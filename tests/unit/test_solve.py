@@ -0,0 +1,32 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+import patterns
+import solve
+from guess import getGuessResponse
+
+WORDS = ["crane", "slate", "eerie", "geese", "raise", "crate", "drain", "trace", "react", "cater", "speed", "sheep"]
+
+
+def test_game_scores_like_the_handlers():
+    game = solve.WordleGame(5, "geese")
+    colours = {3: "GREY", 1: "YELLOW", 2: "GREEN"}
+    for word in ["eerie", "speed", "sheep"]:
+        assert [colours[status] for _, status in game.getRes(word, "geese")] == getGuessResponse(word, "geese")
+
+
+@pytest.mark.parametrize("hard_mode", [False, True])
+def test_solver_finds_every_target(hard_mode):
+    matrix = patterns.patternMatrix(WORDS, WORDS)
+    solver = solve.Solver(WORDS, matrix, hard_mode=hard_mode)
+    for target in range(len(WORDS)):
+        assert solver.solve(target) is not None
+
+
+def test_hard_mode_only_guesses_candidates():
+    matrix = patterns.patternMatrix(WORDS, WORDS)
+    solver = solve.Solver(WORDS, matrix, hard_mode=True)
+    candidates = np.arange(len(WORDS))
+    code = matrix[solver.nextGuess(candidates), WORDS.index("react")]
+    candidates = candidates[matrix[solver.nextGuess(candidates), candidates] == code]
+    assert solver.nextGuess(candidates, (int(code),)) in candidates
@@ -0,0 +1,35 @@
+from botocore.exceptions import ClientError
+from wordle_utils import _updateItem, ResponseStatus, ApplicationStatus
+
+
+class ConditionalTable:
+    table_name = "GameTable"
+
+    def __init__(self, item):
+        self.item = item
+
+    def update_item(self, **kwargs):
+        values = kwargs["ExpressionAttributeValues"]
+        if self.item["attempts_left"] != values[":read_attempts_left"]:
+            raise ClientError({"Error": {"Code": "ConditionalCheckFailedException", "Message": "failed"}}, "UpdateItem")
+        self.item["attempts_left"] = values[":attempts_left"]
+        return {"Attributes": dict(self.item)}
+
+
+def update(table, read_attempts_left):
+    return _updateItem(
+        table, {"game_id": "g"}, "SET attempts_left = :attempts_left",
+        {":attempts_left": str(int(read_attempts_left) - 1), ":read_attempts_left": read_attempts_left},
+        condition_expression="attempts_left = :read_attempts_left",
+    )
+
+
+def test_second_write_from_the_same_read_conflicts():
+    table = ConditionalTable({"game_id": "g", "attempts_left": "6"})
+    first = update(table, "6")
+    assert first["success"] and first["response"]["attempts_left"] == "5"
+    second = update(table, "6")
+    assert not second["success"]
+    assert second["status"] == ResponseStatus.CONFLICT
+    assert second["application_status"] == ApplicationStatus.CONFLICT
+    assert table.item["attempts_left"] == "5"
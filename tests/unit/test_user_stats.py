@@ -0,0 +1,45 @@
+import json
+from word_artifact import WordArtifact
+import getStats
+import guessBatch
+from .helpers import newUser, newGame, play
+
+
+def playGame(user_id, wrong_guesses, win=True):
+    _, game = newGame(user_id)
+    wrong = next(w for w in WordArtifact().words(5) if w != game["word"])
+    for word in [wrong] * wrong_guesses + ([game["word"]] if win else []):
+        play(user_id, game["game_id"], word)
+
+
+def stats(user_id):
+    return json.loads(getStats.handler({"pathParameters": {"user_id": user_id}}, None)["body"])["message"]
+
+
+def test_counters_follow_finished_games(dynamodb):
+    user_id = newUser()
+    assert stats(user_id)["played"] == 0
+    playGame(user_id, 0)
+    playGame(user_id, 2)
+    playGame(user_id, 6, win=False)
+    playGame(user_id, 2)
+    dynamodb.reset()
+    body = stats(user_id)
+    assert dynamodb.summary()["operations"] == {"GetItem": 1}
+    assert (body["played"], body["wins"], body["streak"], body["max_streak"]) == (4, 3, 1, 2)
+    assert body["distribution"]["5"] == {"1": 1, "2": 0, "3": 2, "4": 0, "5": 0, "6": 0, "X": 1}
+    assert body["distribution"]["8"]["9"] == 0
+
+
+def test_stats_writes_only_when_the_game_ends(dynamodb):
+    user_id, game = newGame()
+    wrong = next(w for w in WordArtifact().words(5) if w != game["word"])
+    dynamodb.reset()
+    guessBatch.handler({"pathParameters": {"user_id": user_id, "game_id": game["game_id"]},
+                        "body": json.dumps({"guesses": [wrong]})}, None)
+    assert dynamodb.callCount(table_name="HistoryTable") == 0
+    guessBatch.handler({"pathParameters": {"user_id": user_id, "game_id": game["game_id"]},
+                        "body": json.dumps({"guesses": [game["word"]]})}, None)
+    # the first win also sets the maximum streak
+    assert dynamodb.callCount("UpdateItem", "HistoryTable") == 2
+    assert stats(user_id)["distribution"]["5"]["2"] == 1
@@ -0,0 +1,47 @@
+import pytest
+from compile_words import normalize, compileWords
+from word_artifact import WordArtifact, ArtifactError, _writeArtifact
+
+
+def compile(path, lines, previous=None):
+    version, words_by_length, generations = compileWords(normalize(lines), previous)
+    _writeArtifact(str(path), words_by_length, version, generations)
+    return WordArtifact(str(path))
+
+
+def test_compiler_normalizes_and_filters(tmp_path):
+    artifact = compile(tmp_path / "words.bin", ["Crane", "slate", "crane", "abc", "toolongword", "d-o-g-s", "abroad", "naïve"])
+    assert artifact.version == 1
+    assert artifact.lengths() == [5, 6]
+    assert list(artifact.words(5)) == ["crane", "slate"]
+    assert artifact.ordinal("slate") == 1
+    assert "abroad" in artifact
+    assert "abrupt" not in artifact and "cran" not in artifact and "naïve" not in artifact
+
+
+def test_recompile_keeps_ordinals_and_records_generations(tmp_path):
+    first = compile(tmp_path / "v1.bin", ["slate", "crane"])
+    second = compile(tmp_path / "v2.bin", ["adieu", "crane", "pious"], previous=first)
+    assert second.version == 2
+    assert list(second.words(5)) == ["slate", "crane", "adieu", "pious"]
+    assert second.generations(5) == [2, 4]
+    assert [second.ordinal(w) for w in ["adieu", "crane", "pious", "slate"]] == [2, 1, 3, 0]
+
+
+def test_corrupt_artifact_is_rejected(tmp_path):
+    path = tmp_path / "words.bin"
+    compile(path, ["crane", "slate"])
+    data = bytearray(path.read_bytes())
+    data[-1] ^= 0xff
+    path.write_bytes(bytes(data))
+    with pytest.raises(ArtifactError):
+        WordArtifact(str(path))
+
+
+def test_shipped_artifact_is_valid():
+    artifact = WordArtifact()
+    assert artifact.lengths() == [5, 6, 7, 8]
+    for word_length in artifact.lengths():
+        words = list(artifact.words(word_length))
+        assert len(words) == len(set(words)) == artifact.count(word_length)
+        assert all(artifact.ordinal(w) == i for i, w in enumerate(words))
@@ -0,0 +1,60 @@
+import word_index
+from word_index import WordIndex, _isDictionaryWord
+
+
+class PagedWordTable:
+    """Minimal word table that returns one word per query page."""
+    table_name = "WordTable"
+
+    def __init__(self, words):
+        self.words = sorted(words)
+        self.queries = 0
+        self.get_items = 0
+
+    def query(self, **kwargs):
+        self.queries += 1
+        start = kwargs.get("ExclusiveStartKey", {}).get("idx", -1) + 1
+        length = kwargs["ExpressionAttributeValues"][":partition"]
+        words = [w for w in self.words if len(w) == length]
+        response = {"Items": [{"word": w} for w in words[start:start + 1]]}
+        if start + 1 < len(words):
+            response["LastEvaluatedKey"] = {"idx": start}
+        return response
+
+    def get_item(self, Key):
+        self.get_items += 1
+        if Key["word"] in self.words:
+            return {"Item": dict(Key)}
+        return {}
+
+
+def test_word_index_membership():
+    index = WordIndex(5, ["crane", "SLATE", "adieu", "crane", "toolong"])
+    assert len(index) == 3
+    assert index.nbytes == 15
+    assert "crane" in index and "slate" in index and "adieu" in index
+    assert "cranf" not in index
+    assert "cran" not in index
+    assert "crané" not in index
+    assert [index.word(i) for i in range(len(index))] == ["adieu", "crane", "slate"]
+
+
+def test_index_loads_every_page_once(monkeypatch):
+    monkeypatch.setattr(word_index, "_indexes", {})
+    monkeypatch.setenv("WORD_LOOKUP", "index")
+    table = PagedWordTable(["crane", "slate", "adieu", "abroad"])
+    assert _isDictionaryWord(table, "slate")
+    assert not _isDictionaryWord(table, "slatf")
+    assert _isDictionaryWord(table, "abroad")
+    assert table.queries == 4  # 3 pages of 5 letter words, 1 page of 6 letter words
+    assert table.get_items == 0
+
+
+def test_table_lookup_fallback(monkeypatch):
+    monkeypatch.setattr(word_index, "_indexes", {})
+    monkeypatch.setenv("WORD_LOOKUP", "table")
+    table = PagedWordTable(["crane"])
+    assert _isDictionaryWord(table, "crane")
+    assert not _isDictionaryWord(table, "slate")
+    assert table.queries == 0
+    assert table.get_items == 2
@@ -0,0 +1,66 @@
+import itertools
+import threading
+import types
+import word_loader
+from word_loader import BulkLoader, FileCheckpoint, _wordItems, _loadWords
+
+
+class FlakyBatchTable:
+    """Word table whose BatchWriteItem leaves the last request of every other call unprocessed."""
+    table_name = "WordTable"
+
+    def __init__(self):
+        self.items = {}
+        self.calls = 0
+        self.lock = threading.Lock()
+        self.meta = types.SimpleNamespace(client=self)
+
+    def batch_write_item(self, RequestItems):
+        requests = RequestItems[self.table_name]
+        with self.lock:
+            self.calls += 1
+            unprocessed = requests[-1:] if self.calls % 2 == 0 else []
+        for request in requests[:len(requests) - len(unprocessed)]:
+            item = request["PutRequest"]["Item"]
+            self.items[(item["word_length"], item["word"])] = item
+        return {"UnprocessedItems": {self.table_name: unprocessed} if unprocessed else {}}
+
+
+def test_word_items_normalize_and_number_words():
+    items = list(_wordItems(["Crane", "slate", "crane", "abc", "toolongword", "d-o-g-s", "abroad"]))
+    assert items == [
+        {"word_length": 5, "word": "crane", "ordinal": 0},
+        {"word_length": 5, "word": "slate", "ordinal": 1},
+        {"word_length": 6, "word": "abroad", "ordinal": 0},
+        {"word_length": 0, "word": "5", "count": 2},
+        {"word_length": 0, "word": "6", "count": 1},
+    ]
+
+
+def test_loader_retries_unprocessed_items(monkeypatch):
+    monkeypatch.setattr(word_loader, "BACKOFF_BASE", 0.0001)
+    words = ["".join(letters) for letters in itertools.product("abcdefghij", repeat=5)][:1000]
+    table = FlakyBatchTable()
+    stats = _loadWords(table, words, workers=4)
+    assert stats["complete"]
+    assert stats["items_written"] == 1001
+    assert stats["retries"] > 0
+    assert len(table.items) == 1001
+    assert table.items[(0, "5")]["count"] == 1000
+
+
+def test_loader_resumes_from_checkpoint(tmp_path, monkeypatch):
+    monkeypatch.setattr(word_loader, "BACKOFF_BASE", 0.0001)
+    items = [{"word_length": 5, "word": str(i), "ordinal": i} for i in range(100)]
+    checkpoint = FileCheckpoint(str(tmp_path / "checkpoint.json"))
+    table = FlakyBatchTable()
+    stopped = BulkLoader(table, workers=2, checkpoint=checkpoint).load(iter(items), deadline=0)
+    assert not stopped["complete"]
+    assert checkpoint.load() == 0
+
+    checkpoint.save(2)
+    resumed = BulkLoader(table, workers=2, checkpoint=checkpoint).load(iter(items))
+    assert resumed["complete"]
+    assert resumed["items_written"] == 50
+    assert sorted(int(word) for _, word in table.items) == list(range(50, 100))
+    assert checkpoint.load() == 0
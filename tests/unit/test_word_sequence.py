@@ -0,0 +1,85 @@
+import json
+from word_artifact import WordArtifact
+from wordle_runtime import _getTable
+from word_sequence import _permute, _sequenceOrdinal, _sequenceKey, _nextSequenceWord, SEQUENCE
+import guessBatch
+from .helpers import newUser, newGame
+
+
+class GrowingDictionary:
+    """
+    The generations and words of one length of an artifact, the word of an ordinal being the ordinal.
+    """
+
+    def __init__(self, generations):
+        self.generations_ = generations
+
+    def generations(self, word_length):
+        return self.generations_
+
+    def word(self, word_length, ordinal):
+        return ordinal
+
+
+def test_permutation_is_a_bijection():
+    for size in [1, 2, 3, 5, 16, 17, 1000, 1379]:
+        key = _sequenceKey("user", 5, 0, 0)
+        assert sorted(_permute(index, size, key) for index in range(size)) == list(range(size))
+
+
+def test_sequences_differ_between_users():
+    generations = [1379]
+    first = [_sequenceOrdinal("alice", 5, n, generations) for n in range(20)]
+    second = [_sequenceOrdinal("bob", 5, n, generations) for n in range(20)]
+    assert first != second
+    assert first != sorted(first)
+
+
+def test_words_do_not_repeat_until_exhausted():
+    generations = [300, 450]
+    ordinals = [_sequenceOrdinal("alice", 6, n, generations) for n in range(450)]
+    assert sorted(ordinals) == list(range(450))
+    # the first generation is played before the words added later
+    assert sorted(ordinals[:300]) == list(range(300))
+    # then the sequence starts over, shuffled differently
+    again = [_sequenceOrdinal("alice", 6, n, generations, cycle=1) for n in range(450)]
+    assert sorted(again) == list(range(450)) and again != ordinals
+
+
+def test_dictionary_growth_keeps_played_words():
+    before = [_sequenceOrdinal("alice", 5, n, [300]) for n in range(120)]
+    after = [_sequenceOrdinal("alice", 5, n, [300, 340]) for n in range(340)]
+    assert after[:120] == before
+    assert sorted(after) == list(range(340))
+
+
+def test_dictionary_growth_in_a_later_cycle_does_not_repeat():
+    dictionary = GrowingDictionary([300])
+    user = {"user_id": "alice"}
+    first = [_nextSequenceWord(dictionary, user, 5) for _ in range(300)]
+    second = [_nextSequenceWord(dictionary, user, 5) for _ in range(120)]
+    assert sorted(first) == list(range(300)) and len(set(second)) == 120
+    # the second cycle started with 300 words, and covers the 40 added in its middle
+    dictionary.generations_ = [300, 340]
+    second += [_nextSequenceWord(dictionary, user, 5) for _ in range(220)]
+    assert sorted(second) == list(range(340))
+    assert user[SEQUENCE] == {"5": 640, "5/cycle": [1, 300]}
+    assert _nextSequenceWord(dictionary, user, 5) in second and user[SEQUENCE]["5/cycle"] == [2, 640]
+
+
+def test_create_game_follows_the_sequence(dynamodb):
+    user_id = newUser()
+    artifact = WordArtifact()
+    words = []
+    for n in range(3):
+        dynamodb.reset()
+        _, game = newGame(user_id)
+        # the word is picked without reading the word table
+        assert "WordTable" not in [call.table for call in dynamodb.calls]
+        words.append(game["word"])
+        guessBatch.handler({"pathParameters": {"user_id": user_id, "game_id": game["game_id"]},
+                            "body": json.dumps({"guesses": [game["word"]]})}, None)
+    expected = [artifact.word(5, _sequenceOrdinal(user_id, 5, n, artifact.generations(5))) for n in range(3)]
+    assert words == expected
+    user = _getTable("USER_TABLE").get_item(Key={"user_id": user_id})["Item"]
+    assert user[SEQUENCE] == {"5": 3, "5/cycle": [0, 0]}
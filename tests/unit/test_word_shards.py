@@ -0,0 +1,89 @@
+import collections
+import pytest
+import word_index
+import word_shards
+from local_dynamodb import _installLocalDynamoDB
+from word_index import _isDictionaryWord
+from word_loader import _loadWords
+from word_shards import WordLayout, _getRandomWord
+from wordle_runtime import _getTable, _setResource
+
+WORDS = ["crane", "slate", "adieu", "pious", "pilot", "ghost", "fjord", "mimic", "abroad", "zephyr"]
+
+
+@pytest.fixture
+def dynamodb(monkeypatch):
+    monkeypatch.setenv("WORD_SHARDS", "4")
+    monkeypatch.setattr(word_shards, "_shard_counts", {})
+    monkeypatch.setattr(word_index, "_indexes", {})
+    dynamodb = _installLocalDynamoDB()
+    yield dynamodb
+    _setResource(None)
+
+
+def test_layout_keys():
+    layout = WordLayout(4)
+    assert layout.partition("crane") == "5#{}".format(layout.shard("crane"))
+    assert layout.shard("crane") == WordLayout(4).shard("crane")
+    assert layout.partitions(5) == ["5#0", "5#1", "5#2", "5#3"]
+    assert layout.key("crane") == {"word_shard": layout.partition("crane"), "word": "crane"}
+    assert layout.metadataKey("5#1") == {"word_shard": "0", "word": "5#1"}
+    unsharded = WordLayout(0)
+    assert unsharded.key("crane") == {"word_length": 5, "word": "crane"}
+    assert unsharded.partitions(5) == [5] and unsharded.metadataKey("5") == {"word_length": 0, "word": "5"}
+
+
+def test_sharded_load_numbers_every_shard(dynamodb):
+    table = _getTable("WORD_TABLE")
+    stats = _loadWords(table, WORDS)
+    assert stats["complete"] and stats["items_written"] == len(WORDS) + 2
+    layout = WordLayout(4)
+    ordinals = collections.defaultdict(list)
+    counts = {}
+    for item in table.items():
+        if item["word_shard"] == "0":
+            assert int(item["count"]) == sum(item["shard_counts"])
+            counts.update(zip(layout.partitions(int(item["word"])), map(int, item["shard_counts"])))
+        else:
+            assert item["word_shard"] == layout.partition(item["word"])
+            ordinals[item["word_shard"]].append(int(item["ordinal"]))
+    # every shard has a count, empty shards included, and dense ordinals
+    assert sorted(counts) == layout.partitions(5) + layout.partitions(6) and len(ordinals) > 1
+    assert dict((partition, sorted(found)) for partition, found in ordinals.items()) == \
+        dict((partition, list(range(count))) for partition, count in counts.items() if count)
+
+
+def test_random_word_reads_counts_once(dynamodb):
+    table = _getTable("WORD_TABLE")
+    _loadWords(table, WORDS)
+    dynamodb.reset()
+    seen = collections.Counter()
+    for _ in range(400):
+        reply = _getRandomWord(table, 5)
+        assert reply["success"]
+        seen[reply["response"]["word"]] += 1
+    assert set(seen) == set(word for word in WORDS if len(word) == 5)
+    assert dynamodb.callCount("GetItem") == 1 and dynamodb.callCount("Query") == 400
+    assert not _getRandomWord(table, 7)["success"]
+
+
+def test_random_word_without_counts_queries_every_shard(dynamodb):
+    table = _getTable("WORD_TABLE")
+    layout = WordLayout(4)
+    for word in WORDS:
+        table.put_item(Item=dict(layout.key(word)))
+    dynamodb.reset()
+    assert _getRandomWord(table, 6)["response"]["word"] in ("abroad", "zephyr")
+    assert dynamodb.callCount("Query") == 4
+
+
+def test_sharded_lookups(dynamodb, monkeypatch):
+    table = _getTable("WORD_TABLE")
+    _loadWords(table, WORDS)
+    for mode in ("index", "table"):
+        monkeypatch.setenv("WORD_LOOKUP", mode)
+        assert all(_isDictionaryWord(table, word) for word in WORDS)
+        assert not _isDictionaryWord(table, "cranf")
+    dynamodb.reset()
+    _isDictionaryWord(table, "crane")
+    assert dynamodb.summary()["operations"] == {"GetItem": 1}
@@ -0,0 +1,102 @@
+import pytest
+from word_artifact import WordArtifact
+from wordle_runtime import _getTable
+import word_tiers
+from word_tiers import WordTiers, TIERS, _splitTiers, _getWordTiers
+from word_sequence import _nextTierWord, SEQUENCE
+import createGame
+from .helpers import newUser, newGame
+
+
+def test_tiers_split_by_score():
+    tiers = _splitTiers([0.9, 0.1, 0.5, 0.5, 0.2, 0.8, 0.3])
+    assert tiers == [[1, 4], [6, 2], [3, 5, 0]]
+
+
+def test_tier_index_round_trip():
+    tiers = {5: [[3, 1], [0], [2, 4]], 6: [[], [7], [5, 6]]}
+    index = WordTiers(WordTiers.encode(3, tiers))
+    assert index.version == 3
+    assert index.lengths() == [5, 6]
+    for word_length, ordinals in tiers.items():
+        assert [index.ordinals(word_length, tier) for tier in TIERS] == ordinals
+    assert index.count(6, "easy") == 0 and index.count(9, "easy") == 0
+    with pytest.raises(IndexError):
+        index.ordinal(5, "medium", 1)
+    with pytest.raises(ValueError):
+        WordTiers(b"WRDL" + bytes(9))
+
+
+def test_tier_sequence_plays_every_word_once():
+    artifact = WordArtifact()
+    tiers = WordTiers(WordTiers.encode(artifact.version, {5: [list(range(0, 40)), list(range(40, 90)), list(range(90, 100))]}))
+    user = {"user_id": "alice"}
+    words = [_nextTierWord(artifact, tiers, user, 5, "hard") for _ in range(10)]
+    assert sorted(words) == sorted(artifact.word(5, ordinal) for ordinal in range(90, 100))
+    assert user[SEQUENCE] == {"5:hard": 10, "5:hard/cycle": [0, 0], "5:hard/build": tiers.build}
+    # the next cycle is shuffled again
+    assert _nextTierWord(artifact, tiers, user, 5, "hard") in words
+
+
+def test_rebuilt_index_restarts_the_tier_sequence():
+    artifact = WordArtifact()
+    tiers = WordTiers(WordTiers.encode(artifact.version, {5: [list(range(0, 40)), list(range(40, 90)), list(range(90, 100))]}))
+    # scored again, the same artifact version reshuffles the words between the tiers
+    rescored = WordTiers(WordTiers.encode(artifact.version, {5: [list(range(10, 50)), list(range(50, 100)), list(range(0, 10))]}))
+    assert rescored.version == tiers.version and rescored.build != tiers.build
+    user = {"user_id": "alice"}
+    for _ in range(4):
+        _nextTierWord(artifact, tiers, user, 5, "hard")
+    words = [_nextTierWord(artifact, rescored, user, 5, "hard") for _ in range(10)]
+    assert sorted(words) == sorted(artifact.word(5, ordinal) for ordinal in range(0, 10))
+    assert user[SEQUENCE] == {"5:hard": 10, "5:hard/cycle": [0, 0], "5:hard/build": rescored.build}
+
+
+def test_shipped_index_covers_the_artifact():
+    artifact = WordArtifact()
+    index = _getWordTiers()
+    assert index.version <= artifact.version
+    for word_length in artifact.lengths():
+        ordinals = [ordinal for tier in TIERS for ordinal in index.ordinals(word_length, tier)]
+        assert sorted(ordinals) == list(range(artifact.count(word_length)))
+
+
+def test_create_game_picks_from_the_tier(dynamodb):
+    user_id, game = newGame(difficulty="easy")
+    assert game["difficulty"] == "easy"
+    assert WordArtifact().ordinal(game["word"]) in _getWordTiers().ordinals(5, "easy")
+    assert _getTable("USER_TABLE").get_item(Key={"user_id": user_id})["Item"][SEQUENCE] == {
+        "5:easy": 1, "5:easy/cycle": [0, 0], "5:easy/build": _getWordTiers().build}
+
+
+def test_create_game_rejects_unknown_difficulties(dynamodb):
+    response = createGame.handler({"pathParameters": {"user_id": newUser()},
+                                   "queryStringParameters": {"word_length": "5", "hard_mode": "0", "difficulty": "impossible"}}, None)
+    assert response["statusCode"] == 400
+
+
+def test_create_game_ignores_the_difficulty_without_index(dynamodb, monkeypatch):
+    monkeypatch.setattr(word_tiers, "_tiers", None)
+    monkeypatch.setenv("WORD_TIERS", "/nonexistent/word_tiers.bin")
+    user_id, game = newGame(difficulty="hard")
+    assert "difficulty" not in game
+    assert _getTable("USER_TABLE").get_item(Key={"user_id": user_id})["Item"][SEQUENCE] == {"5": 1, "5/cycle": [0, 0]}
+
+
+def test_shipped_index_keeps_proper_nouns_out_of_the_easy_tier():
+    artifact = WordArtifact()
+    easy = set(artifact.word(5, ordinal) for ordinal in _getWordTiers().ordinals(5, "easy"))
+    assert "aaron" not in easy and "alice" not in easy
+
+
+def test_scores_mix_commonness_and_solve_length():
+    pytest.importorskip("numpy")
+    import patterns
+    import score_words
+    words = ["crane", "slate", "eerie", "geese", "raise", "crate", "drain", "trace", "react", "cater", "speed", "sheep"]
+    lengths = score_words.casualSolveLengths(words, patterns.patternMatrix(words, words), runs=4)
+    assert all(1 <= length <= len(words[0]) + 2 for length in lengths)
+    # the most common and quickest word is the easiest, the rarest and slowest the hardest
+    scores = score_words.scoreWords(words, commonness=list(range(12, 0, -1)), solve_lengths=list(range(12)))
+    assert scores[0] == 0 and scores[-1] == 1
+    assert score_words.scoreWords(words, [1] * 12, list(range(12)), weight=1.0) == [0.5] * 12
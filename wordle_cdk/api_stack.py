@@ -16,8 +16,12 @@ class APIStack(Stack):
         create_game_lambda = lambda_functions['create_game']
         get_game_lambda = lambda_functions['get_game']
         get_user_lambda = lambda_functions['get_user']
+        get_history_lambda = lambda_functions['get_history']
+        get_stats_lambda = lambda_functions['get_stats']
         delete_game_lambda = lambda_functions['delete_game']
         guess_lambda = lambda_functions['guess']
+        guess_batch_lambda = lambda_functions['guess_batch']
+        get_hint_lambda = lambda_functions['get_hint']
         populate_words_lambda = lambda_functions['populate_words']
 
 
@@ -30,7 +34,10 @@ class APIStack(Stack):
             deploy_options={
                 "stage_name": "v1"
             },
-            endpoint_types=[apigw.EndpointType.REGIONAL]
+            endpoint_types=[apigw.EndpointType.REGIONAL],
+            # Lets the functions return gzipped, base64 encoded bodies (see lambda/response_encoder.py).
+            # Request bodies then reach the functions base64 encoded as well, handlers read them through wordle_utils._requestBody
+            binary_media_types=["*/*"]
         )
 
 
@@ -59,6 +66,20 @@ class APIStack(Stack):
         get_user_integration = apigw.LambdaIntegration(get_user_lambda)
         user_resource.add_method("GET", get_user_integration)
 
+        # Create the `/users/{user_id}/history` resource
+        history_resource = user_resource.add_resource("history")
+
+        # Add a GET method to the `/users/{user_id}/history` resource and connect it to the getHistory Lambda function
+        get_history_integration = apigw.LambdaIntegration(get_history_lambda)
+        history_resource.add_method("GET", get_history_integration)
+
+        # Create the `/users/{user_id}/stats` resource
+        stats_resource = user_resource.add_resource("stats")
+
+        # Add a GET method to the `/users/{user_id}/stats` resource and connect it to the getStats Lambda function
+        get_stats_integration = apigw.LambdaIntegration(get_stats_lambda)
+        stats_resource.add_method("GET", get_stats_integration)
+
         # Create the `/users/{user_id}/games` resource
         users_games_resource = user_resource.add_resource("games")
 
@@ -82,4 +103,18 @@ class APIStack(Stack):
 
         # Add a POST method to the `/users/{user_id}/games/{game_id}/guess` resource and connect it to the guess Lambda function
         guess_integration = apigw.LambdaIntegration(guess_lambda)
-        guess_resource.add_method("POST", guess_integration)
\ No newline at end of file
+        guess_resource.add_method("POST", guess_integration)
+
+        # Create the `/users/{user_id}/games/{game_id}/guesses` resource
+        guesses_resource = games_resource.add_resource("guesses")
+
+        # Add a POST method to the `/users/{user_id}/games/{game_id}/guesses` resource and connect it to the guessBatch Lambda function
+        guess_batch_integration = apigw.LambdaIntegration(guess_batch_lambda)
+        guesses_resource.add_method("POST", guess_batch_integration)
+
+        # Create the `/users/{user_id}/games/{game_id}/hint` resource
+        hint_resource = games_resource.add_resource("hint")
+
+        # Add a GET method to the `/users/{user_id}/games/{game_id}/hint` resource and connect it to the getHint Lambda function
+        get_hint_integration = apigw.LambdaIntegration(get_hint_lambda)
+        hint_resource.add_method("GET", get_hint_integration)
@@ -8,7 +8,7 @@ from aws_cdk import (
 
 class DBStack(Stack):
 
-    def __init__(self, scope: Construct, construct_id: str, **kwargs) -> None:
+    def __init__(self, scope: Construct, construct_id: str, word_shards: int = 0, storage_layout: str = "tables", **kwargs) -> None:
         super().__init__(scope, construct_id, **kwargs)
 
         # Create the DynamoDB game table
@@ -16,27 +16,67 @@ class DBStack(Stack):
             self,
             "GameTable",
             partition_key=dynamodb.Attribute(name="game_id", type=dynamodb.AttributeType.STRING),
+            time_to_live_attribute="expires_at",
+            # the stream feeds the game endings to the difficulty aggregator
+            stream=dynamodb.StreamViewType.NEW_AND_OLD_IMAGES,
             removal_policy=core.RemovalPolicy.DESTROY
         )
 
-        # Create the DynamoDB user table
+        # Create the DynamoDB user table. In the single table layout it holds the active games (see lambda/single_table.py),
+        # and its stream feeds the game endings to the difficulty aggregator
         userTable = dynamodb.Table(
             self,
             "UserTable",
             partition_key=dynamodb.Attribute(name="user_id", type=dynamodb.AttributeType.STRING),
+            stream=dynamodb.StreamViewType.NEW_AND_OLD_IMAGES if storage_layout == "single" else None,
             removal_policy=core.RemovalPolicy.DESTROY
         )
 
-        # Create the DynamoDB words table
+        # Create the DynamoDB words table. With word_shards the words of each length are spread over that many
+        # "length#shard" partitions instead of one word_length partition, see lambda/word_shards.py
+        if word_shards:
+            word_partition_key = dynamodb.Attribute(name="word_shard", type=dynamodb.AttributeType.STRING)
+        else:
+            word_partition_key = dynamodb.Attribute(name="word_length", type=dynamodb.AttributeType.NUMBER)
         wordTable = dynamodb.Table(
             self,
             "WordTable",
-            partition_key=dynamodb.Attribute(name="word_length", type=dynamodb.AttributeType.NUMBER),
+            partition_key=word_partition_key,
             sort_key=dynamodb.Attribute(name="word", type=dynamodb.AttributeType.STRING),
             removal_policy=core.RemovalPolicy.DESTROY
         )
 
+        # Create the DynamoDB history table, holding the finished games of each user packed by the compaction job
+        historyTable = dynamodb.Table(
+            self,
+            "HistoryTable",
+            partition_key=dynamodb.Attribute(name="user_id", type=dynamodb.AttributeType.STRING),
+            removal_policy=core.RemovalPolicy.DESTROY
+        )
+
+        # Create the DynamoDB difficulty table, holding sharded per-word counters of finished games
+        difficultyTable = dynamodb.Table(
+            self,
+            "DifficultyTable",
+            partition_key=dynamodb.Attribute(name="word", type=dynamodb.AttributeType.STRING),
+            sort_key=dynamodb.Attribute(name="shard", type=dynamodb.AttributeType.NUMBER),
+            removal_policy=core.RemovalPolicy.DESTROY
+        )
+
+        # Index the dense per-partition word ordinals, used to pick a random word with a single query
+        wordTable.add_global_secondary_index(
+            index_name="WordOrdinalIndex",
+            partition_key=word_partition_key,
+            sort_key=dynamodb.Attribute(name="ordinal", type=dynamodb.AttributeType.NUMBER),
+            projection_type=dynamodb.ProjectionType.KEYS_ONLY
+        )
+
         # Output the table names
         self.user_table_name_output = core.CfnOutput(self, 'UserTableName', value=userTable.table_name)
         self.game_table_name_output = core.CfnOutput(self, 'GameTableName', value=gameTable.table_name)
         self.word_table_name_output = core.CfnOutput(self, 'WordTableName', value=wordTable.table_name)
+        self.history_table_name_output = core.CfnOutput(self, 'HistoryTableName', value=historyTable.table_name)
+        self.difficulty_table_name_output = core.CfnOutput(self, 'DifficultyTableName', value=difficultyTable.table_name)
+        self.game_table_stream_arn_output = core.CfnOutput(self, 'GameTableStreamArn', value=gameTable.table_stream_arn)
+        if storage_layout == "single":
+            self.user_table_stream_arn_output = core.CfnOutput(self, 'UserTableStreamArn', value=userTable.table_stream_arn)
@@ -2,6 +2,8 @@ from constructs import Construct
 import aws_cdk as core
 from aws_cdk import (
     Stack,
+    aws_events as events,
+    aws_events_targets as targets,
     aws_iam as iam,
     aws_lambda as _lambda,
 )
@@ -9,11 +11,13 @@ from aws_cdk import (
 
 class LambdaStack(Stack):
 
-    def __init__(self, scope: Construct, construct_id: str, table_names: dict,**kwargs) -> None:
+    def __init__(self, scope: Construct, construct_id: str, table_names: dict, game_stream_arn: str, single_function: bool = False, word_shards: int = 0, storage_layout: str = "tables", **kwargs) -> None:
         super().__init__(scope, construct_id, **kwargs)
         user_table_name = table_names['user']
         game_table_name = table_names['game']
         word_table_name = table_names['word']
+        history_table_name = table_names['history']
+        difficulty_table_name = table_names['difficulty']
 
         
         # Define a custom IAM policy for CloudWatch Logs access
@@ -34,6 +38,103 @@ class LambdaStack(Stack):
         lambda_role.add_managed_policy(iam.ManagedPolicy.from_aws_managed_policy_name("AmazonDynamoDBFullAccess"))
         lambda_role.add_to_policy(cloudwatch_policy)
 
+        # Create the Lambda function compacting finished games into the history table, run once a day.
+        # It is not an endpoint, so it is deployed the same way with or without the router
+        compact_games_lambda = _lambda.Function(
+            self,
+            "CompactGamesLambda",
+            runtime=_lambda.Runtime.PYTHON_3_8,
+            handler="compactGames.handler",
+            code=_lambda.Code.from_asset("lambda"),
+            environment={
+                "USER_TABLE": user_table_name,
+                "GAME_TABLE": game_table_name,
+                "HISTORY_TABLE": history_table_name,
+                "REGION": self.region
+            },
+            role=lambda_role,
+            timeout=core.Duration.minutes(5)
+        )
+        compact_games_rule = events.Rule(
+            self,
+            "CompactGamesSchedule",
+            schedule=events.Schedule.rate(core.Duration.days(1))
+        )
+        compact_games_rule.add_target(targets.LambdaFunction(compact_games_lambda))
+        self.compact_games_lambda = compact_games_lambda
+
+        # Create the Lambda function folding finished games from the game table stream into the difficulty table.
+        # Records are delivered in micro-batches as large as the stream allows, since a batch only saves writes on the
+        # words it contains more than twice (see the README), and only the updates ending a game reach the function.
+        # In the single table layout the stream is the one of the user table, where the game is the "game" map
+        single_table = storage_layout == "single"
+        embedded = lambda attributes: {"game": {"M": attributes}} if single_table else attributes
+        aggregate_difficulty_lambda = _lambda.Function(
+            self,
+            "AggregateDifficultyLambda",
+            runtime=_lambda.Runtime.PYTHON_3_8,
+            handler="aggregateDifficulty.handler",
+            code=_lambda.Code.from_asset("lambda"),
+            environment={
+                "DIFFICULTY_TABLE": difficulty_table_name,
+                "REGION": self.region
+            },
+            role=lambda_role,
+            timeout=core.Duration.minutes(1)
+        )
+        aggregate_difficulty_lambda.add_event_source_mapping(
+            "GameTableStream",
+            event_source_arn=game_stream_arn,
+            starting_position=_lambda.StartingPosition.LATEST,
+            batch_size=10000,
+            max_batching_window=core.Duration.minutes(5),
+            retry_attempts=3,
+            filters=[_lambda.FilterCriteria.filter({
+                "eventName": _lambda.FilterRule.is_equal("MODIFY"),
+                "dynamodb": {
+                    "OldImage": embedded({"status": {"S": _lambda.FilterRule.is_equal("IN_PROGRESS")}}),
+                    "NewImage": embedded({"status": {"S": _lambda.FilterRule.or_("WON", "LOST")}}),
+                },
+            })]
+        )
+        self.aggregate_difficulty_lambda = aggregate_difficulty_lambda
+
+        # Optionally deploy a single function that routes every endpoint to its handler (see lambda/router.py),
+        # so all endpoints share warm containers instead of each paying its own cold starts
+        if single_function:
+            router_lambda = _lambda.Function(
+                self,
+                "RouterLambda",
+                runtime=_lambda.Runtime.PYTHON_3_8,
+                handler="router.handler",
+                code=_lambda.Code.from_asset("lambda"),
+                environment={
+                    "USER_TABLE": user_table_name,
+                    "STORAGE_LAYOUT": storage_layout,
+                    "GAME_TABLE": game_table_name,
+                    "WORD_TABLE": word_table_name,
+                    "WORD_SHARDS": str(word_shards),
+                    "HISTORY_TABLE": history_table_name,
+                    "REGION": self.region
+                },
+                role=lambda_role,
+                timeout=core.Duration.seconds(30)
+            )
+            self.router_lambda = router_lambda
+            self.get_home_lambda = router_lambda
+            self.create_user_lambda = router_lambda
+            self.create_game_lambda = router_lambda
+            self.delete_game_lambda = router_lambda
+            self.get_game_lambda = router_lambda
+            self.get_user_lambda = router_lambda
+            self.get_history_lambda = router_lambda
+            self.get_stats_lambda = router_lambda
+            self.guess_lambda = router_lambda
+            self.guess_batch_lambda = router_lambda
+            self.get_hint_lambda = router_lambda
+            self.populate_words_lambda = router_lambda
+            return
+
         # Create the Lambda function for getting home page    
         get_home_lambda = _lambda.Function(
             self, 'GetHome',
@@ -42,7 +143,9 @@ class LambdaStack(Stack):
             handler='getHome.handler',
             environment={
                 "USER_TABLE": user_table_name,
+                "STORAGE_LAYOUT": storage_layout,
                 "GAME_TABLE": game_table_name,
+                "HISTORY_TABLE": history_table_name,
                 "REGION": self.region
             },
             role=lambda_role
@@ -71,8 +174,11 @@ class LambdaStack(Stack):
             code=_lambda.Code.from_asset("lambda"),
             environment={
                 "USER_TABLE": user_table_name,
+                "STORAGE_LAYOUT": storage_layout,
                 "GAME_TABLE": game_table_name,
                 "WORD_TABLE": word_table_name,
+                "WORD_SHARDS": str(word_shards),
+                "HISTORY_TABLE": history_table_name,
                 "REGION": self.region
             },
             role=lambda_role
@@ -87,6 +193,7 @@ class LambdaStack(Stack):
             code=_lambda.Code.from_asset("lambda"),
             environment={
                 "USER_TABLE": user_table_name,
+                "STORAGE_LAYOUT": storage_layout,
                 "GAME_TABLE": game_table_name,
                 "REGION": self.region
             },
@@ -102,7 +209,9 @@ class LambdaStack(Stack):
             code=_lambda.Code.from_asset("lambda"),
             environment={
                 "USER_TABLE": user_table_name,
+                "STORAGE_LAYOUT": storage_layout,
                 "GAME_TABLE": game_table_name,
+                "HISTORY_TABLE": history_table_name,
                 "REGION": self.region
             },
             role=lambda_role
@@ -123,6 +232,34 @@ class LambdaStack(Stack):
             role=lambda_role
         )
         
+        # Create the Lambda function for getting the history of a user
+        get_history_lambda = _lambda.Function(
+            self,
+            "GetHistoryLambda",
+            runtime=_lambda.Runtime.PYTHON_3_8,
+            handler="getHistory.handler",
+            code=_lambda.Code.from_asset("lambda"),
+            environment={
+                "HISTORY_TABLE": history_table_name,
+                "REGION": self.region
+            },
+            role=lambda_role
+        )
+
+        # Create the Lambda function for getting the statistics of a user
+        get_stats_lambda = _lambda.Function(
+            self,
+            "GetStatsLambda",
+            runtime=_lambda.Runtime.PYTHON_3_8,
+            handler="getStats.handler",
+            code=_lambda.Code.from_asset("lambda"),
+            environment={
+                "HISTORY_TABLE": history_table_name,
+                "REGION": self.region
+            },
+            role=lambda_role
+        )
+
         # Create the Lambda function for making a guess
         guess_lambda = _lambda.Function(
             self,
@@ -132,8 +269,49 @@ class LambdaStack(Stack):
             code=_lambda.Code.from_asset("lambda"),
             environment={
                 "USER_TABLE": user_table_name,
+                "STORAGE_LAYOUT": storage_layout,
+                "GAME_TABLE": game_table_name,
+                "WORD_TABLE": word_table_name,
+                "WORD_SHARDS": str(word_shards),
+                "HISTORY_TABLE": history_table_name,
+                "REGION": self.region
+            },
+            role=lambda_role
+        )
+
+        # Create the Lambda function for submitting a batch of queued guesses
+        guess_batch_lambda = _lambda.Function(
+            self,
+            "GuessBatchLambda",
+            runtime=_lambda.Runtime.PYTHON_3_8,
+            handler="guessBatch.handler",
+            code=_lambda.Code.from_asset("lambda"),
+            environment={
+                "USER_TABLE": user_table_name,
+                "STORAGE_LAYOUT": storage_layout,
+                "GAME_TABLE": game_table_name,
+                "WORD_TABLE": word_table_name,
+                "WORD_SHARDS": str(word_shards),
+                "HISTORY_TABLE": history_table_name,
+                "REGION": self.region
+            },
+            role=lambda_role
+        )
+
+        # Create the Lambda function for counting the words that still fit a game
+        get_hint_lambda = _lambda.Function(
+            self,
+            "GetHintLambda",
+            runtime=_lambda.Runtime.PYTHON_3_8,
+            handler="getHint.handler",
+            code=_lambda.Code.from_asset("lambda"),
+            environment={
+                "USER_TABLE": user_table_name,
+                "STORAGE_LAYOUT": storage_layout,
                 "GAME_TABLE": game_table_name,
                 "WORD_TABLE": word_table_name,
+                "WORD_SHARDS": str(word_shards),
+                "HISTORY_TABLE": history_table_name,
                 "REGION": self.region
             },
             role=lambda_role
@@ -148,6 +326,7 @@ class LambdaStack(Stack):
             code=_lambda.Code.from_asset("lambda"),
             environment={
                 "WORD_TABLE": word_table_name,
+                "WORD_SHARDS": str(word_shards),
                 "REGION": self.region
             },
             role=lambda_role,
@@ -160,5 +339,9 @@ class LambdaStack(Stack):
         self.delete_game_lambda = delete_game_lambda
         self.get_game_lambda = get_game_lambda
         self.get_user_lambda = get_user_lambda
+        self.get_history_lambda = get_history_lambda
+        self.get_stats_lambda = get_stats_lambda
         self.guess_lambda = guess_lambda
+        self.guess_batch_lambda = guess_batch_lambda
+        self.get_hint_lambda = get_hint_lambda
         self.populate_words_lambda = populate_words_lambda
@@ -9,20 +9,33 @@ class WordleCdkStack(Stack):
     def __init__(self, scope: Construct, construct_id: str, **kwargs) -> None:
         super().__init__(scope, construct_id, **kwargs)
 
-        # Create the DynamoDB stack
-        dynamodb_stack = DBStack(self, 'DynamoDBStack')
+        # Create the DynamoDB stack. Deploy with `cdk deploy -c word_shards=8` to spread the words of each length over 8 partitions
+        word_shards = int(self.node.try_get_context("word_shards") or 0)
+        # Deploy with `cdk deploy -c storage_layout=single` to embed the active game in the user item (see lambda/single_table.py)
+        storage_layout = self.node.try_get_context("storage_layout") or "tables"
+        dynamodb_stack = DBStack(self, 'DynamoDBStack', word_shards=word_shards, storage_layout=storage_layout)
 
         user_table_name = dynamodb_stack.user_table_name_output.value
         game_table_name = dynamodb_stack.game_table_name_output.value
         word_table_name = dynamodb_stack.word_table_name_output.value
+        history_table_name = dynamodb_stack.history_table_name_output.value
+        difficulty_table_name = dynamodb_stack.difficulty_table_name_output.value
+        if storage_layout == "single":
+            game_table_stream_arn = dynamodb_stack.user_table_stream_arn_output.value
+        else:
+            game_table_stream_arn = dynamodb_stack.game_table_stream_arn_output.value
 
         
-        # Create the Lambda stack
+        # Create the Lambda stack. Deploy with `cdk deploy -c single_function=true` to route every endpoint through one function
+        single_function = str(self.node.try_get_context("single_function")).lower() == "true"
         lambda_stack = LambdaStack(self, 'LambdaStack', table_names={
             'user': user_table_name,
             'game': game_table_name,
-            'word': word_table_name
-        })
+            'word': word_table_name,
+            'history': history_table_name,
+            'difficulty': difficulty_table_name
+        }, game_stream_arn=game_table_stream_arn, single_function=single_function,
+            word_shards=word_shards, storage_layout=storage_layout)
 
         api_stack = APIStack(self, 'APIStack', lambda_functions={
             'get_home': lambda_stack.get_home_lambda,
@@ -30,8 +43,12 @@ class WordleCdkStack(Stack):
             'create_game': lambda_stack.create_game_lambda,
             'get_game': lambda_stack.get_game_lambda,
             'get_user': lambda_stack.get_user_lambda,
+            'get_history': lambda_stack.get_history_lambda,
+            'get_stats': lambda_stack.get_stats_lambda,
             'delete_game': lambda_stack.delete_game_lambda,
             'guess': lambda_stack.guess_lambda,
+            'guess_batch': lambda_stack.guess_batch_lambda,
+            'get_hint': lambda_stack.get_hint_lambda,
             'populate_words': lambda_stack.populate_words_lambda
         })
 